@@ -0,0 +1,50 @@
+"""Add dashboard statistics summary tables
+
+Revision ID: 3c1f7e9a2b6d
+Revises: de6ae4bbf4a5
+Create Date: 2026-10-18 00:00:00.000000+00:00
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3c1f7e9a2b6d"
+down_revision = "de6ae4bbf4a5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "collection_inventory_summaries",
+        sa.Column("collection_id", sa.Integer(), nullable=False),
+        sa.Column("medium", sa.Unicode(), nullable=False),
+        sa.Column("metered_titles", sa.Integer(), nullable=False),
+        sa.Column("unlimited_titles", sa.Integer(), nullable=False),
+        sa.Column("open_access_titles", sa.Integer(), nullable=False),
+        sa.Column("loanable_titles", sa.Integer(), nullable=False),
+        sa.Column("metered_licenses_owned", sa.Integer(), nullable=False),
+        sa.Column("metered_licenses_available", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["collection_id"], ["collections.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("collection_id", "medium"),
+    )
+    op.create_table(
+        "library_patron_summaries",
+        sa.Column("library_id", sa.Integer(), nullable=False),
+        sa.Column("total", sa.Integer(), nullable=False),
+        sa.Column("with_active_loan", sa.Integer(), nullable=False),
+        sa.Column("with_active_loan_or_hold", sa.Integer(), nullable=False),
+        sa.Column("loans", sa.Integer(), nullable=False),
+        sa.Column("holds", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["library_id"], ["libraries.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("library_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("library_patron_summaries")
+    op.drop_table("collection_inventory_summaries")
@@ -0,0 +1,32 @@
+"""Add metadata version columns to samlfederations
+
+Revision ID: 5a9d2c7e1f40
+Revises: 3c1f7e9a2b6d
+Create Date: 2026-10-18 00:00:00.000000+00:00
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5a9d2c7e1f40"
+down_revision = "3c1f7e9a2b6d"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "samlfederations",
+        sa.Column("metadata_etag", sa.String(length=256), nullable=True),
+    )
+    op.add_column(
+        "samlfederations",
+        sa.Column("metadata_valid_until", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("samlfederations", "metadata_valid_until")
+    op.drop_column("samlfederations", "metadata_etag")
@@ -0,0 +1,30 @@
+"""Add an index on annotations patron_id, identifier_id and active
+
+Revision ID: 8e3b1d4f6a27
+Revises: 5a9d2c7e1f40
+Create Date: 2026-10-18 00:00:00.000000+00:00
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8e3b1d4f6a27"
+down_revision = "5a9d2c7e1f40"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_annotations_patron_id_identifier_id_active",
+        "annotations",
+        ["patron_id", "identifier_id", "active"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_annotations_patron_id_identifier_id_active", table_name="annotations"
+    )
@@ -39,6 +39,7 @@ from palace.manager.search.query import (
     JSONQueryDict,
     QueryParseException,
 )
+from palace.manager.service.redis.models.search import CustomListIndexing
 from palace.manager.sqlalchemy.model.collection import Collection
 from palace.manager.sqlalchemy.model.customlist import CustomList
 from palace.manager.sqlalchemy.model.datasource import DataSource
@@ -284,18 +285,23 @@ class CustomListsController(
                     works_to_update_in_search.add(work)
                     membership_change = True
 
+        indexing_pending = False
         if membership_change:
             # We need to update the search index entries for works that caused a membership change,
             # so the upstream counts can be calculated correctly.
-            documents = Work.to_search_documents(
-                self._db,
-                [w.id for w in works_to_update_in_search if w.id is not None],
-            )
-            # TODO: Does this need to be done here, or can this be done asynchronously?
-            if isinstance(self.search_engine, ProblemDetail):
-                return self.search_engine
-            self.search_engine.add_documents(documents)
-            self.search_engine.search_service().refresh()
+            work_ids = [w.id for w in works_to_update_in_search if w.id is not None]
+            if self._defer_search_indexing:
+                # Leave the indexing to the search_indexing task, and keep track of
+                # the works so the admin interface can tell when it's caught up.
+                Work.queue_indexing_many(work_ids, redis_client=self.redis_client)
+                CustomListIndexing(self.redis_client, list.id).add(work_ids)
+                indexing_pending = True
+            else:
+                documents = Work.to_search_documents(self._db, work_ids)
+                if isinstance(self.search_engine, ProblemDetail):
+                    return self.search_engine
+                self.search_engine.add_documents(documents)
+                self.search_engine.search_service().refresh()
 
         new_collections = []
         for collection_id in collections:
@@ -311,9 +317,29 @@ class CustomListsController(
 
         if is_new:
             return Response(str(list.id), 201)
+        elif indexing_pending:
+            # The edit has been made, but the search index hasn't caught up yet.
+            return Response(str(list.id), 202)
         else:
             return Response(str(list.id), 200)
 
+    @property
+    def _defer_search_indexing(self) -> bool:
+        return bool(self.manager.services.config.search.defer_custom_list_indexing())
+
+    def custom_list_indexing(self, list_id: int) -> dict[str, Any] | ProblemDetail:
+        """Whether the search index has caught up with the edits made to a list."""
+        library = get_request_library()
+        self.require_librarian(library)
+        data_source = DataSource.lookup(self._db, DataSource.LIBRARY_STAFF)
+
+        list = get_one(self._db, CustomList, id=list_id, data_source=data_source)
+        if not list or list.library != library:
+            return MISSING_CUSTOM_LIST
+
+        pending = CustomListIndexing(self.redis_client, list.id).pending()
+        return dict(id=list.id, indexing_pending=pending > 0, works_pending=pending)
+
     def url_for_custom_list(
         self, library: Library, list: CustomList
     ) -> Callable[[int], str]:
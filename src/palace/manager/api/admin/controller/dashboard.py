@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from datetime import date, datetime, timedelta
 
 import flask
@@ -18,14 +18,26 @@ from palace.manager.sqlalchemy.model.admin import Admin
 
 class DashboardController(CirculationManagerController):
     def stats(
-        self, stats_function: Callable[[Admin, Session], StatisticsResponse]
+        self,
+        stats_function: Callable[[Admin, Session], StatisticsResponse],
+        refresh_function: Callable[[], object] | None = None,
     ) -> StatisticsResponse:
+        """Generate the dashboard statistics.
+
+        If the admin asks for the statistics to be refreshed, refresh_function
+        queues a refresh. The response still has the current statistics, and
+        their asOf time shows when the refreshed ones have arrived.
+        """
         admin = get_request_admin()
+        refresh = flask.request.args.get("refresh", "false").lower() == "true"
+        if refresh and refresh_function is not None:
+            refresh_function()
         return stats_function(admin, self._db)
 
     def bulk_circulation_events(
         self, analytics_exporter: LocalAnalyticsExporter | None = None
-    ) -> tuple[str, str, str, str | None]:
+    ) -> tuple[Iterator[str], str, str, str | None]:
+        """Export circulation events as CSV, a chunk at a time."""
         date_format = "%Y-%m-%d"
 
         def get_date(field: str) -> date:
@@ -60,7 +72,7 @@ class DashboardController(CirculationManagerController):
         library_short_name = library.short_name if library else None
 
         analytics_exporter = analytics_exporter or LocalAnalyticsExporter()
-        data = analytics_exporter.export(self._db, date_start, date_end, library)
+        data = analytics_exporter.export_stream(self._db, date_start, date_end, library)
         return (
             data,
             date_start.strftime(date_format),
@@ -6,11 +6,13 @@ from collections.abc import Iterable
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import not_, union
+from sqlalchemy import delete, insert, not_, union
 from sqlalchemy.orm import Session
 from sqlalchemy.sql import Select, func, select
 from sqlalchemy.sql.expression import and_, distinct, or_
 
+from palace.util.datetime_helpers import utc_now
+
 from palace.manager.api.admin.model.dashboard_statistics import (
     CollectionInventory,
     InventoryStatistics,
@@ -20,18 +22,38 @@ from palace.manager.api.admin.model.dashboard_statistics import (
 )
 from palace.manager.sqlalchemy.model.admin import Admin
 from palace.manager.sqlalchemy.model.collection import Collection
+from palace.manager.sqlalchemy.model.coverage import Timestamp
+from palace.manager.sqlalchemy.model.dashboard_statistics import (
+    CollectionInventorySummary,
+    LibraryPatronSummary,
+)
 from palace.manager.sqlalchemy.model.edition import Edition
 from palace.manager.sqlalchemy.model.integration import IntegrationConfiguration
 from palace.manager.sqlalchemy.model.library import Library
 from palace.manager.sqlalchemy.model.licensing import LicensePool
 from palace.manager.sqlalchemy.model.patron import Hold, Loan, Patron
+from palace.manager.sqlalchemy.util import LOCK_ID_DASHBOARD_STATISTICS
 
 
 def generate_statistics(admin: Admin, db: Session) -> StatisticsResponse:
     return Statistics(db).stats(admin)
 
 
+def refresh_statistics(db: Session) -> datetime | None:
+    return Statistics(db).refresh()
+
+
 class Statistics:
+    """Statistics for the admin dashboard.
+
+    Aggregating over every license pool, patron, loan and hold takes a while on
+    a large installation, so the dashboard reads its statistics from summary
+    tables instead. The summaries are recomputed by `refresh`, which runs
+    periodically in a Celery task, and can also be queued on demand.
+    """
+
+    SERVICE_NAME = "Dashboard Statistics"
+
     METERED_LICENSE_FILTER = and_(  # type: ignore[type-var]
         LicensePool.metered_or_equivalent_type, LicensePool.active_status
     )
@@ -50,8 +72,23 @@ class Statistics:
     def __init__(self, session: Session):
         self._db = session
 
-    def stats(self, admin: Admin) -> StatisticsResponse:
-        """Build and return a statistics response for admin user's authorized libraries."""
+    def stats(self, admin: Admin, live: bool = False) -> StatisticsResponse:
+        """Build and return a statistics response for admin user's authorized libraries.
+
+        :param live: If True, compute the statistics from the live tables, rather
+            than reading them from the summary tables.
+        """
+        if not live:
+            timestamp = Timestamp.lookup(
+                self._db, self.SERVICE_NAME, Timestamp.TASK_TYPE, collection=None
+            )
+            # If the summaries have never been computed, the statistics are
+            # computed from the live tables until they are.
+            live = timestamp is None or timestamp.start is None
+        if live:
+            as_of = utc_now()
+        else:
+            as_of = timestamp.start
 
         # Determine which libraries and collections are authorized for this user.
         authorized_libraries = admin.authorized_libraries()
@@ -61,9 +98,18 @@ class Statistics:
             filter_collections,
         ) = self._authorized_collections(admin, authorized_libraries)
 
-        collection_inventories = self._create_collection_inventories(
-            all_authorized_collections, filter_collections
-        )
+        if live:
+            collection_inventories = self._create_collection_inventories(
+                all_authorized_collections, filter_collections
+            )
+            patron_stats_by_library = self._gather_patron_stats(authorized_libraries)
+        else:
+            collection_inventories = self._summarized_collection_inventories(
+                all_authorized_collections
+            )
+            patron_stats_by_library = self._summarized_patron_stats(
+                authorized_libraries
+            )
         (
             collection_inventory_summary,
             collection_inventory_summary_by_medium,
@@ -77,7 +123,6 @@ class Statistics:
             )
             for library_key, collections in authorized_collections_by_library.items()
         }
-        patron_stats_by_library = self._gather_patron_stats(authorized_libraries)
         library_statistics = [
             LibraryStatistics(
                 key=lib.short_name,
@@ -103,8 +148,123 @@ class Statistics:
             inventory_summary=collection_inventory_summary,
             inventory_by_medium=collection_inventory_summary_by_medium,
             patron_summary=patron_summary,
+            as_of=as_of,
         )
 
+    def refresh(self) -> datetime | None:
+        """Recompute the summary tables from the live tables.
+
+        The summaries are replaced and committed in a single transaction, so the
+        dashboard sees either the old summaries or the new ones, never a mix of
+        the two. Only one refresh runs at a time: the transaction holds an
+        advisory lock until it ends, and a refresh that can't get the lock is
+        skipped, since the one holding it is already computing the summaries.
+
+        :return: The time the summaries were computed as of, or None if another
+            refresh was already running.
+        """
+        locked = self._db.execute(
+            select(func.pg_try_advisory_xact_lock(LOCK_ID_DASHBOARD_STATISTICS))
+        ).scalar()
+        if not locked:
+            return None
+
+        start = utc_now()
+
+        collections = list(self._all_collections().values())
+        statistics = self._run_collections_stats_queries(
+            collections, filter_collections=False
+        )
+        inventory_rows = [
+            dict(
+                collection_id=collection.id,
+                medium=str(medium),
+                **statistics[collection.id].counts_for_medium(medium),
+            )
+            for collection in collections
+            for medium in statistics[collection.id].mediums_present()
+        ]
+
+        libraries = self._db.scalars(select(Library)).all()
+        patron_stats = self._gather_patron_stats(list(libraries))
+        patron_rows = [
+            dict(library_id=library.id, **patron_stats[library.short_name].model_dump())
+            for library in libraries
+        ]
+
+        self._db.execute(delete(CollectionInventorySummary))
+        if inventory_rows:
+            self._db.execute(insert(CollectionInventorySummary), inventory_rows)
+        self._db.execute(delete(LibraryPatronSummary))
+        if patron_rows:
+            self._db.execute(insert(LibraryPatronSummary), patron_rows)
+
+        Timestamp.stamp(
+            self._db,
+            self.SERVICE_NAME,
+            Timestamp.TASK_TYPE,
+            collection=None,
+            start=start,
+            finish=utc_now(),
+            achievements=(
+                f"Collections: {len(collections)}, libraries: {len(libraries)}."
+            ),
+        )
+        return start
+
+    def _summarized_collection_inventories(
+        self, collections: list[_Collection]
+    ) -> list[CollectionInventory]:
+        summaries = self._db.scalars(
+            select(CollectionInventorySummary).where(
+                CollectionInventorySummary.collection_id.in_(
+                    {c.id for c in collections}
+                )
+            )
+        ).all()
+        inventories_by_medium: dict[int, dict[str, InventoryStatistics]] = defaultdict(
+            dict
+        )
+        for summary in summaries:
+            inventories_by_medium[summary.collection_id][summary.medium] = (
+                _inventory_statistics(
+                    **{
+                        column: getattr(summary, column)
+                        for column in _INVENTORY_COUNT_COLUMNS
+                    }
+                )
+            )
+        return [
+            _collection_inventory(collection, inventories_by_medium[collection.id])
+            for collection in collections
+        ]
+
+    def _summarized_patron_stats(
+        self, libraries: list[Library]
+    ) -> dict[str | None, PatronStatistics]:
+        summaries = {
+            summary.library_id: summary
+            for summary in self._db.scalars(
+                select(LibraryPatronSummary).where(
+                    LibraryPatronSummary.library_id.in_({lib.id for lib in libraries})
+                )
+            )
+        }
+        return {
+            library.short_name: (
+                PatronStatistics(
+                    total=summary.total,
+                    with_active_loan=summary.with_active_loan,
+                    with_active_loan_or_hold=summary.with_active_loan_or_hold,
+                    loans=summary.loans,
+                    holds=summary.holds,
+                )
+                if (summary := summaries.get(library.id)) is not None
+                else PatronStatistics.zeroed()
+            )
+            for library in libraries
+        }
+
     def _all_collections(self) -> dict[int | None, _Collection]:
         collection_query = self._db.execute(
             select(Collection.id, IntegrationConfiguration.name)
@@ -257,24 +417,18 @@ class Statistics:
         statistics = self._run_collections_stats_queries(
             collections, filter_collections
         )
-        inventories = []
-        for collection in collections:
-            inventory_by_medium = {
-                str(m): inv
-                for m, inv in statistics[collection.id].inventories_by_medium().items()
-            }
-            summary_inventory = sum(
-                inventory_by_medium.values(), InventoryStatistics.zeroed()
-            )
-            inventories.append(
-                CollectionInventory(
-                    id=collection.id,
-                    name=collection.name,
-                    inventory=summary_inventory,
-                    inventory_by_medium=inventory_by_medium,
-                )
+        return [
+            _collection_inventory(
+                collection,
+                {
+                    str(m): inv
+                    for m, inv in statistics[collection.id]
+                    .inventories_by_medium()
+                    .items()
+                },
             )
-        return inventories
+            for collection in collections
+        ]
 
     @staticmethod
     def _loans_or_holds_query(loan_or_hold: type[Loan] | type[Hold]) -> Select:
@@ -382,6 +536,50 @@ class Statistics:
         }
 
 
+# The counts an inventory is built from, as they're stored in CollectionInventorySummary.
+_INVENTORY_COUNT_COLUMNS = (
+    "metered_titles",
+    "unlimited_titles",
+    "open_access_titles",
+    "loanable_titles",
+    "metered_licenses_owned",
+    "metered_licenses_available",
+)
+
+
+def _inventory_statistics(
+    *,
+    metered_titles: int,
+    unlimited_titles: int,
+    open_access_titles: int,
+    loanable_titles: int,
+    metered_licenses_owned: int,
+    metered_licenses_available: int,
+) -> InventoryStatistics:
+    """Build inventory statistics from the counts they're derived from."""
+    return InventoryStatistics(
+        titles=metered_titles + unlimited_titles + open_access_titles,
+        available_titles=loanable_titles,
+        open_access_titles=open_access_titles,
+        licensed_titles=metered_titles + unlimited_titles,
+        unlimited_license_titles=unlimited_titles,
+        metered_license_titles=metered_titles,
+        metered_licenses_owned=metered_licenses_owned,
+        metered_licenses_available=metered_licenses_available,
+    )
+
+
+def _collection_inventory(
+    collection: _Collection, inventory_by_medium: dict[str, InventoryStatistics]
+) -> CollectionInventory:
+    return CollectionInventory(
+        id=collection.id,
+        name=collection.name,
+        inventory=sum(inventory_by_medium.values(), InventoryStatistics.zeroed()),
+        inventory_by_medium=inventory_by_medium,
+    )
+
+
 def _summarize_collection_inventories(
     collection_inventories: Iterable[CollectionInventory],
     collections: Iterable[_Collection],
@@ -435,32 +633,29 @@ class _CollectionStatisticsQueryResults:
 
     def inventory_for_medium(self, medium: str) -> InventoryStatistics:
         """Return statistics for the specified medium."""
-        unlimited_titles = self._lookup_property(
-            "unlimited_title_counts", medium, "count"
-        )
-        open_access_titles = self._lookup_property(
-            "open_access_title_counts", medium, "count"
-        )
-        loanable_titles = self._lookup_property(
-            "loanable_title_counts", medium, "count"
-        )
-        metered_titles = self._lookup_property("metered_title_counts", medium, "count")
-        metered_owned_licenses = self._lookup_property(
-            "metered_license_stats", medium, "owned"
-        )
-        metered_available_licenses = self._lookup_property(
-            "metered_license_stats", medium, "available"
-        )
-
-        return InventoryStatistics(
-            titles=metered_titles + unlimited_titles + open_access_titles,
-            available_titles=loanable_titles,
-            open_access_titles=open_access_titles,
-            licensed_titles=metered_titles + unlimited_titles,
-            unlimited_license_titles=unlimited_titles,
-            metered_license_titles=metered_titles,
-            metered_licenses_owned=metered_owned_licenses,
-            metered_licenses_available=metered_available_licenses,
+        return _inventory_statistics(**self.counts_for_medium(medium))
+
+    def counts_for_medium(self, medium: str) -> dict[str, int]:
+        """Return the counts the statistics for the specified medium are built from."""
+        return dict(
+            metered_titles=self._lookup_property(
+                "metered_title_counts", medium, "count"
+            ),
+            unlimited_titles=self._lookup_property(
+                "unlimited_title_counts", medium, "count"
+            ),
+            open_access_titles=self._lookup_property(
+                "open_access_title_counts", medium, "count"
+            ),
+            loanable_titles=self._lookup_property(
+                "loanable_title_counts", medium, "count"
+            ),
+            metered_licenses_owned=self._lookup_property(
+                "metered_license_stats", medium, "owned"
+            ),
+            metered_licenses_available=self._lookup_property(
+                "metered_license_stats", medium, "available"
+            ),
         )
 
     def _lookup_property(
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Any, Self
 
 from pydantic import Field, NonNegativeInt
@@ -123,6 +124,10 @@ class StatisticsResponse(CustomBaseModel):
     patron_summary: PatronStatistics = Field(
         description="Summary patron statistics across all libraries."
     )
+    as_of: datetime | None = Field(
+        default=None,
+        description="When the statistics were computed.",
+    )
 
     @property
     def libraries_by_key(self) -> dict[str, LibraryStatistics]:
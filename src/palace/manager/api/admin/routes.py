@@ -4,7 +4,7 @@ from functools import wraps
 from typing import ParamSpec, TypeVar
 
 import flask
-from flask import Response, make_response, redirect, request, url_for
+from flask import Response, redirect, request, stream_with_context, url_for
 
 from palace.manager.api.admin.config import (
     Configuration as AdminClientConfig,
@@ -19,6 +19,9 @@ from palace.manager.api.admin.problem_details import (
 from palace.manager.api.app import app
 from palace.manager.api.controller.static_file import StaticFileController
 from palace.manager.api.routes import allows_library, has_library, library_route
+from palace.manager.celery.tasks.dashboard_statistics import (
+    refresh_dashboard_statistics,
+)
 from palace.manager.core.app_server import returns_problem_detail
 from palace.manager.core.problem_details import INVALID_INPUT
 from palace.manager.sqlalchemy.model.admin import Admin
@@ -346,7 +349,10 @@ def bulk_circulation_events():
     if isinstance(data, ProblemDetail):
         return data
 
-    response = make_response(data)
+    # Stream the file, so a long export doesn't have to be held in memory. The
+    # request context, and the database transaction the rows are read in, stay
+    # open until the last row has been sent.
+    response = Response(stream_with_context(data))
 
     # If gathering events per library, include the library name in the file
     # for convenience. The start and end dates will always be included.
@@ -364,9 +370,12 @@ def bulk_circulation_events():
 @requires_admin
 def stats():
     statistics_response: StatisticsResponse = (
-        app.manager.admin_dashboard_controller.stats(stats_function=generate_statistics)
+        app.manager.admin_dashboard_controller.stats(
+            stats_function=generate_statistics,
+            refresh_function=refresh_dashboard_statistics.delay,
+        )
     )
-    return statistics_response.api_dict()
+    return statistics_response.api_dict(mode="json")
 
 
 @app.route("/admin/quicksight_embed/<dashboard_name>")
@@ -674,6 +683,16 @@ def custom_list_delete(list_id):
     return app.manager.admin_custom_lists_controller.custom_list(list_id)
 
 
+@library_route("/admin/custom_list/<list_id>/indexing", methods=["GET"])
+@has_library
+@returns_json_or_response_or_problem_detail
+@requires_admin
+@requires_csrf_token
+def custom_list_indexing(list_id: int):
+    """Whether the search index has caught up with the edits made to a custom list"""
+    return app.manager.admin_custom_lists_controller.custom_list_indexing(list_id)
+
+
 @library_route("/admin/custom_list/<list_id>/share", methods=["POST"])
 @has_library
 @returns_json_or_response_or_problem_detail
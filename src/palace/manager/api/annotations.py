@@ -1,8 +1,13 @@
+import copy
 import json
 import os
+from functools import cache
+from typing import Any, NamedTuple
 
 from flask import url_for
 from pyld import jsonld
+from sqlalchemy import and_, or_, select, true
+from sqlalchemy.orm import Session
 
 from palace.util.datetime_helpers import utc_now
 
@@ -12,27 +17,45 @@ from palace.manager.api.problem_details import (
     INVALID_ANNOTATION_TARGET,
 )
 from palace.manager.sqlalchemy.model.identifier import Identifier
-from palace.manager.sqlalchemy.model.patron import Annotation
-from palace.manager.sqlalchemy.util import get_one_or_create
+from palace.manager.sqlalchemy.model.licensing import LicensePool
+from palace.manager.sqlalchemy.model.patron import Annotation, Loan, Patron
+from palace.manager.util.problem_detail import ProblemDetail
 
 
-def load_document(url, *args, **kargs):
-    """Retrieves JSON-LD for the given URL from a local
-    file if available, and falls back to the network.
+@cache
+def _local_document(url: str) -> dict[str, Any] | None:
+    """Parse the JSON-LD document for a URL from a local file, if there is one.
+
+    Each file is only read and parsed once per process.
     """
     files = {
         AnnotationWriter.JSONLD_CONTEXT: "anno.jsonld",
         AnnotationWriter.LDP_CONTEXT: "ldp.jsonld",
     }
-    if url in files:
-        base_path = os.path.join(os.path.split(__file__)[0], "jsonld")
-        jsonld_file = os.path.join(base_path, files[url])
-        data = open(jsonld_file).read()
+    if url not in files:
+        return None
+    base_path = os.path.join(os.path.split(__file__)[0], "jsonld")
+    with open(os.path.join(base_path, files[url])) as jsonld_file:
+        return json.load(jsonld_file)
+
+
+def load_document(url, *args, **kargs):
+    """Retrieves JSON-LD for the given URL from a local
+    file if available, and falls back to the network.
+
+    Local documents are tagged as static, so pyld keeps the contexts it
+    resolves from them in its shared cache rather than loading and processing
+    them again for every document it expands or compacts.
+    """
+    document = _local_document(url)
+    if document is not None:
         doc = {
             "contextUrl": None,
             "documentUrl": url,
-            "document": data,
+            # pyld may modify the document, so it gets a copy of its own.
+            "document": copy.deepcopy(document),
             "contentType": "application/ld+json",
+            "tag": "static",
         }
         return doc
     else:
@@ -42,6 +65,186 @@ def load_document(url, *args, **kargs):
 jsonld.set_document_loader(load_document)
 
 
+class UnsupportedCompactionError(Exception):
+    """Raised when a JSON-LD document uses features a ContextCompactor doesn't
+    handle, so it has to be compacted by pyld instead."""
+
+
+class ContextCompactor:
+    """Compacts expanded JSON-LD with a fixed context, without pyld.
+
+    pyld re-processes the context every time it compacts a document, which is
+    most of the cost of writing out an annotation. This compactor works out the
+    terms and prefixes of the context once, and then builds the compacted
+    document directly.
+
+    Only the subset of JSON-LD that annotation targets and bodies use is
+    supported: node objects, node references and plain or typed values, with
+    terms that have no containers. For anything else,
+    UnsupportedCompactionError is raised, and the document should be compacted
+    with pyld.
+    """
+
+    # Characters an IRI must end with for its term to be usable as a prefix.
+    GEN_DELIMS = (":", "/", "?", "#", "[", "]", "@")
+
+    def __init__(self, context: dict[str, Any]) -> None:
+        """Initialize a new instance of ContextCompactor class.
+
+        :param context: The value of the context's "@context" key
+        """
+        self._id_alias = "@id"
+        self._type_alias = "@type"
+        # IRI -> (term, type mapping) for the terms that can be selected.
+        self._terms: dict[str, tuple[str, str | None]] = {}
+        # IRIs with more than one term, or terms with containers.
+        self._unsupported: set[str] = set()
+        # Terms that can be used as prefixes in compact IRIs, with their IRIs.
+        self._prefixes: dict[str, str] = {}
+
+        def expand(value: str) -> str:
+            prefix, colon, suffix = value.partition(":")
+            if colon and isinstance(context.get(prefix), str):
+                return context[prefix] + suffix
+            return value
+
+        for term, definition in context.items():
+            if term.startswith("@"):
+                raise ValueError(f"Unsupported context keyword: {term}")
+            if isinstance(definition, str):
+                iri, type_mapping, container = expand(definition), None, None
+                if iri.endswith(self.GEN_DELIMS):
+                    self._prefixes[term] = iri
+            else:
+                iri = expand(definition["@id"])
+                type_mapping = definition.get("@type")
+                if type_mapping is not None:
+                    type_mapping = expand(type_mapping)
+                container = definition.get("@container")
+                if definition.get("@prefix"):
+                    self._prefixes[term] = iri
+
+            if iri == "@id":
+                self._id_alias = term
+            elif iri == "@type":
+                self._type_alias = term
+            elif iri in self._terms or container is not None:
+                self._unsupported.add(iri)
+            else:
+                self._terms[iri] = (term, type_mapping)
+
+        self._term_names = set(context)
+
+    def compact(self, node: Any) -> dict[str, Any]:
+        """Compact an expanded JSON-LD node object.
+
+        The result matches what jsonld.compact gives for the same node and context,
+        without the "@context" key.
+
+        :raise: UnsupportedCompactionError
+        """
+        if not isinstance(node, dict) or not node:
+            raise UnsupportedCompactionError("Not a node object")
+
+        result: dict[str, Any] = {}
+        # pyld compacts properties in the order of their expanded IRIs.
+        for key, value in sorted(node.items()):
+            values = value if isinstance(value, list) else [value]
+            if not values:
+                raise UnsupportedCompactionError(f"Empty value for {key}")
+
+            if key == "@id":
+                if not isinstance(value, str):
+                    raise UnsupportedCompactionError("Unsupported @id")
+                self._add(result, self._id_alias, self._compact_iri(value, False))
+            elif key == "@type":
+                for type_iri in values:
+                    if not isinstance(type_iri, str):
+                        raise UnsupportedCompactionError("Unsupported @type")
+                    self._add(result, self._type_alias, self._compact_iri(type_iri))
+            elif key.startswith(("http://", "https://")):
+                for item in values:
+                    self._add(result, *self._compact_property(key, item))
+            else:
+                raise UnsupportedCompactionError(f"Unsupported key: {key}")
+
+        return result
+
+    @staticmethod
+    def _add(result: dict[str, Any], key: str, value: Any) -> None:
+        if key not in result:
+            result[key] = value
+        elif isinstance(result[key], list):
+            result[key].append(value)
+        else:
+            result[key] = [result[key], value]
+
+    def _compact_property(self, iri: str, item: Any) -> tuple[str, Any]:
+        """Choose the key a value of a property is compacted under, and compact it."""
+        if iri in self._unsupported:
+            raise UnsupportedCompactionError(f"Unsupported term for {iri}")
+        term, type_mapping = self._terms.get(iri, (None, None))
+
+        if isinstance(item, (str, int, float, bool)):
+            item = {"@value": item}
+        if not isinstance(item, dict) or not item:
+            raise UnsupportedCompactionError(f"Unsupported value for {iri}")
+
+        if "@value" in item:
+            value = item["@value"]
+            if not isinstance(value, (str, int, float, bool)):
+                raise UnsupportedCompactionError(f"Unsupported value for {iri}")
+            if item.keys() == {"@value"}:
+                # Plain values can only use terms without a type mapping.
+                if term is not None and type_mapping is None:
+                    return term, value
+                return self._compact_iri(iri), value
+            if item.keys() == {"@value", "@type"} and term is not None:
+                if type_mapping == item["@type"]:
+                    return term, value
+            raise UnsupportedCompactionError(f"Unsupported value for {iri}")
+
+        if term is not None and type_mapping not in (None, "@id", "@vocab"):
+            raise UnsupportedCompactionError(f"Unsupported term for {iri}")
+
+        if item.keys() == {"@id"} and isinstance(item["@id"], str):
+            if term is None:
+                return self._compact_iri(iri), self.compact(item)
+            if type_mapping == "@id":
+                return term, self._compact_iri(item["@id"], False)
+            if type_mapping == "@vocab":
+                return term, self._compact_iri(item["@id"])
+            return term, self.compact(item)
+
+        if type_mapping == "@vocab":
+            raise UnsupportedCompactionError(f"Unsupported value for {iri}")
+        return (term or self._compact_iri(iri)), self.compact(item)
+
+    def _compact_iri(self, iri: str, vocab: bool = True) -> str:
+        """Compact an IRI to a term, if vocab is set, or otherwise to a compact IRI."""
+        if vocab and iri in self._terms and iri not in self._unsupported:
+            term, type_mapping = self._terms[iri]
+            if type_mapping is None:
+                return term
+
+        candidate = None
+        for prefix, prefix_iri in self._prefixes.items():
+            if iri != prefix_iri and iri.startswith(prefix_iri):
+                curie = prefix + ":" + iri[len(prefix_iri) :]
+                if curie not in self._term_names and (
+                    candidate is None
+                    or (len(curie), curie) < (len(candidate), candidate)
+                ):
+                    candidate = curie
+        if candidate is not None:
+            return candidate
+
+        scheme, colon, _ = iri.partition(":")
+        if not colon or scheme in self._prefixes:
+            raise UnsupportedCompactionError(f"Unsupported IRI: {iri}")
+        return iri
+
+
 class AnnotationWriter:
     CONTENT_TYPE = 'application/ld+json; profile="http://www.w3.org/ns/anno.jsonld"'
 
@@ -50,16 +253,19 @@ class AnnotationWriter:
 
     @classmethod
     def annotations_for(cls, patron, identifier=None):
-        annotations = [
-            annotation for annotation in patron.annotations if annotation.active
-        ]
+        """Find a patron's active annotations, most recent first.
+
+        The annotations are looked up in the database, rather than by loading
+        every annotation the patron has ever made through patron.annotations.
+        """
+        _db = Session.object_session(patron)
+        query = _db.query(Annotation).filter(
+            Annotation.patron_id == patron.id, Annotation.active == true()
+        )
         if identifier:
-            annotations = [
-                annotation
-                for annotation in annotations
-                if annotation.identifier == identifier
-            ]
-        return annotations
+            query = query.filter(Annotation.identifier_id == identifier.id)
+        # The same order as patron.annotations.
+        return query.order_by(Annotation.timestamp.desc()).all()
 
     @classmethod
     def annotation_container_for(cls, patron, identifier=None):
@@ -81,8 +287,8 @@ class AnnotationWriter:
 
         latest_timestamp = None
         if len(annotations) > 0:
-            # patron.annotations is already sorted by timestamp, so the first
-            # annotation is the most recent.
+            # The annotations are sorted by timestamp, so the first annotation
+            # is the most recent.
             latest_timestamp = annotations[0].timestamp
 
         container = dict()
@@ -140,25 +346,112 @@ class AnnotationWriter:
         item["motivation"] = annotation.motivation
         item["body"] = annotation.content
         if annotation.target:
-            target = json.loads(annotation.target)
-            compacted = jsonld.compact(target, cls.JSONLD_CONTEXT)
-            del compacted["@context"]
-            item["target"] = compacted
+            item["target"] = cls.compact(json.loads(annotation.target))
         if annotation.content:
-            body = json.loads(annotation.content)
-            compacted = jsonld.compact(body, cls.JSONLD_CONTEXT)
-            del compacted["@context"]
-            item["body"] = compacted
+            item["body"] = cls.compact(json.loads(annotation.content))
 
         return item
 
+    @staticmethod
+    @cache
+    def _compactor() -> ContextCompactor:
+        document = load_document(AnnotationWriter.JSONLD_CONTEXT)
+        return ContextCompactor(document["document"]["@context"])
+
+    @classmethod
+    def compact(cls, node):
+        """Compact an expanded JSON-LD node with the annotation context.
+
+        Annotation targets and bodies are compacted directly, which is much
+        faster than going through pyld; pyld is only used for anything the
+        direct compaction doesn't support.
+        """
+        try:
+            return cls._compactor().compact(node)
+        except UnsupportedCompactionError:
+            compacted = jsonld.compact(node, cls.JSONLD_CONTEXT)
+            del compacted["@context"]
+            return compacted
+
+
+class _ParsedAnnotation(NamedTuple):
+    """An annotation from a JSON-LD document, before it's been saved."""
+
+    foreign_id: tuple[str, str | None, str]
+    """The (type, deprecated type, identifier) of the book the annotation is in."""
+    motivation: str
+    target: str
+    content: str | None
+
+    @property
+    def target_key(self) -> str | None:
+        # A book can only have one annotation with each motivation, except for
+        # bookmarks, where it can have one per target.
+        return self.target if self.motivation == Annotation.BOOKMARKING else None
+
 
 class AnnotationParser:
+    # The most annotations that can be posted at once.
+    MAX_BATCH_SIZE = 100
+
+    @classmethod
+    def is_batch(cls, data: str | bytes) -> bool:
+        """Whether a request body is a JSON array of annotations."""
+        return data.lstrip()[:1] in ("[", b"[")
+
     @classmethod
     def parse(cls, _db, data, patron):
         try:
             data = json.loads(data)
-            if "id" in data and data["id"] is None:
+        except ValueError as e:
+            return INVALID_ANNOTATION_FORMAT
+
+        [annotation] = cls._save(_db, [cls._parse_document(data)], patron)
+        return annotation
+
+    @classmethod
+    def parse_batch(
+        cls, _db: Session, data: str | bytes, patron: Patron
+    ) -> list[Annotation | ProblemDetail] | ProblemDetail:
+        """Create or update several annotations at once.
+
+        This is how reading apps sync the annotations made while they were offline.
+        `data` is a JSON array of annotations, and each one is parsed the same way
+        as an annotation posted on its own. The result has an Annotation, or the
+        ProblemDetail explaining why there isn't one, for each of them, in order.
+
+        The number of queries this takes doesn't depend on how many annotations
+        there are.
+        """
+        try:
+            documents = json.loads(data)
+        except ValueError:
+            return INVALID_ANNOTATION_FORMAT
+        if not isinstance(documents, list):
+            return INVALID_ANNOTATION_FORMAT
+        if len(documents) > cls.MAX_BATCH_SIZE:
+            return INVALID_ANNOTATION_FORMAT.detailed(
+                f"No more than {cls.MAX_BATCH_SIZE} annotations can be posted at once."
+            )
+
+        return cls._save(
+            _db,
+            [
+                (
+                    cls._parse_document(document)
+                    if isinstance(document, dict)
+                    else INVALID_ANNOTATION_FORMAT
+                )
+                for document in documents
+            ],
+            patron,
+        )
+
+    @classmethod
+    def _parse_document(cls, data: Any) -> _ParsedAnnotation | ProblemDetail:
+        """Validate an annotation, without looking anything up in the database."""
+        try:
+            if isinstance(data, dict) and "id" in data and data["id"] is None:
                 del data["id"]
             data = jsonld.expand(data)
         except ValueError as e:
@@ -178,9 +471,13 @@ class AnnotationParser:
         if not source or not len(source) == 1:
             return INVALID_ANNOTATION_TARGET
         source = source[0].get("@id")
+        if not source:
+            return INVALID_ANNOTATION_TARGET
 
         try:
-            identifier, ignore = Identifier.parse_urn(_db, source)
+            foreign_id = Identifier.prepare_foreign_type_and_identifier(
+                *Identifier.type_and_identifier_for_urn(source)
+            )
         except ValueError as e:
             return INVALID_ANNOTATION_TARGET
 
@@ -191,40 +488,148 @@ class AnnotationParser:
         if motivation not in Annotation.MOTIVATIONS:
             return INVALID_ANNOTATION_MOTIVATION
 
-        loans = patron.loans
-        loan_identifiers = [loan.license_pool.identifier for loan in loans]
-        if identifier not in loan_identifiers:
-            return INVALID_ANNOTATION_TARGET
-
         content = data.get("http://www.w3.org/ns/oa#hasBody")
         if content and len(content) == 1:
-            content = content[0]
+            content = json.dumps(content[0])
         else:
             content = None
 
-        target = json.dumps(target)
-        extra_kwargs = {}
-        if motivation == Annotation.IDLING:
-            # A given book can only have one 'idling' annotation.
-            pass
-        elif motivation == Annotation.BOOKMARKING:
-            # A given book can only have one 'bookmarking' annotation
-            # per target.
-            extra_kwargs["target"] = target
-
-        annotation, ignore = get_one_or_create(
-            _db,
-            Annotation,
-            patron=patron,
-            identifier=identifier,
+        return _ParsedAnnotation(
+            foreign_id=foreign_id,
             motivation=motivation,
-            on_multiple="interchangeable",
-            **extra_kwargs,
+            target=json.dumps(target),
+            content=content,
         )
-        annotation.target = target
-        if content:
-            annotation.content = json.dumps(content)
-        annotation.active = True
-        annotation.timestamp = utc_now()
 
-        return annotation
+    @classmethod
+    def _loaned_identifiers(
+        cls, _db: Session, patron: Patron, parsed: list[_ParsedAnnotation]
+    ) -> dict[tuple[str, str], Identifier]:
+        """Find the identifiers of the books the annotations are in, as long as
+        the patron has them on loan, keyed by their type and identifier.
+
+        Annotations can only be made in books on loan, so there's no need to
+        look up, or create, an identifier for any other book.
+        """
+        if not parsed:
+            return {}
+        loaned = (
+            select(LicensePool.identifier_id)
+            .join(Loan, Loan.license_pool_id == LicensePool.id)
+            .where(Loan.patron_id == patron.id)
+        )
+        foreign_ids = {p.foreign_id for p in parsed}
+        identifiers = _db.query(Identifier).filter(
+            Identifier.id.in_(loaned),
+            or_(
+                *(
+                    and_(
+                        Identifier.type.in_([t for t in (primary, secondary) if t]),
+                        Identifier.identifier == foreign_identifier,
+                    )
+                    for primary, secondary, foreign_identifier in foreign_ids
+                )
+            ),
+        )
+        return {
+            (identifier.type, identifier.identifier): identifier
+            for identifier in identifiers
+        }
+
+    @classmethod
+    def _existing_annotations(
+        cls,
+        _db: Session,
+        patron: Patron,
+        parsed: list[tuple[Identifier, _ParsedAnnotation]],
+    ) -> dict[tuple[int, str, str | None], Annotation]:
+        """Find the patron's annotations the parsed annotations would replace,
+        keyed by their identifier, motivation and target key."""
+        if not parsed:
+            return {}
+        annotations = _db.query(Annotation).filter(
+            Annotation.patron_id == patron.id,
+            or_(
+                *(
+                    and_(
+                        Annotation.identifier_id == identifier.id,
+                        Annotation.motivation == p.motivation,
+                        (
+                            Annotation.target == p.target_key
+                            if p.target_key is not None
+                            else true()
+                        ),
+                    )
+                    for identifier, p in parsed
+                )
+            ),
+        )
+        existing: dict[tuple[int, str, str | None], Annotation] = {}
+        for annotation in annotations:
+            key = (
+                annotation.identifier_id,
+                annotation.motivation,
+                (
+                    annotation.target
+                    if annotation.motivation == Annotation.BOOKMARKING
+                    else None
+                ),
+            )
+            # Earlier race conditions left some duplicate annotations in the
+            # database. They're interchangeable, so the first one found is used.
+            existing.setdefault(key, annotation)
+        return existing
+
+    @classmethod
+    def _save(
+        cls,
+        _db: Session,
+        results: list[_ParsedAnnotation | ProblemDetail],
+        patron: Patron,
+    ) -> list[Annotation | ProblemDetail]:
+        """Create or update the annotations that were parsed successfully."""
+        parsed = [p for p in results if isinstance(p, _ParsedAnnotation)]
+        identifiers = cls._loaned_identifiers(_db, patron, parsed)
+
+        def identifier_for(p: _ParsedAnnotation) -> Identifier | None:
+            primary, secondary, foreign_identifier = p.foreign_id
+            return identifiers.get((primary, foreign_identifier)) or (
+                identifiers.get((secondary, foreign_identifier)) if secondary else None
+            )
+
+        on_loan = []
+        for p in parsed:
+            identifier = identifier_for(p)
+            if identifier is not None:
+                on_loan.append((identifier, p))
+        existing = cls._existing_annotations(_db, patron, on_loan)
+
+        saved: list[Annotation | ProblemDetail] = []
+        now = utc_now()
+        for result in results:
+            if isinstance(result, ProblemDetail):
+                saved.append(result)
+                continue
+            identifier = identifier_for(result)
+            if identifier is None:
+                saved.append(INVALID_ANNOTATION_TARGET)
+                continue
+
+            key = (identifier.id, result.motivation, result.target_key)
+            annotation = existing.get(key)
+            if annotation is None:
+                annotation = Annotation(
+                    patron=patron, identifier=identifier, motivation=result.motivation
+                )
+                _db.add(annotation)
+                existing[key] = annotation
+            annotation.target = result.target
+            if result.content:
+                annotation.content = result.content
+            annotation.active = True
+            annotation.timestamp = now
+            saved.append(annotation)
+
+        # Flush once, so every new annotation has an ID.
+        _db.flush()
+        return saved
@@ -13,6 +13,7 @@ from palace.manager.api.util.flask import PalaceFlask
 from palace.manager.api.util.profilers import (
     PalaceCProfileProfiler,
     PalacePyInstrumentProfiler,
+    PalaceSQLInstrumentation,
     PalaceXrayProfiler,
 )
 from palace.manager.core.app_server import ErrorHandler
@@ -60,6 +61,7 @@ app.url_map.merge_slashes = False
 PalacePyInstrumentProfiler.configure(app)
 PalaceCProfileProfiler.configure(app)
 PalaceXrayProfiler.configure(app)
+PalaceSQLInstrumentation.configure(app)
 
 
 def initialize_admin(_db: Session | None = None):
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import time
 import uuid
-from dataclasses import dataclass
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from datetime import timedelta
-from typing import TYPE_CHECKING
+from threading import Lock
+from types import MappingProxyType
+from typing import TYPE_CHECKING, ClassVar
 
 from jwcrypto import jwe, jwk
+from sqlalchemy import select
 
 from palace.util.datetime_helpers import utc_now
 from palace.util.log import LoggerMixin
@@ -17,7 +22,7 @@ from palace.manager.api.problem_details import (
 from palace.manager.sqlalchemy.model.key import Key, KeyType
 from palace.manager.sqlalchemy.model.patron import Patron
 from palace.manager.util.problem_detail import ProblemDetailException
-from palace.manager.util.uuid import uuid_encode
+from palace.manager.util.uuid import uuid_decode, uuid_encode
 
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
@@ -29,11 +34,74 @@ class TokenPatronInfo:
     pwd: str
 
 
+@dataclass(frozen=True)
+class _KeyRingSnapshot:
+    keys: Mapping[uuid.UUID, jwk.JWK] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    expires: float = 0.0
+
+
+class JWEKeyRing(LoggerMixin):
+    """
+    A per-process cache of the keys used to encrypt patron access tokens.
+
+    Decrypting a token means looking up the key it names, which would otherwise take a
+    trip to the database on every request authenticated with a token. A key's value
+    never changes, so once a key has been loaded it can be used until it's deleted.
+
+    The ring is loaded from the database when it's first used, when it expires, and
+    whenever a token names a key that isn't in it, so a newly rotated in key is found
+    straight away. A key that has been deleted can still be used until the ring
+    expires.
+    """
+
+    TTL: ClassVar[int] = 60
+    """How many seconds the ring is used before it's loaded again regardless."""
+
+    def __init__(self, ttl: int | None = None) -> None:
+        self.ttl = self.TTL if ttl is None else ttl
+        self._snapshot = _KeyRingSnapshot()
+        self._lock = Lock()
+
+    def get(self, _db: Session, key_id: uuid.UUID) -> jwk.JWK | None:
+        """Get a key by its ID, or None if there is no such key."""
+        snapshot = self._snapshot
+        if time.monotonic() < snapshot.expires and key_id in snapshot.keys:
+            return snapshot.keys[key_id]
+        return self._refresh(_db, snapshot).keys.get(key_id)
+
+    def _refresh(self, _db: Session, stale: _KeyRingSnapshot) -> _KeyRingSnapshot:
+        """Load every key from the database, unless another thread already has."""
+        with self._lock:
+            if self._snapshot is not stale:
+                # Another thread loaded the ring while we waited.
+                return self._snapshot
+            keys = _db.scalars(
+                select(Key).where(Key.type == KeyType.AUTH_TOKEN_JWE)
+            ).all()
+            self._snapshot = _KeyRingSnapshot(
+                keys=MappingProxyType(
+                    {key.id: PatronJWEAccessTokenProvider.get_jwk(key) for key in keys}
+                ),
+                expires=time.monotonic() + self.ttl,
+            )
+            self.log.debug(f"Loaded {len(keys)} patron access token keys.")
+            return self._snapshot
+
+    def clear(self) -> None:
+        """Throw away the loaded keys, so they are loaded again when next needed."""
+        with self._lock:
+            self._snapshot = _KeyRingSnapshot()
+
+
 class PatronJWEAccessTokenProvider(LoggerMixin):
     """Provide JWE based access tokens for patron auth"""
 
     CTY = "pv1"
 
+    key_ring: ClassVar[JWEKeyRing] = JWEKeyRing()
+
     @classmethod
     def generate_jwk(cls, key_id: uuid.UUID) -> str:
         """Generate a new key compatible with the token encyption type"""
@@ -147,7 +215,11 @@ class PatronJWEAccessTokenProvider(LoggerMixin):
 
         kid = token.jose_header.get("kid")
         try:
-            key = cls.get_key(_db, kid)
+            key = (
+                cls.key_ring.get(_db, uuid_decode(kid))
+                if isinstance(kid, str)
+                else None
+            )
         except ValueError:
             key = None
 
@@ -157,7 +229,7 @@ class PatronJWEAccessTokenProvider(LoggerMixin):
             )
 
         try:
-            token.decrypt(cls.get_jwk(key))
+            token.decrypt(key)
         except jwe.InvalidJWEData:
             raise ProblemDetailException(
                 problem_detail=PATRON_AUTH_ACCESS_TOKEN_INVALID
@@ -191,6 +263,10 @@ class PatronJWEAccessTokenProvider(LoggerMixin):
         two days.
         """
         two_days_ago = utc_now() - timedelta(days=2)
-        return Key.delete_old_keys(
+        deleted = Key.delete_old_keys(
             _db, KeyType.AUTH_TOKEN_JWE, keep=2, older_than=two_days_ago
         )
+        # Stop using the deleted keys in this process straight away. Other
+        # processes stop using them once their key rings expire.
+        cls.key_ring.clear()
+        return deleted
@@ -55,6 +55,9 @@ class AnnotationController(CirculationManagerController):
             return Response(content, status=200, headers=headers)
 
         data = flask.request.data
+        if AnnotationParser.is_batch(data):
+            return self._post_batch(data, patron, headers)
+
         annotation = AnnotationParser.parse(self._db, data, patron)
 
         if isinstance(annotation, ProblemDetail):
@@ -66,6 +69,29 @@ class AnnotationController(CirculationManagerController):
         headers["Content-Type"] = AnnotationWriter.CONTENT_TYPE
         return Response(content, status_code, headers)
 
+    def _post_batch(self, data, patron, headers):
+        """Create or update a JSON array of annotations.
+
+        The response is a JSON array with the created annotation, or the problem
+        detail explaining why it wasn't created, for each of them in order, so
+        one annotation that can't be synced doesn't stop the others.
+        """
+        results = AnnotationParser.parse_batch(self._db, data, patron)
+
+        if isinstance(results, ProblemDetail):
+            return results
+
+        items = [
+            (
+                json.loads(result.response[0])
+                if isinstance(result, ProblemDetail)
+                else AnnotationWriter.detail(result)
+            )
+            for result in results
+        ]
+        headers["Content-Type"] = "application/json"
+        return Response(json.dumps(items), 200, headers)
+
     def container_for_work(self, identifier_type, identifier):
         id_obj, ignore = Identifier.for_foreign_id(
             self._db, identifier_type, identifier
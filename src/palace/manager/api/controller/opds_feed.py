@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import flask
 from flask import Response, redirect, url_for
+from werkzeug import Response as wkResponse
 
 from palace.manager.api.controller.circulation_manager import (
     CirculationManagerController,
@@ -16,12 +17,15 @@ from palace.manager.feed.facets.crawlable import CrawlableFacets
 from palace.manager.feed.facets.feed import FeaturedFacets
 from palace.manager.feed.facets.search import SearchFacets
 from palace.manager.feed.navigation import NavigationFeed
-from palace.manager.feed.opds import NavigationFacets
+from palace.manager.feed.opds import NavigationFacets, get_serializer
+from palace.manager.feed.snapshot import SnapshotFormat, crawlable_snapshot_url
 from palace.manager.feed.worklist.crawlable import (
     CrawlableCollectionBasedLane,
     CrawlableCustomListBasedLane,
 )
 from palace.manager.search.pagination import Pagination, SortKeyPagination
+from palace.manager.service.redis.exception import TRANSIENT_REDIS_ERRORS
+from palace.manager.service.redis.models.crawlable_feed import CrawlableFeedSnapshot
 from palace.manager.sqlalchemy.model.collection import Collection
 from palace.manager.sqlalchemy.model.customlist import CustomList
 from palace.manager.util.flask_util import OPDSFeedResponse
@@ -236,7 +240,7 @@ class OPDSFeedController(CirculationManagerController):
 
     def _crawlable_feed(
         self, title, url, worklist, annotator=None, feed_class=OPDSAcquisitionFeed
-    ) -> OPDSFeedResponse | ProblemDetail:
+    ) -> OPDSFeedResponse | wkResponse | ProblemDetail:
         """Helper method to create a crawlable feed.
 
         :param title: The title to use for the feed.
@@ -247,6 +251,10 @@ class OPDSFeedController(CirculationManagerController):
         :param feed_class: A drop-in replacement for OPDSAcquisitionFeed
             for use in tests.
         """
+        snapshot_url = self._crawlable_snapshot_url(worklist)
+        if snapshot_url is not None:
+            return redirect(snapshot_url)
+
         pagination = load_pagination_from_request(
             SortKeyPagination, default_size=Pagination.DEFAULT_CRAWLABLE_SIZE
         )
@@ -280,6 +288,45 @@ class OPDSFeedController(CirculationManagerController):
             mime_types=flask.request.accept_mimetypes, max_age=worklist.max_cache_age()
         )
 
+    def _crawlable_snapshot_url(self, worklist) -> str | None:
+        """Find the static snapshot of a crawlable feed to send the client to.
+
+        Only a request for the first page of the feed, with no facets, is sent to the
+        snapshot. The rest of the snapshot links to itself, so a crawler that starts
+        there never comes back. Any request the snapshot can't answer is served live.
+
+        :return: The URL of the first page of the snapshot, in the format the client
+            asked for, or None if the request should be served live.
+        """
+        feed_key = getattr(worklist, "snapshot_key", None)
+        if feed_key is None or flask.request.args:
+            return None
+
+        storage = self.manager.services.storage.public()
+        if storage is None:
+            return None
+
+        snapshot_format = SnapshotFormat.for_serializer(
+            get_serializer(flask.request.accept_mimetypes)
+        )
+        if snapshot_format is None:
+            return None
+
+        try:
+            return crawlable_snapshot_url(
+                storage,
+                CrawlableFeedSnapshot(self.redis_client, feed_key),
+                snapshot_format,
+            )
+        except TRANSIENT_REDIS_ERRORS:
+            # The live feed can still be served without Redis.
+            self.log.warning(
+                "Could not look up crawlable feed snapshot; Redis appears to be "
+                "temporarily unavailable.",
+                exc_info=True,
+            )
+            return None
+
     def _load_search_facets(self, lane):
         entrypoints = list(get_request_library().entrypoints)
         if len(entrypoints) > 1:
@@ -179,7 +179,13 @@ class WorkController(CirculationManagerController):
 
         try:
             lane_name = f"Books Related to {work.title} by {work.author}"
-            lane = RelatedBooksLane(library, work, lane_name, novelist_api=novelist_api)
+            lane = RelatedBooksLane(
+                library,
+                work,
+                lane_name,
+                novelist_api=novelist_api,
+                redis_client=self.redis_client,
+            )
         except ValueError as e:
             # No related books were found.
             return NO_SUCH_LANE.detailed(str(e))
@@ -242,6 +248,7 @@ class WorkController(CirculationManagerController):
                 work=work,
                 display_name=lane_name,
                 novelist_api=novelist_api,
+                redis_client=self.redis_client,
             )
         except CannotLoadConfiguration as e:
             # NoveList isn't configured.
@@ -1,6 +1,10 @@
-from io import BytesIO
+import csv
+from collections.abc import Iterator
+from datetime import date
+from io import BytesIO, StringIO
 
-import unicodecsv as csv
+import unicodecsv
+from sqlalchemy.orm import Session
 from sqlalchemy.sql import func, select
 from sqlalchemy.sql.expression import and_, case, join, literal_column, or_
 
@@ -19,39 +23,73 @@ from palace.manager.sqlalchemy.model.work import Work, WorkGenre
 class LocalAnalyticsExporter:
     """Export large numbers of analytics events in CSV format."""
 
+    HEADER = [
+        "time",
+        "event",
+        "identifier",
+        "identifier_type",
+        "title",
+        "author",
+        "fiction",
+        "audience",
+        "publisher",
+        "imprint",
+        "language",
+        "target_age",
+        "genres",
+        "collection_name",
+        "library_short_name",
+        "library_name",
+        "medium",
+        "distributor",
+        "open_access",
+    ]
+
+    # How many rows are fetched from the database, and written out, at a time when
+    # streaming an export.
+    ROWS_PER_CHUNK = 1000
+
     def export(self, _db, start, end, library=None):
         # Get the results from the database.
         query = self.analytics_query(start, end, library)
         results = _db.execute(query)
 
         # Write the CSV file to a BytesIO.
-        header = [
-            "time",
-            "event",
-            "identifier",
-            "identifier_type",
-            "title",
-            "author",
-            "fiction",
-            "audience",
-            "publisher",
-            "imprint",
-            "language",
-            "target_age",
-            "genres",
-            "collection_name",
-            "library_short_name",
-            "library_name",
-            "medium",
-            "distributor",
-            "open_access",
-        ]
         output = BytesIO()
-        writer = csv.writer(output, encoding="utf-8")
-        writer.writerow(header)
+        writer = unicodecsv.writer(output, encoding="utf-8")
+        writer.writerow(self.HEADER)
         writer.writerows(results)
         return output.getvalue().decode("utf-8")
 
+    def export_stream(
+        self,
+        _db: Session,
+        start: date | str,
+        end: date | str,
+        library: Library | None = None,
+        rows_per_chunk: int = ROWS_PER_CHUNK,
+    ) -> Iterator[str]:
+        """Export the same CSV file as export(), a chunk at a time.
+
+        The rows are read with a server-side cursor, so no more than
+        rows_per_chunk of them are held in memory however long the
+        export is.
+        """
+        query = self.analytics_query(start, end, library).execution_options(
+            yield_per=rows_per_chunk
+        )
+        output = StringIO()
+        writer = csv.writer(output)
+        writer.writerow(self.HEADER)
+        for rows in _db.execute(query).partitions():
+            writer.writerows(rows)
+            yield output.getvalue()
+            output.seek(0)
+            output.truncate()
+        if output.tell():
+            # There were no rows, so the header hasn't been sent yet.
+            yield output.getvalue()
+
     def analytics_query(self, start, end, library=None):
         """Build a database query that fetches rows of analytics data.
 
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import math
 from datetime import datetime, timedelta
-from typing import Any, Literal
+from typing import Any, Literal, Self
 
 from pydantic import BaseModel, ConfigDict, PositiveInt
 
@@ -34,6 +35,19 @@ class OAuthTokenResponse(BaseModel):
         # will get a new token before the current one expires.
         self._expires_at = utc_now() + timedelta(seconds=self.expires_in * 0.95)
 
+    @classmethod
+    def from_expiry(cls, access_token: str, expires: datetime) -> Self:
+        """
+        Recreate a bearer token whose expiration time is already known,
+        for example one that was cached.
+        """
+        expires_in = max(math.ceil((expires - utc_now()).total_seconds()), 1)
+        token = cls(
+            access_token=access_token, expires_in=expires_in, token_type="Bearer"
+        )
+        token._expires_at = expires
+        return token
+
     @property
     def expired(self) -> bool:
         """
@@ -5,6 +5,8 @@ from pathlib import Path
 
 from flask import Flask, g, request
 
+from palace.manager.sqlalchemy import query_instrumentation
+
 
 class PalaceProfiler:
     ENVIRONMENT_VARIABLE: str
@@ -101,3 +103,56 @@ class PalaceXrayProfiler(PalaceProfiler):
         logging.getLogger(cls.__name__).info("Configuring app with AWS XRAY.")
         PalaceXrayMiddleware.setup_xray(xray_recorder)
         PalaceXrayMiddleware(app, xray_recorder)
+
+
+class PalaceSQLInstrumentation(PalaceProfiler):
+    """
+    Count and time the SQL statements run by each request, and log them.
+
+    When the app is in debug mode the stats are also sent back in response headers.
+    """
+
+    ENVIRONMENT_VARIABLE = query_instrumentation.ENVIRONMENT_VARIABLE
+    COUNT_HEADER = "X-Palace-Query-Count"
+    DURATION_HEADER = "X-Palace-Query-Time"
+    SLOWEST_HEADER = "X-Palace-Query-Slowest"
+
+    @classmethod
+    def configure(cls, app: Flask):
+        if not cls.enabled():
+            return
+
+        log = logging.getLogger(cls.__name__)
+        log.info("Configuring app with SQL query instrumentation.")
+        query_instrumentation.install()
+
+        @app.before_request
+        def before_request():
+            query_instrumentation.start_collecting()
+
+        @app.after_request
+        def after_request(response):
+            stats = query_instrumentation.stop_collecting()
+            if stats is None:
+                return response
+
+            log.info(
+                f"{request.method} {request.path} ran {stats.count} queries "
+                f"in {stats.duration_ms}ms.",
+                extra={"palace_sql": stats.log_data()},
+            )
+            if app.debug:
+                response.headers[cls.COUNT_HEADER] = str(stats.count)
+                response.headers[cls.DURATION_HEADER] = f"{stats.duration_ms}ms"
+                if stats.slowest:
+                    # Only the hash from the slowest statement's fingerprint. The
+                    # whole fingerprint is in the logs.
+                    digest, _ = stats.slowest[0][1].split(" ", 1)
+                    response.headers[cls.SLOWEST_HEADER] = digest
+            return response
+
+        @app.teardown_request
+        def teardown_request(exception):
+            # Don't leave a collector behind if the request failed before the
+            # stats were logged.
+            query_instrumentation.stop_collecting()
@@ -13,9 +13,11 @@ import logging
 from logging.handlers import WatchedFileHandler
 from typing import Any
 
-from celery.signals import setup_logging
+from celery import Task
+from celery.signals import setup_logging, task_postrun, task_prerun
 
 from palace.manager.service.container import container_instance
+from palace.manager.sqlalchemy import query_instrumentation
 
 
 @setup_logging.connect
@@ -36,6 +38,25 @@ def celery_logger_setup(loglevel: int, logfile: str | None, **kwargs: Any) -> No
         root_logger.addHandler(handler)
 
 
+def start_task_query_stats(**kwargs: Any) -> None:
+    query_instrumentation.start_collecting()
+
+
+def log_task_query_stats(task: Task, **kwargs: Any) -> None:
+    stats = query_instrumentation.stop_collecting()
+    if stats is not None:
+        logging.getLogger(__name__).info(
+            f"Task {task.name} ran {stats.count} queries in {stats.duration_ms}ms.",
+            extra={"palace_sql": stats.log_data()},
+        )
+
+
+if query_instrumentation.enabled():
+    query_instrumentation.install()
+    task_prerun.connect(start_task_query_stats)
+    task_postrun.connect(log_task_query_stats)
+
+
 services = container_instance()
 services.init_resources()
 import palace.manager.celery.tasks  # noqa: autoflake
@@ -0,0 +1,225 @@
+import datetime
+import logging
+
+from celery import shared_task
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from palace.manager.api.authenticator import LibraryAuthenticator
+from palace.manager.api.circulation.dispatcher import CirculationApiDispatcher
+from palace.manager.celery.task import Task
+from palace.manager.core.config import CannotLoadConfiguration
+from palace.manager.feed.annotator.circulation import (
+    CirculationManagerAnnotator,
+    LibraryAnnotator,
+)
+from palace.manager.feed.facets.crawlable import CrawlableFacets
+from palace.manager.feed.snapshot import CrawlableFeedSnapshotter
+from palace.manager.feed.worklist.crawlable import (
+    CrawlableCollectionBasedLane,
+    CrawlableCustomListBasedLane,
+    CrawlableLane,
+)
+from palace.manager.service.celery.celery import QueueNames
+from palace.manager.service.integration_registry.base import LookupException
+from palace.manager.service.integration_registry.license_providers import (
+    LicenseProvidersRegistry,
+)
+from palace.manager.service.redis.models.crawlable_feed import CrawlableFeedSnapshot
+from palace.manager.service.redis.models.lock import RedisLock
+from palace.manager.sqlalchemy.model.collection import Collection
+from palace.manager.sqlalchemy.model.customlist import CustomList
+from palace.manager.sqlalchemy.model.library import Library
+from palace.manager.sqlalchemy.util import get_one
+from palace.manager.util.problem_detail import ProblemDetailException
+
+CRAWLABLE_FEED_SNAPSHOT_LOCK_TIMEOUT = datetime.timedelta(hours=1)
+
+log = logging.getLogger(__name__)
+
+
+@shared_task(queue=QueueNames.default, bind=True)
+def crawlable_feed_snapshots(task: Task) -> None:
+    """
+    Queue a snapshot of every crawlable feed: one for each library, each collection and
+    each custom list that belongs to a library.
+    """
+    if task.services.storage.public() is None:
+        task.log.info(
+            "No public storage configured. Skipping crawlable feed snapshots."
+        )
+        return
+
+    with task.session() as session:
+        library_ids = session.scalars(select(Library.id).order_by(Library.id)).all()
+        collection_ids = session.scalars(
+            select(Collection.id)
+            .where(Collection.marked_for_deletion == False)
+            .order_by(Collection.id)
+        ).all()
+        customlist_ids = session.scalars(
+            select(CustomList.id)
+            .where(CustomList.library_id != None)
+            .order_by(CustomList.id)
+        ).all()
+
+    for library_id in library_ids:
+        crawlable_feed_snapshot.delay(library_id=library_id)
+    for collection_id in collection_ids:
+        crawlable_feed_snapshot.delay(collection_id=collection_id)
+    for customlist_id in customlist_ids:
+        crawlable_feed_snapshot.delay(customlist_id=customlist_id)
+
+    task.log.info(
+        f"Queued crawlable feed snapshots for {len(library_ids)} libraries, "
+        f"{len(collection_ids)} collections and {len(customlist_ids)} custom lists."
+    )
+
+
+def crawlable_lane(
+    session: Session,
+    *,
+    library_id: int | None = None,
+    collection_id: int | None = None,
+    customlist_id: int | None = None,
+) -> tuple[CrawlableLane, str | None] | None:
+    """
+    Build the lane behind a crawlable feed, the same way the crawlable feed routes do.
+
+    :return: The lane and the title of its feed, or None if whatever the feed is for no
+        longer exists.
+    """
+    if library_id is not None:
+        library = get_one(session, Library, id=library_id)
+        if library is None:
+            return None
+        library_lane = CrawlableCollectionBasedLane()
+        library_lane.initialize(library)
+        return library_lane, library.name
+    if collection_id is not None:
+        collection = get_one(session, Collection, id=collection_id)
+        if collection is None:
+            return None
+        collection_lane = CrawlableCollectionBasedLane()
+        collection_lane.initialize([collection])
+        return collection_lane, collection.name
+    if customlist_id is not None:
+        customlist = get_one(session, CustomList, id=customlist_id)
+        if customlist is None or customlist.library is None:
+            return None
+        list_lane = CrawlableCustomListBasedLane()
+        list_lane.initialize(customlist.library, customlist)
+        return list_lane, customlist.name
+    raise ValueError("One of library_id, collection_id or customlist_id is required.")
+
+
+def crawlable_annotator(
+    session: Session,
+    lane: CrawlableLane,
+    facets: CrawlableFacets,
+    registry: LicenseProvidersRegistry,
+) -> CirculationManagerAnnotator:
+    """
+    Build the annotator for a crawlable feed, the same way CirculationManager.annotator
+    does for the live feed.
+
+    Only what the annotator needs is loaded: the authenticator and the circulation APIs
+    of the feed's own library, rather than those of every library.
+    """
+    library = lane.get_library(session)
+    if library is None:
+        return CirculationManagerAnnotator(lane)
+
+    collection_apis = {}
+    for collection in library.associated_collections:
+        try:
+            collection_apis[collection.id] = registry.from_collection(
+                session, collection
+            )
+        except (
+            CannotLoadConfiguration,
+            ProblemDetailException,
+            LookupException,
+        ) as exception:
+            # The live feed leaves out the APIs it can't load, so the snapshot does too.
+            log.warning(
+                f"Unable to load the API for collection {collection.name}: {exception}"
+            )
+
+    authenticator = LibraryAuthenticator.from_config(session, library)
+    return LibraryAnnotator(
+        CirculationApiDispatcher(session, library, collection_apis),
+        lane,
+        library,
+        top_level_title="All Books",
+        library_identifies_patrons=authenticator.identifies_individuals,
+        library_allows_anonymous_access=authenticator.allows_anonymous_access,
+        facets=facets,
+    )
+
+
+@shared_task(queue=QueueNames.default, bind=True)
+def crawlable_feed_snapshot(
+    task: Task,
+    *,
+    library_id: int | None = None,
+    collection_id: int | None = None,
+    customlist_id: int | None = None,
+) -> None:
+    """
+    Bring the static snapshot of a single crawlable feed up to date.
+
+    See palace.manager.feed.snapshot.CrawlableFeedSnapshotter.
+    """
+    storage = task.services.storage.public()
+    if storage is None:
+        task.log.info("No public storage configured. Skipping crawlable feed snapshot.")
+        return
+
+    redis_client = task.services.redis.client()
+    base_url = task.services.config.sitewide.base_url()
+
+    # Annotators build their links with url_for, so they need the app's routes and a
+    # request context to do it in.
+    from palace.manager.api.app import app
+
+    with task.session() as session:
+        lane_and_title = crawlable_lane(
+            session,
+            library_id=library_id,
+            collection_id=collection_id,
+            customlist_id=customlist_id,
+        )
+        if lane_and_title is None:
+            task.log.info(
+                "The feed no longer exists. Skipping crawlable feed snapshot."
+            )
+            return
+        lane, title = lane_and_title
+        feed_key = lane.snapshot_key
+        assert feed_key is not None
+
+        lock = RedisLock(
+            redis_client,
+            ["CrawlableFeedSnapshot", feed_key],
+            lock_timeout=CRAWLABLE_FEED_SNAPSHOT_LOCK_TIMEOUT,
+        )
+        with lock.lock(), app.test_request_context(base_url=base_url):
+            facets = CrawlableFacets.default(lane.get_library(session))
+            snapshotter = CrawlableFeedSnapshotter(
+                session,
+                lane,
+                feed_key,
+                title or feed_key,
+                facets,
+                crawlable_annotator(
+                    session,
+                    lane,
+                    facets,
+                    task.services.integration_registry().license_providers(),
+                ),
+                task.services.search.index(),
+                storage,
+                CrawlableFeedSnapshot(redis_client, feed_key),
+            )
+            snapshotter.run()
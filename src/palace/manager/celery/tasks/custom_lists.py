@@ -210,7 +210,7 @@ def _setup_first_invocation(
 
     if custom_list.auto_update_status == CustomList.INIT:
         # Back-populate from page 1.  Re-adding already-present page-1 entries is
-        # safe because add_entry uses get_one_or_create (no duplicates).
+        # safe because add_works skips works already on the list (no duplicates).
         task.log.info(
             f"Custom list {custom_list.name!r}: INIT — back-populating all entries."
         )
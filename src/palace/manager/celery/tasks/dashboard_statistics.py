@@ -0,0 +1,16 @@
+from celery import shared_task
+
+from palace.manager.api.admin.dashboard_stats import refresh_statistics
+from palace.manager.celery.task import Task
+from palace.manager.service.celery.celery import QueueNames
+
+
+@shared_task(queue=QueueNames.default, bind=True)
+def refresh_dashboard_statistics(task: Task) -> None:
+    """Recompute the summary tables the admin dashboard statistics are read from."""
+    with task.transaction() as session:
+        as_of = refresh_statistics(session)
+        if as_of is None:
+            task.log.info("Dashboard statistics are already being refreshed. Skipping.")
+        else:
+            task.log.info(f"Refreshed dashboard statistics as of {as_of}.")
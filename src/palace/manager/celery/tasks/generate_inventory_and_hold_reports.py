@@ -6,7 +6,7 @@ import logging
 import tempfile
 import uuid
 import zipfile
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime
 from pathlib import Path
 from typing import IO, Any
@@ -286,65 +286,113 @@ def _cell_value(key: str, value: Any, stringify_cols: frozenset[str]) -> Any:
     return value
 
 
-def _write_csv_rows(
-    csv_file: IO[str],
-    keys: list[str],
-    rows: list[dict[str, Any]],
-    stringify_cols: frozenset[str],
-) -> None:
-    writer = csv.writer(csv_file, delimiter=",", quoting=csv.QUOTE_NONNUMERIC)
-    writer.writerow(keys)
-    for row in rows:
-        writer.writerow(
-            [_cell_value(key, row.get(key, ""), stringify_cols) for key in keys]
+class _CsvReportWriter:
+    """Write report rows to a CSV file, one at a time."""
+
+    def __init__(
+        self, csv_file: IO[str], keys: list[str], stringify_cols: frozenset[str]
+    ) -> None:
+        self._file = csv_file
+        self._keys = keys
+        self._stringify_cols = stringify_cols
+        self._writer = csv.writer(csv_file, delimiter=",", quoting=csv.QUOTE_NONNUMERIC)
+        self._writer.writerow(keys)
+
+    def write_row(self, row: dict[str, Any]) -> None:
+        self._writer.writerow(
+            [
+                _cell_value(key, row.get(key, ""), self._stringify_cols)
+                for key in self._keys
+            ]
         )
-    csv_file.flush()
 
+    def close(self) -> None:
+        self._file.flush()
 
-def _write_excel_rows(
-    excel_file: IO[bytes],
-    keys: list[str],
-    rows: list[dict[str, Any]],
-    stringify_cols: frozenset[str],
-) -> None:
-    wb = Workbook(write_only=True)
-    ws = wb.create_sheet()
 
-    header_row = []
-    for key in keys:
-        cell = WriteOnlyCell(ws, value=key)
-        cell.number_format = FORMAT_TEXT
-        header_row.append(cell)
-    ws.append(header_row)
+class _ExcelReportWriter:
+    """Write report rows to a write-only Excel workbook, one at a time.
 
-    for row in rows:
-        data_row = []
+    A write-only workbook spools its rows to a temporary file as they are
+    appended, so the rows are not held in memory until the workbook is saved.
+    """
+
+    def __init__(
+        self, excel_file: IO[bytes], keys: list[str], stringify_cols: frozenset[str]
+    ) -> None:
+        self._file = excel_file
+        self._keys = keys
+        self._stringify_cols = stringify_cols
+        self._workbook = Workbook(write_only=True)
+        self._sheet = self._workbook.create_sheet()
+
+        header_row = []
         for key in keys:
-            value = _cell_value(key, row.get(key, ""), stringify_cols)
-            cell = WriteOnlyCell(ws, value=value)
-            if key in stringify_cols:
+            cell = WriteOnlyCell(self._sheet, value=key)
+            cell.number_format = FORMAT_TEXT
+            header_row.append(cell)
+        self._sheet.append(header_row)
+
+    def write_row(self, row: dict[str, Any]) -> None:
+        data_row = []
+        for key in self._keys:
+            value = _cell_value(key, row.get(key, ""), self._stringify_cols)
+            cell = WriteOnlyCell(self._sheet, value=value)
+            if key in self._stringify_cols:
                 cell.number_format = FORMAT_TEXT
             data_row.append(cell)
-        ws.append(data_row)
+        self._sheet.append(data_row)
 
-    wb.save(excel_file)
-    excel_file.flush()
+    def close(self) -> None:
+        self._workbook.save(self._file)
+        self._file.flush()
 
 
-def _fetch_report_rows(
+_ReportWriter = _CsvReportWriter | _ExcelReportWriter
+
+# How many report rows are fetched from the database at a time.
+REPORT_ROWS_PER_FETCH = 1000
+
+
+def _stream_report_rows(
     db: Session,
     query: Select,
     sql_params: dict[str, Any],
     row_transform: Callable[[dict[str, Any]], dict[str, Any]] | None,
-) -> tuple[list[str], list[dict[str, Any]]]:
-    """Execute a query and buffer all rows as dicts, applying an optional transform."""
-    result = db.execute(query, sql_params)
+) -> tuple[list[str], Iterator[dict[str, Any]]]:
+    """Execute a query with a server-side cursor and stream its rows as dicts,
+    applying an optional transform.
+
+    Only REPORT_ROWS_PER_FETCH rows are held in memory at a time.
+    """
+    result = db.execute(
+        query.execution_options(yield_per=REPORT_ROWS_PER_FETCH), sql_params
+    )
     keys = list(result.keys())
-    if row_transform is None:
-        rows = [dict(row._mapping) for row in result]
-    else:
-        rows = [row_transform(dict(row._mapping)) for row in result]
-    return keys, rows
+
+    def rows() -> Iterator[dict[str, Any]]:
+        for row in result:
+            data = dict(row._mapping)
+            yield data if row_transform is None else row_transform(data)
+
+    return keys, rows()
+
+
+def _write_report_rows(
+    db: Session,
+    sql_params: dict[str, Any],
+    query: Select,
+    writer_factories: Iterable[Callable[[list[str]], _ReportWriter]],
+    row_transform: Callable[[dict[str, Any]], dict[str, Any]] | None,
+) -> None:
+    """Stream the rows of a query into each of the given writers, in a single pass."""
+    keys, rows = _stream_report_rows(db, query, sql_params, row_transform)
+    writers = [factory(keys) for factory in writer_factories]
+    for row in rows:
+        for writer in writers:
+            writer.write_row(row)
+    for writer in writers:
+        writer.close()
 
 
 def _write_reports(
@@ -356,15 +404,24 @@ def _write_reports(
     row_transform: Callable[[dict[str, Any]], dict[str, Any]] | None = None,
     columns_to_stringify: Iterable[str] | None = None,
 ) -> None:
-    """Execute a query once and write both CSV and Excel from the buffered results.
+    """Execute a query once and write both CSV and Excel from the streamed results.
 
     This avoids running the same heavy query twice and guarantees that the CSV
-    and Excel files contain identical data from the same query execution.
+    and Excel files contain identical data from the same query execution. Each
+    row is written to both files as it is fetched, so memory use doesn't grow
+    with the size of the report.
     """
     stringify_cols = frozenset(columns_to_stringify or ())
-    keys, rows = _fetch_report_rows(db, query, sql_params, row_transform)
-    _write_csv_rows(csv_file, keys, rows, stringify_cols)
-    _write_excel_rows(excel_file, keys, rows, stringify_cols)
+    _write_report_rows(
+        db,
+        sql_params,
+        query,
+        [
+            lambda keys: _CsvReportWriter(csv_file, keys, stringify_cols),
+            lambda keys: _ExcelReportWriter(excel_file, keys, stringify_cols),
+        ],
+        row_transform,
+    )
 
 
 def generate_csv_report(
@@ -387,8 +444,13 @@ def generate_csv_report(
         message_prefix=f"generate_csv_report - {csv_file.name}",
         skip_start=True,
     ):
-        keys, rows = _fetch_report_rows(db, query, sql_params, row_transform)
-        _write_csv_rows(csv_file, keys, rows, stringify_cols)
+        _write_report_rows(
+            db,
+            sql_params,
+            query,
+            [lambda keys: _CsvReportWriter(csv_file, keys, stringify_cols)],
+            row_transform,
+        )
         log.debug(f"report written to {csv_file.name}")
 
 
@@ -413,8 +475,13 @@ def generate_excel_report(
         message_prefix=f"generate_excel_report - {excel_file.name}",
         skip_start=True,
     ):
-        keys, rows = _fetch_report_rows(db, query, sql_params, row_transform)
-        _write_excel_rows(excel_file, keys, rows, stringify_cols)
+        _write_report_rows(
+            db,
+            sql_params,
+            query,
+            [lambda keys: _ExcelReportWriter(excel_file, keys, stringify_cols)],
+            row_transform,
+        )
         log.debug(f"report written to {excel_file.name}")
 
 
@@ -2,8 +2,11 @@ from celery import shared_task
 from sqlalchemy import select
 
 from palace.manager.celery.task import Task
+from palace.manager.core.config import CannotLoadConfiguration
 from palace.manager.integration.metadata.novelist import NoveListAPI
 from palace.manager.service.celery.celery import QueueNames
+from palace.manager.service.redis.models.novelist import NoveListRecommendationCache
+from palace.manager.sqlalchemy.model.identifier import Identifier
 from palace.manager.sqlalchemy.model.integration import (
     IntegrationConfiguration,
     IntegrationLibraryConfiguration,
@@ -64,3 +67,42 @@ def update_novelists_by_library(task: Task, library_id: int) -> None:
             f"Update complete for  library('{library.name}' (id={library.id}). "
             f"Novelist API Response:\n{response}"
         )
+
+
+@shared_task(queue=QueueNames.default, bind=True)
+def refresh_novelist_recommendations(
+    task: Task, library_id: int, identifier_id: int
+) -> None:
+    """Look up the NoveList recommendations for a book again, and cache them."""
+    cache = NoveListRecommendationCache(task.services.redis().client(), library_id)
+    try:
+        with task.session() as session:
+            library = Library.by_id(session, id=library_id)
+            identifier = session.get(Identifier, identifier_id)
+            if not library or not identifier:
+                task.log.error(
+                    f"Library (id={library_id}) or identifier (id={identifier_id}) "
+                    f"not found. Unable to refresh recommendations."
+                )
+                return
+
+            try:
+                api = NoveListAPI.from_config(library)
+            except CannotLoadConfiguration:
+                task.log.info(
+                    f"NoveList is no longer configured for library('{library.name}' "
+                    f"(id={library.id}). Dropping cached recommendations."
+                )
+                cache.delete(identifier_id)
+                return
+
+            recommendations = api.lookup_recommendations(identifier)
+            cache.set(identifier_id, recommendations)
+            task.log.info(
+                f"Refreshed {len(recommendations)} NoveList recommendations for "
+                f"{identifier!r} in library('{library.name}' (id={library.id})."
+            )
+    finally:
+        # Whether or not the refresh worked, the next request for a stale entry
+        # can queue another one.
+        cache.release_refresh(identifier_id)
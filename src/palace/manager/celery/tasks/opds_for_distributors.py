@@ -78,7 +78,9 @@ def import_collection(
 
     with task.session() as session:
         collection = load_from_id(session, Collection, collection_id)
-        importer = importer_from_collection(collection, registry)
+        importer = importer_from_collection(
+            collection, registry, task.services.redis.client()
+        )
 
         return opds_import_task(
             task,
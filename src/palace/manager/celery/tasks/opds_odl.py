@@ -1,9 +1,9 @@
 import datetime
 
 from celery import shared_task
-from sqlalchemy import delete, select
+from sqlalchemy import delete, func, select, update
 from sqlalchemy.exc import NoResultFound
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, lazyload
 
 from palace.util.datetime_helpers import utc_now
 
@@ -110,19 +110,37 @@ def _recalculate_holds_for_licensepool(
     license_pool: LicensePool,
     reservation_period: datetime.timedelta,
 ) -> tuple[int, list[AnalyticsEventData]]:
-    # We take out row level locks on all the licenses and holds for this license pool, so that
+    # We take out row level locks on all the licenses for this license pool, so that
     # everything is in a consistent state while we update the hold queue. This means we should be
     # quickly committing the transaction, to avoid contention or deadlocks.
+    session = Session.object_session(license_pool)
     _lock_licenses(license_pool)
-    holds = license_pool.get_active_holds(for_update=True)
 
     license_pool.update_availability_from_licenses()
-    reserved = license_pool.licenses_reserved
+    reserved = license_pool.licenses_reserved or 0
 
-    ready = holds[:reserved]
-    waiting = holds[reserved:]
-    updated = 0
+    active_holds = (
+        select(Hold)
+        .where(Hold.license_pool_id == license_pool.id)
+        .where(LicensePool.active_hold_criteria())
+        .order_by(Hold.start, Hold.id)
+    )
 
+    # Only the holds that have a copy reserved for them are loaded, since each of them
+    # needs an analytics event if the hold just became available.
+    ready: list[Hold] = []
+    if reserved:
+        ready = (
+            session.execute(
+                active_holds.limit(reserved)
+                .options(lazyload(Hold.patron))
+                .with_for_update()
+            )
+            .scalars()
+            .all()
+        )
+
+    updated = 0
     events = []
 
     # These holds have a copy reserved for them.
@@ -141,14 +159,30 @@ def _recalculate_holds_for_licensepool(
                     patron=hold.patron,
                 )
             )
-
-    # Update the position for the remaining holds.
-    for idx, hold in enumerate(waiting):
-        position = idx + 1
-        if hold.position != position:
-            hold.position = position
-            hold.end = None
-            updated += 1
+    session.flush()
+
+    # The remaining holds are numbered in a single statement, no matter how long the
+    # queue is, and only the holds whose position changed are written.
+    queue = (
+        select(
+            Hold.id.label("hold_id"),
+            (func.row_number().over(order_by=(Hold.start, Hold.id)) - reserved).label(
+                "position"
+            ),
+        )
+        .where(Hold.license_pool_id == license_pool.id)
+        .where(LicensePool.active_hold_criteria())
+        .subquery()
+    )
+    result = session.execute(
+        update(Hold)
+        .where(Hold.id == queue.c.hold_id)
+        .where(queue.c.position > 0)
+        .where(Hold.position.is_distinct_from(queue.c.position))
+        .values(position=queue.c.position, end=None)
+        .execution_options(synchronize_session="fetch")
+    )
+    updated += result.rowcount  # type: ignore[attr-defined]
 
     return updated, events
 
@@ -354,7 +388,9 @@ def import_collection(
             collection_name = collection.name
             registry = task.services.integration_registry().license_providers()
 
-            import_result = importer_from_collection(collection, registry).import_feed(
+            import_result = importer_from_collection(
+                collection, registry, task.services.redis.client()
+            ).import_feed(
                 collection,
                 url,
                 apply_bibliographic=apply.bibliographic_apply.delay,
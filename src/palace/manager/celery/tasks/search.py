@@ -50,11 +50,15 @@ def get_presentation_ready_work_ids(
 
 
 def add_documents_to_index(
-    log: LoggerType, index: ExternalSearchIndex, documents: Sequence[dict[str, Any]]
+    log: LoggerType,
+    index: ExternalSearchIndex,
+    documents: Sequence[dict[str, Any]],
+    thread_count: int = 1,
 ) -> None:
     """
     Submit a batch of documents to the search index.
 
+    :param thread_count: The number of bulk requests to have in flight at once.
     :raises FailedToIndex: If the index rejected some of the documents.
     :raises OpenSearchException: If the index rejected the request.
     """
@@ -63,7 +67,9 @@ def add_documents_to_index(
         message_prefix="Works added to index",
         skip_start=True,
     ):
-        failed_documents = index.add_documents(documents=documents)
+        failed_documents = index.add_documents(
+            documents=documents, thread_count=thread_count
+        )
     if failed_documents:
         raise FailedToIndex(f"Failed to index {len(failed_documents)} works.")
 
@@ -157,6 +163,90 @@ def advance_read_pointer(
     set_read_pointer(log, service, revision)
 
 
+BULK_LOAD_INDEX_SETTINGS: dict[str, Any] = {
+    "refresh_interval": "-1",
+    "number_of_replicas": 0,
+}
+"""
+The settings applied to an index while it is being bulk loaded.
+
+Nothing reads from an index that is still being filled, so there is no need to make new
+documents searchable as they arrive, or to copy every write to a replica that will only
+be rebuilt from the finished primary anyway.
+"""
+
+BULK_LOAD_BATCH_SIZE = 2000
+"""How many works each batch of a bulk load indexes."""
+
+BULK_LOAD_THREAD_COUNT = 4
+"""How many bulk requests a bulk load keeps in flight at once."""
+
+
+def use_bulk_load(
+    service: SearchService, revision: SearchSchemaRevision, target_index: str | None
+) -> bool:
+    """
+    Decide whether a reindex starting now can fill its index in bulk-load mode.
+
+    That is only the case for the index of the latest revision while it is not yet
+    serving reads: that is, the new index of a schema migration that advance_read_pointer
+    has not yet published.
+
+    :param service: The search service to read the read pointer from.
+    :param revision: The latest revision.
+    :param target_index: The index the run is going to fill.
+    :raises OpenSearchException: If the read pointer cannot be read.
+    """
+    if target_index is None:
+        return False
+    if target_index != revision.name_for_index(service.base_revision_name):
+        return False
+    read_pointer = service.read_pointer()
+    return read_pointer is None or read_pointer.index != target_index
+
+
+def start_bulk_load(log: LoggerType, service: SearchService, target_index: str) -> None:
+    """
+    Put an index into bulk-load mode. See BULK_LOAD_INDEX_SETTINGS.
+
+    :raises OpenSearchException: If OpenSearch rejects the settings update.
+    """
+    service.index_update_settings(target_index, BULK_LOAD_INDEX_SETTINGS)
+    log.info(f"Started bulk load of {target_index}.")
+
+
+def finish_bulk_load(
+    log: LoggerType,
+    service: SearchService,
+    revision: SearchSchemaRevision,
+    target_index: str,
+    force_merge: bool = False,
+) -> None:
+    """
+    Take an index out of bulk-load mode, so it is ready to serve reads.
+
+    The settings are restored from the revision's mapping rather than from whatever the
+    index had when the run started, so a run that dies partway through a bulk load, and
+    the run that replaces it, still leave the index the way the revision defines it.
+
+    :param force_merge: Whether to merge the index down to a single segment as well.
+    :raises OpenSearchException: If OpenSearch rejects any of the updates.
+    """
+    revision_settings = revision.mapping_document().settings.get("index", {})
+    service.index_update_settings(
+        target_index,
+        {
+            # None resets a setting to the cluster default.
+            key: revision_settings.get(key)
+            for key in BULK_LOAD_INDEX_SETTINGS
+        },
+    )
+    service.index_refresh(target_index)
+    if force_merge:
+        service.index_force_merge(target_index)
+    log.info(f"Finished bulk load of {target_index}.")
+
+
 SEARCH_REINDEX_LOCK_TIMEOUT = timedelta(hours=1)
 """
 How long the search reindex lock survives without being extended.
@@ -172,7 +262,13 @@ persistent backlog; an hour leaves roughly a 2x margin on that.
     queue=QueueNames.default, bind=True, max_retries=4, throws=(LockNotAcquired,)
 )
 def search_reindex(
-    task: Task, offset: int = 0, batch_size: int = 500, target_index: str | None = None
+    task: Task,
+    offset: int = 0,
+    batch_size: int = 500,
+    target_index: str | None = None,
+    bulk_load: bool = False,
+    bulk_load_batch_size: int = BULK_LOAD_BATCH_SIZE,
+    force_merge: bool = False,
 ) -> None:
     """
     Submit all works that are presentation ready to the search index.
@@ -182,11 +278,21 @@ def search_reindex(
     work has been indexed, the read pointer is advanced to the index we filled if it is still
     behind. See advance_read_pointer.
 
+    When a run starts filling an index that is not serving reads yet (see use_bulk_load), it
+    does so in bulk-load mode: the index is put into BULK_LOAD_INDEX_SETTINGS, the batches are
+    bigger, are submitted by several bulk workers at once and follow each other without a
+    cooldown, and the index's settings are restored before it is published.
+
     :param target_index: The index this run is filling, carried across requeues so the final
         batch can tell whether the write pointer moved partway through. Resolved from the write
         pointer when a run starts from the beginning; callers should not pass it. A run started
         at a non-zero offset skips the works before it, so it leaves this unset and never
         advances the read pointer.
+    :param bulk_load: Whether this run is filling its index in bulk-load mode. Decided when a
+        run starts from the beginning; callers should not pass it.
+    :param bulk_load_batch_size: The batch size used instead of batch_size in bulk-load mode.
+    :param force_merge: Whether a bulk load merges the index down to a single segment before
+        publishing it.
     """
     index = task.services.search.index()
     task_lock = TaskLock(
@@ -196,7 +302,19 @@ def search_reindex(
     with task_lock.lock(release_on_exit=False, ignored_exceptions=(Retry, Ignore)):
         try:
             if target_index is None and offset == 0:
-                target_index = resolve_target_index(task.services.search.service())
+                service = task.services.search.service()
+                target_index = resolve_target_index(service)
+                bulk_load = use_bulk_load(
+                    service,
+                    task.services.search.revision_directory().highest(),
+                    target_index,
+                )
+                if bulk_load:
+                    assert target_index is not None
+                    start_bulk_load(task.log, service, target_index)
+
+            if bulk_load:
+                batch_size = bulk_load_batch_size
 
             task.log.info(
                 f"Running search reindex at offset {offset} with batch size {batch_size}."
@@ -213,25 +331,34 @@ def search_reindex(
                 work_ids = get_presentation_ready_work_ids(session, batch_size, offset)
                 documents = Work.to_search_documents(session, work_ids)
 
-            add_documents_to_index(task.log, index, documents)
+            add_documents_to_index(
+                task.log,
+                index,
+                documents,
+                thread_count=BULK_LOAD_THREAD_COUNT if bulk_load else 1,
+            )
 
             if len(work_ids) == batch_size:
                 # This task is complete, but there are more works waiting to be indexed. Requeue ourselves
                 # to process the next batch. We add a random delay to avoid hammering the search service
-                # when this task is running in parallel on multiple workers.
-                delay = random.uniform(5, 15)
+                # when this task is running in parallel on multiple workers. A bulk load is filling an
+                # index nothing reads from, so it carries straight on.
+                delay = 0.0 if bulk_load else random.uniform(5, 15)
                 raise task.replace(
                     signature_with(
-                        task, offset=offset + batch_size, target_index=target_index
+                        task,
+                        offset=offset + batch_size,
+                        target_index=target_index,
+                        bulk_load=bulk_load,
                     ).set(countdown=delay)
                 )
 
-            advance_read_pointer(
-                task.log,
-                task.services.search.service(),
-                task.services.search.revision_directory().highest(),
-                target_index,
-            )
+            service = task.services.search.service()
+            revision = task.services.search.revision_directory().highest()
+            if bulk_load:
+                assert target_index is not None
+                finish_bulk_load(task.log, service, revision, target_index, force_merge)
+            advance_read_pointer(task.log, service, revision, target_index)
         except (FailedToIndex, OpenSearchException) as e:
             # A full pass takes days on a large collection, so a transient search failure
             # retries this batch rather than discarding the run's work. The retry happens
@@ -72,11 +72,6 @@ class CoverageProviderProgress(TimestampData):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        # The offset is distinct from the counter, in that it's not written
-        # to the database -- it's used to track state that's necessary within
-        # a single run of the CoverageProvider.
-        self.offset = 0
-
         self.successes = 0
         self.transient_failures = 0
         self.persistent_failures = 0
@@ -214,19 +209,33 @@ class BaseCoverageProvider:
         timestamp = self.timestamp
 
         # We'll use this TimestampData object to track our progress
-        # as we grant coverage to items.
-        progress = CoverageProviderProgress(start=start_time)
+        # as we grant coverage to items. Its counter is the ID of the
+        # last item we tried to cover, so if the previous run was
+        # interrupted during the first pass, we pick up where it left
+        # off. Only the first pass's counter is stored, so a counter
+        # from a later pass, which covers different items, never makes
+        # the first pass skip items it hasn't tried.
+        progress = CoverageProviderProgress(
+            start=start_time, counter=(timestamp.counter if timestamp else None) or 0
+        )
+
+        for i, covered_statuses in enumerate(covered_status_lists):
+            if progress.is_failure:
+                # An exception stopped the previous pass. If it was the
+                # first pass, the stored counter is left alone, so the
+                # next run resumes where that pass stopped.
+                break
 
-        for covered_statuses in covered_status_lists:
             # We may have completed our work for the previous value of
             # covered_statuses, but there's more work to do. Unset the
             # 'finish' date to guarantee that progress.is_complete
             # starts out False.
             #
-            # Also set the offset to zero to ensure that we always start
-            # at the start of the database table.
+            # Also set the counter to zero to ensure that every pass but
+            # the first starts at the start of the database table.
             original_finish = progress.finish = None
-            progress.offset = 0
+            if i > 0:
+                progress.counter = 0
 
             # Call run_once() until we get an exception or
             # progress.finish is set.
@@ -253,7 +262,11 @@ class BaseCoverageProvider:
                 # so let's write the work to the database as it's
                 # done.
                 original_finish = progress.finish
+                counter = progress.counter
+                if i > 0:
+                    progress.counter = 0
                 self.finalize_timestampdata(progress)
+                progress.counter = counter
 
                 # That wrote a value for progress.finish to the
                 # database, which is fine, but we don't necessarily
@@ -304,8 +317,9 @@ class BaseCoverageProvider:
         have work to do, and will keep calling run_once() forever.
 
         :param progress: A CoverageProviderProgress representing the
-           progress made so far, and the number of records that
-           need to be ignored for the rest of the run.
+           progress made so far. Its counter is the ID of the last item
+           we tried to cover; items up to and including that one are
+           ignored for the rest of the run.
 
         :param count_as_covered: Which values for CoverageRecord.status
            should count as meaning 'already covered'.
@@ -336,13 +350,23 @@ class BaseCoverageProvider:
                 count_as_covered_message,
             )
 
-        qu = qu.offset(progress.offset)
-        batch = qu.limit(self.batch_size)
+        # Page through the items in ID order, starting after the last one we
+        # tried to cover. Unlike an OFFSET, this doesn't get slower as we
+        # get further into the table.
+        item_class = qu.column_descriptions[0]["entity"]
+        batch = (
+            qu.filter(item_class.id > (progress.counter or 0))
+            .order_by(None)
+            .order_by(item_class.id)
+            .limit(self.batch_size)
+        )
         batch_results = batch.all()
         batch_count = len(batch_results)
 
         if not batch_count:
-            # The batch is empty. We're done.
+            # The batch is empty. We're done, and the next run should
+            # start from the beginning.
+            progress.counter = 0
             progress.finish = utc_now()
             return progress
 
@@ -358,23 +382,9 @@ class BaseCoverageProvider:
         progress.transient_failures += transient_failures
         progress.persistent_failures += persistent_failures
 
-        if BaseCoverageRecord.SUCCESS not in count_as_covered:
-            # If any successes happened in this batch, increase the
-            # offset to ignore them, or they will just show up again
-            # the next time we run this batch.
-            progress.offset += successes
-
-        if BaseCoverageRecord.TRANSIENT_FAILURE not in count_as_covered:
-            # If any transient failures happened in this batch,
-            # increase the offset to ignore them, or they will
-            # just show up again the next time we run this batch.
-            progress.offset += transient_failures
-
-        if BaseCoverageRecord.PERSISTENT_FAILURE not in count_as_covered:
-            # If any persistent failures happened in this batch,
-            # increase the offset to ignore them, or they will
-            # just show up again the next time we run this batch.
-            progress.offset += persistent_failures
+        # Whatever happened to the items in this batch, move past them, so
+        # they don't show up again the next time we run this batch.
+        progress.counter = batch_results[-1].id
 
         return progress
 
@@ -156,10 +156,10 @@ class CustomListQueries(LoggerMixin):
             pagination = SortKeyPagination(size=page_size)
             fast_forward = max(0, start_page - 1)
             for _ in range(fast_forward):
-                works = wl.search(
+                work_ids = wl.search_work_ids(
                     _db, json_query, search, pagination=pagination, facets=facets
                 )
-                if not works:
+                if not work_ids:
                     if update_metadata:
                         custom_list.auto_update_last_update = datetime.datetime.now()
                         custom_list.size = custom_list.get_entry_count(_db)
@@ -174,22 +174,24 @@ class CustomListQueries(LoggerMixin):
 
         next_pagination_key: list[Any] | None = None
         for _ in range(max_pages):
-            works = wl.search(
+            # Only the IDs of the works are needed to add them to the list, so
+            # there's no need to load the works themselves.
+            work_ids = wl.search_work_ids(
                 _db, json_query, search, pagination=pagination, facets=facets
             )
 
-            if not works:
+            if not work_ids:
                 cls.logger().info(
                     f"{custom_list.name} customlist updated with {total_works_updated} works, moving on..."
                 )
                 break
 
-            total_works_updated += len(works)
-            for work in works:
-                custom_list.add_entry(work, update_external_index=True)
+            total_works_updated += len(work_ids)
+            added = custom_list.add_works(work_ids, update_external_index=True)
 
             cls.logger().info(
-                f"Updated customlist {custom_list.name} with {total_works_updated} works"
+                f"Updated customlist {custom_list.name} with {total_works_updated} works "
+                f"({len(added)} new on this page)"
             )
 
             next_page = pagination.next_page
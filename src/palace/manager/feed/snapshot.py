@@ -0,0 +1,271 @@
+"""Static, pre-paginated snapshots of crawlable feeds, stored in object storage."""
+
+from __future__ import annotations
+
+import datetime
+import hashlib
+import json
+from collections.abc import Sequence
+from enum import Enum
+from typing import Any, Self
+
+from opensearchpy.helpers.response.hit import Hit
+from sqlalchemy.orm import Session
+
+from palace.util.datetime_helpers import utc_now
+from palace.util.exceptions import BasePalaceException
+from palace.util.log import LoggerMixin
+
+from palace.manager.feed.acquisition import OPDSAcquisitionFeed
+from palace.manager.feed.annotator.circulation import CirculationManagerAnnotator
+from palace.manager.feed.facets.base import FacetsWithEntryPoint
+from palace.manager.feed.facets.crawlable import CrawlableFacets
+from palace.manager.feed.serializer.base import SerializerInterface
+from palace.manager.feed.serializer.opds import OPDS1Version1Serializer
+from palace.manager.feed.serializer.opds2 import OPDS2Serializer
+from palace.manager.feed.worklist.crawlable import CrawlableLane
+from palace.manager.search.external_search import ExternalSearchIndex
+from palace.manager.search.pagination import Pagination, SortKeyPagination
+from palace.manager.service.redis.models.crawlable_feed import CrawlableFeedSnapshot
+from palace.manager.service.storage.s3 import S3Service
+
+CRAWLABLE_SNAPSHOT_PREFIX = "crawlable"
+
+CRAWLABLE_SNAPSHOT_MAX_AGE = datetime.timedelta(hours=12)
+"""
+How old a published snapshot can be and still be served in place of the live feed.
+
+Snapshots are regenerated every few hours, so a snapshot older than this means the
+task that keeps it current has stopped running, and crawlers are better off with the
+live feed than with a catalog that is falling further and further behind.
+"""
+
+
+class CrawlableFeedSnapshotError(BasePalaceException):
+    """A page of a crawlable feed snapshot could not be stored."""
+
+
+class SnapshotFormat(Enum):
+    """The formats a crawlable feed snapshot is written in."""
+
+    OPDS1 = ("opds1.xml", OPDS1Version1Serializer)
+    OPDS2 = ("opds2.json", OPDS2Serializer)
+
+    def __init__(
+        self, extension: str, serializer_class: type[SerializerInterface[Any]]
+    ) -> None:
+        self.extension = extension
+        self.serializer_class = serializer_class
+
+    @classmethod
+    def for_serializer(cls, serializer: SerializerInterface[Any]) -> Self | None:
+        """
+        Find the snapshot format written by the given serializer.
+
+        :return: The format, or None if snapshots aren't written with that serializer.
+        """
+        for snapshot_format in cls:
+            if type(serializer) is snapshot_format.serializer_class:
+                return snapshot_format
+        return None
+
+
+def snapshot_page_key(feed_key: str, page: int, snapshot_format: SnapshotFormat) -> str:
+    """The object storage key of a single page of a crawlable feed snapshot."""
+    return f"{CRAWLABLE_SNAPSHOT_PREFIX}/{feed_key}/{page}.{snapshot_format.extension}"
+
+
+def crawlable_snapshot_url(
+    storage: S3Service,
+    snapshot: CrawlableFeedSnapshot,
+    snapshot_format: SnapshotFormat,
+) -> str | None:
+    """
+    Get the URL of the first page of a crawlable feed snapshot, if it can be served.
+
+    :return: The URL, or None if the snapshot has never been published, or is too old to
+        be served. See CRAWLABLE_SNAPSHOT_MAX_AGE.
+    """
+    published = snapshot.published()
+    if published is None or published.page_count == 0:
+        return None
+    if utc_now() - published.generated > CRAWLABLE_SNAPSHOT_MAX_AGE:
+        return None
+    return storage.generate_url(
+        snapshot_page_key(snapshot.feed_key, 0, snapshot_format)
+    )
+
+
+class CrawlableFeedSnapshotPage(OPDSAcquisitionFeed):
+    """A single page of a crawlable feed snapshot."""
+
+    PAGINATION_RELS = frozenset({"self", "first", "next", "previous"})
+
+    def set_page_links(self, url: str, first_url: str, next_url: str | None) -> None:
+        """
+        Point the feed's own links at the snapshot, rather than at the live feed.
+
+        A crawler that follows the links of a snapshot page stays in the snapshot, so it
+        never comes back to the web app for the rest of the feed.
+        """
+        self.url = url
+        self._feed.metadata.id = url
+        self._feed.links = [
+            link for link in self._feed.links if link.rel not in self.PAGINATION_RELS
+        ]
+        self._feed.add_link(href=url, rel="self")
+        if first_url != url:
+            self._feed.add_link(href=first_url, rel="first")
+        if next_url is not None:
+            self._feed.add_link(href=next_url, rel="next")
+
+    def serialize(self, serializer: SerializerInterface[Any]) -> str:
+        """Serialize the page with the given serializer."""
+        return serializer.serialize_feed(
+            self._feed, precomposed_entries=self._precomposed_entries
+        )
+
+
+class CrawlableFeedSnapshotter(LoggerMixin):
+    """
+    Write a crawlable feed out to object storage as a series of static pages.
+
+    The feed is read one page at a time, with the same page size as the live crawlable
+    feed. Each page is fingerprinted from its search results before anything is loaded
+    from the database, and a page whose fingerprint matches the one in the published
+    manifest is left as it is. Only pages whose works changed are loaded, rendered and
+    uploaded.
+
+    The live crawlable feed puts the most recently updated works first, so updating
+    any work would move every work after it along by one, and change every page. The
+    snapshot is ordered by work ID instead, so updating a work leaves it where it was,
+    and new works are added to the end.
+    """
+
+    # Sorting by last update time after the work ID doesn't change the order, since
+    # work IDs are unique, but it puts the update time in each search result's sort
+    # values, where the fingerprint can see it.
+    SORT_ORDER = ["work_id", "last_update_time"]
+
+    def __init__(
+        self,
+        _db: Session,
+        worklist: CrawlableLane,
+        feed_key: str,
+        title: str,
+        facets: CrawlableFacets,
+        annotator: CirculationManagerAnnotator,
+        search_engine: ExternalSearchIndex,
+        storage: S3Service,
+        snapshot: CrawlableFeedSnapshot,
+        page_size: int = Pagination.DEFAULT_CRAWLABLE_SIZE,
+    ) -> None:
+        self._db = _db
+        self.worklist = worklist
+        self.feed_key = feed_key
+        self.title = title
+        self.annotator = annotator
+        self.search_engine = search_engine
+        self.storage = storage
+        self.snapshot = snapshot
+        self.page_size = page_size
+        self.facets = facets
+
+    def page_url(self, page: int, snapshot_format: SnapshotFormat) -> str:
+        return self.storage.generate_url(
+            snapshot_page_key(self.feed_key, page, snapshot_format)
+        )
+
+    @staticmethod
+    def fingerprint(hits: Sequence[Hit], has_next: bool) -> str:
+        """
+        Fingerprint a page from its search results.
+
+        The sort values include each work's ID and last update time, so a work that
+        changed changes the fingerprint of the page it is on, and no other page.
+        Whether there is a next page is included, because it decides whether the page
+        links to one.
+        """
+        content = [[hit.work_id, list(hit.meta.sort)] for hit in hits]
+        return hashlib.sha256(
+            json.dumps([content, has_next], default=str).encode("utf8")
+        ).hexdigest()
+
+    def run(self) -> int:
+        """
+        Bring the snapshot up to date, and publish its manifest.
+
+        :return: The number of pages that had to be rendered.
+        :raises CrawlableFeedSnapshotError: If a page could not be stored. The manifest is
+            left as it was, so the next run renders every page this one did again.
+        """
+        generated = utc_now()
+        previous = self.snapshot.page_fingerprints()
+        fingerprints: dict[int, str] = {}
+        rendered = 0
+
+        search_filter = self.worklist.filter(self._db, self.facets)
+        search_filter.order = self.SORT_ORDER
+        search_filter.order_ascending = True
+        pagination: SortKeyPagination | None = SortKeyPagination(size=self.page_size)
+        page = 0
+        while pagination is not None:
+            hits = self.search_engine.query_works(
+                query_string=None, filter=search_filter, pagination=pagination
+            )
+            has_next = len(hits) == self.page_size
+            fingerprint = self.fingerprint(hits, has_next)
+            if previous.get(page) != fingerprint:
+                self.render_page(page, hits, has_next)
+                rendered += 1
+            fingerprints[page] = fingerprint
+
+            pagination = pagination.next_page if has_next else None
+            page += 1
+
+        # The feed shrank, so the pages past its new end are no longer reachable.
+        for stale_page in sorted(set(previous) - set(fingerprints)):
+            for snapshot_format in SnapshotFormat:
+                self.storage.delete(
+                    snapshot_page_key(self.feed_key, stale_page, snapshot_format)
+                )
+
+        self.snapshot.publish(fingerprints, generated)
+        self.log.info(
+            f"Published {len(fingerprints)} page snapshot of crawlable feed "
+            f"{self.feed_key}. Rendered {rendered} changed pages."
+        )
+        return rendered
+
+    def render_page(self, page: int, hits: Sequence[Hit], has_next: bool) -> None:
+        """Render a single page in every snapshot format, and store it."""
+        works = self.worklist.works_for_hits(self._db, hits, facets=self.facets)
+        feed = CrawlableFeedSnapshotPage(
+            self.title,
+            self.page_url(page, SnapshotFormat.OPDS1),
+            works,
+            self.annotator,
+            facets=self.facets,
+        )
+        feed.generate_feed()
+        feed.add_facet_links(self.worklist)
+        if isinstance(self.facets, FacetsWithEntryPoint):
+            feed.add_breadcrumb_links(self.worklist, self.facets.entrypoint)
+
+        for snapshot_format in SnapshotFormat:
+            feed.set_page_links(
+                url=self.page_url(page, snapshot_format),
+                first_url=self.page_url(0, snapshot_format),
+                next_url=(
+                    self.page_url(page + 1, snapshot_format) if has_next else None
+                ),
+            )
+            serializer = snapshot_format.serializer_class()
+            key = snapshot_page_key(self.feed_key, page, snapshot_format)
+            if (
+                self.storage.store(
+                    key, feed.serialize(serializer), serializer.content_type()
+                )
+                is None
+            ):
+                raise CrawlableFeedSnapshotError(f"Unable to store {key}.")
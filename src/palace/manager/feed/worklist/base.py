@@ -514,9 +514,11 @@ class WorkList:
 
         # We use an explicit check for Lane.visible here, instead of
         # iterating over self.visible_children, because Lane.visible only
-        # works when the Lane is merged into a database session.
+        # works when the Lane is merged into a database session. Merging
+        # cascades to the Lane's sublanes, so it's skipped for a Lane
+        # that's already in this session.
         for child in self.children:
-            if isinstance(child, Lane):
+            if isinstance(child, Lane) and Session.object_session(child) is not _db:
                 child = _db.merge(child)
 
             if not child.visible:
@@ -708,6 +710,36 @@ class WorkList:
 
         return results
 
+    def search_work_ids(
+        self, _db, query, search_client, pagination=None, facets=None
+    ) -> list[int]:
+        """Find the IDs of the works in this WorkList that match a search query.
+
+        Unlike search(), this doesn't load the matching works from the database,
+        so it's much cheaper when only the IDs are needed.
+
+        :param _db: A database connection.
+        :param query: Search for this string.
+        :param search_client: An ExternalSearchIndex object.
+        :param pagination: A Pagination object.
+        :param facets: A faceting object, probably a SearchFacets.
+        """
+        if not search_client:
+            return []
+
+        if not pagination:
+            pagination = Pagination(offset=0, size=Pagination.DEFAULT_SEARCH_SIZE)
+
+        filter = self.filter(_db, facets)
+        try:
+            return search_client.query_work_ids(query, filter, pagination)
+        except OpenSearchException as e:
+            logging.error(
+                "Problem communicating with OpenSearch. Returning empty list of search results.",
+                exc_info=e,
+            )
+            return []
+
     @inject
     def _groups_for_lanes(
         self,
@@ -7,6 +7,14 @@ class CrawlableLane(DynamicLane):
     # By default, crawlable feeds are cached for 12 hours.
     MAX_CACHE_AGE = 12 * 60 * 60
 
+    @property
+    def snapshot_key(self) -> str | None:
+        """The key this feed's static snapshot is stored under, if it can have one.
+
+        See palace.manager.feed.snapshot.
+        """
+        return None
+
 
 class CrawlableCollectionBasedLane(CrawlableLane):
     # Since these collections may be shared collections, for which
@@ -19,12 +27,14 @@ class CrawlableCollectionBasedLane(CrawlableLane):
 
     def initialize(self, library_or_collections: Library | list[Collection]):  # type: ignore[override]
         self.collection_feed = False
+        self._snapshot_key: str | None = None
 
         if isinstance(library_or_collections, Library):
             # We're looking at only the active collections for the given library.
             library = library_or_collections
             collections = library.active_collections
             identifier = library.name
+            self._snapshot_key = f"library-{library.id}"
         elif isinstance(library_or_collections, list):
             # We're looking at collections directly, without respect
             # to the libraries that might use them.
@@ -34,6 +44,7 @@ class CrawlableCollectionBasedLane(CrawlableLane):
             if len(collections) == 1:
                 self.collection_feed = True
                 self.collection_name = collections[0].name
+                self._snapshot_key = f"collection-{collections[0].id}"
 
         super().initialize(
             library,
@@ -45,6 +56,10 @@ class CrawlableCollectionBasedLane(CrawlableLane):
             # further.
             self.collection_ids = [x.id for x in collections]
 
+    @property
+    def snapshot_key(self) -> str | None:
+        return self._snapshot_key
+
     @property
     def url_arguments(self):
         if not self.collection_feed:
@@ -65,12 +80,17 @@ class CrawlableCustomListBasedLane(CrawlableLane):
 
     def initialize(self, library, customlist):
         self.customlist_name = customlist.name
+        self.customlist_id = customlist.id
         super().initialize(
             library,
             "Crawlable feed: %s" % self.customlist_name,
             customlists=[customlist],
         )
 
+    @property
+    def snapshot_key(self) -> str | None:
+        return f"list-{self.customlist_id}"
+
     @property
     def url_arguments(self):
         kwargs = dict(list_name=self.customlist_name)
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import datetime
+import itertools
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from threading import Lock
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from expiringdict import ExpiringDict
+from sqlalchemy import select
+from sqlalchemy.orm import Session, selectinload
+
+from palace.util.log import LoggerMixin
+
+from palace.manager.core.config import Configuration
+from palace.manager.sqlalchemy.model.lane import Lane, LaneGenre
+
+if TYPE_CHECKING:
+    from palace.manager.feed.worklist.base import WorkList
+
+
+def _as_tuple(value: Any) -> Any:
+    """Freeze a list (or set) configuration value, leaving anything else alone."""
+    if isinstance(value, (list, set, frozenset)):
+        return tuple(value)
+    return value
+
+
+def _as_list(value: Any) -> Any:
+    """Thaw a frozen configuration value, so its consumer can't change the original."""
+    if isinstance(value, tuple):
+        return list(value)
+    return value
+
+
+@dataclass(frozen=True)
+class LaneRestrictions:
+    """
+    The restrictions a WorkList puts on the works in it, once everything it inherits
+    from its parentage has been resolved.
+
+    These are the WorkList's contributions to a search Filter. Anything that depends
+    on the request (facets, the library's active collections) is left out.
+    """
+
+    media: Any = None
+    languages: Any = None
+    fiction: Any = None
+    audiences: Any = None
+    target_age: Any = None
+    license_datasource_id: int | None = None
+    genre_id_restrictions: tuple[tuple[int, ...], ...] = ()
+    customlist_id_restrictions: tuple[tuple[int, ...], ...] = ()
+
+    @classmethod
+    def from_worklist(cls, worklist: WorkList) -> LaneRestrictions:
+        """Resolve the restrictions of a WorkList by walking its parentage."""
+        inherit_one = worklist.inherited_value
+        inherit_some = worklist.inherited_values
+        return cls(
+            media=_as_tuple(inherit_one("media")),
+            languages=_as_tuple(inherit_one("languages")),
+            fiction=inherit_one("fiction"),
+            audiences=_as_tuple(inherit_one("audiences")),
+            target_age=inherit_one("target_age"),
+            license_datasource_id=inherit_one("license_datasource_id"),
+            genre_id_restrictions=tuple(
+                tuple(sorted(ids)) for ids in inherit_some("genre_ids")
+            ),
+            customlist_id_restrictions=tuple(
+                tuple(ids) for ids in inherit_some("customlist_ids")
+            ),
+        )
+
+    def filter_arguments(self) -> dict[str, Any]:
+        """
+        The arguments to pass to the Filter constructor to apply these restrictions.
+
+        Every call returns new lists, so a Filter that modifies its arguments doesn't
+        modify the restrictions they came from.
+        """
+        return dict(
+            media=_as_list(self.media),
+            languages=_as_list(self.languages),
+            fiction=self.fiction,
+            audiences=_as_list(self.audiences),
+            target_age=self.target_age,
+            genre_restriction_sets=[list(ids) for ids in self.genre_id_restrictions],
+            customlist_restriction_sets=[
+                list(ids) for ids in self.customlist_id_restrictions
+            ],
+            license_datasource=self.license_datasource_id,
+        )
+
+
+@dataclass(frozen=True)
+class LaneTreeSnapshot(LoggerMixin):
+    """
+    An immutable snapshot of the lane hierarchy of a single library.
+
+    Resolving the restrictions of a Lane means walking its parentage and gathering
+    the genres and custom lists of every lane on the way, which takes a trip to the
+    database for each of them. The lane hierarchy rarely changes, so a snapshot of
+    every lane's restrictions is built once, and shared by every request the process
+    handles, until the site configuration changes.
+
+    Lane and LaneGenre changes already mark the site configuration as changed. Custom
+    list changes in this process clear the snapshots directly. Custom list changes
+    made by other processes are picked up when the snapshot expires.
+    """
+
+    library_id: int
+    configuration_version: datetime.datetime | None
+    restrictions: Mapping[int, LaneRestrictions] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+
+    MAX_AGE: ClassVar[int] = 300
+    """How many seconds a snapshot is used before it's built again regardless."""
+
+    _cache: ClassVar[dict[int, LaneTreeSnapshot]] = ExpiringDict(
+        max_len=1000, max_age_seconds=MAX_AGE
+    )
+    _build_lock: ClassVar[Lock] = Lock()
+
+    @classmethod
+    def build(cls, _db: Session, library_id: int) -> LaneTreeSnapshot:
+        """Resolve the restrictions of every lane in a library."""
+        configuration_version = Configuration._site_configuration_last_update()
+
+        # Loading every lane of the library up front means that walking each lane's
+        # parentage is served from the session's identity map.
+        lanes = _db.scalars(
+            select(Lane)
+            .where(Lane.library_id == library_id)
+            .options(
+                selectinload(Lane.lane_genres).joinedload(LaneGenre.genre),
+                selectinload(Lane.customlists),
+            )
+        ).all()
+        restrictions = {lane.id: LaneRestrictions.from_worklist(lane) for lane in lanes}
+        cls.logger().info(
+            f"Built lane tree snapshot of {len(restrictions)} lanes "
+            f"for library {library_id}."
+        )
+        return cls(library_id, configuration_version, MappingProxyType(restrictions))
+
+    @classmethod
+    def for_library(cls, _db: Session, library_id: int) -> LaneTreeSnapshot:
+        """Get a current snapshot of a library's lanes, building one if necessary."""
+        configuration_version = Configuration._site_configuration_last_update()
+        snapshot = cls._cache.get(library_id)
+        if snapshot is not None and snapshot.configuration_version == (
+            configuration_version
+        ):
+            return snapshot
+
+        with cls._build_lock:
+            # Another thread may have built the snapshot while we waited.
+            snapshot = cls._cache.get(library_id)
+            if snapshot is None or snapshot.configuration_version != (
+                configuration_version
+            ):
+                snapshot = cls.build(_db, library_id)
+                cls._cache[library_id] = snapshot
+        return snapshot
+
+    @classmethod
+    def restrictions_for(
+        cls, _db: Session, worklist: WorkList
+    ) -> LaneRestrictions | None:
+        """
+        Look up the restrictions of a WorkList in its library's snapshot.
+
+        :return: The restrictions, or None if the WorkList isn't a Lane that can be
+            found in a snapshot. The restrictions of anything else must be resolved
+            by walking its parentage.
+        """
+        if type(worklist) is not Lane or worklist.id is None:
+            return None
+
+        # A lane that is about to change must be read as it is now, not as it was when
+        # the snapshot was built.
+        if any(
+            isinstance(obj, (Lane, LaneGenre))
+            for obj in itertools.chain(_db.new, _db.dirty, _db.deleted)
+        ):
+            return None
+
+        return cls.for_library(_db, worklist.library_id).restrictions.get(worklist.id)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Throw away every snapshot, so they are built again when next needed."""
+        cls._cache.clear()
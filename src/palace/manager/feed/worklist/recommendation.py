@@ -2,17 +2,23 @@ from collections import defaultdict
 
 from sqlalchemy.orm import Session
 
+from palace.util.log import LoggerMixin
+
 from palace.manager.core.config import CannotLoadConfiguration
+from palace.manager.data_layer.identifier import IdentifierData
 from palace.manager.feed.facets.feed import Facets
 from palace.manager.feed.worklist.contributor import ContributorLane
 from palace.manager.feed.worklist.dynamic import WorkBasedLane
 from palace.manager.feed.worklist.series import SeriesLane
 from palace.manager.integration.metadata.novelist import NoveListAPI
+from palace.manager.service.redis.exception import TRANSIENT_REDIS_ERRORS
+from palace.manager.service.redis.models.novelist import NoveListRecommendationCache
+from palace.manager.service.redis.redis import Redis
 from palace.manager.sqlalchemy.model.contributor import Contributor
 from palace.manager.sqlalchemy.model.identifier import Identifier
 
 
-class RecommendationLane(WorkBasedLane):
+class RecommendationLane(WorkBasedLane, LoggerMixin):
     """A lane of recommended Works based on a particular Work"""
 
     DISPLAY_NAME = "Titles recommended by NoveList"
@@ -23,10 +29,19 @@ class RecommendationLane(WorkBasedLane):
     MAX_CACHE_AGE = 24 * 60 * 60
 
     def __init__(
-        self, library, work, display_name=None, novelist_api=None, parent=None
+        self,
+        library,
+        work,
+        display_name=None,
+        novelist_api=None,
+        parent=None,
+        redis_client: Redis | None = None,
     ):
         """Constructor.
 
+        :param redis_client: If provided, NoveList recommendations are cached
+            in Redis, and NoveList is only asked for them when they aren't.
+
         :raises: CannotLoadConfiguration if `novelist_api` is not provided
         and no Novelist integration is configured for this library.
         """
@@ -36,16 +51,65 @@ class RecommendationLane(WorkBasedLane):
             display_name=display_name,
         )
         self.novelist_api = novelist_api or NoveListAPI.from_config(library)
+        self.recommendation_cache = (
+            NoveListRecommendationCache(redis_client, library.id)
+            if redis_client is not None
+            else None
+        )
         if parent:
             parent.append_child(self)
         _db = Session.object_session(library)
         self.recommendations = self.fetch_recommendations(_db)
 
+    def lookup_recommendations(self) -> list[IdentifierData]:
+        """Get the NoveList recommendations for this Work's primary identifier.
+
+        Cached recommendations are used if there are any. Stale ones are used
+        too, while a task looks them up again in the background. Only when
+        nothing is cached, or the cache can't be reached, is NoveList asked
+        while the request waits.
+        """
+        identifier = self.edition.primary_identifier
+        cache = self.recommendation_cache
+        if cache is None:
+            return self.novelist_api.lookup_recommendations(identifier)
+
+        try:
+            cached = cache.get(identifier.id)
+            if cached is not None:
+                if not cached.fresh and cache.claim_refresh(identifier.id):
+                    from palace.manager.celery.tasks.novelist import (
+                        refresh_novelist_recommendations,
+                    )
+
+                    # retry=False: fail fast instead of blocking the request on
+                    # Celery's publish-retry loop if the broker is down.
+                    refresh_novelist_recommendations.apply_async(
+                        (cache.library_id, identifier.id), retry=False
+                    )
+                return cached.recommendations
+        except TRANSIENT_REDIS_ERRORS:
+            self.log.warning(
+                "Could not read cached NoveList recommendations; Redis appears "
+                "to be temporarily unavailable.",
+                exc_info=True,
+            )
+            return self.novelist_api.lookup_recommendations(identifier)
+
+        recommendations = self.novelist_api.lookup_recommendations(identifier)
+        try:
+            cache.set(identifier.id, recommendations)
+        except TRANSIENT_REDIS_ERRORS:
+            self.log.warning(
+                "Could not cache NoveList recommendations; Redis appears to be "
+                "temporarily unavailable.",
+                exc_info=True,
+            )
+        return recommendations
+
     def fetch_recommendations(self, _db: Session) -> list[Identifier]:
         """Get identifiers of recommendations for this LicensePool"""
-        recommendation_data = self.novelist_api.lookup_recommendations(
-            self.edition.primary_identifier
-        )
+        recommendation_data = self.lookup_recommendations()
         recommendations = []
         by_type: defaultdict[str, list[str]] = defaultdict(list)
         for identifier in recommendation_data:
@@ -125,14 +189,21 @@ class RelatedBooksLane(WorkBasedLane):
         RecommendationLane.MAX_CACHE_AGE,
     )
 
-    def __init__(self, library, work, display_name=None, novelist_api=None):
+    def __init__(
+        self,
+        library,
+        work,
+        display_name=None,
+        novelist_api=None,
+        redis_client: Redis | None = None,
+    ):
         super().__init__(
             library,
             work,
             display_name=display_name,
         )
         _db = Session.object_session(library)
-        sublanes = self._get_sublanes(_db, novelist_api)
+        sublanes = self._get_sublanes(_db, novelist_api, redis_client)
         if not sublanes:
             raise ValueError(
                 "No related books for {} by {}".format(
@@ -148,13 +219,15 @@ class RelatedBooksLane(WorkBasedLane):
         """
         return []
 
-    def _get_sublanes(self, _db, novelist_api):
+    def _get_sublanes(self, _db, novelist_api, redis_client=None):
         sublanes = list()
 
         for contributor_lane in self._contributor_sublanes(_db):
             sublanes.append(contributor_lane)
 
-        for recommendation_lane in self._recommendation_sublane(_db, novelist_api):
+        for recommendation_lane in self._recommendation_sublane(
+            _db, novelist_api, redis_client
+        ):
             sublanes.append(recommendation_lane)
 
         # Create a series sublane.
@@ -195,7 +268,7 @@ class RelatedBooksLane(WorkBasedLane):
             )
             yield contributor_lane
 
-    def _recommendation_sublane(self, _db, novelist_api):
+    def _recommendation_sublane(self, _db, novelist_api, redis_client=None):
         """Create a recommendations sublane."""
         lane_name = "Similar titles recommended by NoveList"
         try:
@@ -205,6 +278,7 @@ class RelatedBooksLane(WorkBasedLane):
                 display_name=lane_name,
                 novelist_api=novelist_api,
                 parent=self,
+                redis_client=redis_client,
             )
             if recommendation_lane.recommendations:
                 yield recommendation_lane
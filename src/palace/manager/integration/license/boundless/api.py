@@ -31,7 +31,6 @@ from palace.manager.api.circulation.exceptions import (
 from palace.manager.api.circulation.fulfillment import DirectFulfillment, Fulfillment
 from palace.manager.api.selftest import HasCollectionSelfTests
 from palace.manager.api.web_publication_manifest import FindawayManifest, SpineItem
-from palace.manager.celery.tasks import boundless
 from palace.manager.core.selftest import SelfTestResult
 from palace.manager.data_layer.bibliographic import BibliographicData
 from palace.manager.data_layer.circulation import CirculationData
@@ -723,4 +722,6 @@ class BoundlessApi(
 
     @classmethod
     def import_task(cls, collection_id: int, force: bool = False) -> Signature:
-        return boundless.import_collection.s(collection_id, import_all=force)
+        from palace.manager.celery.tasks.boundless import import_collection
+
+        return import_collection.s(collection_id, import_all=force)
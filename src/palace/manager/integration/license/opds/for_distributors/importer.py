@@ -16,14 +16,23 @@ from palace.manager.integration.license.opds.requests import OAuthOpdsRequest
 from palace.manager.service.integration_registry.license_providers import (
     LicenseProvidersRegistry,
 )
+from palace.manager.service.redis.models.oauth_token import OAuthTokenCache
+from palace.manager.service.redis.redis import Redis
 from palace.manager.sqlalchemy.model.collection import Collection
 
 OpdsForDistributorsImporterT = OpdsImporter[OPDS1Feed, OPDS1Publication]
 
 
 def importer_from_collection(
-    collection: Collection, registry: LicenseProvidersRegistry
+    collection: Collection,
+    registry: LicenseProvidersRegistry,
+    redis_client: Redis | None = None,
 ) -> OpdsForDistributorsImporterT:
+    """
+    Create an importer for an OPDS for Distributors collection.
+
+    :param redis_client: If given, the collection's OAuth token is cached in Redis.
+    """
     if not registry.equivalent(collection.protocol, OPDSForDistributorsAPI):
         raise PalaceValueError(
             f"Collection {collection.name} [id={collection.id} protocol={collection.protocol}] is not an OPDS for Distributors collection."
@@ -31,8 +40,16 @@ def importer_from_collection(
     settings = integration_settings_load(
         OPDSForDistributorsAPI.settings_class(), collection.integration_configuration
     )
+    token_cache = (
+        OAuthTokenCache(redis_client, settings.external_account_id, settings.username)
+        if redis_client is not None
+        else None
+    )
     request = OAuthOpdsRequest(
-        settings.external_account_id, settings.username, settings.password
+        settings.external_account_id,
+        settings.username,
+        settings.password,
+        token_cache=token_cache,
     )
     extractor = Opds1Extractor(
         settings.external_account_id,
@@ -13,6 +13,7 @@ from sqlalchemy.orm import Session
 from palace.opds import rwpm
 from palace.opds.odl.info import LicenseInfo
 from palace.opds.odl.odl import License
+from palace.util.exceptions import PalaceValueError
 from palace.util.log import LoggerMixin, elapsed_time_logging
 
 from palace.manager.celery.tasks.apply import (
@@ -365,8 +366,19 @@ class OpdsImporter[FeedType, PublicationType](LoggerMixin):
             )
             return False
 
-        feed_bibliographic, failures = self._extract_publications_from_feed(feed)
-        next_url = self._extractor.feed_next_url(feed)
+        try:
+            # The feed may only be parsed as its publications are extracted, so
+            # a feed that's broken part way through fails here rather than when
+            # it's fetched.
+            feed_bibliographic, failures = self._extract_publications_from_feed(feed)
+            next_url = self._extractor.feed_next_url(feed)
+        except PalaceValueError as e:
+            self.log.error(
+                f"Failed to parse the feed from '{feed_url}' "
+                f"for collection '{collection.name}' (id={collection.id}): {e}",
+                exc_info=e,
+            )
+            return False
         results = {}
 
         replacement_policy = ReplacementPolicy.from_license_source(
@@ -17,6 +17,7 @@ from palace.manager.integration.license.opds.requests import (
 from palace.manager.service.integration_registry.license_providers import (
     LicenseProvidersRegistry,
 )
+from palace.manager.service.redis.redis import Redis
 from palace.manager.sqlalchemy.model.collection import Collection
 from palace.manager.util.http.http import HTTP
 
@@ -31,10 +32,14 @@ Opds2WithODLImporterT = OpdsImporter[
 
 
 def importer_from_collection(
-    collection: Collection, registry: LicenseProvidersRegistry
+    collection: Collection,
+    registry: LicenseProvidersRegistry,
+    redis_client: Redis | None = None,
 ) -> Opds2WithODLImporterT:
     """
     Create an OPDS2WithODLImporter from a OPDS2+ODL (OPDS2WithODLApi protocol) Collection.
+
+    :param redis_client: If given, the collection's OAuth token is cached in Redis.
     """
     if not registry.equivalent(collection.protocol, OPDS2WithODLApi):
         raise PalaceValueError(
@@ -50,6 +55,7 @@ def importer_from_collection(
         settings.password,
         settings.external_account_id,
         requests_session,
+        redis_client,
     )
     extractor = OPDS2WithODLExtractor(
         _ODL_PUBLICATION_ADAPTOR.validate_python,
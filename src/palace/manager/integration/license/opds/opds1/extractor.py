@@ -7,9 +7,8 @@ from typing import Any
 from urllib.parse import urljoin
 
 import dateutil
-import feedparser
 from lxml import etree
-from lxml.etree import ElementTree, _Element as Element
+from lxml.etree import _Element as Element
 
 from palace.opds.odl.info import LicenseInfo
 from palace.opds.odl.odl import License
@@ -34,6 +33,7 @@ from palace.manager.integration.license.opds.for_distributors.utils import (
 from palace.manager.integration.license.opds.opds1.settings import (
     IdentifierSource,
 )
+from palace.manager.integration.license.opds.opds1.stream import OPDS1FeedStream
 from palace.manager.integration.license.opds.opds1.xml_parser import OPDSXMLParser
 from palace.manager.sqlalchemy.model.classification import Subject
 from palace.manager.sqlalchemy.model.edition import Edition
@@ -50,8 +50,7 @@ from palace.manager.util.opds_writer import OPDSFeed
 @dataclass
 class OPDS1Feed:
     parser: OPDSXMLParser
-    feed_parser: dict[str, Any]
-    etree: ElementTree
+    stream: OPDS1FeedStream
 
 
 @dataclass
@@ -97,14 +96,6 @@ class Opds1Extractor(OpdsExtractor[OPDS1Feed, OPDS1Publication], BearerTokenDrmM
         """
         return RightsStatus.rights_uri_from_string(rights_string)
 
-    @staticmethod
-    def _extract_feedparser_entries(feed: OPDS1Feed) -> Generator[dict[str, Any]]:
-        yield from feed.feed_parser["entries"]
-
-    @staticmethod
-    def _extract_elementtree_entries(feed: OPDS1Feed) -> Generator[Element]:
-        yield from feed.parser._xpath(feed.etree, "/atom:feed/atom:entry")
-
     @staticmethod
     def _extract_title(entry_fp: dict[str, Any]) -> str | None:
         title = entry_fp.get("title", None)
@@ -578,36 +569,27 @@ class Opds1Extractor(OpdsExtractor[OPDS1Feed, OPDS1Publication], BearerTokenDrmM
         return IdentifierData.parse_urn(identifier_fp)
 
     def feed_parse(self, feed: bytes) -> OPDS1Feed:
-        parser = self._xml_parser
-        feed_parser = feedparser.parse(feed)
-        if feed_parser.bozo:
-            raise PalaceValueError(
-                f"Failed to parse OPDS 1.x feed: {feed_parser.bozo_exception}"
-            ) from feed_parser.bozo_exception
-        try:
-            etree_root = etree.fromstring(feed)
-        except etree.Error as e:
-            raise PalaceValueError(f"Failed to parse OPDS 1.x feed XML: {e}") from e
+        stream = OPDS1FeedStream(feed)
+        stream.start()
         return OPDS1Feed(
-            parser=parser,
-            feed_parser=feed_parser,
-            etree=etree_root,
+            parser=self._xml_parser,
+            stream=stream,
         )
 
     @classmethod
     def feed_next_url(cls, feed: OPDS1Feed) -> str | None:
-        parsed_feed = feed.feed_parser["feed"]
-        if not parsed_feed or "links" not in parsed_feed:
-            return None
+        # The feed's links may come after its entries, so the whole feed is read first.
+        feed.stream.finish()
         return first_or_default(
-            [link["href"] for link in parsed_feed["links"] if link["rel"] == "next"]
+            [
+                link["href"]
+                for link in feed.stream.links
+                if link.get("rel") == "next" and link.get("href")
+            ]
         )
 
     def feed_publications(self, feed: OPDS1Feed) -> Generator[OPDS1Publication]:
-        for entry_fp, entry_xml in zip(
-            self._extract_feedparser_entries(feed),
-            self._extract_elementtree_entries(feed),
-        ):
+        for entry_fp, entry_xml in feed.stream.entries():
             yield OPDS1Publication(
                 parser=feed.parser,
                 entry_fp=entry_fp,
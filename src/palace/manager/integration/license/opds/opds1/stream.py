@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Generator
+from datetime import UTC, datetime
+from io import BytesIO
+from typing import Any
+
+import dateutil.parser
+import feedparser
+from lxml import etree
+from lxml.etree import _Element as Element
+
+from palace.util.exceptions import PalaceValueError
+
+from palace.manager.integration.license.opds.opds1.xml_parser import OPDSXMLParser
+
+# feedparser doesn't expose its HTML sanitizer, so it's used through a private
+# function. feedparser is pinned to an exact version, and the stream tests check that
+# the function still sanitizes markup the way feedparser.parse does.
+_sanitize_html = feedparser.sanitizer._sanitize_html
+
+_NS = OPDSXMLParser.NAMESPACES
+_ATOM = "{%s}" % _NS["atom"]
+_DC = "{%s}" % _NS["dc"]
+_DCTERMS = "{%s}" % _NS["dcterms"]
+_BIBFRAME = "{http://bibframe.org/vocab/}"
+
+_FEED = f"{_ATOM}feed"
+_ENTRY = f"{_ATOM}entry"
+_LINK = f"{_ATOM}link"
+
+# The date elements that set an entry's updated and published dates. When an entry
+# has more than one of them, the last one wins.
+_UPDATED = {f"{_ATOM}updated", f"{_ATOM}modified", f"{_DCTERMS}modified", f"{_DC}date"}
+_PUBLISHED = {f"{_ATOM}published", f"{_ATOM}issued", f"{_DCTERMS}issued"}
+
+# Elements in these namespaces are keyed by these prefixes, whatever prefix the feed
+# itself uses for them.
+_KNOWN_PREFIXES = {_NS["dc"]: "dc", _NS["dcterms"]: "dcterms"}
+
+_CONTENT_TYPES = {
+    "text": "text/plain",
+    "html": "text/html",
+    "xhtml": "application/xhtml+xml",
+}
+_MARKUP_TYPES = {"text/html", "application/xhtml+xml"}
+
+# Characters that show up when text encoded as windows-1252 was read as latin-1,
+# mapped to the characters that were meant.
+_CP1252 = {
+    code: bytes([code]).decode("cp1252")
+    for code in range(0x80, 0xA0)
+    if code not in (0x81, 0x8D, 0x8F, 0x90, 0x9D)
+}
+
+
+def _clean(value: str, media_type: str | None = None) -> str:
+    """
+    Clean up a text value the way feedparser does, so the values read from a feed
+    don't depend on which parser read it.
+
+    Markup is sanitized, and text that was encoded as UTF-8 twice is repaired.
+    """
+    value = value.strip()
+    if media_type in _MARKUP_TYPES:
+        value = _sanitize_html(value, "utf-8", media_type)
+    try:
+        value = value.encode("iso-8859-1").decode("utf-8")
+    except (UnicodeEncodeError, UnicodeDecodeError):
+        pass
+    return value.translate(_CP1252)
+
+
+def _text(element: Element) -> str:
+    return _clean(element.text or "")
+
+
+def _parse_date(value: str) -> time.struct_time | None:
+    """Parse a feed date into a UTC time tuple, the way feedparser reports dates."""
+    if not value:
+        return None
+    # A date that leaves out its month or day falls on the first of them.
+    default = datetime(datetime.now(UTC).year, 1, 1)
+    try:
+        parsed = dateutil.parser.parse(value, default=default)
+    except (ValueError, OverflowError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    return parsed.utctimetuple()
+
+
+def _content_detail(element: Element) -> dict[str, str]:
+    """Turn an <atom:summary> or <atom:content> tag into a content detail."""
+    content_type = element.get("type", "text")
+    media_type = _CONTENT_TYPES.get(content_type, content_type)
+    if content_type == "xhtml":
+        # The content is the markup inside the tag's <div>.
+        value = "".join(
+            etree.tostring(child, encoding=str, with_tail=True)
+            for div in element
+            for child in div
+        )
+        div_text = element[0].text if len(element) else None
+        value = (div_text or "") + value
+    else:
+        value = "".join(element.itertext())
+    return {"type": media_type, "value": _clean(value, media_type)}
+
+
+def entry_details(entry: Element) -> dict[str, Any]:
+    """
+    Gather the details of an <atom:entry> tag that the OPDS 1.x extractor reads
+    from the tag's children, keyed the way feedparser keys them.
+
+    Children in a namespace other than Atom that aren't handled here are keyed by
+    namespace prefix and lowercased tag name, like ``schema_alternativeheadline``.
+    """
+    details: dict[str, Any] = {}
+    for child in entry:
+        tag = child.tag
+        if not isinstance(tag, str):
+            # A comment or processing instruction.
+            continue
+
+        if tag == f"{_ATOM}id":
+            details["id"] = _text(child)
+        elif tag == f"{_ATOM}title":
+            details["title"] = _content_detail(child)["value"]
+        elif tag in _UPDATED:
+            details["updated_parsed"] = _parse_date(_text(child))
+        elif tag in _PUBLISHED:
+            details["published_parsed"] = _parse_date(_text(child))
+        elif tag == f"{_DC}publisher":
+            details["publisher"] = _text(child)
+        elif tag == f"{_DC}language":
+            details["language"] = _text(child)
+        elif tag == f"{_ATOM}summary":
+            details["summary_detail"] = _content_detail(child)
+        elif tag == f"{_ATOM}content":
+            details.setdefault("content", []).append(_content_detail(child))
+        elif tag == f"{_BIBFRAME}distribution":
+            details["bibframe_distribution"] = {
+                f"bibframe:{etree.QName(name).localname.lower()}": value
+                for name, value in child.attrib.items()
+            }
+        elif not tag.startswith(_ATOM):
+            qname = etree.QName(child)
+            prefix = _KNOWN_PREFIXES.get(qname.namespace or "", child.prefix)
+            if prefix:
+                details[f"{prefix}_{qname.localname.lower()}"] = _text(child)
+    return details
+
+
+class OPDS1FeedStream:
+    """
+    Parse an OPDS 1.x feed in a single streaming pass.
+
+    Each <atom:entry> is handed out as soon as its closing tag has been parsed,
+    along with the details read from it, and is then detached from the document. So
+    an entry is freed as soon as its consumer lets go of it, and the feed is never
+    held in memory as a whole.
+
+    The links of the feed itself are gathered as the feed is parsed.
+    """
+
+    def __init__(self, content: bytes) -> None:
+        self._events = etree.iterparse(
+            BytesIO(content),
+            events=("start", "end"),
+            remove_comments=True,
+        )
+        self._root: Element | None = None
+        self._depth = 0
+        self._pending: Element | None = None
+        self._finished = False
+        self.links: list[dict[str, str]] = []
+
+    def _next_entry(self) -> Element | None:
+        """Parse up to the end of the next entry, or the end of the feed."""
+        if self._pending is not None:
+            entry, self._pending = self._pending, None
+            return entry
+
+        try:
+            for event, element in self._events:
+                if event == "start":
+                    self._depth += 1
+                    if self._root is None:
+                        self._root = element
+                    continue
+
+                self._depth -= 1
+                if self._depth != 1 or self._root is None:
+                    # Anything but a direct child of the feed is handled along with
+                    # the child it belongs to.
+                    continue
+
+                in_feed = self._root.tag == _FEED
+                self._root.remove(element)
+                if in_feed and element.tag == _ENTRY:
+                    return element
+                if in_feed and element.tag == _LINK:
+                    self.links.append(dict(element.attrib))
+        except etree.XMLSyntaxError as e:
+            raise PalaceValueError(f"Failed to parse OPDS 1.x feed: {e}") from e
+
+        self._finished = True
+        return None
+
+    def start(self) -> None:
+        """
+        Parse the feed up to its first entry.
+
+        This reads the feed's own details, and makes sure the feed is XML at all,
+        before any of its entries are handed out.
+        """
+        if self._root is None and not self._finished:
+            self._pending = self._next_entry()
+
+    def entries(self) -> Generator[tuple[dict[str, Any], Element]]:
+        """Hand out the details and the tag of each entry in the feed, in order."""
+        while (entry := self._next_entry()) is not None:
+            yield entry_details(entry), entry
+
+    def finish(self) -> None:
+        """Parse the rest of the feed, skipping any entries that weren't handed out."""
+        for _ in self.entries():
+            pass
@@ -17,6 +17,8 @@ from palace.util.exceptions import PalaceValueError
 from palace.manager.api.model.token import OAuthTokenResponse
 from palace.manager.core.exceptions import IntegrationException
 from palace.manager.integration.license.opds.exception import OpdsResponseException
+from palace.manager.service.redis.models.oauth_token import OAuthTokenCache
+from palace.manager.service.redis.redis import Redis
 from palace.manager.util import first_or_default
 from palace.manager.util.http.base import ResponseCodesTypes
 from palace.manager.util.http.exception import BadResponseException
@@ -127,7 +129,12 @@ class BasicAuthOpdsRequest(BaseOpdsHttpRequest):
 
 
 class OAuthOpdsRequest(BaseOpdsHttpRequest):
-    """An OPDS request that authenticates via OAuth."""
+    """An OPDS request that authenticates via OAuth.
+
+    If a token cache is given, the token and token URL are shared with every
+    other process using the same cache, rather than each process fetching
+    its own.
+    """
 
     def __init__(
         self,
@@ -135,11 +142,13 @@ class OAuthOpdsRequest(BaseOpdsHttpRequest):
         username: str,
         password: str,
         requests_session: MakeRequestT = SentinelType.NotGiven,
+        token_cache: OAuthTokenCache | None = None,
     ) -> None:
         super().__init__(requests_session)
         self._feed_url = feed_url
         self._username = username
         self._password = password
+        self._token_cache = token_cache
 
         self.session_token: OAuthTokenResponse | None = None
         self._token_url: str | None = None
@@ -174,7 +183,11 @@ class OAuthOpdsRequest(BaseOpdsHttpRequest):
     @property
     def _auth(self) -> BearerAuth:
         if self.session_token is None or self.session_token.expired:
-            token = self.refresh_token()
+            cached = self._token_cache.get() if self._token_cache else None
+            if cached is not None:
+                token = self.session_token = cached
+            else:
+                token = self.refresh_token()
         else:
             token = self.session_token
 
@@ -302,16 +315,31 @@ class OAuthOpdsRequest(BaseOpdsHttpRequest):
             )
         return resp.text
 
-    def refresh_token(self) -> OAuthTokenResponse:
+    def _fetch_token(self) -> OAuthTokenResponse:
+        if self._token_url is None and self._token_cache is not None:
+            self._token_url = self._token_cache.get_token_url()
+
         if self._token_url is None:
             auth_document = self._fetch_auth_document()
             token_url = self._token_url = self._get_oauth_url_from_auth_document(
                 auth_document
             )
+            if self._token_cache is not None:
+                self._token_cache.set_token_url(token_url)
         else:
             token_url = self._token_url
 
-        self.session_token = self._oauth_session_token_refresh(token_url)
+        return self._oauth_session_token_refresh(token_url)
+
+    def refresh_token(self) -> OAuthTokenResponse:
+        if self._token_cache is None:
+            self.session_token = self._fetch_token()
+        else:
+            # If another process has already replaced our token, we use the
+            # token it got, instead of getting another one.
+            self.session_token = self._token_cache.refresh(
+                self._fetch_token, rejected=self.session_token
+            )
         return self.session_token
 
 
@@ -327,8 +355,13 @@ def get_opds_requests(
     password: str | None,
     feed_url: str | None,
     requests_session: MakeRequestT = SentinelType.NotGiven,
+    redis_client: Redis | None = None,
 ) -> BaseOpdsHttpRequest:
-    """Get the appropriate OPDS request class based on the authentication type."""
+    """Get the appropriate OPDS request class based on the authentication type.
+
+    :param redis_client: If given, OAuth tokens are cached in Redis and shared
+        between processes.
+    """
     if authentication == OpdsAuthType.BASIC:
         if username is None or password is None:
             raise PalaceValueError("Username and password are required for basic auth.")
@@ -338,7 +371,14 @@ def get_opds_requests(
             raise PalaceValueError(
                 "Username, password and feed_url are required for OAuth."
             )
-        return OAuthOpdsRequest(feed_url, username, password, requests_session)
+        token_cache = (
+            OAuthTokenCache(redis_client, feed_url, username)
+            if redis_client is not None
+            else None
+        )
+        return OAuthOpdsRequest(
+            feed_url, username, password, requests_session, token_cache
+        )
     elif authentication == OpdsAuthType.NONE:
         return NoAuthOpdsRequest(requests_session)
     else:
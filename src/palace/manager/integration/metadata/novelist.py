@@ -1,11 +1,12 @@
 import datetime
+import itertools
 import json
 import logging
 import urllib.error
 import urllib.parse
 import urllib.request
 from collections import Counter
-from collections.abc import Mapping
+from collections.abc import Generator, Iterable, Mapping
 from typing import Annotated, Any, Self
 
 from requests import Response
@@ -13,6 +14,7 @@ from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session, aliased
 from sqlalchemy.sql import and_, join, or_, select
 
+from palace.util.datetime_helpers import utc_now
 from palace.util.log import LoggerMixin
 
 from palace.manager.core.config import CannotLoadConfiguration
@@ -28,6 +30,7 @@ from palace.manager.integration.settings import (
     FormMetadata,
 )
 from palace.manager.sqlalchemy.model.contributor import Contribution, Contributor
+from palace.manager.sqlalchemy.model.coverage import Timestamp
 from palace.manager.sqlalchemy.model.datasource import DataSource
 from palace.manager.sqlalchemy.model.edition import Edition
 from palace.manager.sqlalchemy.model.identifier import Equivalency, Identifier
@@ -87,6 +90,15 @@ class NoveListAPI(
     AUTH_PARAMS = "&profile=%(profile)s&password=%(password)s"
     MAX_REPRESENTATION_AGE = 7 * 24 * 60 * 60  # one week
 
+    # The name of the Timestamp recording when a library's collection was last
+    # sent to NoveList.
+    COLLECTION_SYNC_SERVICE = "NoveList Collection Sync"
+
+    # How many rows of the collection query to fetch from the database at a time,
+    # and how many records to send to NoveList in each chunk of the request body.
+    ITEMS_PAGE_SIZE = 1000
+    RECORDS_PER_CHUNK = 100
+
     medium_to_book_format_type_values = {
         Edition.BOOK_MEDIUM: "EBook",
         Edition.AUDIO_MEDIUM: "Audiobook",
@@ -418,12 +430,27 @@ class NoveListAPI(
     def get_items_from_query(self, library: Library) -> list[dict[str, str]]:
         """Gets identifiers and its related title, medium, and authors from the
         database.
+
+        :return: a list of Novelist objects to send
+        """
+        return list(self.iter_items_from_query(library))
+
+    def iter_items_from_query(
+        self, library: Library, since: datetime.datetime | None = None
+    ) -> Generator[dict[str, str]]:
+        """Gets identifiers and its related title, medium, and authors from the
+        database, one item at a time.
         Keeps track of the current 'ISBN' identifier and current item object that
         is being processed. If the next ISBN being processed is new, the existing one
-        gets added to the list of items. If the ISBN is the same, then we append
+        gets yielded. If the ISBN is the same, then we append
         the Author property since there are multiple contributors.
 
-        :return: a list of Novelist objects to send
+        The rows are read through a server-side cursor, ITEMS_PAGE_SIZE at a time,
+        so the library's whole catalog is never held in memory.
+
+        :param since: If provided, only the titles whose licenses have changed
+            since this time are included.
+        :return: a generator of Novelist objects to send
         """
         collectionList = [c.id for c in library.active_collections]
 
@@ -433,6 +460,14 @@ class NoveListAPI(
         roles = list(Contributor.AUTHOR_ROLES)
         roles.append(Contributor.Role.NARRATOR)
 
+        conditions = [
+            LicensePool.collection_id.in_(collectionList),
+            or_(i1.type == "ISBN", i2.type == "ISBN"),
+            or_(Contribution.role.in_(roles)),
+        ]
+        if since is not None:
+            conditions.append(LicensePool.last_updated >= since)
+
         isbnQuery = (
             select(
                 i1.identifier,
@@ -460,19 +495,13 @@ class NoveListAPI(
                 .join(Contributor, Contribution.contributor_id == Contributor.id)  # type: ignore[arg-type]
                 .join(DataSource, DataSource.id == LicensePool.data_source_id)  # type: ignore[arg-type]
             )
-            .where(
-                and_(
-                    LicensePool.collection_id.in_(collectionList),
-                    or_(i1.type == "ISBN", i2.type == "ISBN"),
-                    or_(Contribution.role.in_(roles)),
-                )
-            )
+            .where(and_(*conditions))
             .order_by(i1.identifier, i2.identifier)
+            .execution_options(stream_results=True, max_row_buffer=self.ITEMS_PAGE_SIZE)
         )
 
         result = self._db.execute(isbnQuery)
 
-        items = []
         newItem: dict[str, str] | None = None
         existingItem: dict[str, str] | None = None
         currentIdentifier: str | None = None
@@ -494,14 +523,12 @@ class NoveListAPI(
             if addItem and existingItem:
                 # The Role property isn't needed in the actual request.
                 del existingItem["role"]
-                items.append(existingItem)
+                yield existingItem
 
         # For the case when there's only one item in `result`
         if newItem:
             del newItem["role"]
-            items.append(newItem)
-
-        return items
+            yield newItem
 
     def create_item_object(
         self,
@@ -593,31 +620,115 @@ class NoveListAPI(
 
             return (isbn, existingItem, newItem, addItem)
 
-    def put_items_novelist(self, library: Library) -> dict[str, Any] | None:
-        items = self.get_items_from_query(library)
+    @classmethod
+    def collection_sync_service(cls, library: Library) -> str:
+        """The name of the Timestamp recording when a library's collection was last
+        sent to NoveList."""
+        return f"{cls.COLLECTION_SYNC_SERVICE} (library {library.id})"
+
+    def collection_synced_at(self, library: Library) -> datetime.datetime | None:
+        """When the library's collection was last sent to NoveList, if ever.
+
+        This is when the last successful run started, so that any license that
+        changed while it was running is sent again next time.
+        """
+        stamp = Timestamp.lookup(
+            self._db,
+            self.collection_sync_service(library),
+            Timestamp.TASK_TYPE,
+            None,
+        )
+        return stamp.start if stamp else None
+
+    def put_items_novelist(
+        self, library: Library, full: bool = False
+    ) -> dict[str, Any] | None:
+        """Send the library's titles to NoveList.
+
+        Only the titles whose licenses have changed since the last successful run
+        are sent, unless this is the first run or `full` is set. The request body is
+        streamed as it's read from the database.
+
+        :return: NoveList's response, or None if nothing was sent or NoveList
+            rejected the request.
+        """
+        since = None if full else self.collection_synced_at(library)
+        started = utc_now()
+
+        items = self.iter_items_from_query(library, since=since)
+        first_item = next(items, None)
+        records_sent = 0
+
+        def counted(
+            records: Iterable[dict[str, str]],
+        ) -> Generator[dict[str, str]]:
+            nonlocal records_sent
+            for record in records:
+                records_sent += 1
+                yield record
 
         content: dict[str, Any] | None = None
-        if items:
-            data = json.dumps(self.make_novelist_data_object(items))
+        if first_item:
             response = self.put(
                 self.COLLECTION_DATA_API,
                 {
                     "AuthorizedIdentifier": self.AUTHORIZED_IDENTIFIER,
                     "Content-Type": "application/json; charset=utf-8",
                 },
-                data=data,
+                data=self.novelist_data_chunks(
+                    counted(itertools.chain([first_item], items))
+                ),
+                # A streamed body can't be sent again.
+                max_retry_count=0,
             )
-            if response.status_code == 200:
-                content = json.loads(response.content)
-                logging.info("Success from NoveList: %r", response.content)
-            else:
-                logging.error("Data sent was: %r", data)
+            if response.status_code != 200:
+                logging.error(
+                    "Sent %d records%s.",
+                    records_sent,
+                    f" changed since {since.isoformat()}" if since else "",
+                )
                 logging.error(
                     "Error %s from NoveList: %r", response.status_code, response.content
                 )
-
+                return None
+
+            content = json.loads(response.content)
+            logging.info("Success from NoveList: %r", response.content)
+
+        Timestamp.stamp(
+            self._db,
+            self.collection_sync_service(library),
+            Timestamp.TASK_TYPE,
+            start=started,
+            finish=utc_now(),
+            achievements=f"Records sent: {records_sent}",
+        )
         return content
 
+    def novelist_data_chunks(self, items: Iterable[dict[str, str]]) -> Generator[bytes]:
+        """Serialize the data object for NoveList a few records at a time.
+
+        The chunks join up to the same JSON document as serializing the whole
+        data object at once.
+        """
+        header = json.dumps(self.make_novelist_data_object([]))
+        # Everything up to the empty records list's closing bracket.
+        yield header[: header.rindex("]")].encode("utf-8")
+
+        records: list[str] = []
+        first_chunk = True
+        for item in items:
+            records.append(json.dumps(item))
+            if len(records) >= self.RECORDS_PER_CHUNK:
+                yield (("" if first_chunk else ", ") + ", ".join(records)).encode(
+                    "utf-8"
+                )
+                first_chunk = False
+                records = []
+        if records:
+            yield (("" if first_chunk else ", ") + ", ".join(records)).encode("utf-8")
+        yield b"]}"
+
     def make_novelist_data_object(self, items: list[dict[str, str]]) -> dict[str, Any]:
         return {
             "customer": f"{self.profile}:{self.password}",
@@ -3,7 +3,7 @@ from collections.abc import Mapping
 from datetime import datetime
 from re import Pattern
 from threading import Lock
-from typing import Annotated, Any, Final
+from typing import Annotated, Any, Final, cast
 
 from annotated_types import Ge, Le
 from flask_babel import lazy_gettext as _
@@ -38,10 +38,12 @@ from palace.manager.integration.patron_auth.saml.metadata.model import (
     SAMLAttributeType,
     SAMLBinding,
     SAMLIdentityProviderMetadata,
+    SAMLProviderMetadata,
     SAMLServiceProviderMetadata,
     SAMLSubjectPatronIDExtractor,
 )
 from palace.manager.integration.patron_auth.saml.metadata.parser import (
+    SAMLMetadataCache,
     SAMLMetadataParser,
     SAMLMetadataParsingError,
 )
@@ -571,6 +573,11 @@ class SAMLOneLoginConfiguration(LoggerMixin):
     SECURITY = "security"
     AUTHN_REQUESTS_SIGNED = "authnRequestsSigned"
 
+    # IdP metadata parsed by any configuration in this process. A configuration
+    # is built for every SAML request, and parsing the metadata of every
+    # federated IdP each time is costly.
+    _identity_provider_metadata_cache = SAMLMetadataCache()
+
     def __init__(
         self,
         configuration: SAMLWebSSOAuthSettings,
@@ -624,28 +631,27 @@ class SAMLOneLoginConfiguration(LoggerMixin):
 
         :raise: SAMLParsingError
         """
-        identity_providers = []
+        identity_providers: list[SAMLProviderMetadata] = []
 
         if self._configuration.non_federated_identity_provider_xml_metadata:
-            parsing_results = self._metadata_parser.parse(
-                self._configuration.non_federated_identity_provider_xml_metadata
+            identity_providers = self._identity_provider_metadata_cache.get_providers(
+                self._configuration.non_federated_identity_provider_xml_metadata,
+                self._metadata_parser,
             )
-            identity_providers = [
-                parsing_result.provider for parsing_result in parsing_results
-            ]
 
         if self._configuration.federated_identity_provider_entity_ids:
             for identity_provider_metadata in self._get_federated_identity_providers(
                 db
             ):
-                parsing_results = self._metadata_parser.parse(
-                    identity_provider_metadata.xml_metadata
+                identity_providers.extend(
+                    self._identity_provider_metadata_cache.get_providers(
+                        identity_provider_metadata.xml_metadata,
+                        self._metadata_parser,
+                    )
                 )
 
-                for parsing_result in parsing_results:
-                    identity_providers.append(parsing_result.provider)
-
-        return identity_providers
+        # The metadata is IdP metadata, so it's only IdPs that are parsed from it.
+        return cast(list[SAMLIdentityProviderMetadata], identity_providers)
 
     def get_acs_selection_policy(self) -> SAMLACSSelectionPolicy:
         """Resolve the ACS endpoint selection policy for this integration.
@@ -1,11 +1,25 @@
+import hashlib
 import logging
-
-from onelogin.saml2.idp_metadata_parser import OneLogin_Saml2_IdPMetadataParser
+import shutil
+import tempfile
+import urllib.request
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from functools import cached_property
+from typing import IO
+from urllib.error import HTTPError
+
+from lxml import etree
+from onelogin.saml2.constants import OneLogin_Saml2_Constants
 from onelogin.saml2.xmlparser import tostring
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
 
 from palace.util.exceptions import BasePalaceException
 
 from palace.manager.integration.patron_auth.saml.metadata.federations.validator import (
+    SAMLFederatedMetadataExpirationValidator,
     SAMLFederatedMetadataValidator,
 )
 from palace.manager.integration.patron_auth.saml.metadata.parser import (
@@ -22,35 +36,99 @@ class SAMLMetadataLoadingError(BasePalaceException):
     """Raised in the case of any errors occurred during loading of SAML metadata from a remote source"""
 
 
+# The same restrictions onelogin's parser puts on the XML it parses.
+_ITERPARSE_OPTIONS = dict(
+    load_dtd=False,
+    resolve_entities=False,
+    no_network=True,
+    remove_comments=True,
+    remove_pis=True,
+)
+
+
+@dataclass
+class SAMLMetadataDocument:
+    """Aggregated SAML metadata downloaded from a metadata service."""
+
+    file: IO[bytes]
+    """The metadata, spooled to a temporary file."""
+
+    etag: str | None
+    """The HTTP ETag of the metadata, if the metadata service sent one."""
+
+
+@dataclass(frozen=True)
+class SAMLFederatedIdentityProviderMetadata:
+    """Metadata of a single federated IdP, read from a federation's aggregated metadata."""
+
+    entity_id: str
+    display_name: str
+    xml_metadata: str
+
+    @cached_property
+    def digest(self) -> str:
+        """MD5 digest of the IdP's XML metadata.
+
+        It matches the digest PostgreSQL's md5() function gives for the stored XML
+        metadata, so unchanged IdPs can be found without loading their metadata.
+        """
+        return hashlib.md5(
+            self.xml_metadata.encode("utf-8"), usedforsecurity=False
+        ).hexdigest()
+
+
 class SAMLMetadataLoader:
     """Loads SAML metadata from a remote source (e.g. InCommon Metadata Service)"""
 
+    # The size of the chunks metadata is downloaded in.
+    DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
     def __init__(self):
         """Initializes a new instance of SAMLMetadataLoader"""
 
         self._logger = logging.getLogger(__name__)
 
-    def load_idp_metadata(self, url=None):
-        """Load IdP metadata in an XML format from the specified url.
+    def download_idp_metadata(
+        self, url: str, etag: str | None = None
+    ) -> SAMLMetadataDocument | None:
+        """Download IdP metadata in an XML format from the specified url to a temporary file.
+
+        The metadata is never held in memory as a whole.
 
         :param url: URL of a metadata service
-        :type url: Optional[string]
+        :param etag: ETag of the metadata downloaded the last time, if any
 
-        :return: XML string containing InCommon Metadata
-        :rtype: string
+        :return: The downloaded metadata, or None if the metadata service reports
+            that the metadata hasn't changed since it had the given ETag
 
-        :raise: MetadataLoadError
+        :raise: SAMLMetadataLoadingError
         """
-        self._logger.info(f"Started loading IdP XML metadata from {url}")
+        self._logger.info(f"Started downloading IdP XML metadata from {url}")
+
+        headers = {"If-None-Match": etag} if etag else {}
+        metadata_file = tempfile.TemporaryFile()
 
         try:
-            xml_metadata = OneLogin_Saml2_IdPMetadataParser.get_metadata(url)
+            with urllib.request.urlopen(
+                urllib.request.Request(url, headers=headers)
+            ) as response:
+                shutil.copyfileobj(response, metadata_file, self.DOWNLOAD_CHUNK_SIZE)
+                new_etag = response.headers.get("ETag")
+        except HTTPError as exception:
+            metadata_file.close()
+            if exception.code == 304:
+                self._logger.info(f"IdP XML metadata from {url} has not changed")
+                return None
+            raise SAMLMetadataLoadingError() from exception
         except Exception as exception:
+            metadata_file.close()
             raise SAMLMetadataLoadingError() from exception
 
-        self._logger.info(f"Finished loading IdP XML metadata from {url}")
+        metadata_file.seek(0)
+
+        self._logger.info(f"Finished downloading IdP XML metadata from {url}")
 
-        return xml_metadata
+        return SAMLMetadataDocument(metadata_file, new_etag)
 
 
 class SAMLFederatedIdentityProviderLoader:
@@ -58,6 +136,9 @@ class SAMLFederatedIdentityProviderLoader:
 
     ENGLISH_LANGUAGE_CODES = ("en", "eng")
 
+    # How many IdPs are inserted or updated at a time.
+    BATCH_SIZE = 500
+
     def __init__(self, loader, validator, parser):
         """Initialize a new instance of SAMLFederatedIdentityProviderLoader class.
 
@@ -113,60 +194,221 @@ class SAMLFederatedIdentityProviderLoader:
 
         return first_or_default(localized_values).value
 
-    def load(self, federation):
-        """Loads metadata of federated IdPs from the specified metadata service.
+    def _get_display_name(self, idp):
+        """Choose the name an IdP is shown to patrons with.
 
-        :param federation: SAML federation where loaded IdPs belong to
-        :type federation: api.saml.metadata.federations.model.SAMLFederation
+        :param idp: IdP metadata
+        :type idp: api.saml.metadata.model.SAMLIdentityProviderMetadata
 
-        :return: List of SAMLFederatedIdP objects
-        :rtype: Iterable[api.saml.configuration.SAMLFederatedIdentityProvider]
+        :return: IdP's display name
+        :rtype: str
         """
-        if not isinstance(federation, SAMLFederation):
-            raise ValueError(
-                "Argument 'federation' must be an instance of {} class".format(
-                    SAMLFederation
-                )
+        if idp.ui_info.display_names:
+            return self._try_to_get_an_english_value(idp.ui_info.display_names)
+        elif idp.organization.organization_display_names:
+            return self._try_to_get_an_english_value(
+                idp.organization.organization_display_names
+            )
+        elif idp.organization.organization_names:
+            return self._try_to_get_an_english_value(
+                idp.organization.organization_names
             )
 
-        self._logger.info(f"Started loading federated IdP's for {federation}")
+        return idp.entity_id
 
-        federated_idps = []
-        metadata = self._loader.load_idp_metadata(federation.idp_metadata_service_url)
+    @staticmethod
+    def _read_valid_until(metadata: IO[bytes]) -> datetime | None:
+        """Read the validUntil attribute of the metadata's root element, without
+        parsing the rest of the metadata.
 
-        self._validator.validate(federation, metadata)
+        :return: The metadata's expiration time, or None if it can't be read
+        """
+        valid_until = None
 
-        parsing_results = self._parser.parse(metadata)
+        try:
+            for _, root in etree.iterparse(
+                metadata, events=("start",), **_ITERPARSE_OPTIONS
+            ):
+                valid_until = root.get("validUntil")
+                break
+
+            if valid_until:
+                return SAMLFederatedMetadataExpirationValidator.parse_saml_date_time(
+                    valid_until
+                )
+        except (etree.XMLSyntaxError, ValueError):
+            # The validator reports what is wrong with the metadata.
+            pass
+        finally:
+            metadata.seek(0)
 
-        for parsing_result in parsing_results:
-            idp = parsing_result.provider
+        return None
 
-            if idp.ui_info.display_names:
-                display_name = self._try_to_get_an_english_value(
-                    idp.ui_info.display_names
+    def iter_idps(
+        self, metadata: IO[bytes]
+    ) -> Iterator[SAMLFederatedIdentityProviderMetadata]:
+        """Parse federated IdPs from aggregated metadata one EntityDescriptor at a time.
+
+        Each EntityDescriptor is discarded once it has been parsed, so the aggregated
+        metadata is never held in memory as a whole.
+
+        :param metadata: SAML federation's aggregated metadata
+        """
+        entity_descriptors = etree.iterparse(
+            metadata,
+            events=("end",),
+            tag=f"{{{OneLogin_Saml2_Constants.NS_MD}}}EntityDescriptor",
+            **_ITERPARSE_OPTIONS,
+        )
+
+        for _, entity_descriptor_node in entity_descriptors:
+            parsing_results = self._parser.parse_entity_descriptor(
+                entity_descriptor_node
+            )
+
+            # An entity that is both an IdP and an SP is only stored once.
+            if parsing_results:
+                idp = parsing_results[0].provider
+                yield SAMLFederatedIdentityProviderMetadata(
+                    idp.entity_id.strip(),
+                    self._get_display_name(idp).strip(),
+                    tostring(
+                        entity_descriptor_node, encoding="unicode", with_tail=False
+                    ),
                 )
-            elif idp.organization.organization_display_names:
-                display_name = self._try_to_get_an_english_value(
-                    idp.organization.organization_display_names
+
+            entity_descriptor_node.clear(keep_tail=True)
+            while entity_descriptor_node.getprevious() is not None:
+                del entity_descriptor_node.getparent()[0]
+
+    def _synchronize(
+        self,
+        federation: SAMLFederation,
+        session: Session,
+        idps: Iterable[SAMLFederatedIdentityProviderMetadata],
+    ) -> None:
+        """Make the IdPs stored for a federation match the given ones, writing only
+        the IdPs that were added, changed or removed.
+        """
+        existing_idps: dict[str, tuple[int, str]] = {}
+        stale_idp_ids = []
+
+        for idp_id, entity_id, digest in session.execute(
+            select(
+                SAMLFederatedIdentityProvider.id,
+                SAMLFederatedIdentityProvider.entity_id,
+                func.md5(SAMLFederatedIdentityProvider.xml_metadata),
+            ).where(SAMLFederatedIdentityProvider.federation_id == federation.id)
+        ):
+            if entity_id in existing_idps:
+                stale_idp_ids.append(idp_id)
+            else:
+                existing_idps[entity_id] = (idp_id, digest)
+
+        new_idps: list[dict[str, object]] = []
+        changed_idps: list[dict[str, object]] = []
+        seen_entity_ids = set()
+        added = changed = unchanged = 0
+
+        for idp in idps:
+            if idp.entity_id in seen_entity_ids:
+                continue
+            seen_entity_ids.add(idp.entity_id)
+
+            existing_idp = existing_idps.pop(idp.entity_id, None)
+            if existing_idp is None:
+                new_idps.append(
+                    dict(
+                        federation_id=federation.id,
+                        entity_id=idp.entity_id,
+                        display_name=idp.display_name,
+                        xml_metadata=idp.xml_metadata,
+                    )
                 )
-            elif idp.organization.organization_names:
-                display_name = self._try_to_get_an_english_value(
-                    idp.organization.organization_names
+                added += 1
+            elif existing_idp[1] != idp.digest:
+                changed_idps.append(
+                    dict(
+                        id=existing_idp[0],
+                        display_name=idp.display_name,
+                        xml_metadata=idp.xml_metadata,
+                    )
                 )
+                changed += 1
             else:
-                display_name = idp.entity_id
-
-            xml_metadata = tostring(parsing_result.xml_node, encoding="unicode")
-            federated_idp = SAMLFederatedIdentityProvider(
-                federation, idp.entity_id.strip(), display_name.strip(), xml_metadata
+                unchanged += 1
+
+            if len(new_idps) >= self.BATCH_SIZE:
+                session.bulk_insert_mappings(SAMLFederatedIdentityProvider, new_idps)
+                new_idps = []
+            if len(changed_idps) >= self.BATCH_SIZE:
+                session.bulk_update_mappings(
+                    SAMLFederatedIdentityProvider, changed_idps
+                )
+                changed_idps = []
+
+        if new_idps:
+            session.bulk_insert_mappings(SAMLFederatedIdentityProvider, new_idps)
+        if changed_idps:
+            session.bulk_update_mappings(SAMLFederatedIdentityProvider, changed_idps)
+
+        stale_idp_ids.extend(idp_id for idp_id, _ in existing_idps.values())
+        if stale_idp_ids:
+            session.execute(
+                delete(SAMLFederatedIdentityProvider)
+                .where(SAMLFederatedIdentityProvider.id.in_(stale_idp_ids))
+                .execution_options(synchronize_session=False)
             )
 
-            federated_idps.append(federated_idp)
+        session.expire(federation, ["identity_providers"])
 
         self._logger.info(
-            "Finished loading {} federated IdP's for {}".format(
-                len(federated_idps), federation
-            )
+            f"{federation}: {added} IdP's added, {changed} changed, "
+            f"{len(stale_idp_ids)} removed and {unchanged} unchanged"
         )
 
-        return federated_idps
+    def update(self, federation: SAMLFederation, session: Session) -> bool:
+        """Bring the IdPs stored for a federation up to date with its metadata service.
+
+        The metadata is streamed, and only IdPs whose metadata changed are written.
+        If the metadata's ETag or validUntil attribute are the same as the last
+        time, it isn't parsed at all.
+
+        :param federation: SAML federation whose IdPs are updated
+        :param session: Database session
+
+        :return: Whether the metadata had changed
+        """
+        self._logger.info(f"Started updating federated IdP's for {federation}")
+
+        document = self._loader.download_idp_metadata(
+            federation.idp_metadata_service_url, federation.metadata_etag
+        )
+        if document is None:
+            self._logger.info(f"Metadata of {federation} has not changed")
+            return False
+
+        with document.file as metadata:
+            valid_until = self._read_valid_until(metadata)
+            if (
+                valid_until is not None
+                and valid_until == federation.metadata_valid_until
+            ):
+                self._logger.info(
+                    f"Metadata of {federation} is still valid until {valid_until}"
+                )
+                federation.metadata_etag = document.etag
+                return False
+
+            # Verifying the signature needs the whole document.
+            self._validator.validate(federation, metadata.read())
+            metadata.seek(0)
+
+            self._synchronize(federation, session, self.iter_idps(metadata))
+
+        federation.metadata_etag = document.etag
+        federation.metadata_valid_until = valid_until
+
+        self._logger.info(f"Finished updating federated IdP's for {federation}")
+
+        return True
@@ -81,7 +81,7 @@ class SAMLFederatedMetadataExpirationValidator(SAMLFederatedMetadataValidator):
         self._logger = logging.getLogger(__name__)
 
     @staticmethod
-    def _parse_saml_date_time(saml_date_time):
+    def parse_saml_date_time(saml_date_time):
         """Parse the string containing date & time information in the SAML format into datetime object.
 
         :param saml_date_time: String containing date & time information in the SAML format
@@ -128,7 +128,7 @@ class SAMLFederatedMetadataExpirationValidator(SAMLFederatedMetadataValidator):
                 'Metadata does not contain "validUntil" attribute'
             )
 
-        valid_until = self._parse_saml_date_time(valid_until)
+        valid_until = self.parse_saml_date_time(valid_until)
         now = utc_now()
 
         if valid_until < now and (now - valid_until) > self.MAX_CLOCK_SKEW:
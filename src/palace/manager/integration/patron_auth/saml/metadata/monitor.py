@@ -31,13 +31,7 @@ class SAMLMetadataMonitor(Monitor):
         """
         self._logger.info(f"Started processing {saml_federation}")
 
-        for existing_identity_provider in saml_federation.identity_providers:
-            self._db.delete(existing_identity_provider)
-
-        new_identity_providers = self._loader.load(saml_federation)
-
-        for new_identity_provider in new_identity_providers:
-            self._db.add(new_identity_provider)
+        self._loader.update(saml_federation, self._db)
 
         saml_federation.last_updated_at = utc_now()
 
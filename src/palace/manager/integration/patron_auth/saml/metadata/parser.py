@@ -1,4 +1,7 @@
+import hashlib
 import logging
+from collections import OrderedDict
+from threading import Lock
 
 from flask_babel import lazy_gettext as _
 from lxml.etree import XMLSyntaxError
@@ -21,6 +24,7 @@ from palace.manager.integration.patron_auth.saml.metadata.model import (
     SAMLNameID,
     SAMLNameIDFormat,
     SAMLOrganization,
+    SAMLProviderMetadata,
     SAMLService,
     SAMLServiceProviderMetadata,
     SAMLSubject,
@@ -584,6 +588,67 @@ class SAMLMetadataParser:
 
         return self._select_first_indexed_element(nodes)
 
+    def _parse_entity_descriptor(self, entity_descriptor_node):
+        """Parses an EntityDescriptor node into a list of SAMLMetadataParsingResult objects,
+        one for each of its IDPSSODescriptor/SPSSODescriptor nodes
+
+        :param entity_descriptor_node: EntityDescriptor node
+        :type entity_descriptor_node: onelogin.saml2.xmlparser.RestrictedElement
+
+        :return: List of SAMLMetadataParsingResult objects
+        :rtype: List[SAMLMetadataParsingResult]
+
+        :raise: MetadataParsingError
+        """
+        parsing_results = []
+
+        idp_descriptor_nodes = OneLogin_Saml2_XML.query(
+            entity_descriptor_node, "./md:IDPSSODescriptor"
+        )
+        idps = self._parse_providers(
+            entity_descriptor_node,
+            idp_descriptor_nodes,
+            self._parse_idp_metadata,
+        )
+
+        for idp in idps:
+            parsing_result = SAMLMetadataParsingResult(idp, entity_descriptor_node)
+            parsing_results.append(parsing_result)
+
+        sp_descriptor_nodes = OneLogin_Saml2_XML.query(
+            entity_descriptor_node, "./md:SPSSODescriptor"
+        )
+        sps = self._parse_providers(
+            entity_descriptor_node, sp_descriptor_nodes, self._parse_sp_metadata
+        )
+
+        for sp in sps:
+            parsing_result = SAMLMetadataParsingResult(sp, entity_descriptor_node)
+            parsing_results.append(parsing_result)
+
+        return parsing_results
+
+    def parse_entity_descriptor(self, entity_descriptor_node):
+        """Parses a single EntityDescriptor node, for example one read from a stream,
+        and translates it into a list of IdentityProviderMetadata/ServiceProviderMetadata objects
+
+        :param entity_descriptor_node: EntityDescriptor node
+        :type entity_descriptor_node: lxml.etree._Element
+
+        :return: List of SAMLMetadataParsingResult objects
+        :rtype: List[SAMLMetadataParsingResult]
+
+        :raise: MetadataParsingError
+        """
+        try:
+            return self._parse_entity_descriptor(entity_descriptor_node)
+        except XMLSyntaxError as exception:
+            self._logger.exception(
+                "An unexpected error occurred during parsing an EntityDescriptor node"
+            )
+
+            raise SAMLMetadataParsingError() from exception
+
     def parse(self, xml_metadata):
         """Parses an XML string containing SAML metadata and translates it into a list of
         IdentityProviderMetadata/ServiceProviderMetadata objects
@@ -607,33 +672,9 @@ class SAMLMetadataParser:
             )
 
             for entity_descriptor_node in entity_descriptor_nodes:
-                idp_descriptor_nodes = OneLogin_Saml2_XML.query(
-                    entity_descriptor_node, "./md:IDPSSODescriptor"
-                )
-                idps = self._parse_providers(
-                    entity_descriptor_node,
-                    idp_descriptor_nodes,
-                    self._parse_idp_metadata,
-                )
-
-                for idp in idps:
-                    parsing_result = SAMLMetadataParsingResult(
-                        idp, entity_descriptor_node
-                    )
-                    parsing_results.append(parsing_result)
-
-                sp_descriptor_nodes = OneLogin_Saml2_XML.query(
-                    entity_descriptor_node, "./md:SPSSODescriptor"
+                parsing_results.extend(
+                    self._parse_entity_descriptor(entity_descriptor_node)
                 )
-                sps = self._parse_providers(
-                    entity_descriptor_node, sp_descriptor_nodes, self._parse_sp_metadata
-                )
-
-                for sp in sps:
-                    parsing_result = SAMLMetadataParsingResult(
-                        sp, entity_descriptor_node
-                    )
-                    parsing_results.append(parsing_result)
         except XMLSyntaxError as exception:
             self._logger.exception(
                 "An unexpected error occurred during parsing an XML string containing SAML metadata"
@@ -646,6 +687,74 @@ class SAMLMetadataParser:
         return parsing_results
 
 
+class SAMLMetadataCache:
+    """Process-wide LRU cache of the providers parsed from SAML metadata.
+
+    Entries are keyed by a digest of the XML rather than by where the XML came
+    from, so metadata that changes is parsed again, and the entry for the old
+    metadata is eventually evicted.
+    """
+
+    DEFAULT_MAX_SIZE = 1000
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        """Initialize a new instance of SAMLMetadataCache class.
+
+        :param max_size: How many parsed XML documents are kept
+        """
+        self._max_size = max_size
+        self._mutex = Lock()
+        self._providers: OrderedDict[str, tuple[SAMLProviderMetadata, ...]] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._providers)
+
+    def get_providers(
+        self, xml_metadata: str, parser: SAMLMetadataParser
+    ) -> list[SAMLProviderMetadata]:
+        """Return the providers parsed from the XML metadata, parsing it only if it
+        isn't cached already.
+
+        The cached providers are shared, so they must not be modified. Every caller
+        of a cache must also configure its parser the same way.
+
+        :param xml_metadata: XML string containing SAML metadata
+        :param parser: Parser used if the metadata isn't cached
+
+        :return: List of IdentityProviderMetadata/ServiceProviderMetadata objects
+
+        :raise: SAMLMetadataParsingError
+        """
+        key = hashlib.sha256(xml_metadata.encode("utf-8")).hexdigest()
+
+        with self._mutex:
+            providers = self._providers.get(key)
+            if providers is not None:
+                self._providers.move_to_end(key)
+                return list(providers)
+
+        # Parsing happens outside the lock, so a slow parse doesn't hold up
+        # lookups of other metadata.
+        providers = tuple(
+            parsing_result.provider for parsing_result in parser.parse(xml_metadata)
+        )
+
+        with self._mutex:
+            self._providers[key] = providers
+            self._providers.move_to_end(key)
+            while len(self._providers) > self._max_size:
+                self._providers.popitem(last=False)
+
+        return list(providers)
+
+    def clear(self) -> None:
+        """Remove all the cached providers."""
+        with self._mutex:
+            self._providers.clear()
+
+
 class SAMLSubjectParser:
     """Parses SAML response into Subject object"""
 
@@ -43,6 +43,7 @@ class ExternalSearchIndex(LoggerMixin):
         filter: Filter | None,
         pagination: Pagination | None,
         debug: bool,
+        ids_only: bool = False,
     ) -> Search:
         query: Query
         if filter and filter.search_type == "json":
@@ -62,6 +63,10 @@ class ExternalSearchIndex(LoggerMixin):
             # This makes it easy to investigate everything about the
             # results we do get.
             fields = ["*"]
+        elif ids_only:
+            # The work ID is the document ID, so the document source
+            # isn't needed at all.
+            return search.source(False)  # type: ignore[no-any-return]
         else:
             # All we absolutely need is the work ID, which is a
             # key into the database, plus the values of any script fields,
@@ -83,6 +88,7 @@ class ExternalSearchIndex(LoggerMixin):
         filter: Filter | None = None,
         pagination: Pagination | None = None,
         debug: bool = False,
+        ids_only: bool = False,
     ) -> Sequence[Hit]:
         """Run a search query.
 
@@ -98,6 +104,8 @@ class ExternalSearchIndex(LoggerMixin):
             Opensearch for all available fields, not just the
             fields known to be used by the feed generation code.  This
             all comes at a slight performance cost.
+        :param ids_only: If this is True, the search query won't ask
+            for any of the document source, only the document IDs.
         :return: A list of Hit objects containing information about
             the search results. This will include the values of any
             script fields calculated by Opensearch during the
@@ -110,7 +118,7 @@ class ExternalSearchIndex(LoggerMixin):
 
         pagination = pagination or Pagination.default()
         query_data = (query_string, filter, pagination)
-        query_hits = self.query_works_multi([query_data], debug)
+        query_hits = self.query_works_multi([query_data], debug, ids_only=ids_only)
         if not query_hits:
             return []
 
@@ -124,6 +132,7 @@ class ExternalSearchIndex(LoggerMixin):
         self,
         queries: Sequence[tuple[str | None, Filter | None, Pagination]],
         debug: bool = False,
+        ids_only: bool = False,
     ) -> Iterator[Sequence[Hit]]:
         """Run several queries simultaneously and return the results
         as a big list.
@@ -142,7 +151,11 @@ class ExternalSearchIndex(LoggerMixin):
         # as part of `queries`.
         for query_string, filter, pagination in queries:
             search = self.create_search_doc(
-                query_string, filter=filter, pagination=pagination, debug=debug
+                query_string,
+                filter=filter,
+                pagination=pagination,
+                debug=debug,
+                ids_only=ids_only,
             )
             function_scores = filter.scoring_functions if filter else None
             if function_scores:
@@ -178,6 +191,21 @@ class ExternalSearchIndex(LoggerMixin):
             pagination.page_loaded(results)
             yield results
 
+    def query_work_ids(
+        self,
+        query_string: str | None,
+        filter: Filter | None = None,
+        pagination: Pagination | None = None,
+    ) -> list[int]:
+        """Run a search query, and return the IDs of the matching works.
+
+        This is cheaper than query_works() when only the IDs are needed,
+        since the search engine doesn't have to load and return any of the
+        documents' source.
+        """
+        hits = self.query_works(query_string, filter, pagination, ids_only=True)
+        return [int(hit.meta["id"]) for hit in hits]
+
     def count_works(self, filter: Filter | None) -> int:
         """Instead of retrieving works that match `filter`, count the total."""
         if filter is not None and filter.match_nothing is True:
@@ -201,7 +229,12 @@ class ExternalSearchIndex(LoggerMixin):
         self._search_service.index_submit_document(document=document)
 
     def add_documents(
-        self, documents: Sequence[SearchDocument]
+        self, documents: Sequence[SearchDocument], thread_count: int = 1
     ) -> list[SearchServiceFailedDocument]:
-        """Add multiple documents to the search index."""
-        return self._search_service.index_submit_documents(documents=documents)
+        """Add multiple documents to the search index.
+
+        :param thread_count: The number of bulk requests to have in flight at once.
+        """
+        return self._search_service.index_submit_documents(
+            documents=documents, thread_count=thread_count
+        )
@@ -73,25 +73,26 @@ class Filter:
         :param worklist: A WorkList
         :param facets: A SearchFacets object.
         """
+        from palace.manager.feed.worklist.lane_tree import (
+            LaneRestrictions,
+            LaneTreeSnapshot,
+        )
+
         library = worklist.get_library(_db)
+
         # For most configuration settings there is a single value --
-        # either defined on the WorkList or defined by its parent.
-        inherit_one = worklist.inherited_value
-        media = inherit_one("media")
-        languages = inherit_one("languages")
-        fiction = inherit_one("fiction")
-        audiences = inherit_one("audiences")
-        target_age = inherit_one("target_age")
-        collections = inherit_one("collection_ids") or library
-
-        license_datasource_id = inherit_one("license_datasource_id")
-
-        # For genre IDs and CustomList IDs, we might get a separate
-        # set of restrictions from every item in the WorkList hierarchy.
-        # _All_ restrictions must be met for a work to match the filter.
-        inherit_some = worklist.inherited_values
-        genre_id_restrictions = inherit_some("genre_ids")
-        customlist_id_restrictions = inherit_some("customlist_ids")
+        # either defined on the WorkList or defined by its parent. For
+        # genre IDs and CustomList IDs, we might get a separate set of
+        # restrictions from every item in the WorkList hierarchy. _All_
+        # restrictions must be met for a work to match the filter.
+        #
+        # Resolving these means walking the WorkList's parentage, so the
+        # restrictions of a Lane come from a snapshot of its library's
+        # lane hierarchy instead, when there is one.
+        restrictions = LaneTreeSnapshot.restrictions_for(
+            _db, worklist
+        ) or LaneRestrictions.from_worklist(worklist)
+        collections = worklist.inherited_value("collection_ids") or library
 
         if library is None:
             allow_holds = True
@@ -99,18 +100,11 @@ class Filter:
             allow_holds = library.settings.allow_holds
         return cls(
             collections,
-            media,
-            languages,
-            fiction,
-            audiences,
-            target_age,
-            genre_id_restrictions,
-            customlist_id_restrictions,
-            facets,
+            facets=facets,
             allow_holds=allow_holds,
-            license_datasource=license_datasource_id,
             lane_building=True,
             library=library,
+            **restrictions.filter_arguments(),
         )
 
     def __init__(
@@ -135,8 +135,27 @@ class SearchService(ABC):
     def index_submit_documents(
         self,
         documents: Sequence[SearchDocument],
+        thread_count: int = 1,
     ) -> list[SearchServiceFailedDocument]:
-        """Submit search documents to the given index."""
+        """Submit search documents to the given index.
+
+        :param thread_count: The number of bulk requests to have in flight at once.
+        """
+
+    @abstractmethod
+    def index_update_settings(self, name: str, settings: dict[str, Any]) -> None:
+        """Update the dynamic settings of the index with the given *name*.
+
+        A setting whose value is None is reset to the cluster default.
+        """
+
+    @abstractmethod
+    def index_refresh(self, name: str) -> None:
+        """Synchronously refresh the index with the given *name*."""
+
+    @abstractmethod
+    def index_force_merge(self, name: str) -> None:
+        """Merge the segments of the index with the given *name* down to one."""
 
     @abstractmethod
     def write_pointer_set(self, revision: SearchSchemaRevision) -> None:
@@ -276,7 +295,7 @@ class SearchServiceOpensearch1(SearchService, LoggerMixin):
         )
 
     def index_submit_documents(
-        self, documents: Sequence[SearchDocument]
+        self, documents: Sequence[SearchDocument], thread_count: int = 1
     ) -> list[SearchServiceFailedDocument]:
         pointer = self.write_pointer_name()
         self.log.info(f"submitting documents to index {pointer}")
@@ -288,6 +307,9 @@ class SearchServiceOpensearch1(SearchService, LoggerMixin):
             document["_index"] = pointer
             document["_require_alias"] = True
 
+        if thread_count > 1:
+            return self._index_submit_documents_parallel(documents, thread_count)
+
         # See: Sources for "streaming_bulk":
         # https://github.com/opensearch-project/opensearch-py/blob/db972e615b9156b4e364091d6a893d64fb3ef4f3/opensearchpy/helpers/actions.py#L267
         # The documentation is incredibly vague about what the function actually returns, but these
@@ -314,6 +336,41 @@ class SearchServiceOpensearch1(SearchService, LoggerMixin):
 
         return error_results
 
+    def _index_submit_documents_parallel(
+        self, documents: Sequence[SearchDocument], thread_count: int
+    ) -> list[SearchServiceFailedDocument]:
+        # parallel_bulk splits the documents into chunks and sends them from a pool of
+        # threads. Unlike bulk, it yields a result per document rather than collecting
+        # the errors, and it doesn't retry rejected chunks, so there is no backoff here:
+        # the caller retries the batch as a whole.
+        error_results: list[SearchServiceFailedDocument] = []
+        for ok, item in opensearchpy.helpers.parallel_bulk(
+            client=self._write_client,
+            actions=documents,
+            thread_count=thread_count,
+            raise_on_error=False,
+            raise_on_exception=True,
+        ):
+            if not ok:
+                error_results.append(SearchServiceFailedDocument.from_bulk_error(item))
+        return error_results
+
+    def index_update_settings(self, name: str, settings: dict[str, Any]) -> None:
+        self.log.info(f"updating settings for index {name}: {settings}")
+        self._write_client.indices.put_settings(index=name, body={"index": settings})
+
+    def index_refresh(self, name: str) -> None:
+        self.log.debug(f"refreshing index {name}")
+        self._write_client.indices.refresh(index=name)
+
+    def index_force_merge(self, name: str) -> None:
+        self.log.info(f"force merging index {name}")
+        # A force merge of a freshly loaded index can easily outlast the client-wide
+        # timeout, so it gets its own.
+        self._write_client.indices.forcemerge(
+            index=name, max_num_segments=1, request_timeout=3600
+        )
+
     def index_clear_documents(self) -> None:
         self._write_client.delete_by_query(
             index=self.write_pointer_name(),
@@ -1,3 +1,10 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import event as sqlalchemy_event
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import ORMExecuteState
 from sqlalchemy.orm.session import Session
 
 from palace.util.log import LoggerMixin
@@ -7,6 +14,92 @@ from palace.manager.service.analytics.provider import AnalyticsProvider
 from palace.manager.sqlalchemy.model.circulationevent import CirculationEvent
 from palace.manager.sqlalchemy.util import get_one_or_create
 
+# The key that identifies a circulation event. There can only be one event in the
+# database for each key.
+EventKey = tuple[int, str, datetime, int]
+
+
+class CirculationEventBuffer(LoggerMixin):
+    """The circulation events collected in a session that haven't been written yet.
+
+    The events are written with a single INSERT ... ON CONFLICT DO NOTHING when the
+    session commits, so recording an event doesn't cost a SELECT and an INSERT of
+    its own. So that the session always sees the events it collected, they are also
+    written before the next statement the session runs.
+    """
+
+    _SESSION_INFO_KEY = "_circulation_event_buffer"
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+        self._events: dict[EventKey, AnalyticsEventData] = {}
+
+    @classmethod
+    def for_session(cls, session: Session) -> CirculationEventBuffer:
+        """The buffer for a session, which is created the first time it's needed."""
+        buffer: CirculationEventBuffer | None = session.info.get(cls._SESSION_INFO_KEY)
+        if buffer is None:
+            buffer = cls(session)
+            session.info[cls._SESSION_INFO_KEY] = buffer
+            sqlalchemy_event.listen(session, "before_commit", buffer._before_commit)
+            sqlalchemy_event.listen(session, "do_orm_execute", buffer._before_execute)
+            sqlalchemy_event.listen(session, "after_rollback", buffer._after_rollback)
+        return buffer
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def add(self, license_pool_id: int, event: AnalyticsEventData) -> None:
+        key = (license_pool_id, event.type, event.start, event.library_id)
+        # Like get_one_or_create, the first event recorded for a key wins.
+        self._events.setdefault(key, event)
+
+    def flush(self) -> None:
+        """Write the buffered events, skipping any that are already recorded."""
+        if not self._events:
+            return
+        # The buffer is emptied before the insert runs, since running it triggers
+        # _before_execute again.
+        events, self._events = self._events, {}
+        # Insert the rows in a consistent order, so concurrent sessions writing the
+        # same events can't deadlock.
+        rows = [
+            dict(
+                license_pool_id=event.license_pool_id,
+                type=event.type,
+                start=event.start,
+                library_id=event.library_id,
+                old_value=event.old_value,
+                new_value=event.new_value,
+                delta=event.delta,
+                end=event.end,
+            )
+            for _, event in sorted(events.items(), key=lambda item: item[0])
+        ]
+        # With no conflict target, a conflict on either of the unique indexes on
+        # circulationevents means the event was already recorded.
+        statement = (
+            pg_insert(CirculationEvent)
+            .values(rows)
+            .on_conflict_do_nothing()
+            .returning(
+                CirculationEvent.type,
+                CirculationEvent.old_value,
+                CirculationEvent.new_value,
+            )
+        )
+        for event_type, old_value, new_value in self._session.execute(statement):
+            self.log.info(f"EVENT {event_type} {old_value}=>{new_value}")
+
+    def _before_commit(self, session: Session) -> None:
+        self.flush()
+
+    def _before_execute(self, orm_execute_state: ORMExecuteState) -> None:
+        self.flush()
+
+    def _after_rollback(self, session: Session) -> None:
+        self._events.clear()
+
 
 class LocalAnalyticsProvider(AnalyticsProvider, LoggerMixin):
     def collect(
@@ -14,13 +107,25 @@ class LocalAnalyticsProvider(AnalyticsProvider, LoggerMixin):
         event: AnalyticsEventData,
         session: Session | None = None,
     ) -> None:
+        """Log a CirculationEvent to the database, assuming it
+        hasn't already been recorded.
+
+        The event is buffered, and written when the session commits or
+        runs its next statement.
+        """
         if session is None:
             self.log.error("No session provided unable to collect event")
             return
 
-        """Log a CirculationEvent to the database, assuming it
-         hasn't already been recorded.
-         """
+        if event.license_pool_id is not None:
+            CirculationEventBuffer.for_session(session).add(
+                event.license_pool_id, event
+            )
+            return
+
+        # NULLs never conflict in a unique index, so ON CONFLICT DO NOTHING can't
+        # tell if an event without a license pool was already recorded. Those
+        # events are rare, and are looked up before they're created.
         circ_event, was_new = get_one_or_create(
             session,
             CirculationEvent,
@@ -57,7 +57,9 @@ def beat_schedule() -> dict[str, Any]:
     from palace.manager.celery.tasks import (
         bibliotheca,
         boundless,
+        crawlable_feeds,
         custom_lists,
+        dashboard_statistics,
         equivalents,
         license_expiration,
         marc,
@@ -85,6 +87,12 @@ def beat_schedule() -> dict[str, Any]:
                 hour="0,1,7-23",
             ),  # Every hour except 2–6 AM (matches the legacy cron schedule)
         },
+        "crawlable_feed_snapshots": {
+            "task": crawlable_feeds.crawlable_feed_snapshots.name,
+            "schedule": crontab(
+                minute="20", hour="*/4"
+            ),  # Run every 4 hours at 20 minutes past the hour
+        },
         "full_search_reindex": {
             "task": search.search_reindex.name,
             "schedule": crontab(hour="0", minute="10"),  # Run every day at 12:10 AM
@@ -130,6 +138,10 @@ def beat_schedule() -> dict[str, Any]:
                 minute="45", hour="*/3"
             ),  # Run every 3 hours at 45 minutes past the hour
         },
+        "refresh_dashboard_statistics": {
+            "task": dashboard_statistics.refresh_dashboard_statistics.name,
+            "schedule": crontab(minute="*/15"),  # Run every 15 minutes
+        },
         "rotate_jwe_key": {
             "task": rotate_jwe_key.rotate_jwe_key.name,
             "schedule": crontab(
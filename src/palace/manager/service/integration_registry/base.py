@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import importlib
+import threading
 from collections import defaultdict
 from collections.abc import Iterable, Iterator
 from itertools import chain
@@ -26,6 +28,11 @@ class LookupException(BasePalaceException, LookupError):
     """An error occurred while looking up an integration."""
 
 
+def _import_path(integration: type) -> str:
+    """The import path of an integration class, in the form used by register_lazy."""
+    return f"{integration.__module__}:{integration.__qualname__}"
+
+
 class IntegrationRegistry(Generic[T]):
     def __init__(self, goal: Goals, integrations: dict[str, type[T]] | None = None):
         """
@@ -36,6 +43,13 @@ class IntegrationRegistry(Generic[T]):
         """
         self._lookup: dict[str, type[T]] = {}
         self._reverse_lookup: dict[type[T], list[str]] = defaultdict(list)
+        # Integrations registered with register_lazy that haven't been imported yet,
+        # by protocol name, and the protocol names of each of them by import path.
+        self._lazy_lookup: dict[str, str] = {}
+        self._lazy_protocols: dict[str, list[str]] = {}
+        # Held while a lazily registered integration is loaded, so two threads
+        # looking it up for the first time don't both try to register it.
+        self._lazy_lock = threading.RLock()
         self.goal = goal
 
         if integrations:
@@ -69,16 +83,94 @@ class IntegrationRegistry(Generic[T]):
             canonical = integration.__name__
         # Use a dict to preserve order and ensure uniqueness of names
         names = dict.fromkeys(chain([canonical], aliases or [], [integration.__name__]))
+        import_path = _import_path(integration)
         for protocol in names.keys():
-            if protocol in self._lookup and self._lookup[protocol] != integration:
+            if (protocol in self._lookup and self._lookup[protocol] != integration) or (
+                self._lazy_lookup.get(protocol, import_path) != import_path
+            ):
                 raise RegistrationException(
                     f"Integration {protocol} already registered"
                 )
+
+        # If the integration was registered lazily, it's registered for real now.
+        for protocol in self._lazy_protocols.pop(import_path, []):
+            del self._lazy_lookup[protocol]
+
+        for protocol in names.keys():
             self._lookup[protocol] = integration
         self._reverse_lookup[integration] = list(names.keys())
 
         return integration
 
+    def register_lazy(
+        self,
+        import_path: str,
+        *,
+        canonical: str | None = None,
+        aliases: Iterable[str] | None = None,
+    ) -> None:
+        """
+        Register an integration class without importing it.
+
+        The module the class is in is only imported when the integration is first
+        looked up, so the integrations that a process never uses are never imported.
+        Looking an integration up by protocol imports only that integration, but
+        anything that needs all the integration classes, like iterating over the
+        registry, imports all of them.
+
+        :param import_path: Where to find the integration class, in the form
+            ``package.module:ClassName``
+        :param canonical: The canonical protocol name (defaults to the class name)
+        :param aliases: Additional protocol names that can be used to look up the integration
+        :raises RegistrationException: If the import path isn't valid, or a protocol name
+            is already registered to a different integration
+        """
+        module, _, class_name = import_path.partition(":")
+        if not module or not class_name:
+            raise RegistrationException(
+                f"Invalid import path {import_path}. Expected 'package.module:ClassName'."
+            )
+
+        if canonical is None:
+            canonical = class_name
+        names = dict.fromkeys(chain([canonical], aliases or [], [class_name]))
+        for protocol in names.keys():
+            if (
+                protocol in self._lookup
+                and _import_path(self._lookup[protocol]) != import_path
+            ) or self._lazy_lookup.get(protocol, import_path) != import_path:
+                raise RegistrationException(
+                    f"Integration {protocol} already registered"
+                )
+
+        for protocol in names.keys():
+            self._lazy_lookup[protocol] = import_path
+        self._lazy_protocols[import_path] = list(names.keys())
+
+    def _load(self, import_path: str) -> type[T]:
+        """Import an integration that was registered lazily, and register it."""
+        module, _, class_name = import_path.partition(":")
+        with self._lazy_lock:
+            integration: type[T] = getattr(importlib.import_module(module), class_name)
+            names = self._lazy_protocols.pop(import_path, None)
+            if names is None:
+                # Another thread loaded it while this one waited for the lock.
+                return integration
+            for protocol in names:
+                del self._lazy_lookup[protocol]
+            return self.register(integration, canonical=names[0], aliases=names[1:])
+
+    def _load_all(self) -> None:
+        """Import every integration that was registered lazily."""
+        for import_path in list(self._lazy_protocols):
+            self._load(import_path)
+
+    def _load_integration(self, integration: type[T]) -> None:
+        """Make sure an integration class that was registered lazily is registered."""
+        import_path = _import_path(integration)
+        if import_path in self._lazy_protocols:
+            self._load(import_path)
+
     @overload
     def get(self, protocol: str) -> type[T]: ...
 
@@ -99,7 +191,7 @@ class IntegrationRegistry(Generic[T]):
         :return: The integration class if found, otherwise the default value
         :raises LookupException: If protocol is not found and no default is provided
         """
-        if protocol not in self._lookup:
+        if protocol not in self:
             if default is SentinelType.NotGiven:
                 raise LookupException(f"Integration {protocol} not found")
             return default
@@ -125,6 +217,7 @@ class IntegrationRegistry(Generic[T]):
         :return: The canonical protocol name if found, otherwise the default value
         :raises LookupException: If integration is not found and no default is provided
         """
+        self._load_integration(integration)
         if integration not in self._reverse_lookup:
             if default is SentinelType.NotGiven:
                 raise LookupException(f"Integration {integration} not found")
@@ -154,6 +247,7 @@ class IntegrationRegistry(Generic[T]):
         :return: List of protocol names (canonical first, then aliases) if found, otherwise the default value
         :raises LookupException: If integration is not found and no default is provided
         """
+        self._load_integration(integration)
         if integration not in self._reverse_lookup:
             if default is SentinelType.NotGiven:
                 raise LookupException(f"Integration {integration} not found")
@@ -163,6 +257,7 @@ class IntegrationRegistry(Generic[T]):
     @property
     def integrations(self) -> set[type[T]]:
         """Return a set of all registered integration classes."""
+        self._load_all()
         return set(self._reverse_lookup.keys())
 
     def update(self, other: IntegrationRegistry[T]) -> None:
@@ -170,7 +265,8 @@ class IntegrationRegistry(Generic[T]):
         Update this registry to include all integrations from another registry.
 
         All integration classes from the other registry are registered into this
-        registry with their canonical names and aliases preserved.
+        registry with their canonical names and aliases preserved. Integrations the
+        other registry hasn't imported yet are registered lazily.
 
         :param other: Another IntegrationRegistry with the same goal
         :raises RegistrationException: If registries have different goals or if registration conflicts occur
@@ -180,9 +276,10 @@ class IntegrationRegistry(Generic[T]):
                 f"IntegrationRegistry's goals must be the same. (Self: {self.goal}, Other: {other.goal})"
             )
 
-        for integration in other.integrations:
-            names = other.get_protocols(integration)
+        for integration, names in other._reverse_lookup.items():
             self.register(integration, canonical=names[0], aliases=names[1:])
+        for import_path, names in other._lazy_protocols.items():
+            self.register_lazy(import_path, canonical=names[0], aliases=names[1:])
 
     def canonicalize(self, protocol: str) -> str:
         """
@@ -273,6 +370,7 @@ class IntegrationRegistry(Generic[T]):
 
         :return: Iterator of (canonical_protocol, integration_class) tuples
         """
+        self._load_all()
         for integration, names in self._reverse_lookup.items():
             yield names[0], integration
 
@@ -284,6 +382,9 @@ class IntegrationRegistry(Generic[T]):
         :return: The integration class registered under the given protocol
         :raises LookupException: If the protocol is not registered
         """
+        import_path = self._lazy_lookup.get(protocol)
+        if import_path is not None:
+            return self._load(import_path)
         try:
             return self._lookup[protocol]
         except KeyError as e:
@@ -291,7 +392,7 @@ class IntegrationRegistry(Generic[T]):
 
     def __len__(self) -> int:
         """Return the number of registered integration classes."""
-        return len(self._reverse_lookup)
+        return len(self._reverse_lookup) + len(self._lazy_protocols)
 
     def __contains__(self, name: str) -> bool:
         """
@@ -300,13 +401,13 @@ class IntegrationRegistry(Generic[T]):
         :param name: Protocol name to check (canonical or alias)
         :return: True if the protocol name is registered, False otherwise
         """
-        return name in self._lookup
+        return name in self._lookup or name in self._lazy_lookup
 
     def __repr__(self) -> str:
         """
         Return a string representation of the registry.
         """
-        return f"<IntegrationRegistry: {self._lookup}>"
+        return f"<IntegrationRegistry: {self._lookup | self._lazy_lookup}>"
 
     def __add__(self, other: IntegrationRegistry[V]) -> IntegrationRegistry[T | V]:
         """
@@ -13,7 +13,7 @@ if TYPE_CHECKING:
 
 class CatalogServicesRegistry(IntegrationRegistry["MarcExporter"]):
     def __init__(self) -> None:
-        from palace.manager.integration.catalog.marc.exporter import MarcExporter
-
         super().__init__(Goals.CATALOG_GOAL)
-        self.register(MarcExporter)
+        self.register_lazy(
+            "palace.manager.integration.catalog.marc.exporter:MarcExporter"
+        )
@@ -1,12 +1,21 @@
-from palace.manager.integration.discovery.opds_registration import (
-    OpdsRegistrationService,
-)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from palace.manager.integration.goals import Goals
 from palace.manager.service.integration_registry.base import IntegrationRegistry
 
+if TYPE_CHECKING:
+    from palace.manager.integration.discovery.opds_registration import (  # noqa: autoflake
+        OpdsRegistrationService,
+    )
+
 
-class DiscoveryRegistry(IntegrationRegistry[OpdsRegistrationService]):
+class DiscoveryRegistry(IntegrationRegistry["OpdsRegistrationService"]):
     def __init__(self) -> None:
         super().__init__(Goals.DISCOVERY_GOAL)
 
-        self.register(OpdsRegistrationService, canonical="OPDS Registration")
+        self.register_lazy(
+            "palace.manager.integration.discovery.opds_registration:OpdsRegistrationService",
+            canonical="OPDS Registration",
+        )
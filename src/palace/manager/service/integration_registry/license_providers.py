@@ -16,23 +16,36 @@ class LicenseProvidersRegistry(IntegrationRegistry["CirculationApiType"]):
     def __init__(self) -> None:
         super().__init__(Goals.LICENSE_GOAL)
 
-        from palace.manager.integration.license.bibliotheca.api import BibliothecaAPI
-        from palace.manager.integration.license.boundless.api import BoundlessApi
-        from palace.manager.integration.license.opds.for_distributors.api import (
-            OPDSForDistributorsAPI,
+        # The canonical names are the labels of the integrations, which are kept here
+        # so the integrations aren't imported until they are used.
+        self.register_lazy(
+            "palace.manager.integration.license.overdrive.api:OverdriveAPI",
+            canonical="Overdrive",
+        )
+        self.register_lazy(
+            "palace.manager.integration.license.bibliotheca.api:BibliothecaAPI",
+            canonical="Bibliotheca",
+        )
+        self.register_lazy(
+            "palace.manager.integration.license.boundless.api:BoundlessApi",
+            canonical="Axis 360",
+        )
+        self.register_lazy(
+            "palace.manager.integration.license.opds.for_distributors.api:OPDSForDistributorsAPI",
+            canonical="OPDS for Distributors",
+        )
+        self.register_lazy(
+            "palace.manager.integration.license.opds.odl.api:OPDS2WithODLApi",
+            canonical="ODL 2.0",
+        )
+        self.register_lazy(
+            "palace.manager.integration.license.opds.opds1.api:OPDSAPI",
+            canonical="OPDS Import",
+        )
+        self.register_lazy(
+            "palace.manager.integration.license.opds.opds2.api:OPDS2API",
+            canonical="OPDS 2.0 Import",
         )
-        from palace.manager.integration.license.opds.odl.api import OPDS2WithODLApi
-        from palace.manager.integration.license.opds.opds1.api import OPDSAPI
-        from palace.manager.integration.license.opds.opds2.api import OPDS2API
-        from palace.manager.integration.license.overdrive.api import OverdriveAPI
-
-        self.register(OverdriveAPI, canonical=OverdriveAPI.label())
-        self.register(BibliothecaAPI, canonical=BibliothecaAPI.label())
-        self.register(BoundlessApi, canonical=BoundlessApi.label())
-        self.register(OPDSForDistributorsAPI, canonical=OPDSForDistributorsAPI.label())
-        self.register(OPDS2WithODLApi, canonical=OPDS2WithODLApi.label())
-        self.register(OPDSAPI, canonical=OPDSAPI.label())
-        self.register(OPDS2API, canonical=OPDS2API.label())
 
     def from_collection(
         self, db: Session, collection: Collection
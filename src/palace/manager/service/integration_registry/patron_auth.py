@@ -3,9 +3,6 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from palace.manager.integration.goals import Goals
-from palace.manager.integration.patron_auth.minimal_authentication import (
-    MinimalAuthenticationProvider,
-)
 from palace.manager.service.integration_registry.base import IntegrationRegistry
 
 if TYPE_CHECKING:
@@ -17,46 +14,40 @@ if TYPE_CHECKING:
 class PatronAuthRegistry(IntegrationRegistry["AuthenticationProviderType"]):
     def __init__(self) -> None:
         super().__init__(Goals.PATRON_AUTH_GOAL)
-        from palace.manager.integration.patron_auth.anonymous_authentication import (
-            AnonymousAuthenticationProvider,
-        )
-        from palace.manager.integration.patron_auth.kansas_patron import (
-            KansasAuthenticationAPI,
+
+        self.register_lazy(
+            "palace.manager.integration.patron_auth.simple_authentication:SimpleAuthenticationProvider",
+            canonical="api.simple_authentication",
         )
-        from palace.manager.integration.patron_auth.millenium_patron import (
-            MilleniumPatronAPI,
+        self.register_lazy(
+            "palace.manager.integration.patron_auth.minimal_authentication:MinimalAuthenticationProvider",
+            canonical="api.minimal_authentication",
         )
-        from palace.manager.integration.patron_auth.oidc.provider import (
-            OIDCAuthenticationProvider,
+        self.register_lazy(
+            "palace.manager.integration.patron_auth.millenium_patron:MilleniumPatronAPI",
+            canonical="api.millenium_patron",
         )
-        from palace.manager.integration.patron_auth.saml.provider import (
-            SAMLWebSSOAuthenticationProvider,
+        self.register_lazy(
+            "palace.manager.integration.patron_auth.sip2.provider:SIP2AuthenticationProvider",
+            canonical="api.sip",
         )
-        from palace.manager.integration.patron_auth.simple_authentication import (
-            SimpleAuthenticationProvider,
+        self.register_lazy(
+            "palace.manager.integration.patron_auth.kansas_patron:KansasAuthenticationAPI",
+            canonical="api.kansas_patron",
         )
-        from palace.manager.integration.patron_auth.sip2.provider import (
-            SIP2AuthenticationProvider,
+        self.register_lazy(
+            "palace.manager.integration.patron_auth.oidc.provider:OIDCAuthenticationProvider",
+            canonical="api.oidc.provider",
         )
-        from palace.manager.integration.patron_auth.sirsidynix_authentication_provider import (
-            SirsiDynixHorizonAuthenticationProvider,
+        self.register_lazy(
+            "palace.manager.integration.patron_auth.saml.provider:SAMLWebSSOAuthenticationProvider",
+            canonical="api.saml.provider",
         )
-
-        self.register(
-            SimpleAuthenticationProvider, canonical="api.simple_authentication"
-        )
-        self.register(
-            MinimalAuthenticationProvider, canonical="api.minimal_authentication"
-        )
-        self.register(MilleniumPatronAPI, canonical="api.millenium_patron")
-        self.register(SIP2AuthenticationProvider, canonical="api.sip")
-        self.register(KansasAuthenticationAPI, canonical="api.kansas_patron")
-        self.register(OIDCAuthenticationProvider, canonical="api.oidc.provider")
-        self.register(SAMLWebSSOAuthenticationProvider, canonical="api.saml.provider")
-        self.register(
-            SirsiDynixHorizonAuthenticationProvider,
+        self.register_lazy(
+            "palace.manager.integration.patron_auth.sirsidynix_authentication_provider:SirsiDynixHorizonAuthenticationProvider",
             canonical="api.sirsidynix_authentication_provider",
         )
-        self.register(
-            AnonymousAuthenticationProvider, canonical="api.anonymous_authentication"
+        self.register_lazy(
+            "palace.manager.integration.patron_auth.anonymous_authentication:AnonymousAuthenticationProvider",
+            canonical="api.anonymous_authentication",
         )
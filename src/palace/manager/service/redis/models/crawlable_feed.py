@@ -0,0 +1,87 @@
+import datetime
+from collections.abc import Mapping
+from typing import NamedTuple
+
+from palace.util.log import LoggerMixin
+
+from palace.manager.service.redis.redis import Redis
+
+
+class PublishedSnapshot(NamedTuple):
+    """When a crawlable feed snapshot was last published, and how many pages it has."""
+
+    generated: datetime.datetime
+    page_count: int
+
+
+class CrawlableFeedSnapshot(LoggerMixin):
+    """
+    The manifest of the static snapshot of a single crawlable feed.
+
+    The pages of a snapshot live in object storage. The manifest is stored in Redis as a
+    single hash, with a field per page holding a fingerprint of what is on that page, so
+    a later run can tell which pages need to be rendered again, and two fields recording
+    when the snapshot was last published and how many pages it has. The web app reads
+    those two fields to decide whether to send a crawler to the snapshot.
+    """
+
+    GENERATED_FIELD = "generated"
+    PAGE_COUNT_FIELD = "pages"
+    PAGE_FIELD_PREFIX = "page::"
+
+    def __init__(self, redis_client: Redis, feed_key: str):
+        self._redis_client = redis_client
+        self.feed_key = feed_key
+        self._key = self._redis_client.get_key(self.__class__.__name__, feed_key)
+
+    @classmethod
+    def _page_field(cls, page: int) -> str:
+        return f"{cls.PAGE_FIELD_PREFIX}{page}"
+
+    def published(self) -> PublishedSnapshot | None:
+        """Get when the snapshot was last published, or None if it never has been."""
+        generated, page_count = self._redis_client.hmget(
+            self._key, [self.GENERATED_FIELD, self.PAGE_COUNT_FIELD]
+        )
+        if generated is None or page_count is None:
+            return None
+        return PublishedSnapshot(
+            generated=datetime.datetime.fromisoformat(generated),
+            page_count=int(page_count),
+        )
+
+    def page_fingerprints(self) -> dict[int, str]:
+        """Get the fingerprint of every page of the published snapshot."""
+        fingerprints = {}
+        for field, value in self._redis_client.hgetall(self._key).items():
+            if field.startswith(self.PAGE_FIELD_PREFIX):
+                fingerprints[int(field.removeprefix(self.PAGE_FIELD_PREFIX))] = value
+        return fingerprints
+
+    def publish(
+        self, fingerprints: Mapping[int, str], generated: datetime.datetime
+    ) -> None:
+        """
+        Replace the manifest with one for a newly generated snapshot.
+
+        :param fingerprints: The fingerprint of each page, keyed by page number. The pages
+            are numbered from zero, and the snapshot has as many pages as there are entries.
+        :param generated: When the snapshot was generated. Must be timezone aware.
+        """
+        if generated.tzinfo is None:
+            raise ValueError("Timestamp must be timezone aware.")
+
+        mapping: dict[str | bytes, str | int] = {
+            self._page_field(page): fingerprint
+            for page, fingerprint in fingerprints.items()
+        }
+        mapping[self.GENERATED_FIELD] = generated.isoformat()
+        mapping[self.PAGE_COUNT_FIELD] = len(fingerprints)
+        with self._redis_client.pipeline() as pipe:
+            pipe.delete(self._key)
+            pipe.hset(self._key, mapping=mapping)
+            pipe.execute()
+
+    def delete(self) -> bool:
+        """Remove the manifest. Returns True if there was one to remove."""
+        return self._redis_client.delete(self._key) > 0
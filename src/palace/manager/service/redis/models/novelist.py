@@ -0,0 +1,135 @@
+import datetime
+import json
+from typing import NamedTuple
+
+from palace.util.datetime_helpers import utc_now
+from palace.util.log import LoggerMixin
+
+from palace.manager.data_layer.identifier import IdentifierData
+from palace.manager.service.redis.redis import Redis
+
+
+class CachedRecommendations(NamedTuple):
+    """The NoveList recommendations for a book, and when they were looked up."""
+
+    recommendations: list[IdentifierData]
+    fetched: datetime.datetime
+    fresh: bool
+
+
+class NoveListRecommendationCache(LoggerMixin):
+    """
+    A cache of the NoveList recommendations for the books of a single library.
+
+    The recommendations for a book are stored in Redis as a single JSON string, keyed by
+    library and identifier. An entry is fresh for a while after it's looked up, and can
+    then be served stale while it's looked up again in the background, until it expires
+    altogether. A lookup that found no recommendations is cached too, but it's only
+    fresh for a short time, so a book that NoveList learns about is picked up quickly.
+
+    Entries are refreshed by the refresh_novelist_recommendations task. Only one refresh
+    per entry is queued at a time: whoever claims the refresh queues the task, and the
+    claim expires on its own in case the task never runs.
+    """
+
+    FRESH_FOR = datetime.timedelta(hours=24)
+    """How long recommendations are served without being looked up again."""
+
+    EMPTY_FRESH_FOR = datetime.timedelta(hours=1)
+    """How long a lookup that found no recommendations is served without being
+    looked up again."""
+
+    EXPIRES_AFTER = datetime.timedelta(days=7)
+    """How long after they were looked up recommendations may be served stale."""
+
+    REFRESH_CLAIM_EXPIRES_AFTER = datetime.timedelta(minutes=5)
+    """How long a claim on refreshing an entry lasts."""
+
+    def __init__(self, redis_client: Redis, library_id: int):
+        self._redis_client = redis_client
+        self.library_id = library_id
+
+    def _key(self, identifier_id: int) -> str:
+        return self._redis_client.get_key(
+            self.__class__.__name__, self.library_id, identifier_id
+        )
+
+    def _refresh_key(self, identifier_id: int) -> str:
+        return self._redis_client.get_key(
+            self.__class__.__name__, self.library_id, identifier_id, "Refresh"
+        )
+
+    def get(self, identifier_id: int) -> CachedRecommendations | None:
+        """Get the cached recommendations for a book, or None if there are none."""
+        value = self._redis_client.get(self._key(identifier_id))
+        if value is None:
+            return None
+
+        data = json.loads(value)
+        recommendations = [
+            IdentifierData(type=type_, identifier=identifier)
+            for type_, identifier in data["recommendations"]
+        ]
+        fetched = datetime.datetime.fromisoformat(data["fetched"])
+        fresh_for = self.FRESH_FOR if recommendations else self.EMPTY_FRESH_FOR
+        return CachedRecommendations(
+            recommendations=recommendations,
+            fetched=fetched,
+            fresh=utc_now() - fetched < fresh_for,
+        )
+
+    def set(
+        self,
+        identifier_id: int,
+        recommendations: list[IdentifierData],
+        fetched: datetime.datetime | None = None,
+    ) -> None:
+        """
+        Cache the recommendations for a book.
+
+        :param fetched: When the recommendations were looked up. Must be timezone
+            aware. Defaults to now.
+        """
+        fetched = fetched or utc_now()
+        if fetched.tzinfo is None:
+            raise ValueError("Timestamp must be timezone aware.")
+
+        value = json.dumps(
+            {
+                "recommendations": [
+                    [recommendation.type, recommendation.identifier]
+                    for recommendation in recommendations
+                ],
+                "fetched": fetched.isoformat(),
+            }
+        )
+        expires_at = fetched + self.EXPIRES_AFTER
+        with self._redis_client.pipeline() as pipe:
+            pipe.set(self._key(identifier_id), value, exat=expires_at)
+            pipe.delete(self._refresh_key(identifier_id))
+            pipe.execute()
+
+    def claim_refresh(self, identifier_id: int) -> bool:
+        """
+        Claim the refresh of the recommendations for a book.
+
+        :return: True if the caller should queue the refresh, False if someone else
+            already has.
+        """
+        return bool(
+            self._redis_client.set(
+                self._refresh_key(identifier_id),
+                utc_now().isoformat(),
+                nx=True,
+                ex=self.REFRESH_CLAIM_EXPIRES_AFTER,
+            )
+        )
+
+    def release_refresh(self, identifier_id: int) -> None:
+        """Release a claim on refreshing the recommendations for a book."""
+        self._redis_client.delete(self._refresh_key(identifier_id))
+
+    def delete(self, identifier_id: int) -> bool:
+        """Remove the cached recommendations for a book. Returns True if there were
+        any to remove."""
+        return self._redis_client.delete(self._key(identifier_id)) > 0
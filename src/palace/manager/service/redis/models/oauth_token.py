@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import datetime
+import hashlib
+import json
+from collections.abc import Callable
+
+from redis import RedisError
+
+from palace.util.datetime_helpers import utc_now
+from palace.util.log import LoggerMixin
+
+from palace.manager.api.model.token import OAuthTokenResponse
+from palace.manager.service.redis.models.lock import RedisLock
+from palace.manager.service.redis.redis import Redis
+
+
+class OAuthTokenCache(LoggerMixin):
+    """
+    The OAuth token used to authenticate with an OPDS distributor, shared between
+    every process that talks to it.
+
+    Tokens are keyed by the feed URL and username they were issued for, and are kept
+    until they expire. The token URL found in the feed's authentication document is
+    cached alongside them, so it doesn't have to be looked up every time a token is.
+
+    Only one process refreshes a token at a time. Refreshing takes a lock, and a
+    process that has to wait for it uses the token the lock holder stored instead of
+    getting another one.
+
+    Redis being unavailable is never fatal: the cache acts as if it were empty, and
+    tokens are fetched directly.
+    """
+
+    TOKEN_URL_EXPIRES_AFTER = datetime.timedelta(hours=24)
+    """How long the token URL is cached for."""
+
+    LOCK_TIMEOUT = datetime.timedelta(seconds=30)
+    """How long a process may hold the refresh lock for."""
+
+    LOCK_WAIT_SECONDS = 10.0
+    """How long to wait for another process to finish refreshing the token, before
+    fetching one without the lock."""
+
+    def __init__(self, redis_client: Redis, feed_url: str, username: str) -> None:
+        self._redis_client = redis_client
+        self._id = hashlib.sha256(f"{feed_url}\n{username}".encode()).hexdigest()
+
+    def _key(self, *parts: str) -> str:
+        return self._redis_client.get_key(self.__class__.__name__, self._id, *parts)
+
+    def get(self) -> OAuthTokenResponse | None:
+        """Get the cached token, or None if there isn't an unexpired one."""
+        try:
+            value = self._redis_client.get(self._key())
+        except RedisError as e:
+            self.log.warning(f"Unable to get cached OAuth token: {e}")
+            return None
+        if value is None:
+            return None
+
+        data = json.loads(value)
+        token = OAuthTokenResponse.from_expiry(
+            data["access_token"], datetime.datetime.fromisoformat(data["expires"])
+        )
+        return None if token.expired else token
+
+    def set(self, token: OAuthTokenResponse) -> None:
+        """Cache a token until it expires."""
+        expires_in = token.expires - utc_now()
+        if expires_in <= datetime.timedelta(0):
+            return
+        value = json.dumps(
+            {"access_token": token.access_token, "expires": token.expires.isoformat()}
+        )
+        try:
+            self._redis_client.set(self._key(), value, px=expires_in)
+        except RedisError as e:
+            self.log.warning(f"Unable to cache OAuth token: {e}")
+
+    def get_token_url(self) -> str | None:
+        try:
+            return self._redis_client.get(self._key("TokenUrl"))
+        except RedisError as e:
+            self.log.warning(f"Unable to get cached OAuth token URL: {e}")
+            return None
+
+    def set_token_url(self, token_url: str) -> None:
+        try:
+            self._redis_client.set(
+                self._key("TokenUrl"), token_url, ex=self.TOKEN_URL_EXPIRES_AFTER
+            )
+        except RedisError as e:
+            self.log.warning(f"Unable to cache OAuth token URL: {e}")
+
+    def refresh(
+        self,
+        fetch: Callable[[], OAuthTokenResponse],
+        rejected: OAuthTokenResponse | None = None,
+    ) -> OAuthTokenResponse:
+        """
+        Get a new token, and cache it.
+
+        If another process cached a token while we waited for the lock, that token
+        is used rather than fetching another one.
+
+        :param fetch: Gets a new token from the distributor.
+        :param rejected: The token the caller was using, which it wants replaced. It's
+            never returned, even if it's still cached.
+        """
+        lock = RedisLock(
+            self._redis_client,
+            [self.__class__.__name__, self._id, "Refresh"],
+            lock_timeout=self.LOCK_TIMEOUT,
+        )
+        try:
+            acquired = lock.acquire_blocking(timeout=self.LOCK_WAIT_SECONDS)
+        except RedisError as e:
+            self.log.warning(f"Unable to lock OAuth token for refresh: {e}")
+            return fetch()
+
+        if not acquired:
+            self.log.warning(
+                "Timed out waiting for another process to refresh the OAuth token."
+            )
+        try:
+            cached = self.get()
+            if cached is not None and (
+                rejected is None or cached.access_token != rejected.access_token
+            ):
+                return cached
+            token = fetch()
+            self.set(token)
+            return token
+        finally:
+            if acquired:
+                try:
+                    lock.release()
+                except RedisError as e:
+                    self.log.warning(f"Unable to release OAuth token lock: {e}")
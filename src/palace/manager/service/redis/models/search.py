@@ -1,4 +1,5 @@
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
+from datetime import timedelta
 
 from palace.util.log import LoggerMixin
 
@@ -22,6 +23,13 @@ class WaitingForIndexing(LoggerMixin):
 
         return self._redis_client.sadd(self._key, work_id) == 1
 
+    def add_many(self, works: Iterable[int]) -> int:
+        """Add several works at once, returning how many weren't already waiting."""
+        work_ids = list(works)
+        if not work_ids:
+            return 0
+        return self._redis_client.sadd(self._key, *work_ids)
+
     def pop(self, size: int) -> Sequence[int]:
         elements = self._redis_client.spop(self._key, size)
         return [int(e) for e in elements]
@@ -34,3 +42,55 @@ class WaitingForIndexing(LoggerMixin):
         if len(works) == 0:
             return
         self._redis_client.srem(self._key, *works)
+
+    def waiting(self, works: Sequence[int]) -> set[int]:
+        """Which of the given works are still waiting to be indexed."""
+        if len(works) == 0:
+            return set()
+        flags = self._redis_client.smismember(self._key, works)
+        return {work for work, flag in zip(works, flags) if flag}
+
+
+class CustomListIndexing(LoggerMixin):
+    """
+    The works whose search documents are out of date because they were added to
+    or removed from a custom list, and that are waiting in WaitingForIndexing for
+    the search_indexing task to pick them up.
+
+    This lets the admin interface tell whether the search index has caught up
+    with an edit to a list, without having to index the works itself.
+    """
+
+    def __init__(
+        self,
+        redis_client: Redis,
+        custom_list_id: int,
+        expire_time: timedelta = timedelta(hours=1),
+    ):
+        self._redis_client = redis_client
+        self._key = self._redis_client.get_key(
+            "Search", self.__class__.__name__, custom_list_id
+        )
+        self.expire_time = expire_time
+
+    def add(self, works: Iterable[int]) -> None:
+        work_ids = list(works)
+        if not work_ids:
+            return
+        with self._redis_client.pipeline() as pipe:
+            pipe.sadd(self._key, *work_ids)
+            pipe.expire(self._key, self.expire_time)
+            pipe.execute()
+
+    def pending(self) -> int:
+        """
+        How many of the works are still waiting to be indexed.
+
+        Works that aren't waiting any more are forgotten, so once this reaches
+        zero the list's edits are in the search index, or are being indexed.
+        """
+        work_ids = [int(work) for work in self._redis_client.smembers(self._key)]
+        waiting = WaitingForIndexing(self._redis_client).waiting(work_ids)
+        if done := set(work_ids) - waiting:
+            self._redis_client.srem(self._key, *done)
+        return len(waiting)
@@ -95,6 +95,7 @@ class RedisPrefixCheckMixin(ABC):
             RedisCommandArgs("SMEMBERS"),
             RedisCommandArgs("SSCAN"),
             RedisCommandArgs("SISMEMBER"),
+            RedisCommandArgs("SMISMEMBER"),
             RedisCommandArgs("DEL", args_end=None),
             RedisCommandArgs("MGET", args_end=None),
             RedisCommandArgs("EXISTS", args_end=None),
@@ -18,4 +18,8 @@ class SearchConfiguration(ServiceConfiguration):
     read_max_retries: int = 0
     read_retry_on_timeout: bool = False
     maxsize: int = 25
+    # When set, edits to custom lists in the admin interface only queue the
+    # changed works for the search_indexing task, instead of indexing them
+    # during the request.
+    defer_custom_list_indexing: bool = False
     model_config = SettingsConfigDict(env_prefix="PALACE_SEARCH_")
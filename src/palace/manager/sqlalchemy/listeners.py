@@ -12,10 +12,12 @@ from sqlalchemy.orm import Mapper, Session
 from palace.util.datetime_helpers import utc_now
 
 from palace.manager.core.config import Configuration
+from palace.manager.feed.worklist.lane_tree import LaneTreeSnapshot
 from palace.manager.service.container import container_instance
 from palace.manager.service.redis.models.dirty_identifiers import DirtyIdentifierIds
 from palace.manager.sqlalchemy.before_flush_decorator import Listener, ListenerState
 from palace.manager.sqlalchemy.model.base import Base
+from palace.manager.sqlalchemy.model.customlist import CustomList
 from palace.manager.sqlalchemy.model.identifier import (
     Equivalency,
     Identifier,
@@ -293,6 +295,27 @@ def add_work_to_customlists(session: Session, instance: Work | LicensePool) -> N
 @Listener.before_flush((Lane, LaneGenre), one_shot=True)
 def configuration_relevant_lifecycle_event(session: Session):
     site_configuration_has_changed(session)
+    # The site configuration timestamp only moves once per cooldown period,
+    # so make sure this process doesn't keep using a stale lane tree.
+    LaneTreeSnapshot.clear()
+
+
+@Listener.before_flush(CustomList, ListenerState.new, one_shot=True)
+@Listener.before_flush(CustomList, ListenerState.deleted, one_shot=True)
+def customlist_lifecycle_event(session: Session) -> None:
+    # Lanes that take their works from every list from a data source
+    # depend on which custom lists exist.
+    LaneTreeSnapshot.clear()
+
+
+@event.listens_for(Lane.customlists, "append")
+@event.listens_for(Lane.customlists, "remove")
+def lane_customlists_modified(target: Lane, *_args: Any) -> None:
+    # Changing a lane's lists doesn't count as modifying the lane itself,
+    # so it doesn't trigger configuration_relevant_lifecycle_event.
+    if hasattr(target, "_customlist_ids"):
+        del target._customlist_ids
+    LaneTreeSnapshot.clear()
 
 
 @event.listens_for(Lane.library_id, "set")
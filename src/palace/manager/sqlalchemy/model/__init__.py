@@ -16,6 +16,7 @@ import palace.manager.sqlalchemy.model.contributor
 import palace.manager.sqlalchemy.model.coverage
 import palace.manager.sqlalchemy.model.credential
 import palace.manager.sqlalchemy.model.customlist
+import palace.manager.sqlalchemy.model.dashboard_statistics
 import palace.manager.sqlalchemy.model.datasource
 import palace.manager.sqlalchemy.model.devicetokens
 import palace.manager.sqlalchemy.model.discovery_service_registration
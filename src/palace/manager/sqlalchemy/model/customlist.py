@@ -1,7 +1,9 @@
 # CustomList, CustomListEntry
 from __future__ import annotations
 
+import datetime
 import logging
+from collections.abc import Iterable
 from functools import total_ordering
 from typing import TYPE_CHECKING
 
@@ -16,11 +18,15 @@ from sqlalchemy import (
     Table,
     Unicode,
     UniqueConstraint,
+    exists,
     func,
+    insert,
+    literal,
+    update,
 )
-from sqlalchemy.orm import Mapped, relationship
+from sqlalchemy.orm import Mapped, aliased, relationship
 from sqlalchemy.orm.session import Session
-from sqlalchemy.sql.expression import or_, select
+from sqlalchemy.sql.expression import and_, or_, select
 
 from palace.util.datetime_helpers import utc_now
 
@@ -290,6 +296,96 @@ class CustomList(Base):
 
         return entry, was_new
 
+    def add_works(
+        self,
+        work_ids: Iterable[int],
+        first_appearance: datetime.datetime | None = None,
+        update_external_index: bool = True,
+    ) -> list[int]:
+        """Add many Works to a CustomList at once, by ID.
+
+        This does what add_entry() does for each Work, in two statements
+        however many Works there are: an UPDATE that brings the
+        most_recent_appearance of the Works already on the list up to date,
+        and an INSERT ... SELECT that creates an entry for every other Work.
+        Only the Works that were actually added to the list need their
+        search documents updated, so only they are queued for indexing.
+
+        :param work_ids: The IDs of the Works to add. IDs of Works that
+          don't exist are ignored.
+        :return: The IDs of the Works that weren't already on the list.
+        """
+        work_ids = sorted(set(work_ids))
+        if not work_ids:
+            return []
+        first_appearance = first_appearance or utc_now()
+        _db = Session.object_session(self)
+
+        _db.execute(
+            update(CustomListEntry)
+            .where(
+                CustomListEntry.list_id == self.id,
+                CustomListEntry.work_id.in_(work_ids),
+                or_(
+                    CustomListEntry.most_recent_appearance == None,
+                    CustomListEntry.most_recent_appearance < first_appearance,
+                ),
+            )
+            .values(most_recent_appearance=first_appearance)
+            .execution_options(synchronize_session="fetch")
+        )
+
+        # There's no unique constraint on (list_id, work_id) for an
+        # ON CONFLICT clause to use, so the Works already on the list are
+        # left out of the SELECT instead.
+        existing_entry = aliased(CustomListEntry)
+        new_entries = select(
+            literal(self.id, type_=Integer),
+            Work.id,
+            Work.presentation_edition_id,
+            literal(False, type_=Boolean),
+            literal(first_appearance, type_=DateTime(timezone=True)),
+            literal(first_appearance, type_=DateTime(timezone=True)),
+        ).where(
+            Work.id.in_(work_ids),
+            ~exists().where(
+                and_(
+                    existing_entry.list_id == self.id,
+                    existing_entry.work_id == Work.id,
+                )
+            ),
+        )
+        added = (
+            _db.execute(
+                insert(CustomListEntry)
+                .from_select(
+                    [
+                        "list_id",
+                        "work_id",
+                        "edition_id",
+                        "featured",
+                        "first_appearance",
+                        "most_recent_appearance",
+                    ],
+                    new_entries,
+                )
+                .returning(CustomListEntry.work_id)
+            )
+            .scalars()
+            .all()
+        )
+
+        # The new entries were created behind the ORM's back, so the list's
+        # entries need to be reloaded.
+        _db.expire(self, ["entries"])
+
+        if added:
+            self.updated = utc_now()
+            self.size += len(added)
+            if update_external_index:
+                Work.queue_indexing_many(added)
+        return list(added)
+
     def remove_entry(self, work_or_edition):
         """Remove the entry for a particular Work or Edition and/or any of its
         equivalent Editions.
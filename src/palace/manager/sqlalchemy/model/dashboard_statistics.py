@@ -0,0 +1,58 @@
+"""Precomputed statistics for the admin dashboard."""
+
+from __future__ import annotations
+
+from sqlalchemy import Column, ForeignKey, Integer, Unicode
+from sqlalchemy.orm import Mapped
+
+from palace.manager.sqlalchemy.model.base import Base
+
+
+class CollectionInventorySummary(Base):
+    """The inventory of one medium in a collection.
+
+    These rows are recomputed from the collection's license pools whenever the
+    dashboard statistics are refreshed, so the dashboard can be loaded without
+    aggregating over every license pool.
+    """
+
+    __tablename__ = "collection_inventory_summaries"
+
+    collection_id: Mapped[int] = Column(
+        Integer,
+        ForeignKey("collections.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    # The medium, as it's keyed in the dashboard statistics. Titles without a
+    # medium are keyed as "None".
+    medium: Mapped[str] = Column(Unicode, primary_key=True)
+
+    metered_titles: Mapped[int] = Column(Integer, nullable=False, default=0)
+    unlimited_titles: Mapped[int] = Column(Integer, nullable=False, default=0)
+    open_access_titles: Mapped[int] = Column(Integer, nullable=False, default=0)
+    loanable_titles: Mapped[int] = Column(Integer, nullable=False, default=0)
+    metered_licenses_owned: Mapped[int] = Column(Integer, nullable=False, default=0)
+    metered_licenses_available: Mapped[int] = Column(Integer, nullable=False, default=0)
+
+
+class LibraryPatronSummary(Base):
+    """The patron, loan and hold totals for a library.
+
+    Like CollectionInventorySummary, these rows are recomputed whenever the
+    dashboard statistics are refreshed.
+    """
+
+    __tablename__ = "library_patron_summaries"
+
+    library_id: Mapped[int] = Column(
+        Integer,
+        ForeignKey("libraries.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    total: Mapped[int] = Column(Integer, nullable=False, default=0)
+    with_active_loan: Mapped[int] = Column(Integer, nullable=False, default=0)
+    with_active_loan_or_hold: Mapped[int] = Column(Integer, nullable=False, default=0)
+    loans: Mapped[int] = Column(Integer, nullable=False, default=0)
+    holds: Mapped[int] = Column(Integer, nullable=False, default=0)
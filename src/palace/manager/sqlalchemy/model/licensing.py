@@ -22,6 +22,7 @@ from sqlalchemy import (
     UniqueConstraint,
     and_,
     false,
+    func,
     or_,
     select,
     true,
@@ -669,9 +670,7 @@ class LicensePool(Base):
             if l.currently_available_loans is not None
         )
 
-        ignored_holds_ids = {h.id for h in (ignored_holds or set())}
-        active_holds_ids = {h.id for h in self.get_active_holds()}
-        patrons_in_hold_queue = len(active_holds_ids - ignored_holds_ids)
+        patrons_in_hold_queue = self.active_holds_count(ignored_holds=ignored_holds)
         if patrons_in_hold_queue > licenses_available:
             licenses_reserved = licenses_available
             licenses_available = 0
@@ -687,19 +686,26 @@ class LicensePool(Base):
             as_of=as_of,
         )
 
+    @staticmethod
+    def active_hold_criteria() -> ColumnElement[Boolean]:
+        """The criteria a Hold must meet to still be in its license pool's queue.
+
+        A hold is active unless it is in position 0 (its copy is reserved) and its
+        reservation has run out.
+        """
+        return or_(
+            Hold.position != 0,
+            Hold.position == None,
+            and_(Hold.end > utc_now(), Hold.position == 0),
+        )
+
     def get_active_holds(self, for_update: bool = False) -> list[Hold]:
         _db = Session.object_session(self)
         query = (
             select(Hold)
             .where(Hold.license_pool_id == self.id)
-            .where(
-                or_(
-                    Hold.position != 0,
-                    Hold.position == None,
-                    and_(Hold.end > utc_now(), Hold.position == 0),
-                )
-            )
-            .order_by(Hold.start)
+            .where(self.active_hold_criteria())
+            .order_by(Hold.start, Hold.id)
         )
 
         if for_update:
@@ -707,6 +713,24 @@ class LicensePool(Base):
 
         return _db.execute(query).scalars().all()
 
+    def active_holds_count(self, ignored_holds: set[Hold] | None = None) -> int:
+        """Count the holds in this pool's queue, without loading them.
+
+        :param ignored_holds: Holds to leave out of the count, usually because they
+            are about to be deleted.
+        """
+        _db = Session.object_session(self)
+        query = (
+            select(func.count(Hold.id))
+            .where(Hold.license_pool_id == self.id)
+            .where(self.active_hold_criteria())
+        )
+        ignored_holds_ids = {h.id for h in (ignored_holds or set()) if h.id is not None}
+        if ignored_holds_ids:
+            query = query.where(Hold.id.not_in(ignored_holds_ids))
+        count: int = _db.execute(query).scalar_one()
+        return count
+
     def update_availability(
         self,
         new_licenses_owned: int | None,
@@ -763,6 +763,16 @@ class Annotation(Base):
         self.timestamp = utc_now()
 
 
+# Annotations are looked up by patron, and optionally by the book they're on,
+# and only the active ones are ever shown.
+Index(
+    "ix_annotations_patron_id_identifier_id_active",
+    Annotation.patron_id,
+    Annotation.identifier_id,
+    Annotation.active,
+)
+
+
 class PatronProfileStorage(ProfileStorage):
     """Interface between a Patron object and the User Profile Management
     Protocol.
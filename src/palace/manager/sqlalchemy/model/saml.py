@@ -16,6 +16,12 @@ class SAMLFederation(Base):
     idp_metadata_service_url: Mapped[str] = Column(String(2048), nullable=False)
     last_updated_at = Column(DateTime(), nullable=True)
 
+    # The HTTP ETag and the validUntil attribute of the aggregated metadata the
+    # federation's IdPs were last loaded from. If neither has changed, the
+    # metadata hasn't either, and loading it again can be skipped.
+    metadata_etag = Column(String(256), nullable=True)
+    metadata_valid_until = Column(DateTime(timezone=True), nullable=True)
+
     certificate = Column(Text(), nullable=True)
 
     identity_providers: Mapped[list[SAMLFederatedIdentityProvider]] = relationship(
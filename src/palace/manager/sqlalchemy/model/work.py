@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import re
 from collections import Counter
-from collections.abc import Sequence
+from collections.abc import Iterable, Mapping, Sequence
 from datetime import date, datetime, timezone
 from decimal import Decimal
 from functools import cache
@@ -26,7 +26,13 @@ from sqlalchemy import (
 )
 from sqlalchemy.dialects.postgresql import INT4RANGE
 from sqlalchemy.ext.associationproxy import association_proxy
-from sqlalchemy.orm import Mapped, contains_eager, joinedload, relationship
+from sqlalchemy.orm import (
+    Mapped,
+    contains_eager,
+    joinedload,
+    relationship,
+    selectinload,
+)
 from sqlalchemy.orm.base import NO_VALUE
 from sqlalchemy.orm.session import Session
 from sqlalchemy.sql.expression import and_, case, literal_column, select
@@ -1274,6 +1280,19 @@ class Work(Base, LoggerMixin):
         if work_id is not None:
             waiting.add(work_id)
 
+    @staticmethod
+    @inject
+    def queue_indexing_many(
+        work_ids: Iterable[int], *, redis_client: Redis = Provide["redis.client"]
+    ) -> None:
+        """
+        Add several works to the set of works in redis waiting to be indexed,
+        in a single command.
+        """
+        from palace.manager.service.redis.models.search import WaitingForIndexing
+
+        WaitingForIndexing(redis_client).add_many(work_ids)
+
     def set_presentation_ready(self, as_of=None, exclude_search=False):
         """Set this work as presentation-ready, no matter what.
 
@@ -1494,9 +1513,11 @@ class Work(Base, LoggerMixin):
             joinedload(Work.suppressed_for),
             joinedload(Work.work_genres).joinedload(WorkGenre.genre),
             joinedload(Work.custom_list_entries),
+            selectinload(Work.license_pools),
         )
 
         rows: list[Work] = qu.all()
+        lane_priority_levels = cls._lane_priority_levels(session, work_ids)
 
         ## IDENTIFIERS START
         ## Identifiers is a house of cards, it comes crashing down if anything is changed here
@@ -1599,7 +1620,9 @@ class Work(Base, LoggerMixin):
             )
 
             try:
-                search_doc = cls.search_doc_as_dict(cast(Self, item))
+                search_doc = cls.search_doc_as_dict(
+                    cast(Self, item), lane_priority_levels
+                )
                 results.append(search_doc)
             except:
                 cls.logger().exception(f"Could not create search document for {item}")
@@ -1607,7 +1630,47 @@ class Work(Base, LoggerMixin):
         return results
 
     @classmethod
-    def search_doc_as_dict(cls, doc: Self) -> dict[str, Any]:
+    def _lane_priority_levels(
+        cls, session: Session, work_ids: Sequence[int]
+    ) -> dict[int, int]:
+        """Look up the lane priority level of every collection the works have a
+        license pool in, keyed by collection id.
+
+        Every work in a batch usually comes from the same handful of collections, so
+        the collections' settings are read once for the whole batch rather than once
+        for every license pool.
+        """
+        from palace.manager.sqlalchemy.model.collection import Collection
+        from palace.manager.sqlalchemy.model.integration import (
+            IntegrationConfiguration,
+        )
+
+        collection_ids = select(LicensePool.collection_id).where(
+            LicensePool.work_id.in_(work_ids)
+        )
+        rows = session.execute(
+            select(Collection.id, IntegrationConfiguration.settings_dict)
+            .join(Collection.integration_configuration)
+            .where(Collection.id.in_(collection_ids))
+        )
+        return {
+            collection_id: settings.get(
+                "lane_priority_level",
+                IntegrationConfigurationConstants.DEFAULT_LANE_PRIORITY_LEVEL,
+            )
+            for collection_id, settings in rows
+        }
+
+    @classmethod
+    def search_doc_as_dict(
+        cls, doc: Self, lane_priority_levels: Mapping[int, int] | None = None
+    ) -> dict[str, Any]:
+        """Create the search document for a work.
+
+        :param lane_priority_levels: The lane priority level of each of the work's
+            collections, keyed by collection id. A collection that isn't in it has its
+            settings looked up.
+        """
         columns = {
             "work": [
                 "fiction",
@@ -1747,13 +1810,21 @@ class Work(Base, LoggerMixin):
                     lc["medium"] = doc.presentation_edition.medium
                 lc["licensepool_id"] = license_pool.id
                 lc["quality"] = doc.quality
-                collection_settings = (
-                    license_pool.collection.integration_configuration.settings_dict
-                )
-                lc["lane_priority_level"] = collection_settings.get(
-                    "lane_priority_level",
-                    IntegrationConfigurationConstants.DEFAULT_LANE_PRIORITY_LEVEL,
-                )
+                if (
+                    lane_priority_levels is not None
+                    and license_pool.collection_id in lane_priority_levels
+                ):
+                    lc["lane_priority_level"] = lane_priority_levels[
+                        license_pool.collection_id
+                    ]
+                else:
+                    collection_settings = (
+                        license_pool.collection.integration_configuration.settings_dict
+                    )
+                    lc["lane_priority_level"] = collection_settings.get(
+                        "lane_priority_level",
+                        IntegrationConfigurationConstants.DEFAULT_LANE_PRIORITY_LEVEL,
+                    )
                 result["licensepools"].append(lc)
             # use the maximum lane priority level associated with the work.
             if result["licensepools"]:
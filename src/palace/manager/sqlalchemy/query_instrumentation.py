@@ -0,0 +1,187 @@
+"""
+Optional instrumentation of the SQL queries run by a request or a task.
+
+When the PALACE_SQL_INSTRUMENTATION environment variable is set, listeners on the
+SQLAlchemy engine time every statement that's run while a QueryStats collector is
+active, and record how many statements were run, how long they took between them,
+and which were the slowest. The web application collects stats for each request and
+the Celery workers for each task, and log them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+ENVIRONMENT_VARIABLE = "PALACE_SQL_INSTRUMENTATION"
+
+# Where the start times of the statements running on a connection are kept, in
+# the connection's info dictionary.
+_START_TIMES_KEY = "palace_query_start_times"
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_BIND_PARAMETER = re.compile(r"%\(\w+\)s|%s|:\w+|\$\d+")
+_VALUE_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def enabled() -> bool:
+    return os.environ.get(ENVIRONMENT_VARIABLE) is not None
+
+
+def fingerprint(statement: str, length: int = 200) -> str:
+    """
+    Reduce a SQL statement to a short fingerprint that's the same however it's
+    parameterized.
+
+    Literals and bind parameters are replaced with ``?``, lists of values with
+    ``(...)``, and runs of whitespace with a single space. The fingerprint is the
+    start of the normalized statement, prefixed with a hash of the whole of it, so
+    statements that only differ past the cut-off can still be told apart.
+    """
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _BIND_PARAMETER.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _VALUE_LIST.sub("(...)", normalized)
+    normalized = _WHITESPACE.sub(" ", normalized).strip()
+    digest = hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:8]
+    if len(normalized) > length:
+        normalized = normalized[:length] + "..."
+    return f"{digest} {normalized}"
+
+
+@dataclass
+class QueryStats:
+    """The SQL statements run by a single request or task."""
+
+    SLOWEST_COUNT = 3
+    """How many of the slowest statements are kept."""
+
+    count: int = 0
+    duration: float = 0.0
+    """The time spent running statements, in seconds."""
+    slowest: list[tuple[float, str]] = field(default_factory=list)
+    """The duration and fingerprint of the slowest statements, slowest first."""
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        if len(self.slowest) < self.SLOWEST_COUNT or duration > self.slowest[-1][0]:
+            self.slowest.append((duration, fingerprint(statement)))
+            self.slowest.sort(key=lambda slow: slow[0], reverse=True)
+            del self.slowest[self.SLOWEST_COUNT :]
+
+    @property
+    def duration_ms(self) -> float:
+        return round(self.duration * 1000, 3)
+
+    def log_data(self) -> dict[str, Any]:
+        """The stats, in a form that can be logged as a JSON field."""
+        return {
+            "count": self.count,
+            "duration_ms": self.duration_ms,
+            "slowest": [
+                {"duration_ms": round(duration * 1000, 3), "statement": statement}
+                for duration, statement in self.slowest
+            ],
+        }
+
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar(
+    "palace_query_stats", default=None
+)
+
+
+def start_collecting() -> QueryStats:
+    """Start collecting the stats of the statements run in the current context."""
+    stats = QueryStats()
+    _current_stats.set(stats)
+    return stats
+
+
+def stop_collecting() -> QueryStats | None:
+    """Stop collecting stats in the current context, and return what was collected."""
+    stats = _current_stats.get()
+    _current_stats.set(None)
+    return stats
+
+
+@contextmanager
+def collect_query_stats() -> Generator[QueryStats]:
+    """Collect the stats of the statements run inside the context manager."""
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def _before_cursor_execute(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    conn.info.setdefault(_START_TIMES_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    start_times = conn.info.get(_START_TIMES_KEY)
+    if not start_times:
+        return
+    duration = time.perf_counter() - start_times.pop()
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, duration)
+
+
+def _handle_error(exception_context: Any) -> None:
+    # A statement that fails never reaches after_cursor_execute, so its start time
+    # is dropped here.
+    connection = exception_context.connection
+    if connection is not None and connection.info.get(_START_TIMES_KEY):
+        connection.info[_START_TIMES_KEY].pop()
+
+
+def installed() -> bool:
+    """Is the instrumentation listening to the statements run by every engine?"""
+    return bool(event.contains(Engine, "before_cursor_execute", _before_cursor_execute))
+
+
+def install() -> None:
+    """Listen to the statements run by every engine. Safe to call more than once."""
+    if installed():
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(Engine, "handle_error", _handle_error)
+
+
+def uninstall() -> None:
+    """Stop listening to the statements run by every engine. Safe to call more than once."""
+    if not installed():
+        return
+    event.remove(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.remove(Engine, "after_cursor_execute", _after_cursor_execute)
+    event.remove(Engine, "handle_error", _handle_error)
@@ -17,6 +17,10 @@ from sqlalchemy.orm import Session
 # initializes or migrates the database at a time.
 LOCK_ID_DB_INIT = 1000000001
 
+# This is the lock ID used to ensure that only one process refreshes the admin
+# dashboard statistics at a time.
+LOCK_ID_DASHBOARD_STATISTICS = 1000000002
+
 
 @contextmanager
 def pg_advisory_lock(
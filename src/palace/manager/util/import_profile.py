@@ -0,0 +1,155 @@
+"""
+Profile how long it takes to import the application's modules.
+
+This runs Python with ``-X importtime`` in a subprocess, so the numbers reflect a
+fresh interpreter, and reports the slowest imports. It can also check that an import
+stays within a time budget, and that it doesn't pull in modules that should only be
+imported when they are used. For example, to see what importing the web application
+costs:
+```
+bin/util/import_profile palace.manager.api.app
+```
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+
+from palace.util.exceptions import BasePalaceException
+
+
+class ImportProfileError(BasePalaceException):
+    """The code being profiled failed to run."""
+
+
+@dataclass(frozen=True)
+class ImportTime:
+    """How long it took to import a single module."""
+
+    module: str
+    self_us: int
+    """The time spent importing the module itself, in microseconds."""
+    cumulative_us: int
+    """The time spent importing the module and the modules it imported."""
+    depth: int
+    """How deeply nested the import was. 0 is a top level import."""
+
+
+@dataclass(frozen=True)
+class ImportProfile:
+    imports: list[ImportTime]
+
+    @property
+    def total(self) -> float:
+        """The total time spent importing, in seconds."""
+        return sum(entry.self_us for entry in self.imports) / 1_000_000
+
+    @property
+    def modules(self) -> set[str]:
+        return {entry.module for entry in self.imports}
+
+    def imported(self, prefixes: Iterable[str]) -> list[str]:
+        """The modules that were imported that match any of the given prefixes.
+
+        A prefix matches the module itself, and any module inside it.
+        """
+        prefixes = tuple(prefixes)
+        return sorted(
+            module
+            for module in self.modules
+            if any(
+                module == prefix or module.startswith(f"{prefix}.")
+                for prefix in prefixes
+            )
+        )
+
+    def slowest(self, count: int) -> list[ImportTime]:
+        """The imports that took longest, including the modules they imported."""
+        return sorted(
+            self.imports, key=lambda entry: entry.cumulative_us, reverse=True
+        )[:count]
+
+    @classmethod
+    def parse(cls, output: str) -> ImportProfile:
+        """Parse the report that ``python -X importtime`` writes to stderr."""
+        imports = []
+        for line in output.splitlines():
+            if not line.startswith("import time:"):
+                continue
+            self_us, cumulative_us, name = line.removeprefix("import time:").split(
+                "|", 2
+            )
+            if not self_us.strip().isdigit():
+                # The header line.
+                continue
+            module = name.strip()
+            depth = (len(name) - len(name.lstrip()) - 1) // 2
+            imports.append(
+                ImportTime(module, int(self_us), int(cumulative_us), max(depth, 0))
+            )
+        return cls(imports)
+
+
+def profile_imports(code: str, python: str = sys.executable) -> ImportProfile:
+    """Run some code in a fresh interpreter, and profile the imports it makes."""
+    result = subprocess.run(
+        [python, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        errors = [
+            line
+            for line in result.stderr.splitlines()
+            if not line.startswith("import time:")
+        ]
+        raise ImportProfileError(
+            f"Profiling {code!r} failed: " + "\n".join(errors[-20:])
+        )
+    return ImportProfile.parse(result.stderr)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Profile how long it takes to import a module."
+    )
+    parser.add_argument("module", help="The module to import.")
+    parser.add_argument(
+        "--top", type=int, default=25, help="How many of the slowest imports to show."
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        help="Fail if importing takes longer than this many seconds.",
+    )
+    parser.add_argument(
+        "--forbid",
+        action="append",
+        default=[],
+        metavar="MODULE",
+        help="Fail if this module, or any module inside it, is imported. "
+        "Can be given more than once.",
+    )
+    args = parser.parse_args(argv)
+
+    profile = profile_imports(f"import {args.module}")
+    print(f"Importing {args.module} took {profile.total:.3f}s.\n")
+    print(f"{'cumulative':>12}  {'self':>10}  module")
+    for entry in profile.slowest(args.top):
+        print(
+            f"{entry.cumulative_us / 1000:>10.1f}ms  {entry.self_us / 1000:>8.1f}ms  "
+            f"{'  ' * entry.depth}{entry.module}"
+        )
+
+    failed = False
+    if args.budget is not None and profile.total > args.budget:
+        print(f"\nOver the budget of {args.budget:.3f}s.")
+        failed = True
+    if forbidden := profile.imported(args.forbid):
+        print("\nImported forbidden modules:\n  " + "\n  ".join(forbidden))
+        failed = True
+    return 1 if failed else 0
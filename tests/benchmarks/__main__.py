@@ -0,0 +1,132 @@
+"""
+Run the benchmark suite, and compare its results between commits.
+
+Run the benchmarks against the test database, writing the timings to
+benchmark-results/<commit>.json:
+```
+python -m tests.benchmarks run
+```
+
+Any other arguments are passed on to pytest, so a single benchmark can be run with
+something like `python -m tests.benchmarks run -k to_search_documents`.
+
+Compare the timings from two runs, failing if any benchmark got more than 10% slower:
+```
+python -m tests.benchmarks compare benchmark-results/abc123.json benchmark-results/def456.json
+```
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+BENCHMARK_DIR = Path(__file__).parent
+RESULTS_DIR = Path("benchmark-results")
+
+
+def _default_output() -> Path:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = "results"
+    return RESULTS_DIR / f"{commit}.json"
+
+
+def run(output: Path | None, rounds: int, pytest_args: list[str]) -> int:
+    output = output or _default_output()
+    exit_code = pytest.main(
+        [
+            str(BENCHMARK_DIR),
+            # Benchmarks are timed one at a time, so they don't compete for the CPU.
+            "--numprocesses=0",
+            "--run-benchmarks",
+            f"--benchmark-rounds={rounds}",
+            f"--benchmark-results={output}",
+            *pytest_args,
+        ]
+    )
+    if output.exists():
+        print(f"Benchmark results written to {output}")
+    return int(exit_code)
+
+
+def _medians(results_file: Path) -> dict[str, float]:
+    results: dict[str, Any] = json.loads(results_file.read_text())
+    return {
+        benchmark["name"]: benchmark["median"] for benchmark in results["benchmarks"]
+    }
+
+
+def compare(old_file: Path, new_file: Path, threshold: float) -> int:
+    old = _medians(old_file)
+    new = _medians(new_file)
+    regressions = []
+    width = max((len(name) for name in old.keys() | new.keys()), default=0)
+    print(f"{'benchmark':<{width}}  {'old':>10}  {'new':>10}  {'change':>8}")
+    for name in sorted(old.keys() | new.keys()):
+        old_median, new_median = old.get(name), new.get(name)
+        if old_median is None or new_median is None:
+            change = "added" if old_median is None else "removed"
+        else:
+            ratio = new_median / old_median - 1 if old_median else 0.0
+            change = f"{ratio:+.1%}"
+            if ratio > threshold:
+                regressions.append(name)
+        old_column = f"{old_median * 1000:.2f}ms" if old_median is not None else "-"
+        new_column = f"{new_median * 1000:.2f}ms" if new_median is not None else "-"
+        print(f"{name:<{width}}  {old_column:>10}  {new_column:>10}  {change:>8}")
+
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) got more than {threshold:.0%} slower.")
+        return 1
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.benchmarks", description=__doc__.split("\n\n")[0]
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run the benchmarks.")
+    run_parser.add_argument(
+        "--output", type=Path, help="Where to write the results JSON."
+    )
+    run_parser.add_argument(
+        "--rounds", type=int, default=5, help="Timed rounds per benchmark."
+    )
+
+    compare_parser = subparsers.add_parser(
+        "compare", help="Compare the results of two runs."
+    )
+    compare_parser.add_argument("old", type=Path)
+    compare_parser.add_argument("new", type=Path)
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="How much slower a benchmark can get before it counts as a regression.",
+    )
+
+    args, extra = parser.parse_known_args(argv)
+    if args.command == "run":
+        return run(args.output, args.rounds, extra)
+    if extra:
+        parser.error(f"unrecognized arguments: {' '.join(extra)}")
+    return compare(args.old, args.new, args.threshold)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
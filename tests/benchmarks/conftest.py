@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from palace.manager.core.classifier import Classifier
+from palace.manager.sqlalchemy.model.classification import Subject
+from palace.manager.sqlalchemy.model.datasource import DataSource
+from palace.manager.sqlalchemy.model.work import Work
+from tests.fixtures.database import DatabaseTransactionFixture
+from tests.manager.feed.conftest import patch_url_for  # noqa: F401
+
+# The sizes of the synthetic catalogs the benchmarks run against.
+CATALOG_SIZES = (10, 100, 500)
+
+# Subjects the way they come in from distributors, as (scheme, identifier, name).
+SUBJECTS = (
+    (Subject.BISAC, "FIC009000", "Fiction / Fantasy / General"),
+    (Subject.BISAC, "FIC028000", "Fiction / Science Fiction / General"),
+    (Subject.BISAC, "FIC022000", "Fiction / Mystery & Detective / General"),
+    (Subject.BISAC, "FIC027000", "Fiction / Romance / General"),
+    (Subject.BISAC, "JUV037000", "Juvenile Fiction / Fantasy & Magic"),
+    (Subject.BISAC, "YAF019000", "Young Adult Fiction / Fantasy / General"),
+    (Subject.BISAC, "HIS036000", "History / United States / General"),
+    (Subject.BISAC, "BIO000000", "Biography & Autobiography / General"),
+    (Subject.BISAC, "COK000000", "Cooking / General"),
+    (Subject.DDC, "813.54", None),
+    (Subject.DDC, "973.7", None),
+    (Subject.DDC, "641.5", None),
+    (Subject.LCC, "PS3563", None),
+    (Subject.LCC, "QA76", None),
+    (Subject.OVERDRIVE, "Fantasy", None),
+    (Subject.OVERDRIVE, "Science Fiction", None),
+    (Subject.OVERDRIVE, "Juvenile Fiction", None),
+    (Subject.OVERDRIVE, "Cooking & Food", None),
+    (Subject.TAG, "dragons", None),
+    (Subject.TAG, "space opera", None),
+    (Subject.TAG, "cozy mystery", None),
+    (Subject.TAG, "civil war", None),
+)
+
+GENRES = ("Fantasy", "Science Fiction", "Mystery", "Romance", "History", "Cooking")
+AUDIENCES = (
+    Classifier.AUDIENCE_ADULT,
+    Classifier.AUDIENCE_YOUNG_ADULT,
+    Classifier.AUDIENCE_CHILDREN,
+)
+LANGUAGES = ("eng", "spa", "fre")
+TITLE_WORDS = (
+    "Shadow",
+    "River",
+    "Crown",
+    "Winter",
+    "Garden",
+    "Empire",
+    "Secret",
+    "Storm",
+    "Kitchen",
+    "Letters",
+)
+
+
+class SyntheticCatalog:
+    """
+    A catalog of works with license pools, covers and classifications, built the same
+    way every time for a given size, so timings can be compared between commits.
+    """
+
+    def __init__(self, db: DatabaseTransactionFixture, size: int) -> None:
+        self.db = db
+        self.size = size
+        rng = random.Random(size)
+        session = db.session
+        data_source = DataSource.lookup(session, DataSource.OVERDRIVE)
+        authors = [f"Author {number}, Synthetic" for number in range(size // 5 + 1)]
+
+        self.works: list[Work] = []
+        for number in range(size):
+            title = " ".join(rng.sample(TITLE_WORDS, 3))
+            work = db.work(
+                title=f"{title} {number}",
+                authors=rng.choice(authors),
+                genre=rng.choice(GENRES),
+                language=rng.choice(LANGUAGES),
+                audience=rng.choice(AUDIENCES),
+                fiction=rng.random() < 0.7,
+                quality=round(rng.random(), 2),
+                with_license_pool=True,
+            )
+            edition = work.presentation_edition
+            edition.publisher = f"Publisher {rng.randrange(20)}"
+            edition.series = rng.choice([None, f"{title} Series"])
+            edition.cover_full_url = f"http://example.com/covers/{number}.png"
+            edition.cover_thumbnail_url = f"http://example.com/covers/{number}.t.png"
+            for scheme, identifier, name in rng.sample(SUBJECTS, 3):
+                edition.primary_identifier.classify(
+                    data_source,
+                    scheme,
+                    identifier,
+                    name,
+                    weight=rng.randrange(1, 100),
+                )
+            self.works.append(work)
+        session.flush()
+
+    @property
+    def work_ids(self) -> list[int]:
+        return [work.id for work in self.works]
+
+
+@pytest.fixture(params=CATALOG_SIZES, ids=lambda size: f"{size}_works")
+def synthetic_catalog(
+    request: pytest.FixtureRequest, db: DatabaseTransactionFixture
+) -> SyntheticCatalog:
+    return SyntheticCatalog(db, request.param)
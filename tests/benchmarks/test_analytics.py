@@ -0,0 +1,59 @@
+import datetime
+
+import pytest
+
+from palace.util.datetime_helpers import datetime_utc
+
+from palace.manager.service.analytics.eventdata import AnalyticsEventData
+from palace.manager.service.analytics.local import LocalAnalyticsProvider
+from palace.manager.sqlalchemy.model.circulationevent import CirculationEvent
+from tests.benchmarks.conftest import SyntheticCatalog
+from tests.fixtures.benchmark import BenchmarkFixture
+from tests.fixtures.database import DatabaseTransactionFixture
+
+pytestmark = pytest.mark.benchmark
+
+# How many events are collected for each license pool in the catalog.
+EVENTS_PER_POOL = 10
+
+
+def test_collect_local_events(
+    db: DatabaseTransactionFixture,
+    synthetic_catalog: SyntheticCatalog,
+    benchmark_fixture: BenchmarkFixture,
+) -> None:
+    # A burst of checkout and checkin events for every book in the catalog, where
+    # every event is also reported a second time, the way a retried task would.
+    library = db.default_library()
+    start = datetime_utc(2024, 1, 1)
+    events = [
+        AnalyticsEventData.create(
+            library,
+            pool,
+            (
+                CirculationEvent.DISTRIBUTOR_CHECKOUT
+                if number % 2
+                else CirculationEvent.DISTRIBUTOR_CHECKIN
+            ),
+            start + datetime.timedelta(minutes=number),
+            old_value=number,
+            new_value=number + 1,
+        )
+        for work in synthetic_catalog.works
+        for pool in work.license_pools
+        for number in range(EVENTS_PER_POOL)
+    ]
+    provider = LocalAnalyticsProvider()
+
+    def clear_events() -> None:
+        db.session.query(CirculationEvent).delete(synchronize_session=False)
+        db.session.commit()
+
+    def collect() -> int:
+        for event in events + events:
+            provider.collect(event, db.session)
+        db.session.commit()
+        return db.session.query(CirculationEvent).count()
+
+    count = benchmark_fixture.pedantic(collect, setup=clear_events)
+    assert count == len(events)
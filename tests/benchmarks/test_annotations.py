@@ -0,0 +1,119 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+from pyld import jsonld
+
+from palace.manager.api import annotations
+from palace.manager.api.annotations import AnnotationParser, AnnotationWriter
+from palace.manager.sqlalchemy.model.patron import Annotation
+from palace.manager.util.problem_detail import ProblemDetail
+from tests.benchmarks.conftest import SyntheticCatalog
+from tests.fixtures.benchmark import BenchmarkFixture
+from tests.fixtures.database import DatabaseTransactionFixture
+
+pytestmark = pytest.mark.benchmark
+
+# How many bookmarks the patron has for each book in the catalog.
+BOOKMARKS_PER_WORK = 5
+
+# How many annotations each thread parses and serializes.
+ANNOTATIONS_PER_THREAD = 100
+
+
+def test_annotation_page_for(
+    db: DatabaseTransactionFixture,
+    synthetic_catalog: SyntheticCatalog,
+    benchmark_fixture: BenchmarkFixture,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # A patron with a handful of bookmarks in every book in the catalog, half of
+    # which have since been deleted, and a reading position for each book.
+    def url_for(endpoint: str, **kwargs: Any) -> str:
+        return f"http://localhost/{endpoint}"
+
+    monkeypatch.setattr(annotations, "url_for", url_for)
+    patron = db.patron()
+    patron.synchronize_annotations = True
+    for work in synthetic_catalog.works:
+        identifier = work.presentation_edition.primary_identifier
+        for number in range(BOOKMARKS_PER_WORK * 2):
+            target = {
+                "http://www.w3.org/ns/oa#hasSource": [{"@id": identifier.urn}],
+                "http://www.w3.org/ns/oa#hasSelector": [
+                    {
+                        "@type": ["http://www.w3.org/ns/oa#FragmentSelector"],
+                        "http://www.w3.org/1999/02/22-rdf-syntax-ns#value": [
+                            {"@value": f"epubcfi(/6/4[chap01ref]!/4/{number}/1:0)"}
+                        ],
+                    }
+                ],
+            }
+            db.session.add(
+                Annotation(
+                    patron=patron,
+                    identifier=identifier,
+                    motivation=(
+                        Annotation.IDLING if number == 0 else Annotation.BOOKMARKING
+                    ),
+                    target=json.dumps(target),
+                    active=number % 2 == 0,
+                )
+            )
+    db.session.commit()
+
+    page = benchmark_fixture.pedantic(
+        lambda: AnnotationWriter.annotation_page_for(patron),
+        setup=db.session.expire_all,
+    )
+    assert len(page["items"]) == synthetic_catalog.size * BOOKMARKS_PER_WORK
+
+
+@pytest.mark.parametrize("threads", [1, 8], ids=lambda threads: f"{threads}_threads")
+def test_parse_and_serialize_annotations(
+    benchmark_fixture: BenchmarkFixture, threads: int
+) -> None:
+    # Annotations posted the way reading apps post them, with the annotation
+    # context, parsed into expanded JSON-LD and compacted again by pyld, by
+    # several request threads at once.
+    documents = [
+        {
+            "@context": [
+                AnnotationWriter.JSONLD_CONTEXT,
+                {"ls": Annotation.LS_NAMESPACE},
+            ],
+            "type": "Annotation",
+            "motivation": "bookmarking",
+            "body": {
+                "type": "TextualBody",
+                "bodyValue": f"Note {number}",
+                "purpose": "describing",
+            },
+            "target": {
+                "source": "urn:isbn:9781449358068",
+                "selector": {
+                    "type": "oa:FragmentSelector",
+                    "value": f"epubcfi(/6/4!/4/{number}/1:0)",
+                },
+            },
+        }
+        for number in range(ANNOTATIONS_PER_THREAD)
+    ]
+
+    def parse_and_serialize(thread: int) -> int:
+        serialized = 0
+        for document in documents:
+            parsed = AnnotationParser._parse_document(json.loads(json.dumps(document)))
+            assert not isinstance(parsed, ProblemDetail)
+            for node in (parsed.target, parsed.content):
+                assert node is not None
+                jsonld.compact(json.loads(node), AnnotationWriter.JSONLD_CONTEXT)
+            serialized += 1
+        return serialized
+
+    def run() -> int:
+        with ThreadPoolExecutor(threads) as executor:
+            return sum(executor.map(parse_and_serialize, range(threads)))
+
+    assert benchmark_fixture(run) == threads * ANNOTATIONS_PER_THREAD
@@ -0,0 +1,57 @@
+import pytest
+
+from palace.manager.core.classifier import lookup_classifier
+from palace.manager.core.classifier.work import WorkClassifier
+from palace.manager.data_layer.subject import SubjectData
+from palace.manager.sqlalchemy.model.identifier import Identifier
+from tests.benchmarks.conftest import SUBJECTS, SyntheticCatalog
+from tests.fixtures.benchmark import BenchmarkFixture
+from tests.fixtures.database import DatabaseTransactionFixture
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.mark.parametrize("repeat", [10, 100], ids=lambda repeat: f"{repeat}x")
+def test_classify_subjects(benchmark_fixture: BenchmarkFixture, repeat: int) -> None:
+    subjects = [
+        SubjectData(type=scheme, identifier=identifier, name=name)
+        for scheme, identifier, name in SUBJECTS
+    ] * repeat
+
+    def classify() -> list[tuple]:
+        results = []
+        for subject in subjects:
+            classifier = lookup_classifier(subject.type)
+            assert classifier is not None
+            results.append(classifier.classify(subject))
+        return results
+
+    assert len(benchmark_fixture(classify)) == len(subjects)
+
+
+def test_work_classifier(
+    db: DatabaseTransactionFixture,
+    synthetic_catalog: SyntheticCatalog,
+    benchmark_fixture: BenchmarkFixture,
+) -> None:
+    # The classifications are looked up ahead of time, so only weighing them up is
+    # timed.
+    classifications = {
+        work: list(
+            Identifier.classifications_for_identifier_ids(
+                db.session, [work.presentation_edition.primary_identifier.id]
+            )
+        )
+        for work in synthetic_catalog.works
+    }
+
+    def classify() -> list[tuple]:
+        results = []
+        for work, work_classifications in classifications.items():
+            classifier = WorkClassifier(work)
+            for classification in work_classifications:
+                classifier.add(classification)
+            results.append(classifier.classify())
+        return results
+
+    assert len(benchmark_fixture(classify)) == synthetic_catalog.size
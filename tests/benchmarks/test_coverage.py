@@ -0,0 +1,49 @@
+import pytest
+from sqlalchemy import insert
+
+from palace.manager.core.coverage import CoverageProviderProgress
+from palace.manager.sqlalchemy.model.coverage import CoverageRecord
+from palace.manager.sqlalchemy.model.identifier import Identifier
+from tests.fixtures.benchmark import BenchmarkFixture
+from tests.fixtures.database import DatabaseTransactionFixture
+from tests.mocks.mock import AlwaysSuccessfulCoverageProvider
+
+pytestmark = pytest.mark.benchmark
+
+# How many identifiers in the table need coverage.
+IDENTIFIERS = 20000
+
+
+def test_run_once_deep_in_table(
+    db: DatabaseTransactionFixture, benchmark_fixture: BenchmarkFixture
+) -> None:
+    # A coverage provider that has already worked through most of a large
+    # table of identifiers, covering the next batch.
+    db.session.execute(
+        insert(Identifier),
+        [
+            {"type": Identifier.GUTENBERG_ID, "identifier": f"benchmark-{i}"}
+            for i in range(IDENTIFIERS)
+        ],
+    )
+    provider = AlwaysSuccessfulCoverageProvider(db.session)
+    provider.batch_size = 100
+    [after] = (
+        provider.items_that_need_coverage()
+        .order_by(Identifier.id)
+        .offset(IDENTIFIERS - provider.batch_size - 1)
+        .limit(1)
+        .all()
+    )
+
+    def clear_coverage() -> None:
+        db.session.query(CoverageRecord).filter(
+            CoverageRecord.data_source_id == provider.data_source.id
+        ).delete(synchronize_session=False)
+        db.session.expire_all()
+
+    progress = benchmark_fixture.pedantic(
+        lambda: provider.run_once(CoverageProviderProgress(counter=after.id)),
+        setup=clear_coverage,
+    )
+    assert progress.successes == provider.batch_size
@@ -0,0 +1,44 @@
+import json
+
+import pytest
+
+from palace.manager.core.query.customlist import CustomListQueries
+from palace.manager.sqlalchemy.model.customlist import CustomListEntry
+from tests.benchmarks.conftest import SyntheticCatalog
+from tests.fixtures.benchmark import BenchmarkFixture
+from tests.fixtures.database import DatabaseTransactionFixture
+from tests.mocks.search import ExternalSearchIndexFake
+
+pytestmark = pytest.mark.benchmark
+
+
+def test_populate_query_pages(
+    db: DatabaseTransactionFixture,
+    synthetic_catalog: SyntheticCatalog,
+    benchmark_fixture: BenchmarkFixture,
+) -> None:
+    # Every work in the catalog matches the list's query, and comes back from
+    # the search index a page at a time.
+    search = ExternalSearchIndexFake()
+    search.mock_query_works(synthetic_catalog.works)
+    custom_list, _ = db.customlist(num_entries=0)
+    custom_list.library = db.default_library()
+    custom_list.auto_update_query = json.dumps(
+        {"query": {"key": "medium", "value": "Book"}}
+    )
+
+    def clear_entries() -> None:
+        db.session.query(CustomListEntry).filter(
+            CustomListEntry.list_id == custom_list.id
+        ).delete(synchronize_session=False)
+        db.session.expire_all()
+
+    count, next_key = benchmark_fixture.pedantic(
+        lambda: CustomListQueries.populate_query_pages(
+            db.session, search, custom_list, page_size=50
+        ),
+        setup=clear_entries,
+    )
+    assert count == synthetic_catalog.size
+    assert next_key is None
+    assert custom_list.size == synthetic_catalog.size
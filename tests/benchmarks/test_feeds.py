@@ -0,0 +1,53 @@
+import json
+
+import pytest
+
+from palace.manager.feed.acquisition import OPDSAcquisitionFeed
+from palace.manager.feed.annotator.circulation import LibraryAnnotator
+from palace.manager.feed.serializer.opds2 import OPDS2Serializer
+from palace.manager.util.flask_util import OPDSFeedResponse
+from tests.benchmarks.conftest import SyntheticCatalog
+from tests.fixtures.benchmark import BenchmarkFixture
+from tests.fixtures.database import DatabaseTransactionFixture
+from tests.manager.feed.conftest import PatchedUrlFor
+
+pytestmark = pytest.mark.benchmark
+
+
+def _acquisition_feed(
+    db: DatabaseTransactionFixture, catalog: SyntheticCatalog
+) -> OPDSAcquisitionFeed:
+    annotator = LibraryAnnotator(None, None, db.default_library())
+    feed = OPDSAcquisitionFeed(
+        "Benchmark", "http://example.com/feed", catalog.works, annotator
+    )
+    feed.generate_feed()
+    return feed
+
+
+def test_acquisition_feed(
+    db: DatabaseTransactionFixture,
+    synthetic_catalog: SyntheticCatalog,
+    benchmark_fixture: BenchmarkFixture,
+    patch_url_for: PatchedUrlFor,
+) -> None:
+    # Build an OPDS 1.x feed of the whole catalog, loading the works from the
+    # database as a request would.
+    def generate() -> OPDSFeedResponse:
+        return _acquisition_feed(db, synthetic_catalog).as_response()
+
+    response = benchmark_fixture.pedantic(generate, setup=db.session.expire_all)
+    assert response.status_code == 200
+    assert response.get_data(as_text=True).count("<entry") == synthetic_catalog.size
+
+
+def test_opds2_serializer(
+    db: DatabaseTransactionFixture,
+    synthetic_catalog: SyntheticCatalog,
+    benchmark_fixture: BenchmarkFixture,
+    patch_url_for: PatchedUrlFor,
+) -> None:
+    # Only the serialization is timed, not building the feed's entries.
+    feed = _acquisition_feed(db, synthetic_catalog)
+    serialized = benchmark_fixture(OPDS2Serializer().serialize_feed, feed._feed)
+    assert len(json.loads(serialized)["publications"]) == synthetic_catalog.size
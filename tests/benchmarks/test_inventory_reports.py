@@ -0,0 +1,80 @@
+import tempfile
+import tracemalloc
+
+import pytest
+
+from palace.manager.celery.tasks.generate_inventory_and_hold_reports import (
+    _write_reports,
+)
+from tests.fixtures.benchmark import BenchmarkFixture
+from tests.fixtures.database import DatabaseTransactionFixture
+from tests.manager.celery.tasks.test_generate_inventory_and_hold_reports import (
+    _synthetic_report_query,
+)
+
+pytestmark = pytest.mark.benchmark
+
+# How many rows are in the report.
+REPORT_ROWS = 50000
+
+
+def test_write_reports(
+    db: DatabaseTransactionFixture, benchmark_fixture: BenchmarkFixture
+) -> None:
+    # A large report, streamed to its CSV and Excel files.
+    query = _synthetic_report_query(REPORT_ROWS)
+    with (
+        tempfile.TemporaryFile("w+", encoding="utf-8") as csv_file,
+        tempfile.TemporaryFile("w+b") as excel_file,
+    ):
+
+        def rewind() -> None:
+            for file in (csv_file, excel_file):
+                file.seek(0)
+                file.truncate()
+
+        benchmark_fixture.pedantic(
+            lambda: _write_reports(
+                db.session,
+                csv_file=csv_file,
+                excel_file=excel_file,
+                sql_params={},
+                query=query,
+                columns_to_stringify=frozenset({"identifier"}),
+            ),
+            setup=rewind,
+        )
+        csv_file.seek(0)
+        assert sum(1 for _ in csv_file) == REPORT_ROWS + 1
+
+
+def test_write_reports_memory_is_bounded(db: DatabaseTransactionFixture) -> None:
+    """Streaming a large report uses a fraction of the memory buffering it does."""
+    query = _synthetic_report_query(REPORT_ROWS)
+
+    tracemalloc.start()
+    try:
+        with (
+            tempfile.TemporaryFile("w+", encoding="utf-8") as csv_file,
+            tempfile.TemporaryFile("w+b") as excel_file,
+        ):
+            tracemalloc.reset_peak()
+            _write_reports(
+                db.session,
+                csv_file=csv_file,
+                excel_file=excel_file,
+                sql_params={},
+                query=query,
+                columns_to_stringify=frozenset({"identifier"}),
+            )
+            _, streamed_peak = tracemalloc.get_traced_memory()
+
+        tracemalloc.reset_peak()
+        result = db.session.execute(query)
+        buffered_rows = [dict(row._mapping) for row in result]
+        _, buffered_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert len(buffered_rows) == REPORT_ROWS
+    assert streamed_peak < buffered_peak / 4
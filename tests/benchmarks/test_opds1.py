@@ -0,0 +1,22 @@
+import pytest
+
+from palace.manager.integration.license.opds.opds1.extractor import Opds1Extractor
+from tests.fixtures.benchmark import BenchmarkFixture
+from tests.fixtures.files import OPDSFilesFixture
+
+pytestmark = pytest.mark.benchmark
+
+
+def test_feed_publications(
+    opds_files_fixture: OPDSFilesFixture, benchmark_fixture: BenchmarkFixture
+) -> None:
+    # Reading every publication in a page of a feed, in the single pass the
+    # extractor streams the feed in.
+    feed = opds_files_fixture.sample_data("palace_feed.opds")
+    extractor = Opds1Extractor("http://example.com/feed", "Example Data Source")
+
+    def read_publications() -> int:
+        parsed = extractor.feed_parse(feed)
+        return sum(1 for _ in extractor.feed_publications(parsed))
+
+    assert benchmark_fixture(read_publications) == 100
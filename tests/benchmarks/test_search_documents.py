@@ -0,0 +1,21 @@
+import pytest
+
+from palace.manager.sqlalchemy.model.work import Work
+from tests.benchmarks.conftest import SyntheticCatalog
+from tests.fixtures.benchmark import BenchmarkFixture
+from tests.fixtures.database import DatabaseTransactionFixture
+
+pytestmark = pytest.mark.benchmark
+
+
+def test_to_search_documents(
+    db: DatabaseTransactionFixture,
+    synthetic_catalog: SyntheticCatalog,
+    benchmark_fixture: BenchmarkFixture,
+) -> None:
+    work_ids = synthetic_catalog.work_ids
+    documents = benchmark_fixture.pedantic(
+        lambda: Work.to_search_documents(db.session, work_ids),
+        setup=db.session.expire_all,
+    )
+    assert len(documents) == synthetic_catalog.size
@@ -0,0 +1,14 @@
+import pytest
+
+from palace.manager.util.import_profile import ImportProfile, profile_imports
+from tests.fixtures.benchmark import BenchmarkFixture
+from tests.manager.util.test_import_profile import REGISTRY_STARTUP
+
+pytestmark = pytest.mark.benchmark
+
+
+def test_integration_registry_startup(benchmark_fixture: BenchmarkFixture) -> None:
+    # A new process importing the services container and building the integration
+    # registries, the way every web app and Celery worker process starts up.
+    profile: ImportProfile = benchmark_fixture(profile_imports, REGISTRY_STARTUP)
+    assert "palace.manager.service.container" in profile.modules
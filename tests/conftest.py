@@ -9,6 +9,7 @@ pytest_plugins = [
     "tests.fixtures.api_admin",
     "tests.fixtures.api_controller",
     "tests.fixtures.api_routes",
+    "tests.fixtures.benchmark",
     "tests.fixtures.celery",
     "tests.fixtures.database",
     "tests.fixtures.equivalents",
@@ -21,6 +22,7 @@ pytest_plugins = [
     "tests.fixtures.oidc",
     "tests.fixtures.overdrive",
     "tests.fixtures.pyinstrument",
+    "tests.fixtures.query_budget",
     "tests.fixtures.redis",
     "tests.fixtures.s3",
     "tests.fixtures.search",
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+import subprocess
+import time
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+from typing import Any, ParamSpec, TypeVar
+
+import pytest
+
+from palace.util.datetime_helpers import utc_now
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+_benchmark_results = pytest.StashKey[list[dict[str, Any]]]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("benchmarks")
+    group.addoption(
+        "--run-benchmarks",
+        action="store_true",
+        default=False,
+        help="Run the tests marked as benchmarks, which are skipped otherwise.",
+    )
+    group.addoption(
+        "--benchmark-rounds",
+        type=int,
+        default=5,
+        help="How many timed rounds each benchmark runs.",
+    )
+    group.addoption(
+        "--benchmark-results",
+        type=Path,
+        default=None,
+        help="Write the benchmark timings to this JSON file.",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.stash[_benchmark_results] = []
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    if config.getoption("run_benchmarks"):
+        return
+    skip = pytest.mark.skip(reason="Benchmarks only run with --run-benchmarks.")
+    for item in items:
+        if item.get_closest_marker("benchmark"):
+            item.add_marker(skip)
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    config = session.config
+    results_file: Path | None = config.getoption("benchmark_results")
+    results = config.stash[_benchmark_results]
+    if results_file is None or not results:
+        return
+
+    results_file.parent.mkdir(parents=True, exist_ok=True)
+    results_file.write_text(
+        json.dumps(
+            {
+                "commit": _git_commit(),
+                "datetime": utc_now().isoformat(),
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "benchmarks": sorted(results, key=lambda result: result["name"]),
+            },
+            indent=2,
+        )
+    )
+
+
+class BenchmarkFixture:
+    """
+    Time a function over several rounds, and record the timings.
+
+    The function is run once untimed to warm up, and then once per round. Its result
+    from the last round is returned, so the test can check it did what was expected.
+    For example:
+    ```
+    documents = benchmark_fixture(Work.to_search_documents, session, work_ids)
+    assert len(documents) == len(work_ids)
+    ```
+    """
+
+    def __init__(self, name: str, rounds: int, results: list[dict[str, Any]]) -> None:
+        self.name = name
+        self.rounds = rounds
+        self._results = results
+        self.timings: list[float] = []
+
+    def __call__(
+        self,
+        func: Callable[P, T],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> T:
+        return self.pedantic(partial(func, *args, **kwargs))
+
+    def pedantic(
+        self, func: Callable[[], T], setup: Callable[[], object] | None = None
+    ) -> T:
+        """
+        Benchmark a function, calling setup before each round without timing it.
+
+        This is useful to expire a session between rounds, so each round loads what
+        it needs from the database the way a fresh request would.
+        """
+        if self.timings:
+            raise ValueError("A test can only run one benchmark.")
+
+        if setup:
+            setup()
+        result = func()
+        for _ in range(self.rounds):
+            if setup:
+                setup()
+            start = time.perf_counter()
+            result = func()
+            self.timings.append(time.perf_counter() - start)
+
+        self._results.append(self.stats())
+        return result
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "rounds": len(self.timings),
+            "min": min(self.timings),
+            "max": max(self.timings),
+            "mean": statistics.mean(self.timings),
+            "median": statistics.median(self.timings),
+            "stddev": (
+                statistics.stdev(self.timings) if len(self.timings) > 1 else 0.0
+            ),
+        }
+
+
+@pytest.fixture
+def benchmark_fixture(request: pytest.FixtureRequest) -> BenchmarkFixture:
+    # Timing tests belong in the benchmark suite, where they're skipped by default,
+    # not in the regular test run.
+    if request.node.get_closest_marker("benchmark") is None:
+        pytest.fail(
+            f"{request.node.nodeid} uses benchmark_fixture, but isn't marked as a benchmark."
+        )
+    config = request.config
+    return BenchmarkFixture(
+        request.node.nodeid,
+        max(config.getoption("benchmark_rounds"), 1),
+        config.stash[_benchmark_results],
+    )
@@ -0,0 +1,50 @@
+from collections.abc import Generator
+from contextlib import contextmanager
+
+import pytest
+
+from palace.manager.sqlalchemy import query_instrumentation
+from palace.manager.sqlalchemy.query_instrumentation import (
+    QueryStats,
+    collect_query_stats,
+)
+
+
+class QueryBudgetFixture:
+    """
+    Assert that a block of code runs no more than a given number of SQL statements.
+
+    For example:
+    ```
+    with query_budget(10):
+        response = controller.endpoint()
+    ```
+
+    Anything waiting to be flushed to the database is flushed when the block runs its
+    first query, so flush the session before the block to keep that out of the count.
+    """
+
+    def __init__(self) -> None:
+        # Only remove the instrumentation afterwards if it wasn't already installed.
+        self._installed = query_instrumentation.installed()
+        query_instrumentation.install()
+
+    def close(self) -> None:
+        if not self._installed:
+            query_instrumentation.uninstall()
+
+    @contextmanager
+    def __call__(self, max_queries: int) -> Generator[QueryStats]:
+        with collect_query_stats() as stats:
+            yield stats
+        assert stats.count <= max_queries, (
+            f"Ran {stats.count} queries, over the budget of {max_queries}. "
+            f"Slowest: {stats.log_data()['slowest']}"
+        )
+
+
+@pytest.fixture
+def query_budget() -> Generator[QueryBudgetFixture]:
+    fixture = QueryBudgetFixture()
+    yield fixture
+    fixture.close()
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Generator
+from collections.abc import Generator, Iterable
 from contextlib import contextmanager
 from typing import Any
 from unittest.mock import patch
@@ -299,15 +299,20 @@ class WorkQueueIndexingFixture:
     def __init__(self):
         self.queued_works = set()
         self.patch = patch.object(Work, "queue_indexing", self.queue)
+        self.patch_many = patch.object(Work, "queue_indexing_many", self.queue_many)
 
     def queue(self, work_id: int | None, *, redis_client: Any = None) -> None:
         return self.queued_works.add(work_id)
 
+    def queue_many(self, work_ids: Iterable[int], *, redis_client: Any = None) -> None:
+        self.queued_works.update(work_ids)
+
     def clear(self):
         self.queued_works.clear()
 
     def disable_fixture(self):
         self.patch.stop()
+        self.patch_many.stop()
 
     def is_queued(self, work: int | Work, *, clear: bool = False) -> bool:
         if isinstance(work, Work):
@@ -326,9 +331,11 @@ class WorkQueueIndexingFixture:
     def fixture(cls):
         fixture = cls()
         fixture.patch.start()
+        fixture.patch_many.start()
         try:
             yield fixture
         finally:
+            fixture.patch_many.stop()
             fixture.patch.stop()
 
 
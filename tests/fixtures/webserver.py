@@ -13,12 +13,15 @@ class MockAPIServerRequest:
 
     headers: dict[str, str]
     payload: bytes
+    chunks: list[bytes]
     method: str
     path: str
 
     def __init__(self) -> None:
         self.headers = {}
         self.payload = b""
+        # The chunks of a payload sent with chunked transfer encoding.
+        self.chunks = []
         self.method = "GET"
         self.path = "/"
 
@@ -71,11 +74,29 @@ class MockAPIServerRequestHandler(BaseHTTPRequestHandler, LoggerMixin):
             if header is not None:
                 _request.headers[k] = header
         _request.path = self.path
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            _request.chunks = self._read_chunked()
+            _request.payload = b"".join(_request.chunks)
+            return _request
         _readable = int(self.headers.get("Content-Length") or 0)
         if _readable > 0:
             _request.payload = self.rfile.read(_readable)
         return _request
 
+    def _read_chunked(self) -> list[bytes]:
+        """Read a request body sent with chunked transfer encoding."""
+        _chunks = []
+        while True:
+            _size = int(self.rfile.readline().split(b";")[0].strip(), 16)
+            if _size == 0:
+                # Skip any trailers, up to the blank line that ends the body.
+                while self.rfile.readline().strip():
+                    pass
+                break
+            _chunks.append(self.rfile.read(_size))
+            self.rfile.readline()
+        return _chunks
+
     def _handle_everything(self) -> None:
         _request = self._read_everything()
         assert isinstance(self.server, MockAPIInternalServer)
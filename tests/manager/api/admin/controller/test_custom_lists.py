@@ -22,6 +22,7 @@ from palace.manager.api.admin.problem_details import (
 from palace.manager.api.problem_details import CANNOT_DELETE_SHARED_LIST
 from palace.manager.core.query.customlist import CustomListQueries
 from palace.manager.search.pagination import Pagination
+from palace.manager.service.redis.models.search import WaitingForIndexing
 from palace.manager.sqlalchemy.model.admin import Admin, AdminRole
 from palace.manager.sqlalchemy.model.collection import Collection
 from palace.manager.sqlalchemy.model.customlist import CustomList, CustomListEntry
@@ -29,10 +30,13 @@ from palace.manager.sqlalchemy.model.datasource import DataSource
 from palace.manager.sqlalchemy.model.edition import Edition
 from palace.manager.sqlalchemy.model.lane import Lane
 from palace.manager.sqlalchemy.model.library import Library
+from palace.manager.sqlalchemy.model.work import Work
 from palace.manager.sqlalchemy.util import create, get_one
 from palace.manager.util.problem_detail import ProblemDetail
 from tests.fixtures.api_admin import AdminLibrarianFixture
 from tests.fixtures.database import DatabaseTransactionFixture
+from tests.fixtures.redis import RedisFixture
+from tests.fixtures.search import WorkQueueIndexingFixture
 from tests.mocks.flask import add_request_context
 from tests.mocks.search import ExternalSearchIndexFake, SearchServiceFake
 
@@ -713,6 +717,115 @@ class TestCustomListsController:
                 list.id,
             )
 
+    def test_custom_list_edit_deferred_indexing(
+        self,
+        admin_librarian_fixture: AdminLibrarianFixture,
+        redis_fixture: RedisFixture,
+        work_queue_indexing: WorkQueueIndexingFixture,
+    ):
+        # The works go into the real WaitingForIndexing set in redis.
+        work_queue_indexing.disable_fixture()
+        admin_librarian_fixture.ctrl.services_fixture.services.config.search.defer_custom_list_indexing.from_value(
+            True
+        )
+        db = admin_librarian_fixture.ctrl.db
+        controller = admin_librarian_fixture.manager.admin_custom_lists_controller
+
+        data_source = DataSource.lookup(db.session, DataSource.LIBRARY_STAFF)
+        list, ignore = create(
+            db.session, CustomList, name=db.fresh_str(), data_source=data_source
+        )
+        list.library = db.default_library()
+        w1 = db.work(title="Alpha", with_license_pool=True)
+        w2 = db.work(title="Bravo", with_license_pool=True)
+        w3 = db.work(title="Charlie", with_license_pool=True)
+        list.add_entry(w1, update_external_index=False)
+
+        search_engine = admin_librarian_fixture.ctrl.controller.search_engine
+        assert isinstance(search_engine, ExternalSearchIndexFake)
+        search_service: SearchServiceFake = search_engine.search_service()  # type: ignore [assignment]
+
+        def indexing_status() -> dict[str, Any]:
+            with admin_librarian_fixture.request_context_with_library_and_admin("/"):
+                response = controller.custom_list_indexing(list.id)
+            assert isinstance(response, dict)
+            return response
+
+        assert indexing_status() == dict(
+            id=list.id, indexing_pending=False, works_pending=0
+        )
+
+        def entries(*works: Work) -> str:
+            return json.dumps(
+                [
+                    dict(id=work.presentation_edition.primary_identifier.urn)
+                    for work in works
+                ]
+            )
+
+        with admin_librarian_fixture.request_context_with_library_and_admin(
+            "/", method="POST"
+        ):
+            form = ImmutableMultiDict(
+                [
+                    ("id", str(list.id)),
+                    ("name", list.name),
+                    ("entries", entries(w2, w3)),
+                    ("deletedEntries", entries(w1)),
+                    ("collections", json.dumps([])),
+                ]
+            )
+            add_request_context(flask.request, CustomListPostRequest, form=form)
+            response = controller.custom_list(list.id)
+
+        # The edit was made, but nothing was indexed during the request, so the
+        # response says indexing is still pending.
+        assert isinstance(response, flask.Response)
+        assert 202 == response.status_code
+        assert list.id == int(response.get_data(as_text=True))
+        assert {w2, w3} == {entry.work for entry in list.entries}
+        assert search_service.documents_all() == []
+        assert indexing_status() == dict(
+            id=list.id, indexing_pending=True, works_pending=3
+        )
+
+        # Once the search_indexing task has picked up the works and indexed them,
+        # the index has caught up with the edit.
+        waiting = WaitingForIndexing(redis_fixture.client)
+        work_ids = waiting.pop(10)
+        assert {w1.id, w2.id, w3.id} == set(work_ids)
+        search_engine.add_documents(Work.to_search_documents(db.session, work_ids))
+
+        assert indexing_status() == dict(
+            id=list.id, indexing_pending=False, works_pending=0
+        )
+        assert {w1.id, w2.id, w3.id} == {
+            document["_id"] for document in search_service.documents_all()
+        }
+
+    def test_custom_list_indexing_errors(
+        self, admin_librarian_fixture: AdminLibrarianFixture
+    ):
+        db = admin_librarian_fixture.ctrl.db
+        controller = admin_librarian_fixture.manager.admin_custom_lists_controller
+        with admin_librarian_fixture.request_context_with_library_and_admin("/"):
+            assert MISSING_CUSTOM_LIST == controller.custom_list_indexing(-1)
+
+        # A list that belongs to another library can't be found either.
+        list, _ = db.customlist(
+            data_source_name=DataSource.LIBRARY_STAFF, num_entries=0
+        )
+        list.library = db.library()
+        with admin_librarian_fixture.request_context_with_library_and_admin("/"):
+            assert MISSING_CUSTOM_LIST == controller.custom_list_indexing(list.id)
+
+        # Librarians of the list's library are the only ones who can see it.
+        admin_librarian_fixture.admin.remove_role(
+            AdminRole.LIBRARIAN, db.default_library()
+        )
+        with admin_librarian_fixture.request_context_with_library_and_admin("/"):
+            pytest.raises(AdminNotAuthorized, controller.custom_list_indexing, list.id)
+
     def test_custom_list_auto_update_cases(
         self, admin_librarian_fixture: AdminLibrarianFixture
     ):
@@ -82,7 +82,7 @@ class TestDashboardController:
                 dashboard_fixture.manager.admin_dashboard_controller.bulk_circulation_events()
             )
         reader = csv.reader(
-            [row for row in response.split("\r\n") if row], dialect=csv.excel
+            [row for row in "".join(response).split("\r\n") if row], dialect=csv.excel
         )
         rows = [row for row in reader][1::]  # skip header row
         assert 1 == len(rows)
@@ -96,9 +96,9 @@ class TestDashboardController:
         # Now verify that this works by passing incoming query
         # parameters into a LocalAnalyticsExporter object.
         class MockLocalAnalyticsExporter:
-            def export(self, _db, date_start, date_end, library):
+            def export_stream(self, _db, date_start, date_end, library):
                 self.called_with = (_db, date_start, date_end, library)
-                return "A CSV file"
+                return iter(["A CSV file"])
 
         exporter = MockLocalAnalyticsExporter()
         with dashboard_fixture.ctrl.request_context_with_library(
@@ -125,8 +125,8 @@ class TestDashboardController:
             assert dashboard_fixture.ctrl.db.default_library() == args.pop(0)
             assert [] == args
 
-            # The data returned is whatever export() returned.
-            assert "A CSV file" == response
+            # The data returned is whatever export_stream() returned.
+            assert ["A CSV file"] == list(response)
 
             # The other data is necessary to build a filename for the
             # "CSV file".
@@ -158,3 +158,29 @@ class TestDashboardController:
             dashboard_fixture.ctrl.db.session,
         ) == stats_mock.call_args.args
         assert {} == stats_mock.call_args.kwargs
+
+    @pytest.mark.parametrize(
+        "query_string,refreshed",
+        [
+            pytest.param("", False, id="no refresh"),
+            pytest.param("?refresh=false", False, id="refresh false"),
+            pytest.param("?refresh=true", True, id="refresh true"),
+        ],
+    )
+    def test_stats_refresh(
+        self, dashboard_fixture: DashboardFixture, query_string: str, refreshed: bool
+    ):
+        # A refresh is only queued before the statistics are generated when the
+        # admin asks for it.
+        calls = []
+        stats_mock = mock.MagicMock(side_effect=lambda *args: calls.append("stats"))
+        refresh_mock = mock.MagicMock(side_effect=lambda *args: calls.append("refresh"))
+        with dashboard_fixture.request_context_with_admin(
+            f"/{query_string}", admin=dashboard_fixture.admin
+        ):
+            dashboard_fixture.manager.admin_dashboard_controller.stats(
+                stats_function=stats_mock, refresh_function=refresh_mock
+            )
+        assert calls == (["refresh", "stats"] if refreshed else ["stats"])
+        if refreshed:
+            refresh_mock.assert_called_once_with()
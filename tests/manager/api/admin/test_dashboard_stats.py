@@ -4,18 +4,26 @@ from datetime import timedelta
 from typing import TYPE_CHECKING
 
 import pytest
+from freezegun import freeze_time
+from sqlalchemy import func, select
 
 from palace.util.datetime_helpers import utc_now
 
-from palace.manager.api.admin.dashboard_stats import generate_statistics
+from palace.manager.api.admin.dashboard_stats import (
+    Statistics,
+    generate_statistics,
+    refresh_statistics,
+)
 from palace.manager.api.admin.model.dashboard_statistics import (
     InventoryStatistics,
     PatronStatistics,
 )
 from palace.manager.sqlalchemy.model.admin import Admin, AdminRole
+from palace.manager.sqlalchemy.model.coverage import Timestamp
+from palace.manager.sqlalchemy.model.dashboard_statistics import LibraryPatronSummary
 from palace.manager.sqlalchemy.model.datasource import DataSource
 from palace.manager.sqlalchemy.model.licensing import LicensePoolStatus
-from palace.manager.sqlalchemy.util import create
+from palace.manager.sqlalchemy.util import LOCK_ID_DASHBOARD_STATISTICS, create
 
 if TYPE_CHECKING:
     from palace.manager.sqlalchemy.model.collection import Collection
@@ -31,7 +39,15 @@ class AdminStatisticsSessionFixture:
         self.db = db
 
     def get_statistics(self):
-        return generate_statistics(self.admin, self.db.session)
+        """Refresh the precomputed statistics and read them back, checking that
+        they match the statistics computed from the live tables."""
+        refresh_statistics(self.db.session)
+        response = generate_statistics(self.admin, self.db.session)
+        live = Statistics(self.db.session).stats(self.admin, live=True)
+        assert response.model_copy(update={"as_of": None}) == live.model_copy(
+            update={"as_of": None}
+        )
+        return response
 
 
 @pytest.fixture
@@ -641,3 +657,74 @@ def test_stats_parent_collection_permissions(
     # No exceptions were thrown
     assert child.id in collection_ids
     assert parent.name not in collection_ids
+
+
+def test_stats_precomputed(admin_statistics_session: AdminStatisticsSessionFixture):
+    """The statistics are read from summaries computed when they're refreshed."""
+    admin = admin_statistics_session.admin
+    db = admin_statistics_session.db
+    admin.add_role(AdminRole.SYSTEM_ADMIN)
+    library = db.default_library()
+    db.patron()
+
+    def timestamp() -> Timestamp | None:
+        return Timestamp.lookup(
+            db.session, Statistics.SERVICE_NAME, Timestamp.TASK_TYPE, collection=None
+        )
+
+    # The summaries have never been computed, so until they are, the statistics
+    # are computed from the live tables, without writing anything.
+    assert timestamp() is None
+    now = utc_now()
+    with freeze_time(now):
+        response = generate_statistics(admin, db.session)
+    assert response.as_of == now
+    assert 1 == response.libraries_by_key[library.short_name].patron_statistics.total
+    assert timestamp() is None
+    assert 0 == db.session.query(LibraryPatronSummary).count()
+
+    first_computed = now + timedelta(minutes=1)
+    with freeze_time(first_computed):
+        assert refresh_statistics(db.session) == first_computed
+    stamp = timestamp()
+    assert stamp is not None
+    assert stamp.start == first_computed
+
+    # After that, changes aren't seen until the statistics are refreshed.
+    db.patron()
+    db.edition(with_open_access_download=True)
+    response = generate_statistics(admin, db.session)
+    assert response.as_of == first_computed
+    assert 1 == response.patron_summary.total
+    assert 0 == response.inventory_summary.titles
+
+    refreshed = first_computed + timedelta(minutes=15)
+    with freeze_time(refreshed):
+        assert refresh_statistics(db.session) == refreshed
+    response = generate_statistics(admin, db.session)
+    assert response.as_of == refreshed
+    assert 2 == response.patron_summary.total
+    assert 1 == response.inventory_summary.titles
+
+    # The live statistics are computed as of now.
+    with freeze_time(refreshed + timedelta(minutes=1)):
+        live = Statistics(db.session).stats(admin, live=True)
+    assert live.as_of == refreshed + timedelta(minutes=1)
+
+
+def test_refresh_skipped_while_running(db: DatabaseTransactionFixture):
+    """Only one refresh runs at a time, and any others are skipped."""
+    db.patron()
+
+    # Another process is refreshing the statistics, and holds the lock until
+    # its transaction ends.
+    with db.database.engine.connect() as connection, connection.begin():
+        connection.execute(
+            select(func.pg_advisory_xact_lock(LOCK_ID_DASHBOARD_STATISTICS))
+        )
+        assert refresh_statistics(db.session) is None
+        assert 0 == db.session.query(LibraryPatronSummary).count()
+
+    # Once it's done, the statistics can be refreshed again.
+    assert refresh_statistics(db.session) is not None
+    assert 1 == db.session.query(LibraryPatronSummary).count()
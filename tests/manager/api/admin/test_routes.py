@@ -77,7 +77,7 @@ class MockAdminController(MockController):
             return INVALID_CSRF_TOKEN
 
     def bulk_circulation_events(self):
-        return "data", "date", "date_end", "library"
+        return iter(["data"]), "date", "date_end", "library"
 
     def import_libraries(self):
         return flask.Response(
@@ -938,6 +938,13 @@ class TestAdminCustomListsServices:
         )
         fixture.assert_supported_methods(url, "GET", "POST", "DELETE")
 
+    def test_custom_list_indexing(self, fixture: AdminRouteFixture):
+        url = "/admin/custom_list/<list_id>/indexing"
+        fixture.assert_authenticated_request_calls(
+            url, fixture.controller.custom_list_indexing, "<list_id>"
+        )
+        fixture.assert_supported_methods(url, "GET")
+
 
 class TestAdminLanes:
     CONTROLLER_NAME = "admin_lanes_controller"
@@ -1,7 +1,9 @@
 import base64
 import functools
 import json
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Any
 from unittest.mock import MagicMock, patch
@@ -16,7 +18,10 @@ from sqlalchemy import delete
 from palace.util.datetime_helpers import utc_now
 from palace.util.log import LogLevel
 
-from palace.manager.api.authentication.access_token import PatronJWEAccessTokenProvider
+from palace.manager.api.authentication.access_token import (
+    JWEKeyRing,
+    PatronJWEAccessTokenProvider,
+)
 from palace.manager.api.problem_details import (
     PATRON_AUTH_ACCESS_TOKEN_EXPIRED,
     PATRON_AUTH_ACCESS_TOKEN_INVALID,
@@ -30,6 +35,7 @@ from tests.fixtures.database import DatabaseTransactionFixture
 class JWEProviderFixture:
     def __init__(self, db: DatabaseTransactionFixture):
         self.db = db
+        PatronJWEAccessTokenProvider.key_ring.clear()
         self.patron = db.patron()
         self.generate_token = functools.partial(
             PatronJWEAccessTokenProvider.generate_token,
@@ -288,3 +294,117 @@ class TestJWEProvider:
             keep=2,
             older_than=utc_now() - timedelta(days=2),
         )
+
+
+class TestJWEKeyRing:
+    @staticmethod
+    def mock_session(*keys: Key, delay: float = 0.0) -> MagicMock:
+        """A session that loads the given keys."""
+
+        def scalars(*args: Any, **kwargs: Any) -> MagicMock:
+            time.sleep(delay)
+            result = MagicMock()
+            result.all.return_value = list(keys)
+            return result
+
+        session = MagicMock()
+        session.scalars.side_effect = scalars
+        return session
+
+    @staticmethod
+    def key() -> Key:
+        key_id = uuid.uuid4()
+        return Key(
+            id=key_id,
+            value=PatronJWEAccessTokenProvider.generate_jwk(key_id),
+            type=KeyType.AUTH_TOKEN_JWE,
+        )
+
+    def test_get(self, db: DatabaseTransactionFixture):
+        db.session.execute(delete(Key).where(Key.type == KeyType.AUTH_TOKEN_JWE))
+        key = PatronJWEAccessTokenProvider.create_key(db.session)
+        ring = JWEKeyRing()
+
+        # The keys are loaded from the database the first time one is asked for.
+        with patch.object(db.session, "scalars", wraps=db.session.scalars) as scalars:
+            jwk_key = ring.get(db.session, key.id)
+            assert isinstance(jwk_key, jwk.JWK)
+            assert jwk_key.get("kid") == uuid_encode(key.id)
+            assert scalars.call_count == 1
+
+            # After that, they're served from the ring.
+            assert ring.get(db.session, key.id) is jwk_key
+            assert scalars.call_count == 1
+
+            # Asking for a key that doesn't exist loads the keys again.
+            assert ring.get(db.session, uuid.uuid4()) is None
+            assert scalars.call_count == 2
+
+            # Until the ring is cleared, that is.
+            ring.clear()
+            assert ring.get(db.session, key.id) is not jwk_key
+            assert scalars.call_count == 3
+
+    def test_rotation(self):
+        old_key = self.key()
+        ring = JWEKeyRing()
+        assert ring.get(self.mock_session(old_key), old_key.id) is not None
+
+        # A key that was rotated in after the ring was loaded is found straight away,
+        # and the old key can still be used.
+        new_key = self.key()
+        session = self.mock_session(old_key, new_key)
+        assert ring.get(session, new_key.id) is not None
+        assert ring.get(session, old_key.id) is not None
+        assert session.scalars.call_count == 1
+
+    def test_expiry(self):
+        key = self.key()
+        ring = JWEKeyRing(ttl=60)
+
+        with freeze_time() as frozen:
+            assert ring.get(self.mock_session(key), key.id) is not None
+
+            # A key that has been deleted can still be used until the ring expires.
+            session = self.mock_session()
+            frozen.tick(59)
+            assert ring.get(session, key.id) is not None
+            assert session.scalars.call_count == 0
+
+            # Then the ring is loaded again, and the key is gone.
+            frozen.tick(2)
+            assert ring.get(session, key.id) is None
+            assert session.scalars.call_count == 1
+
+    def test_concurrent_access(self):
+        key = self.key()
+        ring = JWEKeyRing()
+
+        # Lots of threads miss at once, but the keys are only loaded once.
+        session = self.mock_session(key, delay=0.05)
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            results = list(executor.map(lambda _: ring.get(session, key.id), range(50)))
+        assert session.scalars.call_count == 1
+        assert all(result is results[0] for result in results)
+        assert results[0] is not None
+
+    def test_decrypt_token(
+        self, db: DatabaseTransactionFixture, jwe_provider: JWEProviderFixture
+    ):
+        token = jwe_provider.generate_token()
+
+        # Once the key is in the ring, decrypting a token doesn't touch the database.
+        PatronJWEAccessTokenProvider.decrypt_token(db.session, token)
+        with patch.object(db.session, "scalars") as scalars:
+            decrypted = PatronJWEAccessTokenProvider.decrypt_token(db.session, token)
+            scalars.assert_not_called()
+        assert decrypted.id == jwe_provider.patron.id
+
+        # Deleting old keys in this process takes them out of the ring straight away.
+        jwe_provider.key.created = utc_now() - timedelta(days=3)
+        for _ in range(2):
+            PatronJWEAccessTokenProvider.create_key(db.session)
+        assert PatronJWEAccessTokenProvider.delete_old_keys(db.session) == 1
+        with pytest.raises(ProblemDetailException) as exc:
+            PatronJWEAccessTokenProvider.decrypt_token(db.session, token)
+        assert exc.value.problem_detail == PATRON_AUTH_ACCESS_TOKEN_INVALID
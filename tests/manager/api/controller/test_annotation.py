@@ -1,6 +1,7 @@
 import datetime
 import json
 from time import mktime
+from typing import Any
 from wsgiref.handlers import format_date_time
 
 import pytest
@@ -8,6 +9,11 @@ import pytest
 from palace.util.datetime_helpers import utc_now
 
 from palace.manager.api.annotations import AnnotationWriter
+from palace.manager.api.problem_details import (
+    INVALID_ANNOTATION_FORMAT,
+    INVALID_ANNOTATION_TARGET,
+)
+from palace.manager.sqlalchemy.model.identifier import Identifier
 from palace.manager.sqlalchemy.model.patron import Annotation, Patron
 from palace.manager.sqlalchemy.util import create
 from tests.fixtures.api_controller import CirculationControllerFixture
@@ -211,6 +217,64 @@ class TestAnnotationController:
             assert str(annotation.id) in item["id"]
             assert annotation.motivation == item["motivation"]
 
+    def test_post_batch_to_container(self, annotation_fixture: AnnotationFixture):
+        def bookmark(identifier: Identifier, location: str) -> dict[str, Any]:
+            return {
+                "@context": AnnotationWriter.JSONLD_CONTEXT,
+                "type": "Annotation",
+                "motivation": Annotation.BOOKMARKING,
+                "target": {"source": identifier.urn, "selector": location},
+            }
+
+        other_identifier = annotation_fixture.db.identifier()
+        data = [
+            bookmark(annotation_fixture.identifier, "epubcfi(/6/4!/4/10/3:10)"),
+            bookmark(other_identifier, "epubcfi(/6/4!/4/10/3:10)"),
+            bookmark(annotation_fixture.identifier, "epubcfi(/6/8!/4/2/1:0)"),
+        ]
+
+        with annotation_fixture.request_context_with_library(
+            "/",
+            headers=dict(Authorization=annotation_fixture.valid_auth),
+            method="POST",
+            data=json.dumps(data),
+        ):
+            patron = (
+                annotation_fixture.manager.annotations.authenticated_patron_from_request()
+            )
+            assert isinstance(patron, Patron)
+            annotation_fixture.pool.loan_to(patron)
+
+            response = annotation_fixture.manager.annotations.container()
+            assert 200 == response.status_code
+            assert "application/json" == response.headers["Content-Type"]
+
+            # The bookmarks in the book on loan were created, and the one in the
+            # other book wasn't, but the response has an entry for each of them.
+            annotations = (
+                annotation_fixture.db.session.query(Annotation)
+                .filter(Annotation.patron == patron)
+                .order_by(Annotation.id)
+                .all()
+            )
+            assert 2 == len(annotations)
+            first, error, second = json.loads(response.get_data(as_text=True))
+            assert str(annotations[0].id) in first["id"]
+            assert str(annotations[1].id) in second["id"]
+            assert INVALID_ANNOTATION_TARGET.uri == error["type"]
+            assert 400 == error["status"]
+
+        # A batch that can't be parsed at all is rejected outright.
+        with annotation_fixture.request_context_with_library(
+            "/",
+            headers=dict(Authorization=annotation_fixture.valid_auth),
+            method="POST",
+            data="[not json",
+        ):
+            annotation_fixture.manager.annotations.authenticated_patron_from_request()
+            response = annotation_fixture.manager.annotations.container()
+            assert INVALID_ANNOTATION_FORMAT == response
+
     def test_detail(self, annotation_fixture: AnnotationFixture):
         annotation_fixture.pool.loan_to(annotation_fixture.default_patron)
 
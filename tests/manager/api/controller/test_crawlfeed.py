@@ -1,12 +1,15 @@
 import json
 from contextlib import contextmanager
 from typing import Any
-from unittest.mock import MagicMock, create_autospec
+from unittest.mock import MagicMock, create_autospec, patch
 
 import feedparser
+import redis
 from flask import url_for
 from opensearchpy.helpers.response.hit import Hit
 
+from palace.util.datetime_helpers import utc_now
+
 from palace.manager.api.problem_details import (
     NO_SUCH_COLLECTION,
     NO_SUCH_LANE,
@@ -22,9 +25,12 @@ from palace.manager.feed.worklist.crawlable import (
 )
 from palace.manager.feed.worklist.dynamic import DynamicLane
 from palace.manager.search.pagination import SortKeyPagination
+from palace.manager.service.redis.models.crawlable_feed import CrawlableFeedSnapshot
 from palace.manager.util.flask_util import Response
 from palace.manager.util.problem_detail import ProblemDetail
 from tests.fixtures.api_controller import CirculationControllerFixture
+from tests.fixtures.redis import RedisFixture
+from tests.fixtures.s3 import S3ServiceFixture
 
 
 class TestCrawlableFeed:
@@ -336,3 +342,72 @@ class TestCrawlableFeed:
             if l["rel"] == "http://opds-spec.org/facet"
         }
         assert facet_groups == {"Collection Name", "Distributor"}
+
+    def test__crawlable_feed_snapshot(
+        self,
+        circulation_fixture: CirculationControllerFixture,
+        redis_fixture: RedisFixture,
+        s3_service_fixture: S3ServiceFixture,
+    ):
+        controller = circulation_fixture.manager.opds_feeds
+        library = circulation_fixture.db.default_library()
+        storage = s3_service_fixture.mock_service()
+        circulation_fixture.services_fixture.services.storage.public.override(storage)
+
+        lane = CrawlableCollectionBasedLane()
+        lane.initialize(library)
+        snapshot = CrawlableFeedSnapshot(redis_fixture.client, f"library-{library.id}")
+        opds1_url = storage.generate_url(f"crawlable/library-{library.id}/0.opds1.xml")
+        opds2_url = storage.generate_url(f"crawlable/library-{library.id}/0.opds2.json")
+
+        # No snapshot has been published, so the feed is served live.
+        with circulation_fixture.request_context_with_library("/"):
+            assert controller._crawlable_snapshot_url(lane) is None
+
+        snapshot.publish({0: "a"}, utc_now())
+
+        # Once it has, the client is sent to the snapshot, in the format it asked for.
+        with circulation_fixture.request_context_with_library("/"):
+            assert controller._crawlable_snapshot_url(lane) == opds1_url
+            response = controller._crawlable_feed(
+                title="Lane title", url="Lane URL", worklist=lane
+            )
+            assert response.status_code == 302
+            assert response.headers["Location"] == opds1_url
+        with circulation_fixture.request_context_with_library(
+            "/", headers={"Accept": "application/opds+json"}
+        ):
+            assert controller._crawlable_snapshot_url(lane) == opds2_url
+
+        # Snapshots aren't written in every format.
+        with circulation_fixture.request_context_with_library(
+            "/",
+            headers={"Accept": "application/atom+xml;api-version=2"},
+        ):
+            assert controller._crawlable_snapshot_url(lane) is None
+
+        # Only the first page, without any facets, is sent to the snapshot.
+        with circulation_fixture.request_context_with_library("/?size=10"):
+            assert controller._crawlable_snapshot_url(lane) is None
+
+        # A lane that isn't snapshotted is served live.
+        dynamic_lane = DynamicLane()
+        dynamic_lane.initialize(library)
+        with circulation_fixture.request_context_with_library("/"):
+            assert controller._crawlable_snapshot_url(dynamic_lane) is None
+
+        # If Redis is unavailable, the feed is served live.
+        with (
+            circulation_fixture.request_context_with_library("/"),
+            patch.object(
+                CrawlableFeedSnapshot,
+                "published",
+                side_effect=redis.exceptions.ConnectionError(),
+            ),
+        ):
+            assert controller._crawlable_snapshot_url(lane) is None
+
+        # As it is if there is no public storage to serve the snapshot from.
+        circulation_fixture.services_fixture.services.storage.public.override(None)
+        with circulation_fixture.request_context_with_library("/"):
+            assert controller._crawlable_snapshot_url(lane) is None
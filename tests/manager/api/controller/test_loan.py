@@ -79,6 +79,7 @@ from tests.fixtures.database import DatabaseTransactionFixture
 from tests.fixtures.http import MockHttpClientFixture
 from tests.fixtures.library import LibraryFixture
 from tests.fixtures.opds import OPDSSerializationTestHelper
+from tests.fixtures.query_budget import QueryBudgetFixture
 from tests.fixtures.redis import RedisFixture
 from tests.fixtures.services import ServicesFixture
 from tests.mocks.circulation import MockPatronActivityCirculationAPI
@@ -1808,6 +1809,51 @@ class TestLoanController:
             retry=False,
         )
 
+    def test_active_loans_query_budget(
+        self,
+        db: DatabaseTransactionFixture,
+        loan_fixture: LoanFixture,
+        query_budget: QueryBudgetFixture,
+    ):
+        # The loans feed runs the same number of queries however many loans the
+        # patron has, so the feed doesn't slow down as a patron borrows more books.
+        with loan_fixture.request_context_with_library(
+            "/", headers=dict(Authorization=loan_fixture.valid_auth)
+        ):
+            patron = loan_fixture.manager.loans.authenticated_patron_from_request()
+        assert isinstance(patron, Patron)
+
+        def borrow(count: int) -> None:
+            now = utc_now()
+            for _ in range(count):
+                work = db.work(with_license_pool=True)
+                [pool] = work.license_pools
+                pool.loan_to(patron, now, now + datetime.timedelta(days=14))
+            db.session.flush()
+
+        def loans_feed_queries(loans: int) -> int:
+            # Load everything from the database, the way a new request would.
+            db.session.expire_all()
+            with loan_fixture.request_context_with_library(
+                "/", headers=dict(Authorization=loan_fixture.valid_auth)
+            ):
+                with (
+                    patch("palace.manager.api.controller.loan.sync_patron_activity"),
+                    query_budget(100) as stats,
+                ):
+                    loan_fixture.manager.loans.authenticated_patron_from_request()
+                    response = loan_fixture.manager.loans.sync()
+            assert len(feedparser.parse(response.data)["entries"]) == loans
+            return stats.count
+
+        # The first feed loads whatever is cached for the rest of the requests.
+        borrow(5)
+        loans_feed_queries(5)
+
+        queries = loans_feed_queries(5)
+        borrow(5)
+        assert loans_feed_queries(10) == queries
+
     @pytest.mark.parametrize(
         "refresh,expected_sync_call_count",
         [
@@ -50,6 +50,8 @@ from palace.manager.util.problem_detail import ProblemDetail
 from tests.fixtures.api_controller import CirculationControllerFixture
 from tests.fixtures.database import DatabaseTransactionFixture
 from tests.fixtures.opds import OPDSSerializationTestHelper
+from tests.fixtures.query_budget import QueryBudgetFixture
+from tests.fixtures.redis import RedisFixture
 from tests.fixtures.services import ServicesFixture
 
 
@@ -302,6 +304,21 @@ class TestWorkController:
         assert expect.data == response.get_data()
         assert OPDSFeed.ENTRY_TYPE == response.headers["Content-Type"]
 
+    def test_permalink_query_budget(
+        self, work_fixture: WorkFixture, query_budget: QueryBudgetFixture
+    ):
+        # Looking up a book's entry runs a bounded number of queries, so a change
+        # that makes the entry much more expensive to build shows up here.
+        work_fixture.db.session.flush()
+        with work_fixture.request_context_with_library("/"):
+            assert work_fixture.identifier.type is not None
+            assert work_fixture.identifier.identifier is not None
+            with query_budget(50):
+                response = work_fixture.manager.work_controller.permalink(
+                    work_fixture.identifier.type, work_fixture.identifier.identifier
+                )
+        assert 200 == response.status_code
+
     def test_permalink_work_with_no_presentation_edition(
         self, work_fixture: WorkFixture
     ):
@@ -528,7 +545,9 @@ class TestWorkController:
         assert expect == response.get_data()
         assert OPDSFeed.ENTRY_TYPE == response.headers["Content-Type"]
 
-    def test_recommendations(self, work_fixture: WorkFixture):
+    def test_recommendations(
+        self, work_fixture: WorkFixture, redis_fixture: RedisFixture
+    ):
         # Test the ability to get a feed of works recommended by an
         # external service.
         [self.lp] = work_fixture.english_1.license_pools
@@ -663,6 +682,7 @@ class TestWorkController:
     def test_recommendations_content_negotiation(
         self,
         work_fixture: WorkFixture,
+        redis_fixture: RedisFixture,
         accept_header: str | None,
         expected_content_type: str,
     ):
@@ -691,7 +711,9 @@ class TestWorkController:
         assert response.status_code == 200
         assert response.content_type == expected_content_type
 
-    def test_related_books(self, work_fixture: WorkFixture):
+    def test_related_books(
+        self, work_fixture: WorkFixture, redis_fixture: RedisFixture
+    ):
         # Test the related_books controller.
 
         # Remove the contributor from the work created during setup.
@@ -2,6 +2,8 @@ import datetime
 
 from freezegun import freeze_time
 
+from palace.util.datetime_helpers import utc_now
+
 from palace.manager.api.model.token import OAuthTokenResponse
 from tests.fixtures.files import BoundlessFilesFixture
 
@@ -35,3 +37,21 @@ class TestOAuthTokenResponse:
 
             frozen_time.tick(delta=datetime.timedelta(seconds=400))
             assert token.expired
+
+    def test_from_expiry(self) -> None:
+        with freeze_time() as frozen_time:
+            expires = utc_now() + datetime.timedelta(seconds=100)
+            token = OAuthTokenResponse.from_expiry("token", expires)
+            assert token.access_token == "token"
+            assert token.token_type == "Bearer"
+            # The token expires exactly when it was said to, rather than a little
+            # before its expires_in runs out, like a token that was just granted.
+            assert token.expires == expires
+            assert not token.expired
+
+            frozen_time.tick(delta=datetime.timedelta(seconds=100))
+            assert token.expired
+
+            # A token that's already expired can be recreated too.
+            token = OAuthTokenResponse.from_expiry("token", expires)
+            assert token.expired
@@ -1,13 +1,24 @@
 import datetime
 import json
+from collections.abc import Callable
 from typing import Any
+from unittest.mock import MagicMock
 
 import pytest
 from pyld import jsonld
+from sqlalchemy import event
+from sqlalchemy.orm import Session
 
 from palace.util.datetime_helpers import utc_now
 
-from palace.manager.api.annotations import AnnotationParser, AnnotationWriter
+from palace.manager.api import annotations
+from palace.manager.api.annotations import (
+    AnnotationParser,
+    AnnotationWriter,
+    ContextCompactor,
+    UnsupportedCompactionError,
+    load_document,
+)
 from palace.manager.api.problem_details import (
     INVALID_ANNOTATION_FORMAT,
     INVALID_ANNOTATION_MOTIVATION,
@@ -15,6 +26,7 @@ from palace.manager.api.problem_details import (
 )
 from palace.manager.sqlalchemy.model.patron import Annotation
 from palace.manager.sqlalchemy.util import create
+from palace.manager.util.problem_detail import ProblemDetail
 from tests.fixtures.api_controller import ControllerFixture
 
 
@@ -376,6 +388,225 @@ class TestAnnotationWriter:
             assert compacted_body == detail["body"]
 
 
+OA = "http://www.w3.org/ns/oa#"
+LS = "http://librarysimplified.org/terms/"
+RDF = "http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+XSD = "http://www.w3.org/2001/XMLSchema#"
+DCTERMS = "http://purl.org/dc/terms/"
+
+# Expanded targets and bodies the way they are stored, and documents that use the
+# rest of what the direct compaction supports.
+SUPPORTED_DOCUMENTS = [
+    pytest.param(
+        {
+            OA + "hasSource": [{"@id": "urn:isbn:9781449358068"}],
+            OA
+            + "hasSelector": [
+                {
+                    "@type": [OA + "FragmentSelector"],
+                    RDF + "value": [{"@value": "epubcfi(/6/4[chap01ref]!/4/10/3:10)"}],
+                }
+            ],
+        },
+        id="target",
+    ),
+    pytest.param(
+        {
+            OA + "hasSource": {"@id": "urn:isbn:9781449358068"},
+            OA
+            + "hasSelector": {
+                "@type": OA + "FragmentSelector",
+                RDF + "value": "epubcfi(/6/4[chap01ref]!/4/10/3:10)",
+            },
+        },
+        id="target-without-lists",
+    ),
+    pytest.param(
+        {
+            "@type": OA + "TextualBody",
+            OA + "bodyValue": "A good description",
+            OA + "hasPurpose": {"@id": OA + "describing"},
+        },
+        id="textual-body",
+    ),
+    pytest.param(
+        {
+            LS + "time": [{"@value": "2021-03-23T19:23:38.000Z"}],
+            LS + "device": [{"@value": "urn:uuid:c83db5b1-9130-4b86-93ea"}],
+            LS + "chapter": [{"@value": 3}],
+            LS + "progress": [{"@value": 0.25}],
+            LS + "bookmark": [{"@value": True}],
+        },
+        id="bookmark-body",
+    ),
+    pytest.param(
+        {
+            OA
+            + "hasSelector": [
+                {
+                    "@type": [OA + "RangeSelector"],
+                    OA
+                    + "hasStartSelector": [
+                        {
+                            "@type": [OA + "XPathSelector"],
+                            RDF + "value": [{"@value": "/p[1]"}],
+                            OA
+                            + "refinedBy": [
+                                {
+                                    "@type": [OA + "TextPositionSelector"],
+                                    OA
+                                    + "start": [
+                                        {
+                                            "@value": 10,
+                                            "@type": XSD + "nonNegativeInteger",
+                                        }
+                                    ],
+                                    OA + "end": [{"@value": 20}],
+                                }
+                            ],
+                        }
+                    ],
+                    OA
+                    + "hasEndSelector": [
+                        {
+                            "@id": "urn:selector:1",
+                            "@type": [OA + "TextQuoteSelector"],
+                            OA + "exact": [{"@value": "exact"}],
+                            OA + "prefix": [{"@value": "before "}],
+                            OA + "suffix": [{"@value": " after"}],
+                        }
+                    ],
+                }
+            ],
+        },
+        id="nested-selectors",
+    ),
+    pytest.param(
+        {
+            DCTERMS
+            + "created": [
+                {"@value": "2021-01-01T00:00:00Z", "@type": XSD + "dateTime"}
+            ],
+            DCTERMS + "modified": [{"@value": "2021-01-02T00:00:00Z"}],
+            DCTERMS
+            + "rights": [{"@id": "http://creativecommons.org/licenses/by/4.0/"}],
+        },
+        id="typed-and-untyped-values",
+    ),
+    pytest.param(
+        {
+            "@id": OA + "annotation",
+            "@type": [OA + "SpecificResource", "http://schema.org/Thing", "urn:x:y"],
+            OA + "hasSource": [{"@id": "urn:isbn:1"}, {"@value": "urn:isbn:2"}],
+            OA + "hasPurpose": [{"@id": OA + "tagging"}, {"@id": OA + "unknown"}],
+            OA + "via": [{"@id": OA + "FragmentSelector"}],
+            LS + "reference": [{"@id": "urn:x"}],
+            LS + "nested": [{LS + "value": [{"@value": "b"}]}],
+        },
+        id="multiple-values-and-iris",
+    ),
+]
+
+# Documents that are left to pyld.
+UNSUPPORTED_DOCUMENTS = [
+    pytest.param(
+        {"http://www.w3.org/ns/activitystreams#items": [{"@list": [{"@id": "urn:a"}]}]},
+        id="list-container",
+    ),
+    pytest.param(
+        {RDF + "value": [{"@value": "hola", "@language": "es"}]},
+        id="language",
+    ),
+    pytest.param(
+        {RDF + "value": [{"@value": "10", "@type": XSD + "int"}]},
+        id="typed-value-without-term",
+    ),
+    pytest.param({LS + "empty": [{}]}, id="empty-node"),
+]
+
+
+class TestContextCompactor:
+    @staticmethod
+    def pyld_compact(document: dict[str, Any]) -> dict[str, Any]:
+        compacted = jsonld.compact(document, AnnotationWriter.JSONLD_CONTEXT)
+        del compacted["@context"]
+        return compacted
+
+    @pytest.mark.parametrize("document", SUPPORTED_DOCUMENTS)
+    def test_compact(self, document: dict[str, Any]):
+        compacted = AnnotationWriter._compactor().compact(document)
+
+        # The same document pyld gives, with its keys in the same order.
+        assert json.dumps(compacted) == json.dumps(self.pyld_compact(document))
+        assert AnnotationWriter.compact(document) == compacted
+
+    @pytest.mark.parametrize("document", UNSUPPORTED_DOCUMENTS)
+    def test_compact_unsupported(self, document: dict[str, Any]):
+        with pytest.raises(UnsupportedCompactionError):
+            AnnotationWriter._compactor().compact(document)
+
+        # AnnotationWriter falls back to pyld.
+        assert AnnotationWriter.compact(document) == self.pyld_compact(document)
+
+    def test_compact_not_expanded(self):
+        compactor = AnnotationWriter._compactor()
+        with pytest.raises(UnsupportedCompactionError):
+            compactor.compact({"@context": {}, "source": "urn:isbn:1"})
+        with pytest.raises(UnsupportedCompactionError):
+            compactor.compact([{OA + "hasSource": [{"@id": "urn:isbn:1"}]}])
+
+    def test_context_with_keywords(self):
+        # The compactor is only built for contexts without keywords of their own.
+        with pytest.raises(ValueError):
+            ContextCompactor({"@vocab": "http://example.com/"})
+
+
+class TestLoadDocument:
+    def test_local_document(self, monkeypatch: pytest.MonkeyPatch):
+        load_json = MagicMock(side_effect=json.load)
+        monkeypatch.setattr(json, "load", load_json)
+        annotations._local_document.cache_clear()
+
+        first = load_document(AnnotationWriter.JSONLD_CONTEXT)
+        second = load_document(AnnotationWriter.JSONLD_CONTEXT)
+        load_document(AnnotationWriter.LDP_CONTEXT)
+
+        # Each file is only read once, and pyld gets it already parsed.
+        assert load_json.call_count == 2
+        assert "@context" in first["document"]
+        assert first["documentUrl"] == AnnotationWriter.JSONLD_CONTEXT
+        # The documents are tagged so pyld caches the contexts it resolves.
+        assert first["tag"] == "static"
+
+        # Each caller gets its own copy, so nothing pyld does to one changes
+        # the others.
+        assert first["document"] == second["document"]
+        assert first["document"] is not second["document"]
+        first["document"]["@context"].clear()
+        assert (
+            load_document(AnnotationWriter.JSONLD_CONTEXT)["document"]
+            == second["document"]
+        )
+
+    def test_context_loaded_once(self, monkeypatch: pytest.MonkeyPatch):
+        # Once pyld has resolved the annotation context, it doesn't load it
+        # again for the documents it expands or compacts.
+        loader = MagicMock(side_effect=load_document)
+        monkeypatch.setattr(jsonld, "_default_document_loader", loader)
+        monkeypatch.setattr(jsonld, "_resolved_context_cache", {})
+
+        document = {
+            "@context": AnnotationWriter.JSONLD_CONTEXT,
+            "type": "Annotation",
+            "motivation": "bookmarking",
+            "target": {"source": "urn:isbn:9781449358068"},
+        }
+        for _ in range(3):
+            expanded = jsonld.expand(document)
+            jsonld.compact(expanded, AnnotationWriter.JSONLD_CONTEXT)
+        loader.assert_called_once()
+
+
 class AnnotationParserFixture(AnnotationFixture):
     def __init__(self, controller_fixture: ControllerFixture):
         super().__init__(controller_fixture)
@@ -758,3 +989,174 @@ class TestAnnotationParser:
 
         # We no longer respect the patron settings for sync
         assert isinstance(annotation, Annotation)
+
+    @staticmethod
+    def _count_queries(session: Session, func: Callable[[], Any]) -> int:
+        statements = []
+
+        def count(*args: Any) -> None:
+            statements.append(args[2])
+
+        connection = session.connection()
+        event.listen(connection, "before_cursor_execute", count)
+        try:
+            func()
+        finally:
+            event.remove(connection, "before_cursor_execute", count)
+        return len(statements)
+
+    def test_parse_query_count(
+        self, annotation_parser_fixture: AnnotationParserFixture
+    ):
+        # Whether the annotation is in a book on loan is checked with a query,
+        # rather than by loading every one of the patron's loans, so the cost of
+        # parsing an annotation doesn't depend on how many loans the patron has.
+        db = annotation_parser_fixture.db
+        patron = annotation_parser_fixture.patron_value
+        annotation_parser_fixture.pool.loan_to(patron)
+        data_json = json.dumps(self._sample_jsonld(annotation_parser_fixture))
+
+        def queries_to_parse() -> int:
+            db.session.flush()
+            db.session.expire_all()
+            return self._count_queries(
+                db.session,
+                lambda: AnnotationParser.parse(db.session, data_json, patron),
+            )
+
+        one_loan = queries_to_parse()
+        for _ in range(10):
+            db.licensepool(None).loan_to(patron)
+        assert queries_to_parse() == one_loan
+
+    def test_parse_batch(self, annotation_parser_fixture: AnnotationParserFixture):
+        db = annotation_parser_fixture.db
+        patron = annotation_parser_fixture.patron_value
+        annotation_parser_fixture.pool.loan_to(patron)
+
+        idling = self._sample_jsonld(annotation_parser_fixture)
+        bookmark = self._sample_jsonld(
+            annotation_parser_fixture, motivation=Annotation.BOOKMARKING
+        )
+        other_bookmark = self._sample_jsonld(
+            annotation_parser_fixture, motivation=Annotation.BOOKMARKING
+        )
+        other_bookmark["target"]["selector"]["value"] = "epubcfi(/6/8!/4/2/1:0)"
+        not_on_loan = self._sample_jsonld(annotation_parser_fixture)
+        not_on_loan["target"]["source"] = db.identifier().urn
+        invalid_motivation = self._sample_jsonld(annotation_parser_fixture)
+        invalid_motivation["motivation"] = "not-a-valid-motivation"
+
+        # An existing bookmark is updated rather than duplicated.
+        existing, ignore = create(
+            db.session,
+            Annotation,
+            patron=patron,
+            identifier=annotation_parser_fixture.identifier,
+            motivation=Annotation.BOOKMARKING,
+            target=json.dumps(jsonld.expand(bookmark)[0][OA + "hasTarget"][0]),
+            active=False,
+        )
+
+        results = AnnotationParser.parse_batch(
+            db.session,
+            json.dumps(
+                [
+                    idling,
+                    bookmark,
+                    not_on_loan,
+                    other_bookmark,
+                    invalid_motivation,
+                    "not an annotation",
+                    bookmark,
+                ]
+            ),
+            patron,
+        )
+        assert isinstance(results, list)
+        (
+            idling_result,
+            bookmark_result,
+            not_on_loan_result,
+            other_bookmark_result,
+            invalid_motivation_result,
+            not_an_annotation_result,
+            repeated_bookmark_result,
+        ) = results
+
+        assert isinstance(idling_result, Annotation)
+        assert Annotation.IDLING == idling_result.motivation
+        assert bookmark_result == existing
+        assert True == existing.active
+        assert isinstance(other_bookmark_result, Annotation)
+        assert other_bookmark_result.id is not None
+        assert other_bookmark_result not in (existing, idling_result)
+        assert repeated_bookmark_result == existing
+
+        assert INVALID_ANNOTATION_TARGET == not_on_loan_result
+        assert INVALID_ANNOTATION_MOTIVATION == invalid_motivation_result
+        assert INVALID_ANNOTATION_FORMAT == not_an_annotation_result
+
+        assert 3 == db.session.query(Annotation).filter_by(patron=patron).count()
+
+    def test_parse_batch_invalid(
+        self, annotation_parser_fixture: AnnotationParserFixture
+    ):
+        db = annotation_parser_fixture.db
+        patron = annotation_parser_fixture.patron_value
+
+        assert INVALID_ANNOTATION_FORMAT == AnnotationParser.parse_batch(
+            db.session, "[not json", patron
+        )
+        assert INVALID_ANNOTATION_FORMAT == AnnotationParser.parse_batch(
+            db.session,
+            json.dumps(self._sample_jsonld(annotation_parser_fixture)),
+            patron,
+        )
+        assert [] == AnnotationParser.parse_batch(db.session, "[]", patron)
+
+        too_many = [self._sample_jsonld(annotation_parser_fixture)] * (
+            AnnotationParser.MAX_BATCH_SIZE + 1
+        )
+        result = AnnotationParser.parse_batch(db.session, json.dumps(too_many), patron)
+        assert isinstance(result, ProblemDetail)
+        assert INVALID_ANNOTATION_FORMAT.uri == result.uri
+
+    def test_parse_batch_query_count(
+        self, annotation_parser_fixture: AnnotationParserFixture
+    ):
+        # The annotations in a batch are looked up and saved together, so the
+        # number of queries doesn't depend on how many there are, or how many
+        # books they're in.
+        db = annotation_parser_fixture.db
+        patron = annotation_parser_fixture.patron_value
+
+        def queries_to_parse(book_count: int) -> int:
+            documents = []
+            for book in range(book_count):
+                pool = db.licensepool(None)
+                pool.loan_to(patron)
+                for location in range(5):
+                    document = self._sample_jsonld(
+                        annotation_parser_fixture, motivation=Annotation.BOOKMARKING
+                    )
+                    document["target"]["source"] = pool.identifier.urn
+                    document["target"]["selector"]["value"] = f"epubcfi(/6/{location})"
+                    documents.append(document)
+            data = json.dumps(documents)
+            db.session.flush()
+            db.session.expire_all()
+
+            results: list[Annotation | ProblemDetail] = []
+
+            def parse() -> None:
+                parsed = AnnotationParser.parse_batch(db.session, data, patron)
+                assert isinstance(parsed, list)
+                results.extend(parsed)
+
+            count = self._count_queries(db.session, parse)
+            assert all(isinstance(result, Annotation) for result in results)
+            assert len(results) == book_count * 5
+            return count
+
+        assert queries_to_parse(1) == queries_to_parse(10)
@@ -222,3 +222,43 @@ class TestLocalAnalyticsExporter:
         rows = [row for row in reader][1::]  # skip header row
 
         assert 0 == len(rows)
+
+    def test_export_stream(self, db: DatabaseTransactionFixture):
+        exporter = LocalAnalyticsExporter()
+        work = db.work(title='A "quoted", comma title', with_open_access_download=True)
+        [pool] = work.license_pools
+        library = db.default_library()
+        start = datetime.now() - timedelta(minutes=10)
+        for minute in range(5):
+            get_one_or_create(
+                db.session,
+                CirculationEvent,
+                license_pool=pool,
+                type=CirculationEvent.DISTRIBUTOR_CHECKOUT,
+                start=start + timedelta(minutes=minute),
+                library=library,
+            )
+        yesterday = date.today() - timedelta(days=1)
+        tomorrow = date.today() + timedelta(days=1)
+
+        # The streamed export is the same as the one built in memory, however it's
+        # split up.
+        expected = exporter.export(db.session, yesterday, tomorrow)
+        chunks = list(
+            exporter.export_stream(db.session, yesterday, tomorrow, rows_per_chunk=2)
+        )
+        assert "".join(chunks) == expected
+        # The header goes out with the first chunk of rows.
+        assert len(chunks) == 3
+        assert len(chunks[0].splitlines()) == 3
+
+        chunks = list(exporter.export_stream(db.session, yesterday, tomorrow, library))
+        assert "".join(chunks) == exporter.export(
+            db.session, yesterday, tomorrow, library
+        )
+        assert len(chunks) == 1
+
+        # If there are no events, just the header is exported.
+        chunks = list(exporter.export_stream(db.session, yesterday, yesterday))
+        assert chunks == [exporter.export(db.session, yesterday, yesterday)]
+        assert chunks == [",".join(LocalAnalyticsExporter.HEADER) + "\r\n"]
@@ -0,0 +1,71 @@
+import logging
+
+import pytest
+from flask import Flask
+from sqlalchemy import create_engine, text
+
+from palace.manager.api.util.profilers import PalaceSQLInstrumentation
+from palace.manager.sqlalchemy.query_instrumentation import (
+    ENVIRONMENT_VARIABLE,
+    fingerprint,
+)
+
+
+class TestPalaceSQLInstrumentation:
+    @pytest.fixture
+    def app(self) -> Flask:
+        app = Flask(__name__)
+        engine = create_engine("sqlite://")
+
+        @app.route("/")
+        def index() -> str:
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+                connection.execute(text("SELECT 2"))
+            return "ok"
+
+        return app
+
+    def test_not_enabled(self, app: Flask, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv(ENVIRONMENT_VARIABLE, raising=False)
+        PalaceSQLInstrumentation.configure(app)
+        app.debug = True
+        response = app.test_client().get("/")
+        assert PalaceSQLInstrumentation.COUNT_HEADER not in response.headers
+
+    @pytest.mark.parametrize("debug", [True, False])
+    def test_enabled(
+        self,
+        app: Flask,
+        monkeypatch: pytest.MonkeyPatch,
+        caplog: pytest.LogCaptureFixture,
+        debug: bool,
+    ) -> None:
+        caplog.set_level(logging.INFO)
+        monkeypatch.setenv(ENVIRONMENT_VARIABLE, "1")
+        PalaceSQLInstrumentation.configure(app)
+        app.debug = debug
+        response = app.test_client().get("/")
+        assert response.status_code == 200
+
+        # The stats are always logged.
+        [record] = [r for r in caplog.records if hasattr(r, "palace_sql")]
+        assert record.getMessage().startswith("GET / ran 2 queries in ")
+        assert record.palace_sql["count"] == 2
+        assert [slow["statement"] for slow in record.palace_sql["slowest"]] == [
+            fingerprint("SELECT ?")
+        ] * 2
+
+        # But only sent back in debug mode.
+        if debug:
+            assert response.headers[PalaceSQLInstrumentation.COUNT_HEADER] == "2"
+            assert response.headers[PalaceSQLInstrumentation.DURATION_HEADER].endswith(
+                "ms"
+            )
+            assert (
+                response.headers[PalaceSQLInstrumentation.SLOWEST_HEADER]
+                == fingerprint("SELECT ?").split(" ")[0]
+            )
+        else:
+            assert PalaceSQLInstrumentation.COUNT_HEADER not in response.headers
+            assert PalaceSQLInstrumentation.DURATION_HEADER not in response.headers
@@ -0,0 +1,195 @@
+from unittest.mock import patch
+
+import pytest
+
+from palace.util.log import LogLevel
+
+from palace.manager.api.authenticator import LibraryAuthenticator
+from palace.manager.celery.tasks.crawlable_feeds import (
+    crawlable_annotator,
+    crawlable_feed_snapshot,
+    crawlable_feed_snapshots,
+    crawlable_lane,
+)
+from palace.manager.feed.annotator.circulation import (
+    CirculationManagerAnnotator,
+    LibraryAnnotator,
+)
+from palace.manager.feed.facets.crawlable import CrawlableFacets
+from palace.manager.feed.worklist.crawlable import (
+    CrawlableCollectionBasedLane,
+    CrawlableCustomListBasedLane,
+)
+from palace.manager.service.integration_registry.license_providers import (
+    LicenseProvidersRegistry,
+)
+from tests.fixtures.celery import CeleryFixture
+from tests.fixtures.database import DatabaseTransactionFixture
+from tests.fixtures.redis import RedisFixture
+from tests.fixtures.services import ServicesFixture
+
+
+class TestCrawlableFeedSnapshots:
+    def test_crawlable_feed_snapshots(
+        self,
+        db: DatabaseTransactionFixture,
+        celery_fixture: CeleryFixture,
+    ) -> None:
+        library = db.default_library()
+        collection = db.default_collection()
+        deleted = db.collection()
+        deleted.marked_for_deletion = True
+        customlist, _ = db.customlist(num_entries=0)
+        customlist.library = library
+        orphan, _ = db.customlist(num_entries=0)
+
+        with patch(
+            "palace.manager.celery.tasks.crawlable_feeds.crawlable_feed_snapshot"
+        ) as snapshot:
+            crawlable_feed_snapshots.delay().wait()
+
+        # A snapshot is queued for every feed that can be crawled, and nothing else.
+        queued = [call.kwargs for call in snapshot.delay.call_args_list]
+        assert {"library_id": library.id} in queued
+        assert {"collection_id": collection.id} in queued
+        assert {"collection_id": deleted.id} not in queued
+        assert {"customlist_id": customlist.id} in queued
+        assert {"customlist_id": orphan.id} not in queued
+
+    def test_crawlable_feed_snapshots_no_storage(
+        self,
+        db: DatabaseTransactionFixture,
+        celery_fixture: CeleryFixture,
+        services_fixture: ServicesFixture,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        caplog.set_level(LogLevel.info)
+        services_fixture.services.storage.public.override(None)
+        with patch(
+            "palace.manager.celery.tasks.crawlable_feeds.crawlable_feed_snapshot"
+        ) as snapshot:
+            crawlable_feed_snapshots.delay().wait()
+
+        snapshot.delay.assert_not_called()
+        assert "No public storage configured" in caplog.text
+
+
+class TestCrawlableLane:
+    def test_crawlable_lane(self, db: DatabaseTransactionFixture) -> None:
+        library = db.default_library()
+        collection = db.default_collection()
+        customlist, _ = db.customlist(num_entries=0)
+        customlist.library = library
+
+        result = crawlable_lane(db.session, library_id=library.id)
+        assert result is not None
+        lane, title = result
+        assert isinstance(lane, CrawlableCollectionBasedLane)
+        assert lane.library_id == library.id
+        assert lane.snapshot_key == f"library-{library.id}"
+        assert title == library.name
+
+        result = crawlable_lane(db.session, collection_id=collection.id)
+        assert result is not None
+        lane, title = result
+        assert isinstance(lane, CrawlableCollectionBasedLane)
+        assert lane.collection_ids == [collection.id]
+        assert lane.snapshot_key == f"collection-{collection.id}"
+        assert title == collection.name
+
+        result = crawlable_lane(db.session, customlist_id=customlist.id)
+        assert result is not None
+        lane, title = result
+        assert isinstance(lane, CrawlableCustomListBasedLane)
+        assert lane.snapshot_key == f"list-{customlist.id}"
+        assert title == customlist.name
+
+    def test_crawlable_lane_missing(self, db: DatabaseTransactionFixture) -> None:
+        assert crawlable_lane(db.session, library_id=-1) is None
+        assert crawlable_lane(db.session, collection_id=-1) is None
+        assert crawlable_lane(db.session, customlist_id=-1) is None
+
+        orphan, _ = db.customlist(num_entries=0)
+        assert crawlable_lane(db.session, customlist_id=orphan.id) is None
+
+        with pytest.raises(ValueError, match="One of library_id"):
+            crawlable_lane(db.session)
+
+
+class TestCrawlableAnnotator:
+    def test_crawlable_annotator(self, db: DatabaseTransactionFixture) -> None:
+        library = db.default_library()
+        collection = db.default_collection()
+        registry = LicenseProvidersRegistry()
+
+        lane = CrawlableCollectionBasedLane()
+        lane.initialize(library)
+        facets = CrawlableFacets.default(library)
+        annotator = crawlable_annotator(db.session, lane, facets, registry)
+
+        # A library's feed is annotated for that library, with the circulation APIs
+        # of its own collections.
+        assert isinstance(annotator, LibraryAnnotator)
+        assert annotator.lane == lane
+        assert annotator.library == library
+        assert annotator.facets == facets
+        assert annotator.circulation is not None
+        assert set(annotator.circulation.api_for_collection) == {collection.id}
+        authenticator = LibraryAuthenticator.from_config(db.session, library)
+        assert annotator.identifies_patrons == authenticator.identifies_individuals
+        assert (
+            annotator.allows_anonymous_access == authenticator.allows_anonymous_access
+        )
+
+        # A collection's feed doesn't belong to any one library.
+        lane = CrawlableCollectionBasedLane()
+        lane.initialize([collection])
+        annotator = crawlable_annotator(
+            db.session, lane, CrawlableFacets.default(None), registry
+        )
+        assert type(annotator) is CirculationManagerAnnotator
+
+
+class TestCrawlableFeedSnapshot:
+    def test_crawlable_feed_snapshot(
+        self,
+        db: DatabaseTransactionFixture,
+        celery_fixture: CeleryFixture,
+        redis_fixture: RedisFixture,
+    ) -> None:
+        library = db.default_library()
+
+        with patch(
+            "palace.manager.celery.tasks.crawlable_feeds.CrawlableFeedSnapshotter"
+        ) as snapshotter:
+            crawlable_feed_snapshot.delay(library_id=library.id).wait()
+
+        snapshotter.return_value.run.assert_called_once_with()
+        args = snapshotter.call_args.args
+        session, lane, feed_key, title, facets, annotator = args[:6]
+        assert isinstance(lane, CrawlableCollectionBasedLane)
+        assert lane.library_id == library.id
+        assert feed_key == f"library-{library.id}"
+        assert title == library.name
+
+        # The feed is annotated just like the live crawlable feed is.
+        assert isinstance(facets, CrawlableFacets)
+        assert isinstance(annotator, LibraryAnnotator)
+        assert annotator.lane == lane
+        assert annotator.facets == facets
+
+    def test_crawlable_feed_snapshot_missing(
+        self,
+        db: DatabaseTransactionFixture,
+        celery_fixture: CeleryFixture,
+        redis_fixture: RedisFixture,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        caplog.set_level(LogLevel.info)
+        with patch(
+            "palace.manager.celery.tasks.crawlable_feeds.CrawlableFeedSnapshotter"
+        ) as snapshotter:
+            crawlable_feed_snapshot.delay(collection_id=-1).wait()
+
+        snapshotter.assert_not_called()
+        assert "The feed no longer exists" in caplog.text
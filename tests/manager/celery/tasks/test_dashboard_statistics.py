@@ -0,0 +1,46 @@
+from palace.manager.api.admin.dashboard_stats import Statistics
+from palace.manager.celery.tasks.dashboard_statistics import (
+    refresh_dashboard_statistics,
+)
+from palace.manager.sqlalchemy.model.coverage import Timestamp
+from palace.manager.sqlalchemy.model.dashboard_statistics import (
+    CollectionInventorySummary,
+    LibraryPatronSummary,
+)
+from tests.fixtures.celery import CeleryFixture
+from tests.fixtures.database import DatabaseTransactionFixture
+
+
+def test_refresh_dashboard_statistics(
+    db: DatabaseTransactionFixture, celery_fixture: CeleryFixture
+):
+    library = db.default_library()
+    collection = db.default_collection()
+    db.patron()
+    db.edition(with_open_access_download=True)
+
+    refresh_dashboard_statistics.delay().wait()
+
+    [patron_summary] = db.session.query(LibraryPatronSummary).all()
+    assert patron_summary.library_id == library.id
+    assert patron_summary.total == 1
+
+    [inventory_summary] = db.session.query(CollectionInventorySummary).all()
+    assert inventory_summary.collection_id == collection.id
+    assert inventory_summary.medium == "Book"
+    assert inventory_summary.open_access_titles == 1
+    assert inventory_summary.loanable_titles == 1
+
+    timestamp = Timestamp.lookup(
+        db.session, Statistics.SERVICE_NAME, Timestamp.TASK_TYPE, collection=None
+    )
+    assert timestamp is not None
+    assert timestamp.start is not None
+
+    # Running it again replaces the summaries.
+    db.patron()
+    refresh_dashboard_statistics.delay().wait()
+    db.session.expire_all()
+    [patron_summary] = db.session.query(LibraryPatronSummary).all()
+    assert patron_summary.total == 2
+    assert db.session.query(CollectionInventorySummary).count() == 1
@@ -10,7 +10,7 @@ from unittest.mock import MagicMock, create_autospec
 import pytest
 from openpyxl import load_workbook
 from pytest import LogCaptureFixture
-from sqlalchemy import literal, select
+from sqlalchemy import Float, case, cast, func, literal, select
 from sqlalchemy.sql import Select
 
 from palace.opds.odl.info import LicenseStatus
@@ -18,7 +18,9 @@ from palace.util.datetime_helpers import utc_now
 from palace.util.log import LogLevel
 
 from palace.manager.celery.tasks.generate_inventory_and_hold_reports import (
+    _cell_value,
     _inventory_report_row_transform,
+    _write_reports,
     generate_csv_report,
     generate_excel_report,
     generate_inventory_and_hold_reports,
@@ -277,6 +279,76 @@ def test_generate_csv_report_quotes_target_age(
     assert '"5-8"' in csv_content
 
 
+def _synthetic_report_query(rows: int) -> Select:
+    """A report-shaped query that generates its rows, rather than reading them
+    from tables that would have to be filled first."""
+    n = func.generate_series(1, rows).column_valued("n")
+    return select(
+        n.label("id"),
+        (9780000000000 + n).label("identifier"),
+        func.concat("Title ", n).label("title"),
+        case((n % 3 == 0, None), else_=cast(n, Float) * 1.5).label("score"),
+        func.repeat("x", 64).label("padding"),
+    )
+
+
+def _buffered_reports(
+    db: DatabaseTransactionFixture,
+    query: Select,
+    stringify_cols: frozenset[str],
+) -> tuple[str, list[list[object]]]:
+    """Write a report's rows the way reports used to be written: buffer every row,
+    then write the buffered rows to a CSV file and then to a workbook."""
+    result = db.session.execute(query)
+    keys = list(result.keys())
+    rows = [dict(row._mapping) for row in result]
+
+    csv_file = io.StringIO()
+    writer = csv.writer(csv_file, delimiter=",", quoting=csv.QUOTE_NONNUMERIC)
+    writer.writerow(keys)
+    for row in rows:
+        writer.writerow([_cell_value(key, row[key], stringify_cols) for key in keys])
+
+    # Empty cells are read back from a workbook as None.
+    excel_rows: list[list[object]] = [list(keys)]
+    for row in rows:
+        values = [_cell_value(key, row[key], stringify_cols) for key in keys]
+        excel_rows.append([None if value == "" else value for value in values])
+    return csv_file.getvalue(), excel_rows
+
+
+def test_write_reports_matches_buffered_output(
+    db: DatabaseTransactionFixture, monkeypatch: pytest.MonkeyPatch
+):
+    """Streaming a report writes the same CSV and Excel files as buffering it."""
+    # Fetch a few rows at a time, so the rows come in several batches.
+    monkeypatch.setattr(
+        "palace.manager.celery.tasks.generate_inventory_and_hold_reports.REPORT_ROWS_PER_FETCH",
+        7,
+    )
+    query = _synthetic_report_query(50)
+    stringify_cols = frozenset({"identifier"})
+
+    csv_file = io.StringIO()
+    excel_file = io.BytesIO()
+    _write_reports(
+        db.session,
+        csv_file=csv_file,
+        excel_file=excel_file,
+        sql_params={},
+        query=query,
+        columns_to_stringify=stringify_cols,
+    )
+
+    expected_csv, expected_excel_rows = _buffered_reports(db, query, stringify_cols)
+    assert csv_file.getvalue() == expected_csv
+    assert csv_file.getvalue().count("\n") == 51
+
+    ws = load_workbook(io.BytesIO(excel_file.getvalue())).active
+    assert ws is not None
+    assert [list(row) for row in ws.iter_rows(values_only=True)] == expected_excel_rows
+
+
 def test_only_active_collections_are_included(
     db: DatabaseTransactionFixture, services_fixture: ServicesFixture
 ):
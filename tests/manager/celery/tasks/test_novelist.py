@@ -1,10 +1,13 @@
+import datetime
 from unittest.mock import create_autospec, patch
 
 import pytest
 
+from palace.util.datetime_helpers import utc_now
 from palace.util.log import LogLevel
 
 from palace.manager.celery.tasks.novelist import (
+    refresh_novelist_recommendations,
     update_novelists_by_library,
     update_novelists_for_all_libraries,
 )
@@ -13,8 +16,13 @@ from palace.manager.integration.metadata.novelist import (
     NoveListAPI,
     NoveListApiSettings,
 )
+from palace.manager.service.redis.models.novelist import NoveListRecommendationCache
+from palace.manager.sqlalchemy.model.identifier import Identifier
 from tests.fixtures.celery import CeleryFixture
 from tests.fixtures.database import DatabaseTransactionFixture
+from tests.fixtures.files import FilesFixture
+from tests.fixtures.http import MockHttpClientFixture
+from tests.fixtures.redis import RedisFixture
 
 
 def test_update_novelists_for_all_libraries(
@@ -86,3 +94,79 @@ def test_update_novelists_by_library_library_not_found(
     caplog.set_level(LogLevel.info)
     update_novelists_by_library.delay(library_id=100).wait()
     assert f"Library with id=100 not found. Unable to process task." in caplog.text
+
+
+class TestRefreshNovelistRecommendations:
+    def test_refresh(
+        self,
+        db: DatabaseTransactionFixture,
+        celery_fixture: CeleryFixture,
+        redis_fixture: RedisFixture,
+        http_client: MockHttpClientFixture,
+    ):
+        library = db.default_library()
+        db.integration_configuration(
+            NoveListAPI,
+            Goals.METADATA_GOAL,
+            libraries=[library],
+            settings=NoveListApiSettings(username="library", password="yep"),
+        )
+        identifier = db.identifier(identifier_type=Identifier.ISBN)
+        cache = NoveListRecommendationCache(redis_fixture.client, library.id)
+        fetched = utc_now() - datetime.timedelta(days=2)
+        cache.set(identifier.id, [], fetched)
+        assert cache.claim_refresh(identifier.id)
+
+        # NoveList now knows the book.
+        http_client.queue_response(
+            200,
+            media_type="application/json",
+            content=FilesFixture("novelist").sample_data("vampire_kisses.json"),
+        )
+        refresh_novelist_recommendations.delay(library.id, identifier.id).wait()
+
+        # The cached recommendations were replaced with fresh ones.
+        cached = cache.get(identifier.id)
+        assert cached is not None
+        assert cached.fresh is True
+        assert cached.fetched > fetched
+        assert len(cached.recommendations) == 5
+        assert len(http_client.requests) == 1
+
+        # And the next stale read can queue another refresh.
+        assert cache.claim_refresh(identifier.id)
+
+    def test_refresh_not_configured(
+        self,
+        db: DatabaseTransactionFixture,
+        celery_fixture: CeleryFixture,
+        redis_fixture: RedisFixture,
+        caplog: pytest.LogCaptureFixture,
+    ):
+        caplog.set_level(LogLevel.info)
+        library = db.default_library()
+        identifier = db.identifier(identifier_type=Identifier.ISBN)
+        cache = NoveListRecommendationCache(redis_fixture.client, library.id)
+        cache.set(identifier.id, [])
+        assert cache.claim_refresh(identifier.id)
+
+        # NoveList is no longer configured, so the cached recommendations are dropped.
+        refresh_novelist_recommendations.delay(library.id, identifier.id).wait()
+        assert cache.get(identifier.id) is None
+        assert cache.claim_refresh(identifier.id)
+        assert "NoveList is no longer configured" in caplog.text
+
+    def test_refresh_not_found(
+        self,
+        db: DatabaseTransactionFixture,
+        celery_fixture: CeleryFixture,
+        redis_fixture: RedisFixture,
+        caplog: pytest.LogCaptureFixture,
+    ):
+        library = db.default_library()
+        cache = NoveListRecommendationCache(redis_fixture.client, library.id)
+        assert cache.claim_refresh(100)
+
+        refresh_novelist_recommendations.delay(library.id, 100).wait()
+        assert "Unable to refresh recommendations" in caplog.text
+        assert cache.claim_refresh(100)
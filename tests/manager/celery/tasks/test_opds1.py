@@ -161,6 +161,27 @@ class TestImportCollection:
         opds1_import_fixture.import_feed("hot garbage 🗑️")
         assert "Failed to parse OPDS 1.x feed" in caplog.text
 
+    def test_importing_truncated_feed(
+        self,
+        opds1_import_fixture: Opds1ImportFixture,
+        opds_files_fixture: OPDSFilesFixture,
+        caplog: pytest.LogCaptureFixture,
+    ):
+        # The feed is only parsed as its entries are read, so a feed that breaks
+        # off after its first entry fails part way through the import. The import
+        # is abandoned the same way as for a feed that can't be parsed at all.
+        feed_data = opds_files_fixture.sample_text("content_server_mini.opds")
+        first_entry_end = feed_data.index("</entry>") + len("</entry>")
+
+        imported_editions, pools, works = opds1_import_fixture.import_feed(
+            feed_data[: first_entry_end + 100]
+        )
+        assert "Failed to parse the feed" in caplog.text
+        assert "Failed to parse OPDS 1.x feed" in caplog.text
+        assert len(imported_editions) == 0
+        assert len(pools) == 0
+        assert len(works) == 0
+
     def test_import(
         self,
         db: DatabaseTransactionFixture,
@@ -1,5 +1,7 @@
 from unittest.mock import MagicMock, create_autospec, patch
 
+from sqlalchemy.orm import Session
+
 from palace.manager.celery.tasks.saml import (
     _create_saml_federated_identity_provider_loader,
     update_saml_federation_idps_metadata,
@@ -33,23 +35,27 @@ def test_update_saml_federation_idps_metadata_task(
     assert not preexisting_idps
 
     # Now we'll set up some mocking for the update.
-    idps_to_add = [
-        SAMLFederatedIdentityProvider(
-            saml_federation,
-            saml_strings.IDP_1_ENTITY_ID,
-            saml_strings.IDP_1_UI_INFO_EN_DISPLAY_NAME,
-            saml_strings.CORRECT_XML_WITH_IDP_1,
-        ),
-        SAMLFederatedIdentityProvider(
-            saml_federation,
-            saml_strings.IDP_2_ENTITY_ID,
-            saml_strings.IDP_2_UI_INFO_EN_DISPLAY_NAME,
-            saml_strings.CORRECT_XML_WITH_IDP_2,
-        ),
-    ]
+    def update(federation: SAMLFederation, session: Session) -> bool:
+        session.add_all(
+            [
+                SAMLFederatedIdentityProvider(
+                    federation,
+                    saml_strings.IDP_1_ENTITY_ID,
+                    saml_strings.IDP_1_UI_INFO_EN_DISPLAY_NAME,
+                    saml_strings.CORRECT_XML_WITH_IDP_1,
+                ),
+                SAMLFederatedIdentityProvider(
+                    federation,
+                    saml_strings.IDP_2_ENTITY_ID,
+                    saml_strings.IDP_2_UI_INFO_EN_DISPLAY_NAME,
+                    saml_strings.CORRECT_XML_WITH_IDP_2,
+                ),
+            ]
+        )
+        return True
 
     loader = create_autospec(spec=SAMLFederatedIdentityProviderLoader)
-    loader.load = MagicMock(return_value=idps_to_add)
+    loader.update = MagicMock(side_effect=update)
 
     with patch(
         "palace.manager.celery.tasks.saml._create_saml_federated_identity_provider_loader"
@@ -59,12 +65,21 @@ def test_update_saml_federation_idps_metadata_task(
         # Run the actual update task.
         update_saml_federation_idps_metadata.delay().wait()
 
+    # The federation was updated.
+    loader.update.assert_called_once()
+    assert loader.update.call_args.args[0] == saml_federation
+    db.session.refresh(saml_federation)
+    assert saml_federation.last_updated_at is not None
+
     # The added IdPs should remain in the database after the task runs.
     identity_providers: list[SAMLFederatedIdentityProvider] = db.session.query(
         SAMLFederatedIdentityProvider
     ).all()
     assert len(identity_providers) == 2
-    assert idps_to_add == identity_providers
+    assert {idp.entity_id for idp in identity_providers} == {
+        saml_strings.IDP_1_ENTITY_ID,
+        saml_strings.IDP_2_ENTITY_ID,
+    }
 
 
 def test_create_saml_federated_identity_provider_loader():
@@ -11,6 +11,8 @@ from opensearchpy import OpenSearchException
 from sqlalchemy.orm import Session
 
 from palace.manager.celery.tasks.search import (
+    BULK_LOAD_INDEX_SETTINGS,
+    BULK_LOAD_THREAD_COUNT,
     get_presentation_ready_work_ids,
     index_works,
     search_indexing,
@@ -409,8 +411,9 @@ def test_search_reindex_advances_read_pointer(
     fixture.assert_pointers(read=fixture.old_index, write=fixture.new_index)
 
     # A real migration always takes more than one batch, so use a batch size that makes
-    # the run requeue itself: the index it is filling has to survive the requeues.
-    search_reindex.delay(batch_size=3).wait()
+    # the run requeue itself: the index it is filling has to survive the requeues. The new
+    # index is not serving reads, so it is filled as a bulk load, in bulk-load batches.
+    search_reindex.delay(bulk_load_batch_size=3).wait()
 
     # Having filled the new index end to end, the reindex publishes it. Nothing had to
     # chain a second task on to do it.
@@ -456,7 +459,7 @@ def test_search_reindex_advances_read_pointer_after_a_retried_batch(
         ExternalSearchIndex, "add_documents", autospec=True
     ) as add_documents:
         add_documents.side_effect = [None, OpenSearchException(), None, None]
-        search_reindex.delay(batch_size=4).wait()
+        search_reindex.delay(bulk_load_batch_size=4).wait()
 
     assert add_documents.call_count == 4
     fixture.assert_pointers(read=fixture.new_index, write=fixture.new_index)
@@ -546,10 +549,16 @@ def test_search_reindex_retries_when_the_pointers_cannot_be_read(
 
     # Reading the pointers is the last thing a pass does, after days of work on a large
     # collection, so a transient failure there is retried rather than losing the run.
+    # The read pointer is also read on the way in, to decide on a bulk load.
     with patch.object(
         type(fixture.service), "read_pointer", autospec=True
     ) as read_pointer:
-        read_pointer.side_effect = [OpenSearchException(), current_read_pointer]
+        read_pointer.side_effect = [
+            current_read_pointer,
+            OpenSearchException(),
+            current_read_pointer,
+            current_read_pointer,
+        ]
         search_reindex.delay().wait()
 
     fixture.assert_pointers(read=fixture.new_index, write=fixture.new_index)
@@ -576,7 +585,7 @@ def test_search_reindex_does_not_advance_read_pointer_when_it_fails(
     ) as add_documents:
         add_documents.side_effect = [None, *([OpenSearchException()] * 5)]
         with pytest.raises(MaxRetriesExceededError):
-            search_reindex.delay(batch_size=5).wait()
+            search_reindex.delay(bulk_load_batch_size=5).wait()
 
     assert add_documents.call_count == 6
     fixture.assert_pointers(read=fixture.old_index, write=fixture.new_index)
@@ -617,6 +626,149 @@ def test_search_reindex_leaves_current_read_pointer_alone(
     assert service.read_pointer() == before
 
 
+def test_search_reindex_bulk_load_restores_index_settings(
+    celery_fixture: CeleryFixture,
+    redis_fixture: RedisFixture,
+    search_migration_fixture: SearchMigrationFixture,
+    end_to_end_search_fixture: EndToEndSearchFixture,
+):
+    fixture = search_migration_fixture
+
+    def index_settings() -> dict[str, Any]:
+        settings: dict[str, Any] = fixture.client.indices.get_settings(
+            index=fixture.new_index
+        )[fixture.new_index]["settings"]["index"]
+        return settings
+
+    applied: list[dict[str, Any]] = []
+    original_add_documents = ExternalSearchIndex.add_documents
+
+    def add_documents(self: ExternalSearchIndex, *args: Any, **kwargs: Any) -> Any:
+        applied.append(index_settings())
+        return original_add_documents(self, *args, **kwargs)
+
+    with patch.object(ExternalSearchIndex, "add_documents", add_documents):
+        search_reindex.delay(bulk_load_batch_size=4, force_merge=True).wait()
+
+    # Every batch went into an index that was not refreshing or replicating.
+    assert len(applied) == 3
+    for settings in applied:
+        assert settings["refresh_interval"] == "-1"
+        assert settings["number_of_replicas"] == "0"
+
+    # Before the index was published, it got the settings its revision defines back, and
+    # was refreshed, so all the works are searchable straight away.
+    settings = index_settings()
+    assert "refresh_interval" not in settings
+    assert settings["number_of_replicas"] == str(
+        fixture.new_revision.mapping_document().settings["index"]["number_of_replicas"]
+    )
+    fixture.assert_pointers(read=fixture.new_index, write=fixture.new_index)
+    end_to_end_search_fixture.expect_results(fixture.works, "", ordered=False)
+
+
+@pytest.fixture
+def mock_search_migration_pointers(
+    services_fixture: ServicesFixture, monkeypatch: pytest.MonkeyPatch
+) -> tuple[str, str]:
+    """
+    Point the mocked search service at an index mid-migration: the write pointer is on
+    the latest revision, and the read pointer is still on an older one.
+    """
+    base_name = "test_index"
+    old_revision = MockSearchSchemaRevisionLatest(41)
+    revision = MockSearchSchemaRevisionLatest(42)
+    old_index = old_revision.name_for_index(base_name)
+    new_index = revision.name_for_index(base_name)
+
+    monkeypatch.setattr(
+        services_fixture.search_service, "base_revision_name", base_name
+    )
+    services_fixture.search_revision_directory.highest.return_value = revision
+    services_fixture.search_service.read_pointer.return_value = SearchPointer(
+        alias=f"{base_name}-search-read",
+        index=old_index,
+        version=old_revision.version,
+    )
+    services_fixture.search_service.write_pointer.return_value = SearchPointer(
+        alias=f"{base_name}-search-write", index=new_index, version=revision.version
+    )
+    return old_index, new_index
+
+
+@pytest.mark.parametrize("force_merge", [False, True])
+@patch("palace.manager.celery.tasks.search.random.uniform")
+@patch("palace.manager.celery.tasks.search.get_presentation_ready_work_ids")
+def test_search_reindex_bulk_load(
+    mock_get_work_ids: MagicMock,
+    mock_random_uniform: MagicMock,
+    force_merge: bool,
+    celery_fixture: CeleryFixture,
+    search_reindex_task_lock_fixture: SearchReindexTaskLockFixture,
+    services_fixture: ServicesFixture,
+    mock_search_migration_pointers: tuple[str, str],
+) -> None:
+    _, new_index = mock_search_migration_pointers
+    search_service = services_fixture.search_service
+    work_ids = [1, 2, 3, 4, 5]
+    mock_get_work_ids.side_effect = lambda session, batch_size, offset: work_ids[
+        offset : offset + batch_size
+    ]
+    services_fixture.search_index.add_documents.return_value = None
+
+    search_reindex.delay(
+        batch_size=1, bulk_load_batch_size=2, force_merge=force_merge
+    ).wait()
+
+    # The bulk-load batch size is used rather than the ordinary one, all the way through.
+    assert [c.args[1] for c in mock_get_work_ids.call_args_list] == [2, 2, 2]
+
+    # The batches are submitted by several bulk workers, one straight after another.
+    add_documents = services_fixture.search_index.add_documents
+    assert add_documents.call_count == 3
+    for add_call in add_documents.call_args_list:
+        assert add_call.kwargs["thread_count"] == BULK_LOAD_THREAD_COUNT
+    mock_random_uniform.assert_not_called()
+
+    # The index was put into bulk-load mode, then restored, refreshed and optionally
+    # merged, before it was published.
+    assert search_service.index_update_settings.call_args_list == [
+        call(new_index, BULK_LOAD_INDEX_SETTINGS),
+        call(new_index, {"refresh_interval": None, "number_of_replicas": 1}),
+    ]
+    search_service.index_refresh.assert_called_once_with(new_index)
+    if force_merge:
+        search_service.index_force_merge.assert_called_once_with(new_index)
+    else:
+        search_service.index_force_merge.assert_not_called()
+    search_service.read_pointer_set.assert_called_once_with(
+        services_fixture.search_revision_directory.highest.return_value
+    )
+    assert search_reindex_task_lock_fixture.task_lock.locked() is False
+
+
+@patch("palace.manager.celery.tasks.search.get_presentation_ready_work_ids")
+def test_search_reindex_no_bulk_load_for_live_index(
+    mock_get_work_ids: MagicMock,
+    celery_fixture: CeleryFixture,
+    services_fixture: ServicesFixture,
+    mock_search_pointers: None,
+) -> None:
+    # The index is already serving reads, so it is reindexed the ordinary way.
+    mock_get_work_ids.return_value = [1]
+    services_fixture.search_index.add_documents.return_value = None
+
+    search_reindex.delay().wait()
+
+    assert mock_get_work_ids.call_args.args[1] == 500
+    assert (
+        services_fixture.search_index.add_documents.call_args.kwargs["thread_count"]
+        == 1
+    )
+    services_fixture.search_service.index_update_settings.assert_not_called()
+    services_fixture.search_service.index_refresh.assert_not_called()
+
+
 class SearchIndexingFixture:
     def __init__(self, redis_fixture: RedisFixture):
         self.redis_fixture = redis_fixture
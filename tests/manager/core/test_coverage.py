@@ -2,6 +2,7 @@ import datetime
 from typing import cast
 
 import pytest
+from sqlalchemy import insert
 
 from palace.util.datetime_helpers import datetime_utc, utc_now
 
@@ -218,7 +219,7 @@ class TestBaseCoverageProvider:
         class MockProvider(BaseCoverageProvider):
             SERVICE_NAME = "I do nothing"
             run_once_calls = []
-            expect_offset = 0
+            expect_counter = 0
 
             def run_once(self, progress, count_as_covered=None):
                 now = utc_now()
@@ -230,29 +231,29 @@ class TestBaseCoverageProvider:
                 # .finish will have been reset to None.
                 assert None == progress.finish
 
-                # Verify that progress.offset is cleared when we
+                # Verify that progress.counter is cleared when we
                 # expect, and left alone when we expect. This lets
-                assert self.expect_offset == progress.offset
+                assert self.expect_counter == progress.counter
 
                 self.run_once_calls.append((count_as_covered, now))
-                progress.offset = len(self.run_once_calls)
+                progress.counter = len(self.run_once_calls)
 
                 if len(self.run_once_calls) == 1:
                     # This is the first call. We will not be setting
-                    # .finish, so the offset will not be reset on the
+                    # .finish, so the counter will not be reset on the
                     # next call. This simulates what happens when a
                     # given `count_as_covered` setting can't be
                     # handled in one batch.
-                    self.expect_offset = progress.offset
+                    self.expect_counter = progress.counter
                 else:
                     # This is the second or third call. Set .finish to
                     # indicate we're done with this `count_as_covered`
                     # setting.
                     progress.finish = now
 
-                    # If there is another call, progress.offset will be
+                    # If there is another call, progress.counter will be
                     # reset to zero. (So will .finish.)
-                    self.expect_offset = 0
+                    self.expect_counter = 0
                 return progress
 
         # We start with no Timestamp.
@@ -287,14 +288,129 @@ class TestBaseCoverageProvider:
         assert CoverageRecord.DEFAULT_COUNT_AS_COVERED == third_call[0]
 
         # On the second and third calls, final_progress.finish was set
-        # to the current time, and .offset was set to the number of
+        # to the current time, and .counter was set to the number of
         # calls so far.
         #
         # These values are cleared out before each run_once() call
         # -- we tested that above -- so the surviving values are the
         # ones associated with the third call.
         assert third_call[1] == final_progress.finish
-        assert 3 == final_progress.offset
+        assert 3 == final_progress.counter
+
+        # Only the first pass's counter is stored, so the third call's
+        # counter, from the second pass, wasn't.
+        assert 0 == timestamp.counter
+
+    def test_run_once_and_update_timestamp_resumes(
+        self, db: DatabaseTransactionFixture
+    ):
+        # If a run is interrupted, the next run picks up after the last
+        # item that was covered.
+        first = db.identifier()
+        second = db.identifier()
+        third = db.identifier()
+
+        class Mock(AlwaysSuccessfulCoverageProvider):
+            fail_on: Identifier | None = None
+
+            def process_item(self, item):
+                if item == self.fail_on:
+                    raise Exception("Interrupted")
+                return super().process_item(item)
+
+        provider = Mock(db.session, batch_size=1)
+        provider.fail_on = second
+        provider.run_once_and_update_timestamp()
+        assert [first] == provider.attempts
+
+        # The counter records the last item that was covered before the
+        # exception stopped the run.
+        timestamp = provider.timestamp
+        assert "Exception: Interrupted" in timestamp.exception
+        assert first.id == timestamp.counter
+
+        # The next run starts after it.
+        provider = Mock(db.session, batch_size=1)
+        provider.run_once_and_update_timestamp()
+        assert [second, third] == provider.attempts
+
+        # Once a run has made it all the way through the table, the
+        # counter is reset, so the next run starts from the beginning.
+        assert 0 == provider.timestamp.counter
+
+        # A counter left over from an earlier run only applies to the
+        # first pass through the table. Items before it that still need
+        # coverage are picked up by the second pass.
+        fourth = db.identifier()
+        fifth = db.identifier()
+        provider.timestamp.counter = fourth.id
+        provider = Mock(db.session, batch_size=1)
+        provider.run_once_and_update_timestamp()
+        assert [fifth, fourth] == provider.attempts
+
+    def test_run_once_and_update_timestamp_resumes_after_second_pass(
+        self, db: DatabaseTransactionFixture
+    ):
+        # If a run is interrupted during its second pass, which retries
+        # transient failures, the next run's first pass starts from the
+        # beginning of the table, rather than where the second pass stopped.
+        first = db.identifier()
+        second = db.identifier()
+        third = db.identifier()
+
+        class Mock(AlwaysSuccessfulCoverageProvider):
+            fail_on: Identifier | None = None
+            count_as_covered: list[str] | None = None
+
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.passes: list[tuple[Identifier, list[str] | None]] = []
+
+            def run_once(self, progress, count_as_covered=None):
+                self.count_as_covered = count_as_covered
+                return super().run_once(progress, count_as_covered)
+
+            def process_item(self, item):
+                self.passes.append((item, self.count_as_covered))
+                if item == self.fail_on:
+                    raise Exception("Interrupted")
+                return super().process_item(item)
+
+        provider = Mock(db.session, batch_size=1)
+        for identifier in (second, third):
+            record, _ = CoverageRecord.add_for(identifier, provider.data_source)
+            record.status = CoverageRecord.TRANSIENT_FAILURE
+
+        # The first pass covers the first identifier. The second pass
+        # retries the second identifier, and is interrupted by the third.
+        provider.fail_on = third
+        provider.run_once_and_update_timestamp()
+        assert provider.passes == [
+            (first, CoverageRecord.PREVIOUSLY_ATTEMPTED),
+            (second, CoverageRecord.DEFAULT_COUNT_AS_COVERED),
+            (third, CoverageRecord.DEFAULT_COUNT_AS_COVERED),
+        ]
+        timestamp = provider.timestamp
+        assert "Exception: Interrupted" in timestamp.exception
+        assert 0 == timestamp.counter
+
+        # Since then, the first identifier lost its coverage, so it needs to
+        # be covered again, even though it comes before where the second pass
+        # stopped. The next run's first pass covers it.
+        [record] = [
+            record
+            for record in first.coverage_records
+            if record.data_source == provider.data_source
+        ]
+        db.session.delete(record)
+        db.session.commit()
+
+        provider = Mock(db.session, batch_size=1)
+        provider.run_once_and_update_timestamp()
+        assert provider.passes == [
+            (first, CoverageRecord.PREVIOUSLY_ATTEMPTED),
+            (third, CoverageRecord.DEFAULT_COUNT_AS_COVERED),
+        ]
 
     def test_run_once_and_update_timestamp_catches_exception(
         self, db: DatabaseTransactionFixture
@@ -381,17 +497,16 @@ class TestBaseCoverageProvider:
         # that's covered will succeed, so the question is which ones
         # get covered.
         progress = CoverageProviderProgress()
-        assert 0 == progress.offset
+        assert None == progress.counter
         result = provider.run_once(progress)
 
         # The TimestampData we passed in was given back to us.
         assert progress == result
 
-        # The offset (an extension specific to
-        # CoverageProviderProgress, not stored in the database)
-        # has not changed -- if we were to call run_once again we
-        # would not need to skip any records.
-        assert 0 == progress.offset
+        # The counter is now the ID of the last identifier we tried
+        # to cover -- if we were to call run_once again we would
+        # start after it.
+        assert uncovered.id == progress.counter
 
         # Various internal totals were updated and a value for .achievements
         # can be generated from those totals.
@@ -419,10 +534,12 @@ class TestBaseCoverageProvider:
         assert covered not in provider.attempts
 
         # We can change which identifiers get processed by changing
-        # what counts as 'coverage'.
+        # what counts as 'coverage', and starting again from the start
+        # of the table.
+        progress.counter = 0
         result = provider.run_once(progress, count_as_covered=[CoverageRecord.SUCCESS])
         assert progress == result
-        assert 0 == progress.offset
+        assert persistent.id == progress.counter
 
         # That processed the persistent failure, but not the success.
         assert persistent in provider.attempts
@@ -430,6 +547,7 @@ class TestBaseCoverageProvider:
 
         # Let's call it again and say that we are covering everything
         # _except_ persistent failures.
+        progress.counter = 0
         result = provider.run_once(
             progress, count_as_covered=[CoverageRecord.PERSISTENT_FAILURE]
         )
@@ -439,10 +557,17 @@ class TestBaseCoverageProvider:
         # successfully covered.
         assert covered in provider.attempts
 
-        # *Now* the offset has changed, so that the first four results
-        # -- which we've decided to skip -- won't be considered again
-        # this run.
-        assert 4 == progress.offset
+        # All four identifiers were considered, so the counter is the
+        # ID of the last one.
+        assert covered.id == progress.counter
+
+        # Once there's nothing left after the counter, the run is
+        # finished and the counter is reset.
+        result = provider.run_once(
+            progress, count_as_covered=[CoverageRecord.PERSISTENT_FAILURE]
+        )
+        assert 0 == progress.counter
+        assert progress.finish is not None
 
     def test_run_once_records_successes_and_failures(
         self, db: DatabaseTransactionFixture
@@ -632,6 +757,31 @@ class TestBaseCoverageProvider:
         assert True == provider.should_update(record)
 
 
+class TestCoverageProviderPagination:
+    def test_batch_by_id_matches_offset(self, db: DatabaseTransactionFixture):
+        """Fetching a batch of items that need coverage by ID finds the
+        same items as skipping over the earlier ones with an OFFSET.
+        """
+        total = 10
+        db.session.execute(
+            insert(Identifier),
+            [
+                {"type": Identifier.GUTENBERG_ID, "identifier": f"pagination-{i}"}
+                for i in range(total)
+            ],
+        )
+        provider = AlwaysSuccessfulCoverageProvider(db.session)
+        provider.batch_size = 3
+        qu = provider.items_that_need_coverage().order_by(Identifier.id)
+        offset = total - provider.batch_size
+        [after] = qu.offset(offset - 1).limit(1).all()
+
+        by_offset = qu.offset(offset).limit(provider.batch_size).all()
+        by_id = qu.filter(Identifier.id > after.id).limit(provider.batch_size).all()
+        assert len(by_id) == provider.batch_size
+        assert by_id == by_offset
+
+
 class TestIdentifierCoverageProvider:
     def test_input_identifier_types(self, db: DatabaseTransactionFixture):
         """Test various acceptable and unacceptable values for the class
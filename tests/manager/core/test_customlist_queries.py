@@ -3,6 +3,7 @@ from unittest.mock import create_autospec
 
 from palace.manager.core.query.customlist import CustomListQueries
 from palace.manager.search.external_search import ExternalSearchIndex
+from palace.manager.sqlalchemy.model.customlist import CustomList
 from tests.fixtures.database import DatabaseTransactionFixture
 
 
@@ -35,7 +36,7 @@ class TestCustomListQueries:
 
         assert count == 0
         assert next_key is None
-        mock_wl().search.assert_not_called()
+        mock_wl().search_work_ids.assert_not_called()
 
     def test_populate_query_pages_explicit_json_query_skips_parse(
         self, mock_wl, mock_page, db: DatabaseTransactionFixture
@@ -44,7 +45,7 @@ class TestCustomListQueries:
         the parse of auto_update_query."""
         mock_search = create_autospec(ExternalSearchIndex)
         w1 = db.work()
-        mock_wl().search.side_effect = [[w1], []]
+        mock_wl().search_work_ids.side_effect = [[w1.id], []]
         custom_list, _ = db.customlist(num_entries=0)
         # Set auto_update_query to something different to prove it is ignored.
         custom_list.auto_update_query = '{"should": "be ignored"}'
@@ -57,7 +58,7 @@ class TestCustomListQueries:
         assert count == 1
         assert next_key is None
         # Confirm the explicit query was forwarded to the search call.
-        call_args = mock_wl().search.call_args_list[0]
+        call_args = mock_wl().search_work_ids.call_args_list[0]
         assert call_args.args[1] == explicit_query
 
     def test_populate_query_pages_single(
@@ -65,7 +66,7 @@ class TestCustomListQueries:
     ):
         mock_search = create_autospec(ExternalSearchIndex)
         w1 = db.work()
-        mock_wl().search.side_effect = [[w1], []]
+        mock_wl().search_work_ids.side_effect = [[w1.id], []]
         custom_list, _ = db.customlist(num_entries=0)
         custom_list.auto_update_query = "{}"
 
@@ -74,7 +75,7 @@ class TestCustomListQueries:
         )
         assert count == 1
         assert next_key is None
-        assert mock_wl().search.call_count == 2
+        assert mock_wl().search_work_ids.call_count == 2
         assert [e.work_id for e in custom_list.entries] == [w1.id]
 
     def test_populate_query_multi_page(
@@ -83,7 +84,7 @@ class TestCustomListQueries:
         mock_search = create_autospec(ExternalSearchIndex)
         w1 = db.work()
         w2 = db.work()
-        mock_wl().search.side_effect = [[w1], [w2], []]
+        mock_wl().search_work_ids.side_effect = [[w1.id], [w2.id], []]
         next_page = page_count_property_mock(mock_page)
 
         custom_list, _ = db.customlist(num_entries=0)
@@ -94,7 +95,7 @@ class TestCustomListQueries:
         )
         assert count == 2
         assert next_key is None
-        assert mock_wl().search.call_count == 3
+        assert mock_wl().search_work_ids.call_count == 3
         assert next_page.call_count == 2
         assert [e.work_id for e in custom_list.entries] == [w1.id, w2.id]
 
@@ -106,7 +107,7 @@ class TestCustomListQueries:
         w2 = db.work()
         w3 = db.work()
         next_page = page_count_property_mock(mock_page)
-        mock_wl().search.side_effect = [[w1], [w2], [w3], []]
+        mock_wl().search_work_ids.side_effect = [[w1.id], [w2.id], [w3.id], []]
         custom_list, _ = db.customlist(num_entries=0)
         custom_list.auto_update_query = "{}"
 
@@ -120,7 +121,7 @@ class TestCustomListQueries:
         )
         # The search will be paged through from 0, but only the 2nd page onwards should be populated
         assert count == 1
-        assert mock_wl().search.call_count == 2
+        assert mock_wl().search_work_ids.call_count == 2
         assert next_page.call_count == 2
         assert [e.work_id for e in custom_list.entries] == [w2.id]
 
@@ -131,7 +132,7 @@ class TestCustomListQueries:
         that cursor and start_page is ignored (no fast-forward search calls)."""
         mock_search = create_autospec(ExternalSearchIndex)
         w1 = db.work()
-        mock_wl().search.side_effect = [[w1], []]
+        mock_wl().search_work_ids.side_effect = [[w1.id], []]
         custom_list, _ = db.customlist(num_entries=0)
         custom_list.auto_update_query = "{}"
         pagination_key = ["sort_key_value", 42]
@@ -157,7 +158,7 @@ class TestCustomListQueries:
         """If a fast-forward search returns no results, the function returns
         early with (0, None) after writing metadata."""
         mock_search = create_autospec(ExternalSearchIndex)
-        mock_wl().search.side_effect = [[]]  # fast-forward page is empty
+        mock_wl().search_work_ids.side_effect = [[]]  # fast-forward page is empty
         custom_list, _ = db.customlist(num_entries=0)
         custom_list.auto_update_query = "{}"
 
@@ -167,7 +168,7 @@ class TestCustomListQueries:
 
         assert count == 0
         assert next_key is None
-        assert mock_wl().search.call_count == 1  # only the fast-forward call
+        assert mock_wl().search_work_ids.call_count == 1  # only the fast-forward call
         # Metadata should have been updated (update_metadata defaults to True)
         assert custom_list.auto_update_last_update is not None
 
@@ -178,7 +179,7 @@ class TestCustomListQueries:
         early with (0, None) after writing metadata."""
         mock_search = create_autospec(ExternalSearchIndex)
         w1 = db.work()
-        mock_wl().search.side_effect = [[w1]]
+        mock_wl().search_work_ids.side_effect = [[w1.id]]
         # Make next_page return None so the fast-forward early-exit triggers.
         mock_page.return_value.next_page = None
         custom_list, _ = db.customlist(num_entries=0)
@@ -190,7 +191,7 @@ class TestCustomListQueries:
 
         assert count == 0
         assert next_key is None
-        assert mock_wl().search.call_count == 1  # only the fast-forward call
+        assert mock_wl().search_work_ids.call_count == 1  # only the fast-forward call
         assert custom_list.auto_update_last_update is not None
 
     def test_populate_query_pages_main_loop_no_next_page_stops(
@@ -200,7 +201,7 @@ class TestCustomListQueries:
         breaks and returns the entries found so far (no cursor)."""
         mock_search = create_autospec(ExternalSearchIndex)
         w1 = db.work()
-        mock_wl().search.side_effect = [[w1]]
+        mock_wl().search_work_ids.side_effect = [[w1.id]]
         mock_page.return_value.next_page = None
         custom_list, _ = db.customlist(num_entries=0)
         custom_list.auto_update_query = "{}"
@@ -219,7 +220,7 @@ class TestCustomListQueries:
         """When update_metadata=False and fast-forward hits empty results,
         metadata is not written before the early return."""
         mock_search = create_autospec(ExternalSearchIndex)
-        mock_wl().search.side_effect = [[]]
+        mock_wl().search_work_ids.side_effect = [[]]
         custom_list, _ = db.customlist(num_entries=0)
         custom_list.auto_update_query = "{}"
 
@@ -238,7 +239,7 @@ class TestCustomListQueries:
         metadata is not written before the early return."""
         mock_search = create_autospec(ExternalSearchIndex)
         w1 = db.work()
-        mock_wl().search.side_effect = [[w1]]
+        mock_wl().search_work_ids.side_effect = [[w1.id]]
         mock_page.return_value.next_page = None
         custom_list, _ = db.customlist(num_entries=0)
         custom_list.auto_update_query = "{}"
@@ -258,7 +259,7 @@ class TestCustomListQueries:
         not written, even on a successful run."""
         mock_search = create_autospec(ExternalSearchIndex)
         w1 = db.work()
-        mock_wl().search.side_effect = [[w1], []]
+        mock_wl().search_work_ids.side_effect = [[w1.id], []]
         custom_list, _ = db.customlist(num_entries=0)
         custom_list.auto_update_query = "{}"
 
@@ -271,3 +272,44 @@ class TestCustomListQueries:
         assert [e.work_id for e in custom_list.entries] == [w1.id]
         # Metadata must NOT have been updated.
         assert custom_list.auto_update_last_update is None
+
+    def test_populate_query_pages_matches_add_entry(
+        self, mock_wl, mock_page, db: DatabaseTransactionFixture
+    ):
+        """Populating a list from search results gives the same entries as adding
+        each work with add_entry(), and leaves works already on the list alone."""
+        mock_search = create_autospec(ExternalSearchIndex)
+        page1 = [db.work(with_open_access_download=True) for _ in range(3)]
+        page2 = [db.work(with_open_access_download=True) for _ in range(2)]
+        next_page = page_count_property_mock(mock_page)
+
+        expected, _ = db.customlist(num_entries=0)
+        for work in page1 + page2:
+            expected.add_entry(work, update_external_index=True)
+
+        custom_list, _ = db.customlist(num_entries=0)
+        custom_list.auto_update_query = "{}"
+        already_listed, _ = custom_list.add_entry(page2[0])
+        mock_wl().search_work_ids.side_effect = [
+            [work.id for work in page1],
+            [work.id for work in page2],
+            [],
+        ]
+
+        count, next_key = CustomListQueries.populate_query_pages(
+            db.session, mock_search, custom_list
+        )
+
+        assert count == 5
+        assert next_key is None
+        assert next_page.call_count == 2
+
+        def entries(customlist: CustomList) -> set[tuple[int | None, int | None, bool]]:
+            return {
+                (entry.work_id, entry.edition_id, entry.featured)
+                for entry in customlist.entries
+            }
+
+        assert entries(custom_list) == entries(expected)
+        assert custom_list.size == expected.size == 5
+        assert already_listed in custom_list.entries
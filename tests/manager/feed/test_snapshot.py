@@ -0,0 +1,290 @@
+import datetime
+import json
+from collections.abc import Sequence
+from unittest.mock import create_autospec
+
+import feedparser
+import pytest
+from freezegun import freeze_time
+from opensearchpy.helpers.response.hit import Hit
+
+from palace.util.datetime_helpers import utc_now
+
+from palace.manager.feed.annotator.circulation import CirculationManagerAnnotator
+from palace.manager.feed.facets.crawlable import CrawlableFacets
+from palace.manager.feed.serializer.opds import (
+    OPDS1Version1Serializer,
+    OPDS1Version2Serializer,
+)
+from palace.manager.feed.serializer.opds2 import OPDS2Serializer
+from palace.manager.feed.snapshot import (
+    CRAWLABLE_SNAPSHOT_MAX_AGE,
+    CrawlableFeedSnapshotError,
+    CrawlableFeedSnapshotter,
+    SnapshotFormat,
+    crawlable_snapshot_url,
+    snapshot_page_key,
+)
+from palace.manager.feed.worklist.crawlable import CrawlableCollectionBasedLane
+from palace.manager.search.external_search import ExternalSearchIndex
+from palace.manager.search.filter import Filter
+from palace.manager.search.pagination import SortKeyPagination
+from palace.manager.service.redis.models.crawlable_feed import CrawlableFeedSnapshot
+from palace.manager.sqlalchemy.model.work import Work
+from tests.fixtures.database import DatabaseTransactionFixture
+from tests.fixtures.redis import RedisFixture
+from tests.fixtures.s3 import MockS3Service, S3ServiceFixture
+from tests.manager.feed.conftest import PatchedUrlFor
+
+
+def hit(work: Work, updated: int = 0) -> Hit:
+    return Hit(
+        {
+            "_source": {"work_id": work.id},
+            "_sort": [work.id, updated],
+        }
+    )
+
+
+class SnapshotFixture:
+    def __init__(
+        self,
+        db: DatabaseTransactionFixture,
+        redis_fixture: RedisFixture,
+        s3_service_fixture: S3ServiceFixture,
+    ) -> None:
+        self.db = db
+        self.storage: MockS3Service = s3_service_fixture.mock_service()
+        self.search_engine = create_autospec(ExternalSearchIndex)
+        self.snapshot = CrawlableFeedSnapshot(redis_fixture.client, "library-1")
+
+        self.lane = CrawlableCollectionBasedLane()
+        self.lane.initialize(db.default_library())
+        self.facets = CrawlableFacets.default(db.default_library())
+        self.snapshotter = CrawlableFeedSnapshotter(
+            db.session,
+            self.lane,
+            "library-1",
+            "A library",
+            self.facets,
+            CirculationManagerAnnotator(self.lane),
+            self.search_engine,
+            self.storage,
+            self.snapshot,
+            page_size=2,
+        )
+
+    def search_results(self, *pages: Sequence[Hit]) -> None:
+        """Have the search engine return each of these pages in turn."""
+        results = iter(pages)
+
+        def query_works(
+            query_string: str | None,
+            filter: Filter,
+            pagination: SortKeyPagination,
+        ) -> Sequence[Hit]:
+            # The real search engine tells the pagination what was on the page.
+            page = next(results)
+            pagination.page_loaded(page)
+            return page
+
+        self.search_engine.query_works.side_effect = query_works
+
+    def upload(self, page: int, snapshot_format: SnapshotFormat) -> str:
+        key = snapshot_page_key("library-1", page, snapshot_format)
+        return self.storage.uploads.pop(key).content.decode("utf8")
+
+
+@pytest.fixture
+def snapshot_fixture(
+    db: DatabaseTransactionFixture,
+    redis_fixture: RedisFixture,
+    s3_service_fixture: S3ServiceFixture,
+    patch_url_for: PatchedUrlFor,
+) -> SnapshotFixture:
+    return SnapshotFixture(db, redis_fixture, s3_service_fixture)
+
+
+class TestSnapshotFormat:
+    def test_for_serializer(self) -> None:
+        assert (
+            SnapshotFormat.for_serializer(OPDS1Version1Serializer())
+            == SnapshotFormat.OPDS1
+        )
+        assert SnapshotFormat.for_serializer(OPDS2Serializer()) == SnapshotFormat.OPDS2
+
+        # Snapshots aren't written in the newer version of OPDS1.
+        assert SnapshotFormat.for_serializer(OPDS1Version2Serializer()) is None
+
+
+class TestCrawlableSnapshotUrl:
+    @freeze_time()
+    def test_crawlable_snapshot_url(self, snapshot_fixture: SnapshotFixture) -> None:
+        storage = snapshot_fixture.storage
+        snapshot = snapshot_fixture.snapshot
+        fmt = SnapshotFormat.OPDS2
+
+        # Never published.
+        assert crawlable_snapshot_url(storage, snapshot, fmt) is None
+
+        # Published, but empty.
+        snapshot.publish({}, utc_now())
+        assert crawlable_snapshot_url(storage, snapshot, fmt) is None
+
+        # Published, and current.
+        snapshot.publish({0: "a", 1: "b"}, utc_now() - CRAWLABLE_SNAPSHOT_MAX_AGE)
+        assert crawlable_snapshot_url(storage, snapshot, fmt) == storage.generate_url(
+            "crawlable/library-1/0.opds2.json"
+        )
+
+        # Published, but too long ago.
+        snapshot.publish(
+            {0: "a", 1: "b"},
+            utc_now() - CRAWLABLE_SNAPSHOT_MAX_AGE - datetime.timedelta(seconds=1),
+        )
+        assert crawlable_snapshot_url(storage, snapshot, fmt) is None
+
+
+class TestCrawlableFeedSnapshotter:
+    def test_run(self, snapshot_fixture: SnapshotFixture) -> None:
+        db = snapshot_fixture.db
+        storage = snapshot_fixture.storage
+        work1 = db.work(with_open_access_download=True)
+        work2 = db.work(with_open_access_download=True)
+        work3 = db.work(with_open_access_download=True)
+
+        snapshot_fixture.search_results(
+            [hit(work1), hit(work2)],
+            [hit(work3)],
+        )
+        assert snapshot_fixture.snapshotter.run() == 2
+
+        # The search engine was asked for one page after another, each page picking up
+        # where the last one left off.
+        first_call, second_call = (
+            snapshot_fixture.search_engine.query_works.call_args_list
+        )
+        first_pagination = first_call.kwargs["pagination"]
+        second_pagination = second_call.kwargs["pagination"]
+        assert isinstance(first_pagination, SortKeyPagination)
+        assert first_pagination.last_item_on_previous_page is None
+        assert isinstance(second_pagination, SortKeyPagination)
+        assert second_pagination.last_item_on_previous_page == [work2.id, 0]
+
+        # The works were sorted by ID, not by when they were last updated.
+        search_filter = first_call.kwargs["filter"]
+        assert search_filter.order == ["work_id", "last_update_time"]
+        assert search_filter.order_ascending is True
+
+        # Each page was stored in each format.
+        page0 = feedparser.parse(snapshot_fixture.upload(0, SnapshotFormat.OPDS1))
+        page1 = json.loads(snapshot_fixture.upload(1, SnapshotFormat.OPDS2))
+        snapshot_fixture.upload(0, SnapshotFormat.OPDS2)
+        snapshot_fixture.upload(1, SnapshotFormat.OPDS1)
+        assert storage.uploads == {}
+
+        assert [entry["title"] for entry in page0["entries"]] == [
+            work1.title,
+            work2.title,
+        ]
+        links = {
+            link["rel"]: link["href"]
+            for link in page0["feed"]["links"]
+            if link["rel"] in ("self", "first", "next", "previous")
+        }
+        assert links == {
+            "self": storage.generate_url("crawlable/library-1/0.opds1.xml"),
+            "next": storage.generate_url("crawlable/library-1/1.opds1.xml"),
+        }
+
+        assert [pub["metadata"]["title"] for pub in page1["publications"]] == [
+            work3.title
+        ]
+        links = {
+            link["rel"]: link["href"]
+            for link in page1["links"]
+            if link["rel"] in ("self", "first", "next", "previous")
+        }
+        assert links == {
+            "self": storage.generate_url("crawlable/library-1/1.opds2.json"),
+            "first": storage.generate_url("crawlable/library-1/0.opds2.json"),
+        }
+
+        # The manifest was published.
+        published = snapshot_fixture.snapshot.published()
+        assert published is not None
+        assert published.page_count == 2
+
+        # When nothing has changed, nothing is rendered again.
+        snapshot_fixture.search_results(
+            [hit(work1), hit(work2)],
+            [hit(work3)],
+        )
+        assert snapshot_fixture.snapshotter.run() == 0
+        assert storage.uploads == {}
+
+        # When a work is updated, only the page it's on is rendered again.
+        snapshot_fixture.search_results(
+            [hit(work1), hit(work2)],
+            [hit(work3, updated=1)],
+        )
+        assert snapshot_fixture.snapshotter.run() == 1
+        snapshot_fixture.upload(1, SnapshotFormat.OPDS1)
+        snapshot_fixture.upload(1, SnapshotFormat.OPDS2)
+        assert storage.uploads == {}
+        assert storage.deleted == []
+
+        # When the feed shrinks, the last page loses its next link and the pages past
+        # the new end are deleted.
+        snapshot_fixture.search_results([hit(work1)])
+        assert snapshot_fixture.snapshotter.run() == 1
+        assert set(storage.uploads) == {
+            "crawlable/library-1/0.opds1.xml",
+            "crawlable/library-1/0.opds2.json",
+        }
+        assert set(storage.deleted) == {
+            "crawlable/library-1/1.opds1.xml",
+            "crawlable/library-1/1.opds2.json",
+        }
+        assert snapshot_fixture.snapshot.page_fingerprints().keys() == {0}
+
+    def test_run_work_updated(self, snapshot_fixture: SnapshotFixture) -> None:
+        db = snapshot_fixture.db
+        storage = snapshot_fixture.storage
+        works = [db.work(with_open_access_download=True) for _ in range(5)]
+        pages = [works[0:2], works[2:4], works[4:]]
+
+        snapshot_fixture.search_results(
+            *[[hit(work) for work in page] for page in pages]
+        )
+        assert snapshot_fixture.snapshotter.run() == 3
+        storage.uploads.clear()
+
+        # The first work is updated. Since the snapshot is ordered by work ID, the work
+        # stays where it was, and only the first page is rendered again.
+        snapshot_fixture.search_results(
+            [hit(works[0], updated=1), hit(works[1])],
+            [hit(works[2]), hit(works[3])],
+            [hit(works[4])],
+        )
+        assert snapshot_fixture.snapshotter.run() == 1
+        assert set(storage.uploads) == {
+            "crawlable/library-1/0.opds1.xml",
+            "crawlable/library-1/0.opds2.json",
+        }
+
+    def test_run_store_failure(self, snapshot_fixture: SnapshotFixture) -> None:
+        work = snapshot_fixture.db.work(with_open_access_download=True)
+        snapshot_fixture.search_results([hit(work)])
+        snapshot_fixture.storage.store = create_autospec(
+            snapshot_fixture.storage.store, return_value=None
+        )
+
+        with pytest.raises(
+            CrawlableFeedSnapshotError,
+            match="Unable to store crawlable/library-1/0.opds1.xml",
+        ):
+            snapshot_fixture.snapshotter.run()
+
+        # The manifest is only published once every page is stored.
+        assert snapshot_fixture.snapshot.published() is None
@@ -817,6 +817,47 @@ class TestWorkList:
 
         assert [] == wl.search(db.session, query, RaisesException())
 
+    def test_search_work_ids(self, db: DatabaseTransactionFixture):
+        # WorkList.search_work_ids() asks the search client for the IDs of the
+        # matching works, and doesn't load the works from the database.
+        wl = WorkList()
+        wl.initialize(db.default_library(), audiences=[Classifier.AUDIENCE_CHILDREN])
+        query = "a query"
+
+        class MockSearchClient:
+            def query_work_ids(self, query, filter, pagination):
+                self.query_work_ids_called_with = (query, filter, pagination)
+                return [3, 1, 2]
+
+        client = MockSearchClient()
+        assert [3, 1, 2] == wl.search_work_ids(db.session, query, client)
+
+        qu, filter, pagination = client.query_work_ids_called_with
+        assert query == qu
+        assert [
+            Classifier.AUDIENCE_CHILDREN,
+            Classifier.AUDIENCE_ALL_AGES,
+        ] == filter.audiences
+        assert 0 == pagination.offset
+        assert Pagination.DEFAULT_SEARCH_SIZE == pagination.size
+
+        # Specific Pagination and Facets objects are used if they're given.
+        facets = SearchFacets(languages=["chi"])
+        pagination = object()
+        wl.search_work_ids(db.session, query, client, pagination, facets)
+        qu, filter, pag = client.query_work_ids_called_with
+        assert pagination == pag
+        assert ["chi"] == filter.languages
+
+        # If there is no search client, or the search fails, there are no results.
+        assert [] == wl.search_work_ids(db.session, query, None)
+
+        class RaisesException:
+            def query_work_ids(self, *args, **kwargs):
+                raise OpenSearchException("oh no")
+
+        assert [] == wl.search_work_ids(db.session, query, RaisesException())
+
     def test_worklist_for_resultset_no_holds_allowed(
         self, db: DatabaseTransactionFixture
     ):
@@ -0,0 +1,207 @@
+import datetime
+from collections.abc import Generator
+
+import pytest
+from psycopg2.extras import NumericRange
+
+from palace.util.datetime_helpers import utc_now
+
+from palace.manager.core.classifier import Classifier
+from palace.manager.core.config import Configuration
+from palace.manager.feed.worklist.base import WorkList
+from palace.manager.feed.worklist.lane_tree import LaneRestrictions, LaneTreeSnapshot
+from palace.manager.search.filter import Filter
+from palace.manager.sqlalchemy.model.classification import Genre
+from palace.manager.sqlalchemy.model.customlist import CustomList
+from palace.manager.sqlalchemy.model.datasource import DataSource
+from palace.manager.sqlalchemy.model.edition import Edition
+from palace.manager.sqlalchemy.util import create
+from tests.fixtures.database import DatabaseTransactionFixture
+
+
+class LaneTreeFixture:
+    def __init__(self, db: DatabaseTransactionFixture) -> None:
+        self.db = db
+        self.session = db.session
+        self.library = db.default_library()
+        self.horror, _ = Genre.lookup(self.session, "Horror")
+        self.fantasy, _ = Genre.lookup(self.session, "Fantasy")
+        self.best_sellers, _ = db.customlist(num_entries=0)
+        self.staff_picks, _ = db.customlist(num_entries=0)
+
+        self.parent = db.lane(display_name="Parent", library=self.library)
+        self.parent.media = Edition.AUDIO_MEDIUM
+        self.parent.languages = ["eng", "fra"]
+        self.parent.fiction = True
+        self.parent.audiences = [Classifier.AUDIENCE_CHILDREN]
+        self.parent.target_age = NumericRange(10, 11, "[]")
+        self.parent.genres = [self.horror]
+        self.parent.customlists = [self.best_sellers]
+        self.parent.license_datasource = DataSource.lookup(
+            self.session, DataSource.GUTENBERG
+        )
+
+        self.child = db.lane(display_name="Child", parent=self.parent)
+        self.child.genres = [self.fantasy]
+        self.child.customlists = [self.staff_picks]
+        self.session.flush()
+
+
+@pytest.fixture
+def lane_tree_fixture(
+    db: DatabaseTransactionFixture,
+) -> Generator[LaneTreeFixture]:
+    LaneTreeSnapshot.clear()
+    yield LaneTreeFixture(db)
+    LaneTreeSnapshot.clear()
+
+
+class TestLaneRestrictions:
+    def test_from_worklist(self, lane_tree_fixture: LaneTreeFixture) -> None:
+        parent = lane_tree_fixture.parent
+        child = lane_tree_fixture.child
+
+        restrictions = LaneRestrictions.from_worklist(child)
+        assert restrictions.media == parent.media
+        assert restrictions.languages == ("eng", "fra")
+        assert restrictions.fiction is True
+        assert restrictions.audiences == (Classifier.AUDIENCE_CHILDREN,)
+        assert restrictions.target_age == parent.target_age
+        assert restrictions.license_datasource_id == parent.license_datasource_id
+
+        # Genre and custom list restrictions are gathered from the whole hierarchy.
+        assert restrictions.genre_id_restrictions == (
+            tuple(sorted(parent.genre_ids)),
+            tuple(sorted(child.genre_ids)),
+        )
+        assert restrictions.customlist_id_restrictions == (
+            (lane_tree_fixture.best_sellers.id,),
+            (lane_tree_fixture.staff_picks.id,),
+        )
+
+    def test_filter_arguments(self, lane_tree_fixture: LaneTreeFixture) -> None:
+        restrictions = LaneRestrictions.from_worklist(lane_tree_fixture.child)
+
+        arguments = restrictions.filter_arguments()
+        assert arguments["languages"] == ["eng", "fra"]
+        assert arguments["customlist_restriction_sets"] == [
+            [lane_tree_fixture.best_sellers.id],
+            [lane_tree_fixture.staff_picks.id],
+        ]
+
+        # Each call returns new lists, so changing them doesn't change the restrictions.
+        arguments["languages"].append("spa")
+        arguments["customlist_restriction_sets"][0].append(-1)
+        assert restrictions.filter_arguments()["languages"] == ["eng", "fra"]
+        assert restrictions.filter_arguments()["customlist_restriction_sets"] == [
+            [lane_tree_fixture.best_sellers.id],
+            [lane_tree_fixture.staff_picks.id],
+        ]
+
+
+class TestLaneTreeSnapshot:
+    def test_restrictions_for(self, lane_tree_fixture: LaneTreeFixture) -> None:
+        session = lane_tree_fixture.session
+        child = lane_tree_fixture.child
+
+        # A lane's restrictions in the snapshot are the ones found by walking its
+        # parentage.
+        assert LaneTreeSnapshot.restrictions_for(
+            session, child
+        ) == LaneRestrictions.from_worklist(child)
+
+        # So the Filter built from them is the same too.
+        filter = Filter.from_worklist(session, child, None)
+        assert filter.languages == ["eng", "fra"]
+        assert [set(x) for x in filter.genre_restriction_sets] == [
+            lane_tree_fixture.parent.genre_ids,
+            child.genre_ids,
+        ]
+        assert filter.customlist_restriction_sets == [
+            [lane_tree_fixture.best_sellers.id],
+            [lane_tree_fixture.staff_picks.id],
+        ]
+
+        # Only a Lane can be found in the snapshot.
+        worklist = WorkList()
+        worklist.initialize(lane_tree_fixture.library)
+        assert LaneTreeSnapshot.restrictions_for(session, worklist) is None
+
+    def test_for_library(
+        self, lane_tree_fixture: LaneTreeFixture, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        session = lane_tree_fixture.session
+        library = lane_tree_fixture.library
+
+        # The snapshot is built once and then shared.
+        snapshot = LaneTreeSnapshot.for_library(session, library.id)
+        assert snapshot.restrictions.keys() == {
+            lane_tree_fixture.parent.id,
+            lane_tree_fixture.child.id,
+        }
+        assert LaneTreeSnapshot.for_library(session, library.id) is snapshot
+
+        # Until the site configuration changes.
+        monkeypatch.setattr(
+            Configuration,
+            "SITE_CONFIGURATION_LAST_UPDATE",
+            utc_now() + datetime.timedelta(seconds=10),
+        )
+        rebuilt = LaneTreeSnapshot.for_library(session, library.id)
+        assert rebuilt is not snapshot
+        assert rebuilt.restrictions == snapshot.restrictions
+
+    def test_lane_changes(self, lane_tree_fixture: LaneTreeFixture) -> None:
+        session = lane_tree_fixture.session
+        child = lane_tree_fixture.child
+        snapshot = LaneTreeSnapshot.for_library(session, lane_tree_fixture.library.id)
+
+        # A lane with changes that haven't been written to the database yet isn't
+        # looked up in the snapshot.
+        child.languages = ["spa"]
+        assert LaneTreeSnapshot.restrictions_for(session, child) is None
+        assert Filter.from_worklist(session, child, None).languages == ["spa"]
+
+        # Once they have been, the snapshot is built again.
+        session.flush()
+        restrictions = LaneTreeSnapshot.restrictions_for(session, child)
+        assert restrictions is not None
+        assert restrictions.languages == ("spa",)
+        assert (
+            LaneTreeSnapshot.for_library(session, lane_tree_fixture.library.id)
+            is not snapshot
+        )
+
+    def test_customlist_changes(self, lane_tree_fixture: LaneTreeFixture) -> None:
+        session = lane_tree_fixture.session
+        library_id = lane_tree_fixture.library.id
+        child = lane_tree_fixture.child
+        snapshot = LaneTreeSnapshot.for_library(session, library_id)
+
+        # Changing a lane's custom lists throws the snapshot away.
+        new_list, _ = lane_tree_fixture.db.customlist(num_entries=0)
+        child.customlists.append(new_list)
+        session.flush()
+        restrictions = LaneTreeSnapshot.restrictions_for(session, child)
+        assert restrictions is not None
+        assert restrictions.customlist_id_restrictions[-1] == (
+            lane_tree_fixture.staff_picks.id,
+            new_list.id,
+        )
+        snapshot = LaneTreeSnapshot.for_library(session, library_id)
+
+        # So does creating or deleting a custom list, since a lane that takes its
+        # works from every list from a data source depends on which lists exist.
+        created, _ = create(
+            session,
+            CustomList,
+            name="A new list",
+            data_source=DataSource.lookup(session, DataSource.NYT),
+        )
+        session.flush()
+        assert LaneTreeSnapshot.for_library(session, library_id) is not snapshot
+        snapshot = LaneTreeSnapshot.for_library(session, library_id)
+
+        session.delete(created)
+        session.flush()
+        assert LaneTreeSnapshot.for_library(session, library_id) is not snapshot
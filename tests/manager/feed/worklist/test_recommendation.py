@@ -1,6 +1,10 @@
-from unittest.mock import MagicMock, create_autospec
+import datetime
+from unittest.mock import MagicMock, create_autospec, patch
 
 import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from palace.util.datetime_helpers import utc_now
 
 from palace.manager.core.classifier import Classifier
 from palace.manager.core.entrypoint import AudiobooksEntryPoint
@@ -12,11 +16,20 @@ from palace.manager.feed.worklist.recommendation import (
     RelatedBooksLane,
 )
 from palace.manager.feed.worklist.series import SeriesLane
-from palace.manager.integration.metadata.novelist import NoveListAPI
+from palace.manager.integration.goals import Goals
+from palace.manager.integration.metadata.novelist import (
+    NoveListAPI,
+    NoveListApiSettings,
+)
 from palace.manager.search.filter import Filter
+from palace.manager.service.redis.models.novelist import NoveListRecommendationCache
+from palace.manager.service.redis.redis import Redis
 from palace.manager.sqlalchemy.model.contributor import Contributor
 from palace.manager.sqlalchemy.model.identifier import Identifier
 from tests.fixtures.database import DatabaseTransactionFixture
+from tests.fixtures.files import FilesFixture
+from tests.fixtures.http import MockHttpClientFixture
+from tests.fixtures.redis import RedisFixture
 
 
 @pytest.fixture
@@ -245,3 +258,139 @@ class TestRelatedBooksLane:
         related_books_fixture.edition.series = "All By Myself"
         lane = RelatedBooksLane(db.default_library(), related_books_fixture.work, "")
         assert [] == lane.works(db.session)
+
+
+class RecommendationCacheFixture:
+    def __init__(
+        self,
+        db: DatabaseTransactionFixture,
+        redis_fixture: RedisFixture,
+        http_client: MockHttpClientFixture,
+    ):
+        self.db = db
+        self.redis_client = redis_fixture.client
+        self.http_client = http_client
+        self.library = db.default_library()
+        db.integration_configuration(
+            NoveListAPI,
+            Goals.METADATA_GOAL,
+            libraries=[self.library],
+            settings=NoveListApiSettings(username="library", password="yep"),
+        )
+        self.novelist_api = NoveListAPI.from_config(self.library)
+        self.files = FilesFixture("novelist")
+
+        # NoveList is asked directly about a book with an ISBN.
+        self.work = db.work(with_license_pool=True)
+        self.identifier = db.identifier(identifier_type=Identifier.ISBN)
+        self.work.presentation_edition.primary_identifier = self.identifier
+        self.cache = NoveListRecommendationCache(self.redis_client, self.library.id)
+
+    def queue_novelist_response(self, filename: str = "vampire_kisses.json") -> None:
+        """Queue up NoveList's response to the next lookup."""
+        self.http_client.queue_response(
+            200,
+            media_type="application/json",
+            content=self.files.sample_data(filename),
+        )
+
+    def lane(self, redis_client: Redis | None = None) -> RecommendationLane:
+        return RecommendationLane(
+            self.library,
+            self.work,
+            "",
+            novelist_api=self.novelist_api,
+            redis_client=redis_client or self.redis_client,
+        )
+
+
+@pytest.fixture
+def recommendation_cache_fixture(
+    db: DatabaseTransactionFixture,
+    redis_fixture: RedisFixture,
+    http_client: MockHttpClientFixture,
+) -> RecommendationCacheFixture:
+    return RecommendationCacheFixture(db, redis_fixture, http_client)
+
+
+class TestRecommendationLaneCache:
+    def test_cache_miss(self, recommendation_cache_fixture: RecommendationCacheFixture):
+        fixture = recommendation_cache_fixture
+        fixture.queue_novelist_response()
+
+        # Nothing is cached, so NoveList is asked while we wait.
+        with patch.object(
+            fixture.novelist_api,
+            "lookup_recommendations",
+            wraps=fixture.novelist_api.lookup_recommendations,
+        ) as lookup:
+            recommendations = fixture.lane().lookup_recommendations()
+            assert len(recommendations) == 5
+            assert len(fixture.http_client.requests) == 1
+            assert lookup.call_count == 1
+
+            # The recommendations were cached.
+            cached = fixture.cache.get(fixture.identifier.id)
+            assert cached is not None
+            assert cached.fresh is True
+            assert cached.recommendations == recommendations
+
+            # So the next lane for the book doesn't ask NoveList.
+            assert fixture.lane().lookup_recommendations() == recommendations
+            assert lookup.call_count == 1
+
+    def test_negative_cache(
+        self, recommendation_cache_fixture: RecommendationCacheFixture
+    ):
+        fixture = recommendation_cache_fixture
+        fixture.queue_novelist_response("null_data.json")
+
+        # NoveList doesn't know the book.
+        lane = fixture.lane()
+        assert lane.lookup_recommendations() == []
+        assert lane.recommendations == []
+
+        # That's cached too, so we don't keep asking.
+        with patch.object(fixture.novelist_api, "lookup_recommendations") as lookup:
+            assert fixture.lane().lookup_recommendations() == []
+            lookup.assert_not_called()
+
+    def test_stale_while_revalidate(
+        self, recommendation_cache_fixture: RecommendationCacheFixture
+    ):
+        fixture = recommendation_cache_fixture
+        identifier_id = fixture.identifier.id
+        stale = [IdentifierData(type=Identifier.ISBN, identifier="9780061122415")]
+        fixture.cache.set(identifier_id, stale, utc_now() - datetime.timedelta(days=2))
+
+        # Stale recommendations are served without asking NoveList, and a refresh is
+        # queued.
+        with (
+            patch.object(fixture.novelist_api, "lookup_recommendations") as lookup,
+            patch(
+                "palace.manager.celery.tasks.novelist.refresh_novelist_recommendations"
+            ) as refresh,
+        ):
+            assert fixture.lane().lookup_recommendations() == stale
+            lookup.assert_not_called()
+            refresh.apply_async.assert_called_once_with(
+                (fixture.library.id, identifier_id), retry=False
+            )
+
+            # The refresh is only queued once.
+            assert fixture.lane().lookup_recommendations() == stale
+            assert refresh.apply_async.call_count == 1
+        assert fixture.http_client.requests == []
+
+    def test_redis_unavailable(
+        self, recommendation_cache_fixture: RecommendationCacheFixture
+    ):
+        fixture = recommendation_cache_fixture
+        fixture.queue_novelist_response()
+
+        # If Redis can't be reached, NoveList is asked directly.
+        redis_client = MagicMock()
+        redis_client.get.side_effect = RedisConnectionError("redis unavailable")
+        recommendations = fixture.lane(redis_client).lookup_recommendations()
+        assert len(recommendations) == 5
+        assert len(fixture.http_client.requests) == 1
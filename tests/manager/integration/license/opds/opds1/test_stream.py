@@ -0,0 +1,273 @@
+from typing import Any
+
+import feedparser
+import pytest
+from freezegun import freeze_time
+from lxml import etree
+
+from palace.util.exceptions import PalaceValueError
+
+from palace.manager.integration.license.opds.opds1.extractor import (
+    Opds1Extractor,
+    OPDS1Publication,
+)
+from palace.manager.integration.license.opds.opds1.stream import (
+    OPDS1FeedStream,
+    entry_details,
+)
+from palace.manager.integration.license.opds.opds1.xml_parser import OPDSXMLParser
+from tests.fixtures.files import (
+    FilesFixture,
+    OPDSFilesFixture,
+    OPDSForDistributorsFilesFixture,
+)
+
+# The feedparser keys the extractor reads.
+EXTRACTED_KEYS = (
+    "id",
+    "title",
+    "schema_alternativeheadline",
+    "updated_parsed",
+    "published_parsed",
+    "publisher",
+    "dcterms_publisher",
+    "language",
+    "dcterms_language",
+    "rights_uri",
+)
+
+
+def feedparser_publications(feed: bytes) -> list[OPDS1Publication]:
+    """Read the publications in a feed the way the extractor used to: with feedparser,
+    and then again with lxml."""
+    parser = OPDSXMLParser()
+    entries = feedparser.parse(feed)["entries"]
+    tags = parser._xpath(etree.fromstring(feed), "/atom:feed/atom:entry")
+    return [
+        OPDS1Publication(parser=parser, entry_fp=entry, entry_xml=tag)
+        for entry, tag in zip(entries, tags, strict=True)
+    ]
+
+
+def comparable(entry: dict[str, Any]) -> dict[str, Any]:
+    """The parts of a feedparser entry the extractor reads."""
+    result = {key: entry[key] for key in EXTRACTED_KEYS if key in entry}
+    if "bibframe_distribution" in entry:
+        result["bibframe:providername"] = entry["bibframe_distribution"].get(
+            "bibframe:providername"
+        )
+    for key in ("summary_detail", "content"):
+        details = entry.get(key)
+        if isinstance(details, dict):
+            details = [details]
+        if details:
+            result[key] = [(d["type"], d["value"]) for d in details]
+    return result
+
+
+def tree(entry: etree._Element) -> list[tuple[Any, dict[str, str], str]]:
+    """The tags, attributes and text of an entry, whatever namespace prefixes it's
+    serialized with."""
+    return [
+        (element.tag, dict(element.attrib), (element.text or "").strip())
+        for element in entry.iter()
+    ]
+
+
+def feed_files(fixture: FilesFixture) -> list[tuple[FilesFixture, str]]:
+    return [(fixture, path.name) for path in sorted(fixture.directory.glob("*.opds"))]
+
+
+FEEDS = feed_files(OPDSFilesFixture()) + feed_files(OPDSForDistributorsFilesFixture())
+
+
+class TestOPDS1FeedStreamParity:
+    """The streaming parser reads the same data out of a feed that feedparser and
+    lxml read between them."""
+
+    @pytest.mark.parametrize(
+        "files,filename",
+        [pytest.param(files, filename, id=filename) for files, filename in FEEDS],
+    )
+    @pytest.mark.parametrize("opds_for_distributors", [False, True])
+    @freeze_time()
+    def test_parity(
+        self, files: FilesFixture, filename: str, opds_for_distributors: bool
+    ) -> None:
+        feed = files.sample_data(filename)
+        extractor = Opds1Extractor(
+            "http://example.com/feed",
+            "Example Data Source",
+            opds_for_distributors=opds_for_distributors,
+        )
+
+        expected = feedparser_publications(feed)
+        parsed = extractor.feed_parse(feed)
+        actual = list(extractor.feed_publications(parsed))
+        assert len(actual) == len(expected)
+
+        for old, new in zip(expected, actual):
+            assert comparable(new.entry_fp) == comparable(old.entry_fp)
+            assert tree(new.entry_xml) == tree(old.entry_xml)
+
+            identifier = extractor.publication_identifier(old)
+            assert extractor.publication_identifier(new) == identifier
+            assert extractor.publication_bibliographic(
+                identifier, new
+            ) == extractor.publication_bibliographic(identifier, old)
+
+        next_links = [
+            link["href"]
+            for link in feedparser.parse(feed)["feed"].get("links", [])
+            if link.get("rel") == "next"
+        ]
+        assert extractor.feed_next_url(parsed) == (
+            next_links[0] if next_links else None
+        )
+
+
+class TestOPDS1FeedStream:
+    def test_entries(self, opds_files_fixture: OPDSFilesFixture) -> None:
+        stream = OPDS1FeedStream(opds_files_fixture.sample_data("content_server.opds"))
+        stream.start()
+
+        # The feed's links before its first entry have been read.
+        assert [link.get("rel") for link in stream.links] == [None, "self"]
+
+        ids = []
+        for details, entry in stream.entries():
+            # Each entry is detached from the feed as it's handed out.
+            assert entry.getparent() is None
+            assert details == entry_details(entry)
+            ids.append(details["id"])
+        assert len(ids) == 76
+        assert len(set(ids)) == 76
+
+        # There's nothing more to read, and the link after the last entry has been
+        # read along the way.
+        assert list(stream.entries()) == []
+        stream.finish()
+        assert [link.get("rel") for link in stream.links] == [None, "self", "next"]
+
+    def test_finish(self, opds_files_fixture: OPDSFilesFixture) -> None:
+        # Links after the feed's entries are read once the feed is finished.
+        feed = b"""<feed xmlns="http://www.w3.org/2005/Atom">
+            <entry><id>urn:isbn:9781683351993</id></entry>
+            <link rel="next" href="http://example.com/next"/>
+        </feed>"""
+        stream = OPDS1FeedStream(feed)
+        stream.start()
+        assert stream.links == []
+        stream.finish()
+        assert stream.links == [{"rel": "next", "href": "http://example.com/next"}]
+
+        extractor = Opds1Extractor("http://example.com/feed", "Example Data Source")
+        assert (
+            extractor.feed_next_url(extractor.feed_parse(feed))
+            == "http://example.com/next"
+        )
+
+    def test_not_a_feed(self) -> None:
+        # A document that isn't an Atom feed has no entries or links.
+        stream = OPDS1FeedStream(b"<rss><entry><id>1</id></entry></rss>")
+        stream.start()
+        assert list(stream.entries()) == []
+        assert stream.links == []
+
+    @pytest.mark.parametrize(
+        "feed",
+        [
+            pytest.param(b"hot garbage", id="not xml"),
+            pytest.param(b"", id="empty"),
+        ],
+    )
+    def test_bad_feed(self, feed: bytes) -> None:
+        extractor = Opds1Extractor("http://example.com/feed", "Example Data Source")
+        with pytest.raises(PalaceValueError, match="Failed to parse OPDS 1.x feed"):
+            extractor.feed_parse(feed)
+
+    def test_truncated_feed(self, opds_files_fixture: OPDSFilesFixture) -> None:
+        # A feed that breaks off part way through fails once the parser reaches the
+        # break.
+        feed = opds_files_fixture.sample_data("content_server_mini.opds")
+        first_entry_end = feed.index(b"</entry>") + len(b"</entry>")
+        stream = OPDS1FeedStream(feed[: first_entry_end + 100])
+        stream.start()
+        entries = stream.entries()
+        assert (
+            next(entries)[0]["id"]
+            == "urn:librarysimplified.org/terms/id/Gutenberg%20ID/10441"
+        )
+        with pytest.raises(PalaceValueError, match="Failed to parse OPDS 1.x feed"):
+            next(entries)
+
+    def test_entry_details(self) -> None:
+        entry = etree.fromstring(
+            """<entry xmlns="http://www.w3.org/2005/Atom"
+                xmlns:dc="http://purl.org/dc/elements/1.1/"
+                xmlns:terms="http://purl.org/dc/terms/"
+                xmlns:bibframe="http://bibframe.org/vocab/">
+              <id> urn:isbn:9781683351993 </id>
+              <title type="html">A &lt;b&gt;bold&lt;/b&gt; title</title>
+              <bibframe:distribution bibframe:ProviderName="Gutenberg"/>
+              <dc:publisher>A publisher</dc:publisher>
+              <terms:language>en</terms:language>
+              <terms:issued>1910</terms:issued>
+              <summary type="html">&lt;p onclick="evil()"&gt;A summary&lt;/p&gt;&lt;script&gt;evil()&lt;/script&gt;</summary>
+              <content type="xhtml"><div xmlns="http://www.w3.org/1999/xhtml">Some <i>content</i></div></content>
+            </entry>"""
+        )
+        details = entry_details(entry)
+        assert details["id"] == "urn:isbn:9781683351993"
+        assert details["title"] == "A <b>bold</b> title"
+        assert details["bibframe_distribution"] == {
+            "bibframe:providername": "Gutenberg"
+        }
+        assert details["publisher"] == "A publisher"
+        # Dublin Core terms are keyed by their usual prefix, whatever the feed calls
+        # them.
+        assert details["dcterms_language"] == "en"
+        assert details["published_parsed"][:6] == (1910, 1, 1, 0, 0, 0)
+
+        # Markup is sanitized.
+        assert details["summary_detail"] == {
+            "type": "text/html",
+            "value": "<p>A summary</p>",
+        }
+        assert details["content"] == [
+            {
+                "type": "application/xhtml+xml",
+                "value": "Some <i>content</i>",
+            }
+        ]
+
+    @pytest.mark.parametrize(
+        "markup",
+        [
+            pytest.param(
+                '<p onclick="evil()">A summary</p><script>evil()</script>', id="script"
+            ),
+            pytest.param('<a href="javascript:evil()">A link</a>', id="javascript"),
+            pytest.param("<b>Bold</b>\r\ntext", id="line_endings"),
+            pytest.param('<img src="a.png" style="x"/><br/>', id="void"),
+        ],
+    )
+    def test_sanitized_like_feedparser(self, markup: str) -> None:
+        # The stream sanitizes markup with a private feedparser function, so this
+        # checks that it still does what feedparser.parse does with the same markup.
+        summary = etree.Element(f"{{{OPDSXMLParser.NAMESPACES['atom']}}}summary")
+        summary.set("type", "html")
+        summary.text = markup
+        entry = etree.Element(f"{{{OPDSXMLParser.NAMESPACES['atom']}}}entry")
+        entry.append(summary)
+        feed = (
+            b'<feed xmlns="http://www.w3.org/2005/Atom"><entry>'
+            + etree.tostring(summary)
+            + b"</entry></feed>"
+        )
+
+        [expected] = feedparser.parse(feed)["entries"]
+        assert entry_details(entry)["summary_detail"] == {
+            "type": expected["summary_detail"]["type"],
+            "value": expected["summary_detail"]["value"],
+        }
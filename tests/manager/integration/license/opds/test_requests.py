@@ -29,7 +29,9 @@ from palace.manager.integration.license.opds.requests import (
     OpdsAuthType,
     get_opds_requests,
 )
+from palace.manager.util.http.http import BearerAuth
 from tests.fixtures.http import MockHttpClientFixture
+from tests.fixtures.redis import RedisFixture
 from tests.mocks.mock import MockRequestsResponse
 
 
@@ -649,6 +651,94 @@ class TestOAuthOpdsRequest:
             opds_request_fixture.request_url,
         ]
 
+    def test_shared_token_cache(
+        self, opds_request_fixture: OpdsRequestFixture, redis_fixture: RedisFixture
+    ) -> None:
+        # Send requests to the fake endpoint, rather than the mock HTTP client.
+        opds_request_fixture.client.stop_patch()
+        endpoint = FakeTokenEndpoint(opds_request_fixture)
+
+        def process_request() -> OAuthOpdsRequest:
+            # Each request object stands in for a separate process.
+            make_request = opds_request_fixture.get_opds_requests(
+                OpdsAuthType.OAUTH,
+                requests_session=endpoint,
+                redis_client=redis_fixture.client,
+            )
+            assert isinstance(make_request, OAuthOpdsRequest)
+            return make_request
+
+        first, second = process_request(), process_request()
+        for make_request in (first, second, first):
+            response = make_request("GET", opds_request_fixture.request_url)
+            assert response.status_code == 200
+
+        # The authentication document was only fetched, and a token only granted,
+        # once between them.
+        assert endpoint.auth_document_requests == 1
+        assert endpoint.token_requests == 1
+
+        # When the distributor stops accepting the token, the first process to find
+        # out gets a new one, and the other uses it rather than getting its own.
+        endpoint.revoke_tokens()
+        for make_request in (first, second):
+            response = make_request("GET", opds_request_fixture.request_url)
+            assert response.status_code == 200
+        assert endpoint.token_requests == 2
+        assert first.session_token is not None
+        assert second.session_token is not None
+        assert first.session_token.access_token == "token-2"
+        assert second.session_token.access_token == "token-2"
+
+        # A process that isn't using the cache gets its own token.
+        opds_request_fixture.get_opds_requests(
+            OpdsAuthType.OAUTH, requests_session=endpoint
+        )("GET", opds_request_fixture.request_url)
+        assert endpoint.auth_document_requests == 2
+        assert endpoint.token_requests == 3
+
+
+class FakeTokenEndpoint:
+    """
+    A distributor that grants OAuth tokens, and counts how many it has granted.
+
+    The feed is protected, so fetching it returns the authentication document.
+    """
+
+    def __init__(self, fixture: OpdsRequestFixture) -> None:
+        self.fixture = fixture
+        self.auth_document_requests = 0
+        self.token_requests = 0
+        self._valid_tokens: set[str] = set()
+
+    def revoke_tokens(self) -> None:
+        self._valid_tokens.clear()
+
+    def __call__(self, method: str, url: str, **kwargs: Any) -> MockRequestsResponse:
+        if url == self.fixture.feed_url:
+            self.auth_document_requests += 1
+            return self.fixture.responses["auth_document_401"]
+        if url == self.fixture.auth_url:
+            assert method == "POST"
+            self.token_requests += 1
+            access_token = f"token-{self.token_requests}"
+            self._valid_tokens.add(access_token)
+            return MockRequestsResponse(
+                200,
+                {},
+                json.dumps(
+                    {
+                        "access_token": access_token,
+                        "token_type": "Bearer",
+                        "expires_in": 3600,
+                    }
+                ),
+            )
+        auth = kwargs.get("auth")
+        if isinstance(auth, BearerAuth) and auth.token in self._valid_tokens:
+            return self.fixture.responses["data"]
+        return self.fixture.responses["other_401"]
+
 
 class TestGetOpdsRequests:
     @pytest.mark.parametrize(
@@ -10,6 +10,8 @@ import dateutil.parser
 import pytest
 from pytest import MonkeyPatch
 
+from palace.util.datetime_helpers import utc_now
+
 from palace.manager.core.config import CannotLoadConfiguration
 from palace.manager.data_layer.identifier import IdentifierData
 from palace.manager.integration.goals import Goals
@@ -17,6 +19,7 @@ from palace.manager.integration.metadata.novelist import (
     NoveListAPI,
     NoveListApiSettings,
 )
+from palace.manager.sqlalchemy.model.coverage import Timestamp
 from palace.manager.sqlalchemy.model.datasource import DataSource
 from palace.manager.sqlalchemy.model.identifier import Identifier
 from palace.manager.sqlalchemy.model.resource import HttpResponseTuple, Representation
@@ -24,6 +27,7 @@ from palace.manager.util.http.http import HTTP
 from tests.fixtures.database import DatabaseTransactionFixture
 from tests.fixtures.files import FilesFixture
 from tests.fixtures.http import MockHttpClientFixture
+from tests.fixtures.webserver import MockAPIServer, MockAPIServerResponse
 from tests.mocks.mock import MockRequestsResponse
 
 
@@ -666,6 +670,106 @@ class TestNoveListAPI:
 
         assert response == mock_response
 
+    def test_put_items_novelist_streams_changes(
+        self, novelist_fixture: NoveListFixture, mock_web_server: MockAPIServer
+    ):
+        db = novelist_fixture.db
+        library = db.default_library()
+        novelist = novelist_fixture.novelist
+        novelist.COLLECTION_DATA_API = mock_web_server.url("/api/collections")
+        novelist.RECORDS_PER_CHUNK = 1
+
+        def queue_response(status_code: int = 200) -> None:
+            mock_web_server.enqueue_response(
+                "PUT",
+                "/api/collections",
+                MockAPIServerResponse(
+                    status_code, content=json.dumps({"RecordsReceived": 1})
+                ),
+            )
+
+        def sent_isbns() -> set[str]:
+            request = mock_web_server.latest_request
+            # The body was streamed to NoveList a record at a time.
+            assert request.headers["Transfer-Encoding"] == "chunked"
+            data = json.loads(request.payload)
+            assert data["customer"] == "library:yep"
+            assert len(request.chunks) == len(data["records"]) + 2
+            return {record["isbn"] for record in data["records"]}
+
+        pools = []
+        for _ in range(2):
+            edition = db.edition(identifier_type=Identifier.ISBN)
+            pools.append(db.licensepool(edition, collection=db.default_collection()))
+        isbns = [pool.identifier.identifier for pool in pools]
+
+        # The first time the library's collection is sent, all of it is sent.
+        assert novelist.collection_synced_at(library) is None
+        queue_response()
+        before = utc_now()
+        assert novelist.put_items_novelist(library) == {"RecordsReceived": 1}
+        assert sent_isbns() == set(isbns)
+        synced_at = novelist.collection_synced_at(library)
+        assert synced_at is not None and synced_at >= before
+        timestamp = Timestamp.lookup(
+            db.session,
+            NoveListAPI.collection_sync_service(library),
+            Timestamp.TASK_TYPE,
+            None,
+        )
+        assert timestamp.achievements == "Records sent: 2"
+
+        # Next time, only the titles whose licenses changed are sent.
+        pools[0].last_updated = utc_now()
+        queue_response()
+        novelist.put_items_novelist(library)
+        assert sent_isbns() == {isbns[0]}
+        assert len(mock_web_server.requests()) == 2
+
+        # If nothing changed, nothing is sent.
+        assert novelist.put_items_novelist(library) is None
+        assert len(mock_web_server.requests()) == 2
+
+        # Unless the whole collection is asked for.
+        queue_response()
+        novelist.put_items_novelist(library, full=True)
+        assert sent_isbns() == set(isbns)
+
+        # If NoveList rejects the changes, they are sent again next time.
+        synced_at = novelist.collection_synced_at(library)
+        pools[1].last_updated = utc_now()
+        queue_response(403)
+        assert novelist.put_items_novelist(library) is None
+        assert sent_isbns() == {isbns[1]}
+        assert novelist.collection_synced_at(library) == synced_at
+
+        queue_response()
+        novelist.put_items_novelist(library)
+        assert sent_isbns() == {isbns[1]}
+
+    def test_novelist_data_chunks(self, novelist_fixture: NoveListFixture):
+        novelist = novelist_fixture.novelist
+        novelist.RECORDS_PER_CHUNK = 2
+        items = [
+            {"isbn": str(isbn), "title": f"Book {isbn}"} for isbn in range(12345, 12350)
+        ]
+
+        # The chunks make up the same document as the whole data object.
+        chunks = list(novelist.novelist_data_chunks(iter(items)))
+        assert b"".join(chunks) == json.dumps(
+            novelist.make_novelist_data_object(items)
+        ).encode("utf-8")
+
+        # The records are sent a few at a time.
+        assert len(chunks) == 5
+        assert chunks[1] == b'{"isbn": "12345", "title": "Book 12345"}, ' + (
+            b'{"isbn": "12346", "title": "Book 12346"}'
+        )
+
+        assert b"".join(novelist.novelist_data_chunks([])) == json.dumps(
+            novelist.make_novelist_data_object([])
+        ).encode("utf-8")
+
     def test_make_novelist_data_object(self, novelist_fixture: NoveListFixture):
         bad_data: list[dict[str, str]] = []
         result = novelist_fixture.novelist.make_novelist_data_object(bad_data)
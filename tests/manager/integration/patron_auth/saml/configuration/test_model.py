@@ -227,6 +227,55 @@ class TestSamlIdpConfiguration:
             ]
         )
 
+    def test_get_identity_providers_caches_parsed_metadata(
+        self,
+        db: DatabaseTransactionFixture,
+        create_saml_configuration: Callable[..., SAMLWebSSOAuthSettings],
+    ):
+        metadata_parser = SAMLMetadataParser()
+        metadata_parser.parse = MagicMock(side_effect=metadata_parser.parse)
+
+        federation = SAMLFederation("Test federation", "http://localhost")
+        federated_idp = SAMLFederatedIdentityProvider(
+            federation,
+            saml_strings.IDP_1_ENTITY_ID,
+            saml_strings.IDP_1_UI_INFO_EN_DISPLAY_NAME,
+            saml_strings.CORRECT_XML_WITH_IDP_1,
+        )
+        db.session.add_all([federation, federated_idp])
+
+        configuration = create_saml_configuration(
+            federated_identity_provider_entity_ids=[saml_strings.IDP_1_ENTITY_ID]
+        )
+
+        def get_identity_providers() -> list[SAMLIdentityProviderMetadata]:
+            onelogin_configuration = SAMLOneLoginConfiguration(configuration)
+            onelogin_configuration._metadata_parser = metadata_parser
+            return onelogin_configuration.get_identity_providers(db.session)
+
+        # The IdP's metadata is parsed the first time a configuration needs it.
+        [identity_provider] = get_identity_providers()
+        assert identity_provider.sso_service.url == saml_strings.IDP_1_SSO_URL
+        metadata_parser.parse.assert_called_once_with(
+            saml_strings.CORRECT_XML_WITH_IDP_1
+        )
+
+        # Configurations built afterwards use the metadata that was already parsed.
+        [identity_provider] = get_identity_providers()
+        assert identity_provider.sso_service.url == saml_strings.IDP_1_SSO_URL
+        metadata_parser.parse.assert_called_once()
+
+        # When the federation's metadata for the IdP changes, it's parsed again.
+        federated_idp.xml_metadata = saml_strings.CORRECT_XML_WITH_IDP_1.replace(
+            saml_strings.IDP_1_SSO_URL, "http://idp1.hilbertteam.net/new/SSO"
+        )
+        db.session.flush()
+        [identity_provider] = get_identity_providers()
+        assert (
+            identity_provider.sso_service.url == "http://idp1.hilbertteam.net/new/SSO"
+        )
+        assert metadata_parser.parse.call_count == 2
+
 
 class TestSamlSpConfiguration:
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Generator
 from functools import partial
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock
@@ -25,6 +25,15 @@ if TYPE_CHECKING:
     from tests.fixtures.api_controller import ControllerFixture
 
 
+@pytest.fixture(autouse=True)
+def clear_identity_provider_metadata_cache() -> Generator[None]:
+    # Parsed IdP metadata is cached for the whole process, so it mustn't leak
+    # from one test into another.
+    SAMLOneLoginConfiguration._identity_provider_metadata_cache.clear()
+    yield
+    SAMLOneLoginConfiguration._identity_provider_metadata_cache.clear()
+
+
 @pytest.fixture
 def create_saml_configuration() -> Callable[..., SAMLWebSSOAuthSettings]:
     return partial(
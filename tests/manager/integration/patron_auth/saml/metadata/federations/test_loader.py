@@ -1,10 +1,17 @@
-from unittest.mock import MagicMock, create_autospec, patch
+import datetime
+import io
+from collections.abc import Iterable
+from unittest.mock import create_autospec, patch
+from urllib.error import HTTPError
 
 import pytest
 
+from palace.util.datetime_helpers import datetime_utc
+
 from palace.manager.integration.patron_auth.saml.metadata.federations import incommon
 from palace.manager.integration.patron_auth.saml.metadata.federations.loader import (
     SAMLFederatedIdentityProviderLoader,
+    SAMLMetadataDocument,
     SAMLMetadataLoader,
     SAMLMetadataLoadingError,
 )
@@ -14,103 +21,272 @@ from palace.manager.integration.patron_auth.saml.metadata.federations.validator
 from palace.manager.integration.patron_auth.saml.metadata.parser import (
     SAMLMetadataParser,
 )
-from palace.manager.sqlalchemy.model.saml import SAMLFederation
+from palace.manager.sqlalchemy.model.saml import (
+    SAMLFederatedIdentityProvider,
+    SAMLFederation,
+)
+from tests.fixtures.database import DatabaseTransactionFixture
 from tests.mocks import saml_strings
 
+# How many IdPs the synthetic federations have.
+SYNTHETIC_FEDERATION_SIZE = 5000
+
+
+def _synthetic_federation_metadata(
+    entity_numbers: Iterable[int],
+    valid_until: str = "2026-10-25T00:00:00Z",
+    renamed: Iterable[int] = (),
+) -> bytes:
+    """Aggregated metadata of a federation with an IdP for each of the given numbers.
+
+    The display names of the renamed IdPs are different from the usual ones.
+    """
+    renamed = set(renamed)
+    entity_descriptors = "".join(
+        f"""
+    <EntityDescriptor entityID="https://idp{number}.example.org/idp/shibboleth">
+        <IDPSSODescriptor protocolSupportEnumeration="urn:oasis:names:tc:SAML:2.0:protocol">
+            <Extensions>
+                <mdui:UIInfo>
+                    <mdui:DisplayName xml:lang="en">{"Renamed" if number in renamed else "Test"} IdP {number}</mdui:DisplayName>
+                </mdui:UIInfo>
+            </Extensions>
+            <SingleSignOnService Binding="urn:oasis:names:tc:SAML:2.0:bindings:HTTP-Redirect" Location="https://idp{number}.example.org/sso"/>
+        </IDPSSODescriptor>
+    </EntityDescriptor>"""
+        for number in entity_numbers
+    )
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<EntitiesDescriptor xmlns="urn:oasis:names:tc:SAML:2.0:metadata" xmlns:mdui="urn:oasis:names:tc:SAML:metadata:ui" validUntil="{valid_until}">
+    <!-- A comment between the entities -->{entity_descriptors}
+</EntitiesDescriptor>
+""".encode()
+
 
 class TestSAMLMetadataLoader:
     @patch("urllib.request.urlopen")
-    def test_load_idp_metadata_raises_error_when_xml_is_incorrect(self, urlopen_mock):
-        # Arrange
+    def test_download_idp_metadata(self, urlopen_mock):
         url = "http://md.incommon.org/InCommon/metadata.xml"
-        incorrect_xml = saml_strings.EMPTY_XML
-        urlopen_response_mock = MagicMock()
-        urlopen_response_mock.read = MagicMock(return_value=incorrect_xml)
-        urlopen_mock.return_value = urlopen_response_mock
+        xml_metadata = _synthetic_federation_metadata(range(10))
+        response = io.BytesIO(xml_metadata)
+        response.headers = {"ETag": '"v2"'}
+        urlopen_mock.return_value = response
         metadata_loader = SAMLMetadataLoader()
 
-        # Act
-        with pytest.raises(SAMLMetadataLoadingError):
-            metadata_loader.load_idp_metadata(url)
+        document = metadata_loader.download_idp_metadata(url, '"v1"')
 
-    @patch("urllib.request.Request")
-    @patch("urllib.request.urlopen")
-    def test_load_idp_metadata_correctly_loads_one_descriptor(
-        self, urlopen_mock, request_mock
-    ):
-        # Arrange
-        url = "http://md.incommon.org/InCommon/metadata.xml"
-        incorrect_xml = saml_strings.CORRECT_XML_WITH_IDP_1
-        urlopen_response_mock = MagicMock()
-        urlopen_response_mock.read = MagicMock(return_value=incorrect_xml)
-        urlopen_mock.return_value = urlopen_response_mock
-        metadata_loader = SAMLMetadataLoader()
+        # The metadata is downloaded to a file, along with its new ETag.
+        assert document is not None
+        assert document.etag == '"v2"'
+        with document.file as metadata:
+            assert metadata.read() == xml_metadata
 
-        # Act
-        xml_metadata = metadata_loader.load_idp_metadata(url)
+        # The metadata service was asked for the metadata only if it changed.
+        [request] = urlopen_mock.call_args.args
+        assert request.full_url == url
+        assert request.get_header("If-none-match") == '"v1"'
 
-        # Assert
-        request_mock.assert_called_with(url, headers={})
-        urlopen_mock.assert_called_with(request_mock(), timeout=None)
-        assert saml_strings.CORRECT_XML_WITH_IDP_1 == xml_metadata
+        # Without an ETag, the metadata is downloaded unconditionally.
+        urlopen_mock.return_value = io.BytesIO(xml_metadata)
+        urlopen_mock.return_value.headers = {}
+        document = metadata_loader.download_idp_metadata(url)
+        assert document is not None
+        assert document.etag is None
+        [request] = urlopen_mock.call_args.args
+        assert not request.has_header("If-none-match")
 
-    @patch("urllib.request.Request")
     @patch("urllib.request.urlopen")
-    def test_load_idp_metadata_correctly_loads_multiple_descriptors(
-        self, urlopen_mock, request_mock
-    ):
-        # Arrange
+    def test_download_idp_metadata_not_modified(self, urlopen_mock):
         url = "http://md.incommon.org/InCommon/metadata.xml"
-        incorrect_xml = saml_strings.CORRECT_XML_WITH_MULTIPLE_IDPS
-        urlopen_response_mock = MagicMock()
-        urlopen_response_mock.read = MagicMock(return_value=incorrect_xml)
-        urlopen_mock.return_value = urlopen_response_mock
         metadata_loader = SAMLMetadataLoader()
 
-        # Act
-        xml_metadata = metadata_loader.load_idp_metadata(url)
+        urlopen_mock.side_effect = HTTPError(url, 304, "Not Modified", {}, None)
+        assert metadata_loader.download_idp_metadata(url, '"v1"') is None
 
-        # Assert
-        request_mock.assert_called_with(url, headers={})
-        urlopen_mock.assert_called_with(request_mock(), timeout=None)
-        assert saml_strings.CORRECT_XML_WITH_MULTIPLE_IDPS == xml_metadata
+        urlopen_mock.side_effect = HTTPError(url, 500, "Server Error", {}, None)
+        with pytest.raises(SAMLMetadataLoadingError):
+            metadata_loader.download_idp_metadata(url, '"v1"')
 
 
 class TestSAMLFederatedIdentityProviderLoader:
-    def test_load(self):
-        # Arrange
-        federation_type = incommon.FEDERATION_TYPE
-        federation_idp_metadata_service_url = incommon.IDP_METADATA_SERVICE_URL
-        xml_metadata = saml_strings.CORRECT_XML_WITH_MULTIPLE_IDPS
+    def test_iter_idps(self):
+        idp_loader = SAMLFederatedIdentityProviderLoader(
+            create_autospec(spec=SAMLMetadataLoader),
+            create_autospec(spec=SAMLFederatedMetadataValidator),
+            SAMLMetadataParser(),
+        )
+        entity_numbers = range(SYNTHETIC_FEDERATION_SIZE)
+
+        idps = list(
+            idp_loader.iter_idps(
+                io.BytesIO(_synthetic_federation_metadata(entity_numbers))
+            )
+        )
+
+        assert len(idps) == SYNTHETIC_FEDERATION_SIZE
+        assert idps[42].entity_id == "https://idp42.example.org/idp/shibboleth"
+        assert idps[42].display_name == "Test IdP 42"
+        assert idps[42].xml_metadata.startswith("<EntityDescriptor")
+        assert idps[42].xml_metadata.endswith("</EntityDescriptor>")
+        assert "https://idp42.example.org/sso" in idps[42].xml_metadata
 
+        # Each IdP's metadata, and so its digest, is the same every time the
+        # federation's metadata is read, unless the IdP itself changed.
+        renamed = {0, 42, SYNTHETIC_FEDERATION_SIZE - 1}
+        reloaded_idps = list(
+            idp_loader.iter_idps(
+                io.BytesIO(
+                    _synthetic_federation_metadata(entity_numbers, renamed=renamed)
+                )
+            )
+        )
+        changed = {
+            number
+            for number, (idp, reloaded_idp) in enumerate(zip(idps, reloaded_idps))
+            if idp.digest != reloaded_idp.digest
+        }
+        assert changed == renamed
+        assert reloaded_idps[42].display_name == "Renamed IdP 42"
+
+    def test_read_valid_until(self):
+        metadata = io.BytesIO(
+            _synthetic_federation_metadata(
+                range(SYNTHETIC_FEDERATION_SIZE), valid_until="2026-10-25T12:30:00Z"
+            )
+        )
+        assert SAMLFederatedIdentityProviderLoader._read_valid_until(
+            metadata
+        ) == datetime_utc(2026, 10, 25, 12, 30)
+        # The metadata can be read again afterwards.
+        assert metadata.tell() == 0
+
+        assert (
+            SAMLFederatedIdentityProviderLoader._read_valid_until(
+                io.BytesIO(saml_strings.INVALID_XML.encode())
+            )
+            is None
+        )
+
+    def test_update(self, db: DatabaseTransactionFixture):
         metadata_loader = create_autospec(spec=SAMLMetadataLoader)
         metadata_validator = create_autospec(spec=SAMLFederatedMetadataValidator)
-        metadata_parser = SAMLMetadataParser()
         idp_loader = SAMLFederatedIdentityProviderLoader(
-            metadata_loader, metadata_validator, metadata_parser
+            metadata_loader, metadata_validator, SAMLMetadataParser()
         )
-        saml_federation = SAMLFederation(
-            federation_type, federation_idp_metadata_service_url
+        federation = SAMLFederation(
+            incommon.FEDERATION_TYPE, incommon.IDP_METADATA_SERVICE_URL
+        )
+        db.session.add(federation)
+        db.session.flush()
+
+        def stored_idps() -> dict[str, SAMLFederatedIdentityProvider]:
+            return {
+                idp.entity_id: idp
+                for idp in db.session.query(SAMLFederatedIdentityProvider).filter(
+                    SAMLFederatedIdentityProvider.federation_id == federation.id
+                )
+            }
+
+        def entity_id(number: int) -> str:
+            return f"https://idp{number}.example.org/idp/shibboleth"
+
+        # The first time, every IdP in the metadata is added.
+        metadata_loader.download_idp_metadata.return_value = SAMLMetadataDocument(
+            io.BytesIO(
+                _synthetic_federation_metadata(range(SYNTHETIC_FEDERATION_SIZE))
+            ),
+            '"v1"',
         )
+        assert idp_loader.update(federation, db.session) is True
 
-        metadata_loader.load_idp_metadata = MagicMock(return_value=xml_metadata)
-        metadata_parser.parse = MagicMock(side_effect=metadata_parser.parse)
+        idps = stored_idps()
+        assert len(idps) == SYNTHETIC_FEDERATION_SIZE
+        assert idps[entity_id(42)].display_name == "Test IdP 42"
+        assert federation.metadata_etag == '"v1"'
+        assert federation.metadata_valid_until == datetime_utc(2026, 10, 25)
+        assert len(federation.identity_providers) == SYNTHETIC_FEDERATION_SIZE
+        metadata_validator.validate.assert_called_once()
+        metadata_loader.download_idp_metadata.assert_called_once_with(
+            incommon.IDP_METADATA_SERVICE_URL, None
+        )
+        idp_ids = {entity_id: idp.id for entity_id, idp in idps.items()}
 
-        # Act
-        idps = idp_loader.load(saml_federation)
+        # If the metadata service says the metadata hasn't changed since it had the
+        # ETag we stored, there is nothing to do.
+        metadata_loader.download_idp_metadata.reset_mock()
+        metadata_validator.validate.reset_mock()
+        metadata_loader.download_idp_metadata.return_value = None
+        assert idp_loader.update(federation, db.session) is False
+        metadata_loader.download_idp_metadata.assert_called_once_with(
+            incommon.IDP_METADATA_SERVICE_URL, '"v1"'
+        )
 
-        # Assert
-        assert 2 == len(idps)
+        # The same goes for metadata that is valid until the same time as before.
+        metadata_loader.download_idp_metadata.return_value = SAMLMetadataDocument(
+            io.BytesIO(
+                _synthetic_federation_metadata(
+                    range(SYNTHETIC_FEDERATION_SIZE), renamed=[42]
+                )
+            ),
+            '"v2"',
+        )
+        assert idp_loader.update(federation, db.session) is False
+        assert federation.metadata_etag == '"v2"'
+        metadata_validator.validate.assert_not_called()
+        assert stored_idps()[entity_id(42)].display_name == "Test IdP 42"
 
-        assert saml_strings.IDP_1_ENTITY_ID == idps[0].entity_id
-        assert saml_strings.IDP_1_UI_INFO_EN_DISPLAY_NAME == idps[0].display_name
-        assert saml_federation == idps[0].federation
+        # When the metadata changes, only the IdPs that were added, changed or
+        # removed are written.
+        removed = range(100)
+        renamed = range(100, 200)
+        added = range(SYNTHETIC_FEDERATION_SIZE, SYNTHETIC_FEDERATION_SIZE + 100)
+        metadata_loader.download_idp_metadata.return_value = SAMLMetadataDocument(
+            io.BytesIO(
+                _synthetic_federation_metadata(
+                    [*range(100, SYNTHETIC_FEDERATION_SIZE), *added],
+                    valid_until="2026-11-01T00:00:00Z",
+                    renamed=renamed,
+                )
+            ),
+            '"v3"',
+        )
+        with (
+            patch.object(
+                db.session,
+                "bulk_insert_mappings",
+                wraps=db.session.bulk_insert_mappings,
+            ) as bulk_insert_mappings,
+            patch.object(
+                db.session,
+                "bulk_update_mappings",
+                wraps=db.session.bulk_update_mappings,
+            ) as bulk_update_mappings,
+        ):
+            assert idp_loader.update(federation, db.session) is True
 
-        assert saml_strings.IDP_2_ENTITY_ID == idps[1].entity_id
-        assert saml_strings.IDP_2_UI_INFO_EN_DISPLAY_NAME == idps[1].display_name
-        assert saml_federation == idps[1].federation
+        assert (
+            sum(len(call.args[1]) for call in bulk_insert_mappings.call_args_list)
+            == 100
+        )
+        assert (
+            sum(len(call.args[1]) for call in bulk_update_mappings.call_args_list)
+            == 100
+        )
+        metadata_validator.validate.assert_called_once()
+        assert federation.metadata_etag == '"v3"'
+        assert federation.metadata_valid_until == datetime_utc(2026, 11, 1)
 
-        metadata_loader.load_idp_metadata.assert_called_once_with(
-            federation_idp_metadata_service_url
+        idps = stored_idps()
+        assert len(idps) == SYNTHETIC_FEDERATION_SIZE
+        assert all(entity_id(number) not in idps for number in removed)
+        assert all(entity_id(number) in idps for number in added)
+        for number in renamed:
+            idp = idps[entity_id(number)]
+            assert idp.display_name == f"Renamed IdP {number}"
+            assert idp.id == idp_ids[entity_id(number)]
+        # The unchanged IdPs are the same rows as before.
+        assert all(
+            idps[entity_id(number)].id == idp_ids[entity_id(number)]
+            for number in range(200, SYNTHETIC_FEDERATION_SIZE)
         )
-        metadata_parser.parse.assert_called_once_with(xml_metadata)
+        assert len(federation.identity_providers) == SYNTHETIC_FEDERATION_SIZE
@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock, create_autospec
+from unittest.mock import create_autospec
 
 from palace.manager.integration.patron_auth.saml.metadata.federations.loader import (
     SAMLFederatedIdentityProviderLoader,
@@ -6,12 +6,8 @@ from palace.manager.integration.patron_auth.saml.metadata.federations.loader imp
 from palace.manager.integration.patron_auth.saml.metadata.monitor import (
     SAMLMetadataMonitor,
 )
-from palace.manager.sqlalchemy.model.saml import (
-    SAMLFederatedIdentityProvider,
-    SAMLFederation,
-)
+from palace.manager.sqlalchemy.model.saml import SAMLFederation
 from tests.fixtures.database import DatabaseTransactionFixture
-from tests.mocks import saml_strings
 
 
 class TestSAMLMetadataMonitor:
@@ -20,26 +16,9 @@ class TestSAMLMetadataMonitor:
         expected_federation = SAMLFederation(
             "Test federation", "http://incommon.org/metadata"
         )
-        expected_federated_identity_providers = [
-            SAMLFederatedIdentityProvider(
-                expected_federation,
-                saml_strings.IDP_1_ENTITY_ID,
-                saml_strings.IDP_1_UI_INFO_EN_DISPLAY_NAME,
-                saml_strings.CORRECT_XML_WITH_IDP_1,
-            ),
-            SAMLFederatedIdentityProvider(
-                expected_federation,
-                saml_strings.IDP_2_ENTITY_ID,
-                saml_strings.IDP_2_UI_INFO_EN_DISPLAY_NAME,
-                saml_strings.CORRECT_XML_WITH_IDP_2,
-            ),
-        ]
-
-        db.session.add_all([expected_federation])
-        db.session.add_all(expected_federated_identity_providers)
+        db.session.add(expected_federation)
 
         loader = create_autospec(spec=SAMLFederatedIdentityProviderLoader)
-        loader.load = MagicMock(return_value=expected_federated_identity_providers)
 
         monitor = SAMLMetadataMonitor(db.session, loader)
 
@@ -47,5 +26,5 @@ class TestSAMLMetadataMonitor:
         monitor.run_once(None)
 
         # Assert
-        identity_providers = db.session.query(SAMLFederatedIdentityProvider).all()
-        assert expected_federated_identity_providers == identity_providers
+        loader.update.assert_called_once_with(expected_federation, db.session)
+        assert expected_federation.last_updated_at is not None
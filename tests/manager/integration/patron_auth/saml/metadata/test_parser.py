@@ -23,6 +23,7 @@ from palace.manager.integration.patron_auth.saml.metadata.model import (
     SAMLUIInfo,
 )
 from palace.manager.integration.patron_auth.saml.metadata.parser import (
+    SAMLMetadataCache,
     SAMLMetadataParser,
     SAMLMetadataParsingError,
     SAMLMetadataParsingResult,
@@ -1001,6 +1002,94 @@ class TestSAMLMetadataParser:
         )
 
 
+class TestSAMLMetadataCache:
+    def test_get_providers(self):
+        cache = SAMLMetadataCache()
+        parser = SAMLMetadataParser()
+        parser.parse = MagicMock(side_effect=parser.parse)
+
+        # The metadata is parsed the first time it's seen.
+        providers = cache.get_providers(saml_strings.CORRECT_XML_WITH_IDP_1, parser)
+        assert [provider.entity_id for provider in providers] == [
+            saml_strings.IDP_1_ENTITY_ID
+        ]
+        parser.parse.assert_called_once_with(saml_strings.CORRECT_XML_WITH_IDP_1)
+
+        # After that, the same providers come from the cache.
+        parser.parse.reset_mock()
+        assert (
+            cache.get_providers(saml_strings.CORRECT_XML_WITH_IDP_1, parser)
+            == providers
+        )
+        assert (
+            cache.get_providers(
+                saml_strings.CORRECT_XML_WITH_IDP_1, SAMLMetadataParser()
+            )
+            == providers
+        )
+        parser.parse.assert_not_called()
+
+        # Changing the list that's returned doesn't change what is cached.
+        providers.clear()
+        assert (
+            len(cache.get_providers(saml_strings.CORRECT_XML_WITH_IDP_1, parser)) == 1
+        )
+
+    def test_get_providers_metadata_changed(self):
+        cache = SAMLMetadataCache()
+        parser = SAMLMetadataParser()
+        parser.parse = MagicMock(side_effect=parser.parse)
+
+        cache.get_providers(saml_strings.CORRECT_XML_WITH_IDP_1, parser)
+
+        # When the metadata changes, the new metadata is parsed, even if it's for
+        # the same IdP.
+        changed_metadata = saml_strings.CORRECT_XML_WITH_IDP_1.replace(
+            saml_strings.IDP_1_SSO_URL, "http://idp1.hilbertteam.net/new/SSO"
+        )
+        [provider] = cache.get_providers(changed_metadata, parser)
+        assert provider.entity_id == saml_strings.IDP_1_ENTITY_ID
+        assert provider.sso_service.url == "http://idp1.hilbertteam.net/new/SSO"
+        assert parser.parse.call_count == 2
+
+        # Clearing the cache means everything is parsed again.
+        cache.clear()
+        assert len(cache) == 0
+        cache.get_providers(changed_metadata, parser)
+        assert parser.parse.call_count == 3
+
+    def test_get_providers_least_recently_used(self):
+        cache = SAMLMetadataCache(max_size=2)
+        parser = SAMLMetadataParser()
+        parser.parse = MagicMock(side_effect=parser.parse)
+
+        cache.get_providers(saml_strings.CORRECT_XML_WITH_IDP_1, parser)
+        cache.get_providers(saml_strings.CORRECT_XML_WITH_IDP_2, parser)
+        # Using the first IdP's metadata makes the second the least recently used.
+        cache.get_providers(saml_strings.CORRECT_XML_WITH_IDP_1, parser)
+        cache.get_providers(saml_strings.CORRECT_XML_WITH_MULTIPLE_IDPS, parser)
+        assert len(cache) == 2
+        assert parser.parse.call_count == 3
+
+        # So it's the second IdP's metadata that was evicted.
+        cache.get_providers(saml_strings.CORRECT_XML_WITH_IDP_1, parser)
+        assert parser.parse.call_count == 3
+        cache.get_providers(saml_strings.CORRECT_XML_WITH_IDP_2, parser)
+        assert parser.parse.call_count == 4
+
+    def test_get_providers_parsing_error(self):
+        cache = SAMLMetadataCache()
+        parser = SAMLMetadataParser()
+
+        # Metadata that can't be parsed isn't cached.
+        with pytest.raises(SAMLMetadataParsingError):
+            cache.get_providers(
+                saml_strings.INCORRECT_XML_WITH_ONE_IDP_METADATA_WITHOUT_SSO_SERVICE,
+                parser,
+            )
+        assert len(cache) == 0
+
+
 class TestSAMLSubjectParser:
     @pytest.mark.parametrize(
         "idp,name_id_format,name_id_nq,name_id_spnq,name_id,attributes,expected_result",
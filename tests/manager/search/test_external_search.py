@@ -47,7 +47,7 @@ class TestExternalSearch:
                 self.query_works_multi_calls = []
                 self.queued_results = []
 
-            def query_works_multi(self, queries, debug=False):
+            def query_works_multi(self, queries, debug=False, ids_only=False):
                 self.query_works_multi_calls.append((queries, debug))
                 return self.queued_results.pop()
 
@@ -88,6 +88,32 @@ class TestExternalSearch:
         assert pagination.offset == default.offset
         assert pagination.size == default.size
 
+    def test_query_work_ids(
+        self,
+        end_to_end_search_fixture: EndToEndSearchFixture,
+        db: DatabaseTransactionFixture,
+    ):
+        duck_life = db.work(
+            title="Moby's life as a Duck", with_open_access_download=True
+        )
+        moby_dick = db.work(title="Moby Dick", with_open_access_download=True)
+        db.work(title="Treasure Island", with_open_access_download=True)
+        index = end_to_end_search_fixture.external_search_index
+        end_to_end_search_fixture.populate_search_index()
+
+        # Only the IDs of the matching works come back, and the pagination
+        # object is told about the page that was loaded.
+        pagination = Pagination(size=10)
+        work_ids = index.query_work_ids("Moby", pagination=pagination)
+        assert sorted(work_ids) == sorted([duck_life.id, moby_dick.id])
+        assert pagination.this_page_size == 2
+
+        # The search doesn't ask for any of the documents' source.
+        search = index.create_search_doc(
+            "Moby", filter=None, pagination=pagination, debug=False, ids_only=True
+        )
+        assert search.to_dict()["_source"] is False
+
     def test_remove_work(
         self,
         end_to_end_search_fixture: EndToEndSearchFixture,
@@ -184,6 +184,54 @@ class TestService:
             "properties": mappings.serialize_properties()
         }
 
+    def test_index_submit_documents_parallel(
+        self, external_search_fixture: ExternalSearchFixture
+    ):
+        """Submitting documents from several bulk workers indexes all of them."""
+        service = external_search_fixture.service
+        revision = MockSearchSchemaRevision(23)
+        revision.mapping_document().properties["x"] = LONG
+        service.index_create(revision)
+        service.write_pointer_set(revision)
+
+        documents: list[SearchDocument] = [
+            {"_id": x, "_source": {"x": x}} for x in range(1, 11)
+        ]
+        assert service.index_submit_documents(documents, thread_count=4) == []
+
+        name = revision.name_for_index(external_search_fixture.index_prefix)
+        service.index_refresh(name)
+        assert external_search_fixture.write_client.count(index=name)["count"] == 10
+
+    def test_index_update_settings(
+        self, external_search_fixture: ExternalSearchFixture
+    ):
+        """Index settings can be changed, and reset by setting them to None."""
+        service = external_search_fixture.service
+        revision = MockSearchSchemaRevision(23)
+        service.index_create(revision)
+        name = revision.name_for_index(external_search_fixture.index_prefix)
+        indices = external_search_fixture.write_client.indices
+
+        def index_settings() -> dict[str, str]:
+            settings: dict[str, str] = indices.get_settings(index=name)[name][
+                "settings"
+            ]["index"]
+            return settings
+
+        service.index_update_settings(
+            name, {"refresh_interval": "-1", "number_of_replicas": 0}
+        )
+        assert index_settings()["refresh_interval"] == "-1"
+        assert index_settings()["number_of_replicas"] == "0"
+
+        service.index_update_settings(name, {"refresh_interval": None})
+        assert "refresh_interval" not in index_settings()
+
+        # Neither of these change the settings, they just have to be accepted.
+        service.index_refresh(name)
+        service.index_force_merge(name)
+
     def test_read_clients_use_dedicated_read_client(self):
         """The read search/multi-search clients are built on the read client.
 
@@ -8,7 +8,10 @@ from freezegun import freeze_time
 from palace.util.datetime_helpers import datetime_utc, utc_now
 
 from palace.manager.service.analytics.eventdata import AnalyticsEventData
-from palace.manager.service.analytics.local import LocalAnalyticsProvider
+from palace.manager.service.analytics.local import (
+    CirculationEventBuffer,
+    LocalAnalyticsProvider,
+)
 from palace.manager.sqlalchemy.model.circulationevent import CirculationEvent
 
 if TYPE_CHECKING:
@@ -146,3 +149,112 @@ class TestLocalAnalyticsProvider:
             assert pool == event.license_pool
             assert library == event.library
             assert -2 == event.delta
+
+    def test_collect_buffers_events(
+        self,
+        db: DatabaseTransactionFixture,
+        local_analytics_provider_fixture: LocalAnalyticsProviderFixture,
+    ) -> None:
+        provider = local_analytics_provider_fixture.provider
+        pool = db.licensepool(edition=None)
+        library = db.default_library()
+        start = datetime_utc(2019, 1, 1)
+
+        def event_data(
+            event_type: str, old_value: int, new_value: int
+        ) -> AnalyticsEventData:
+            return AnalyticsEventData.create(
+                library=library,
+                license_pool=pool,
+                event_type=event_type,
+                time=start,
+                old_value=old_value,
+                new_value=new_value,
+            )
+
+        provider.collect(
+            event_data(CirculationEvent.DISTRIBUTOR_CHECKOUT, 10, 8), db.session
+        )
+        provider.collect(
+            event_data(CirculationEvent.DISTRIBUTOR_CHECKIN, 8, 10), db.session
+        )
+        # This duplicates the first event, so it's ignored.
+        provider.collect(
+            event_data(CirculationEvent.DISTRIBUTOR_CHECKOUT, 500, 200), db.session
+        )
+
+        # Nothing has been written yet.
+        buffer = CirculationEventBuffer.for_session(db.session)
+        assert len(buffer) == 2
+
+        # The events are written when the session commits.
+        db.session.commit()
+        assert len(buffer) == 0
+        events = (
+            db.session.query(CirculationEvent).order_by(CirculationEvent.type).all()
+        )
+        assert [(e.type, e.old_value, e.new_value, e.delta) for e in events] == [
+            (CirculationEvent.DISTRIBUTOR_CHECKIN, 8, 10, 2),
+            (CirculationEvent.DISTRIBUTOR_CHECKOUT, 10, 8, -2),
+        ]
+
+        # Events that were already recorded by an earlier commit are ignored too,
+        # and the recorded events are unchanged.
+        provider.collect(
+            event_data(CirculationEvent.DISTRIBUTOR_CHECKIN, 1, 2), db.session
+        )
+        provider.collect(
+            event_data(CirculationEvent.DISTRIBUTOR_HOLD_PLACE, 1, 2), db.session
+        )
+        db.session.commit()
+        db.session.expire_all()
+        events = (
+            db.session.query(CirculationEvent).order_by(CirculationEvent.type).all()
+        )
+        assert [(e.type, e.old_value, e.new_value) for e in events] == [
+            (CirculationEvent.DISTRIBUTOR_CHECKIN, 8, 10),
+            (CirculationEvent.DISTRIBUTOR_CHECKOUT, 10, 8),
+            (CirculationEvent.DISTRIBUTOR_HOLD_PLACE, 1, 2),
+        ]
+
+    def test_collect_rollback(
+        self,
+        db: DatabaseTransactionFixture,
+        local_analytics_provider_fixture: LocalAnalyticsProviderFixture,
+    ) -> None:
+        pool = db.licensepool(edition=None)
+        local_analytics_provider_fixture.provider.collect(
+            AnalyticsEventData.create(
+                db.default_library(), pool, CirculationEvent.DISTRIBUTOR_CHECKOUT
+            ),
+            db.session,
+        )
+        assert len(CirculationEventBuffer.for_session(db.session)) == 1
+
+        # Buffered events are dropped along with the rest of the transaction.
+        db.session.rollback()
+        assert len(CirculationEventBuffer.for_session(db.session)) == 0
+        assert db.session.query(CirculationEvent).count() == 0
+
+    def test_collect_without_license_pool(
+        self,
+        db: DatabaseTransactionFixture,
+        local_analytics_provider_fixture: LocalAnalyticsProviderFixture,
+    ) -> None:
+        # Events without a license pool are written straight away, since
+        # ON CONFLICT can't spot duplicates of them.
+        start = datetime_utc(2019, 1, 1)
+        for _ in range(2):
+            local_analytics_provider_fixture.provider.collect(
+                AnalyticsEventData.create(
+                    db.default_library(),
+                    None,
+                    CirculationEvent.NEW_PATRON,
+                    start,
+                ),
+                db.session,
+            )
+        assert len(CirculationEventBuffer.for_session(db.session)) == 0
+        [event] = db.session.query(CirculationEvent).all()
+        assert event.license_pool is None
+        assert event.type == CirculationEvent.NEW_PATRON
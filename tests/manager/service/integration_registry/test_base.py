@@ -1,3 +1,10 @@
+import importlib
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from json import JSONDecoder, JSONEncoder
+from types import ModuleType
 from typing import Any
 from unittest.mock import MagicMock
 
@@ -111,6 +118,99 @@ def test_registry_register_multiple_classes(registry: IntegrationRegistry):
     assert len(registry) == 3
 
 
+def test_registry_register_lazy(registry: IntegrationRegistry):
+    """Test that register_lazy() only imports an integration once it's used."""
+    registry.register_lazy(
+        "json.decoder:JSONDecoder", canonical="decoder", aliases=["json"]
+    )
+    registry.register_lazy("json.encoder:JSONEncoder")
+
+    # Nothing has been imported yet, but the integrations are there.
+    assert registry._lookup == {}
+    assert len(registry) == 2
+    assert "decoder" in registry
+    assert "JSONDecoder" in registry
+    assert "JSONEncoder" in registry
+    assert "other" not in registry
+
+    # Looking up a protocol imports just that integration.
+    assert registry["json"] is JSONDecoder
+    assert registry._lazy_lookup == {"JSONEncoder": "json.encoder:JSONEncoder"}
+    assert registry.get_protocols(JSONDecoder) == ["decoder", "json", "JSONDecoder"]
+    assert len(registry) == 2
+
+    # So does looking up the protocol of an integration.
+    assert registry.get_protocol(JSONEncoder) == "JSONEncoder"
+    assert registry._lazy_lookup == {}
+
+    # Anything that needs every integration imports them all.
+    registry.register_lazy("collections:OrderedDict")
+    assert OrderedDict in registry.integrations
+    assert registry._lazy_lookup == {}
+
+
+def test_registry_register_lazy_threads(
+    registry: IntegrationRegistry, monkeypatch: pytest.MonkeyPatch
+):
+    """Two threads can look up a lazily registered integration at the same time."""
+    registry.register_lazy(
+        "json.decoder:JSONDecoder", canonical="decoder", aliases=["json"]
+    )
+
+    # Importing the module is slow, so both threads find the integration still
+    # waiting to be loaded.
+    import_module = importlib.import_module
+
+    def slow_import_module(name: str) -> ModuleType:
+        time.sleep(0.1)
+        return import_module(name)
+
+    monkeypatch.setattr(importlib, "import_module", slow_import_module)
+
+    barrier = threading.Barrier(2)
+
+    def lookup(protocol: str) -> type:
+        barrier.wait()
+        return registry[protocol]
+
+    with ThreadPoolExecutor(2) as executor:
+        results = list(executor.map(lookup, ["decoder", "json"]))
+
+    assert results == [JSONDecoder, JSONDecoder]
+    assert registry._lazy_lookup == {}
+    assert registry.get_protocols(JSONDecoder) == ["decoder", "json", "JSONDecoder"]
+
+
+def test_registry_register_lazy_errors(registry: IntegrationRegistry):
+    with pytest.raises(RegistrationException, match="Invalid import path"):
+        registry.register_lazy("json.decoder.JSONDecoder")
+
+    registry.register_lazy("json.decoder:JSONDecoder", canonical="json")
+    registry.register(list, canonical="list")
+
+    # A protocol can't be registered to two integrations, whether or not they've been
+    # imported.
+    with pytest.raises(RegistrationException, match="json already registered"):
+        registry.register_lazy("json.encoder:JSONEncoder", canonical="json")
+    with pytest.raises(RegistrationException, match="json already registered"):
+        registry.register(dict, canonical="json")
+    with pytest.raises(RegistrationException, match="list already registered"):
+        registry.register_lazy("collections:OrderedDict", canonical="list")
+
+    # But registering the same integration again is fine.
+    registry.register_lazy("json.decoder:JSONDecoder", canonical="json")
+    registry.register(JSONDecoder, canonical="json")
+    assert registry._lazy_lookup == {}
+    assert registry["json"] is JSONDecoder
+
+    # An integration that can't be imported fails when it's looked up, and stays
+    # registered.
+    registry.register_lazy("json.decoder:Missing")
+    with pytest.raises(AttributeError):
+        registry["Missing"]
+    assert "Missing" in registry
+
+
 def test_registry_get_returns_default_if_name_not_registered(
     registry: IntegrationRegistry,
 ):
@@ -224,6 +324,26 @@ def test_registry_update():
     assert registry.get("list") == list
 
 
+def test_registry_update_lazy():
+    """Test that update() and add() keep lazily registered integrations lazy."""
+    registry = IntegrationRegistry(Goals.PATRON_AUTH_GOAL)
+    registry2 = IntegrationRegistry(Goals.PATRON_AUTH_GOAL)
+
+    registry.register(object)
+    registry2.register_lazy("json.decoder:JSONDecoder", canonical="json")
+
+    registry3 = registry + registry2
+    assert len(registry3) == 2
+    assert registry3._lazy_lookup == {
+        "json": "json.decoder:JSONDecoder",
+        "JSONDecoder": "json.decoder:JSONDecoder",
+    }
+    assert registry3["json"] is JSONDecoder
+
+    # The original registry is unchanged.
+    assert registry2._lookup == {}
+
+
 def test_registry_update_raises_different_goals():
     """Test that update() raises an error if the goals are different."""
     registry = IntegrationRegistry(Goals.PATRON_AUTH_GOAL)
@@ -0,0 +1,14 @@
+"""Tests for catalog services integration registry."""
+
+from palace.manager.integration.catalog.marc.exporter import MarcExporter
+from palace.manager.service.integration_registry.catalog_services import (
+    CatalogServicesRegistry,
+)
+
+
+class TestCatalogServicesRegistry:
+    def test_canonical_names(self):
+        """The canonical names the integrations are registered under lazily are the
+        protocols existing integrations are stored with, so they must not change."""
+        registry = CatalogServicesRegistry()
+        assert dict(registry) == {"MarcExporter": MarcExporter}
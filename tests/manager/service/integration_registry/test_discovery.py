@@ -0,0 +1,16 @@
+"""Tests for discovery integration registry."""
+
+from palace.manager.integration.discovery.opds_registration import (
+    OpdsRegistrationService,
+)
+from palace.manager.service.integration_registry.discovery import DiscoveryRegistry
+
+
+class TestDiscoveryRegistry:
+    def test_canonical_names_are_labels(self):
+        """The canonical names the integrations are registered under lazily are
+        their labels."""
+        registry = DiscoveryRegistry()
+        assert dict(registry) == {"OPDS Registration": OpdsRegistrationService}
+        for protocol, integration in registry:
+            assert protocol == integration.label()
@@ -0,0 +1,15 @@
+"""Tests for license providers integration registry."""
+
+from palace.manager.service.integration_registry.license_providers import (
+    LicenseProvidersRegistry,
+)
+
+
+class TestLicenseProvidersRegistry:
+    def test_canonical_names_are_labels(self):
+        """The canonical names the integrations are registered under lazily are
+        their labels."""
+        registry = LicenseProvidersRegistry()
+        assert len(registry) == 7
+        for protocol, integration in registry:
+            assert protocol == integration.label()
@@ -0,0 +1,16 @@
+"""Tests for metadata services integration registry."""
+
+from palace.manager.integration.metadata.novelist import NoveListAPI
+from palace.manager.integration.metadata.nyt import NYTBestSellerAPI
+from palace.manager.service.integration_registry.metadata import MetadataRegistry
+
+
+class TestMetadataRegistry:
+    def test_canonical_names(self):
+        """The canonical names the integrations are registered under lazily are the
+        protocols existing integrations are stored with, so they must not change."""
+        registry = MetadataRegistry()
+        assert dict(registry) == {
+            "New York Times": NYTBestSellerAPI,
+            "NoveList Select": NoveListAPI,
+        }
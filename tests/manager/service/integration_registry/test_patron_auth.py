@@ -1,8 +1,30 @@
 """Tests for patron authentication integration registry."""
 
+from palace.manager.integration.patron_auth.anonymous_authentication import (
+    AnonymousAuthenticationProvider,
+)
+from palace.manager.integration.patron_auth.kansas_patron import (
+    KansasAuthenticationAPI,
+)
+from palace.manager.integration.patron_auth.millenium_patron import MilleniumPatronAPI
+from palace.manager.integration.patron_auth.minimal_authentication import (
+    MinimalAuthenticationProvider,
+)
 from palace.manager.integration.patron_auth.oidc.provider import (
     OIDCAuthenticationProvider,
 )
+from palace.manager.integration.patron_auth.saml.provider import (
+    SAMLWebSSOAuthenticationProvider,
+)
+from palace.manager.integration.patron_auth.simple_authentication import (
+    SimpleAuthenticationProvider,
+)
+from palace.manager.integration.patron_auth.sip2.provider import (
+    SIP2AuthenticationProvider,
+)
+from palace.manager.integration.patron_auth.sirsidynix_authentication_provider import (
+    SirsiDynixHorizonAuthenticationProvider,
+)
 from palace.manager.service.integration_registry.patron_auth import PatronAuthRegistry
 
 
@@ -13,3 +35,19 @@ class TestPatronAuthRegistry:
 
         assert registry["api.oidc.provider"] == OIDCAuthenticationProvider
         assert registry["OIDCAuthenticationProvider"] == OIDCAuthenticationProvider
+
+    def test_canonical_names(self):
+        """The canonical names the integrations are registered under lazily are the
+        protocols existing integrations are stored with, so they must not change."""
+        registry = PatronAuthRegistry()
+        assert dict(registry) == {
+            "api.simple_authentication": SimpleAuthenticationProvider,
+            "api.minimal_authentication": MinimalAuthenticationProvider,
+            "api.millenium_patron": MilleniumPatronAPI,
+            "api.sip": SIP2AuthenticationProvider,
+            "api.kansas_patron": KansasAuthenticationAPI,
+            "api.oidc.provider": OIDCAuthenticationProvider,
+            "api.saml.provider": SAMLWebSSOAuthenticationProvider,
+            "api.sirsidynix_authentication_provider": SirsiDynixHorizonAuthenticationProvider,
+            "api.anonymous_authentication": AnonymousAuthenticationProvider,
+        }
@@ -0,0 +1,57 @@
+import datetime
+
+import pytest
+
+from palace.util.datetime_helpers import utc_now
+
+from palace.manager.service.redis.models.crawlable_feed import (
+    CrawlableFeedSnapshot,
+    PublishedSnapshot,
+)
+from tests.fixtures.redis import RedisFixture
+
+
+class TestCrawlableFeedSnapshot:
+    def test_publish(self, redis_fixture: RedisFixture) -> None:
+        snapshot = CrawlableFeedSnapshot(redis_fixture.client, "library-1")
+
+        # Nothing has been published yet.
+        assert snapshot.published() is None
+        assert snapshot.page_fingerprints() == {}
+
+        generated = utc_now()
+        snapshot.publish({0: "a", 1: "b", 2: "c"}, generated)
+        assert snapshot.published() == PublishedSnapshot(
+            generated=generated, page_count=3
+        )
+        assert snapshot.page_fingerprints() == {0: "a", 1: "b", 2: "c"}
+
+        # Publishing again replaces the whole manifest, including any pages the new
+        # snapshot doesn't have.
+        later = generated + datetime.timedelta(hours=1)
+        snapshot.publish({0: "d"}, later)
+        assert snapshot.published() == PublishedSnapshot(generated=later, page_count=1)
+        assert snapshot.page_fingerprints() == {0: "d"}
+
+    def test_publish_naive_timestamp(self, redis_fixture: RedisFixture) -> None:
+        snapshot = CrawlableFeedSnapshot(redis_fixture.client, "library-1")
+        with pytest.raises(ValueError, match="must be timezone aware"):
+            snapshot.publish({0: "a"}, datetime.datetime.now())
+        assert snapshot.published() is None
+
+    def test_feeds_are_independent(self, redis_fixture: RedisFixture) -> None:
+        library = CrawlableFeedSnapshot(redis_fixture.client, "library-1")
+        collection = CrawlableFeedSnapshot(redis_fixture.client, "collection-1")
+
+        library.publish({0: "a"}, utc_now())
+        assert collection.published() is None
+        assert collection.page_fingerprints() == {}
+
+    def test_delete(self, redis_fixture: RedisFixture) -> None:
+        snapshot = CrawlableFeedSnapshot(redis_fixture.client, "list-1")
+        assert snapshot.delete() is False
+
+        snapshot.publish({0: "a"}, utc_now())
+        assert snapshot.delete() is True
+        assert snapshot.published() is None
+        assert snapshot.page_fingerprints() == {}
@@ -0,0 +1,99 @@
+import datetime
+
+import pytest
+
+from palace.util.datetime_helpers import utc_now
+
+from palace.manager.data_layer.identifier import IdentifierData
+from palace.manager.service.redis.models.novelist import NoveListRecommendationCache
+from palace.manager.sqlalchemy.model.identifier import Identifier
+from tests.fixtures.redis import RedisFixture
+
+
+class TestNoveListRecommendationCache:
+    def test_set_and_get(self, redis_fixture: RedisFixture) -> None:
+        cache = NoveListRecommendationCache(redis_fixture.client, 1)
+        recommendations = [
+            IdentifierData(type=Identifier.ISBN, identifier="9780061122415"),
+            IdentifierData(type=Identifier.ISBN, identifier="9780451524935"),
+        ]
+
+        # Nothing is cached yet.
+        assert cache.get(10) is None
+
+        fetched = utc_now()
+        cache.set(10, recommendations, fetched)
+        cached = cache.get(10)
+        assert cached is not None
+        assert cached.recommendations == recommendations
+        assert cached.fetched == fetched
+        assert cached.fresh is True
+
+        # Entries are kept per library and per identifier.
+        assert cache.get(11) is None
+        assert NoveListRecommendationCache(redis_fixture.client, 2).get(10) is None
+
+        # The entry expires once it's too old to be served even stale.
+        ttl = redis_fixture.client.ttl(cache._key(10))
+        assert 0 < ttl <= NoveListRecommendationCache.EXPIRES_AFTER.total_seconds()
+
+        assert cache.delete(10) is True
+        assert cache.get(10) is None
+        assert cache.delete(10) is False
+
+    def test_freshness(self, redis_fixture: RedisFixture) -> None:
+        cache = NoveListRecommendationCache(redis_fixture.client, 1)
+        recommendations = [
+            IdentifierData(type=Identifier.ISBN, identifier="9780061122415")
+        ]
+
+        # Recommendations looked up a couple of hours ago are still fresh.
+        cache.set(10, recommendations, utc_now() - datetime.timedelta(hours=2))
+        cached = cache.get(10)
+        assert cached is not None
+        assert cached.fresh is True
+
+        # But finding no recommendations a couple of hours ago isn't.
+        cache.set(10, [], utc_now() - datetime.timedelta(hours=2))
+        cached = cache.get(10)
+        assert cached is not None
+        assert cached.recommendations == []
+        assert cached.fresh is False
+
+        # Recommendations looked up a couple of days ago are stale, but can still be
+        # served.
+        cache.set(10, recommendations, utc_now() - datetime.timedelta(days=2))
+        cached = cache.get(10)
+        assert cached is not None
+        assert cached.recommendations == recommendations
+        assert cached.fresh is False
+
+    def test_set_naive_timestamp(self, redis_fixture: RedisFixture) -> None:
+        cache = NoveListRecommendationCache(redis_fixture.client, 1)
+        with pytest.raises(ValueError, match="must be timezone aware"):
+            cache.set(10, [], datetime.datetime.now())
+        assert cache.get(10) is None
+
+    def test_claim_refresh(self, redis_fixture: RedisFixture) -> None:
+        cache = NoveListRecommendationCache(redis_fixture.client, 1)
+
+        # Only one caller gets to claim the refresh of an entry.
+        assert cache.claim_refresh(10) is True
+        assert cache.claim_refresh(10) is False
+        assert cache.claim_refresh(11) is True
+
+        # The claim doesn't last forever, in case the refresh never happens.
+        ttl = redis_fixture.client.ttl(cache._refresh_key(10))
+        assert (
+            0
+            < ttl
+            <= NoveListRecommendationCache.REFRESH_CLAIM_EXPIRES_AFTER.total_seconds()
+        )
+
+        # Once released, it can be claimed again.
+        cache.release_refresh(10)
+        assert cache.claim_refresh(10) is True
+
+        # Caching new recommendations releases the claim too.
+        cache.set(10, [])
+        assert cache.claim_refresh(10) is True
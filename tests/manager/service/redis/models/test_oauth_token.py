@@ -0,0 +1,143 @@
+import datetime
+from unittest.mock import MagicMock
+
+import pytest
+from freezegun import freeze_time
+from redis import RedisError
+
+from palace.manager.api.model.token import OAuthTokenResponse
+from palace.manager.service.redis.models.lock import RedisLock
+from palace.manager.service.redis.models.oauth_token import OAuthTokenCache
+from tests.fixtures.redis import RedisFixture
+
+
+def token(access_token: str, expires_in: int = 3600) -> OAuthTokenResponse:
+    return OAuthTokenResponse(
+        access_token=access_token, expires_in=expires_in, token_type="Bearer"
+    )
+
+
+class TestOAuthTokenCache:
+    def test_set_and_get(self, redis_fixture: RedisFixture) -> None:
+        cache = OAuthTokenCache(redis_fixture.client, "http://feed", "user")
+
+        # Nothing is cached yet.
+        assert cache.get() is None
+
+        cached_token = token("abc")
+        cache.set(cached_token)
+        cached = cache.get()
+        assert cached is not None
+        assert cached.access_token == "abc"
+        assert cached.expires == cached_token.expires
+
+        # Tokens are kept per feed and per username.
+        assert (
+            OAuthTokenCache(redis_fixture.client, "http://feed", "other").get() is None
+        )
+        assert (
+            OAuthTokenCache(redis_fixture.client, "http://other", "user").get() is None
+        )
+        assert OAuthTokenCache(redis_fixture.client, "http://feed", "user").get()
+
+        # The token is only kept until it expires.
+        ttl = redis_fixture.client.ttl(cache._key())
+        assert 0 < ttl <= 3600 * 0.95
+
+        # The username isn't stored in the key.
+        assert "user" not in cache._key().removeprefix(redis_fixture.key_prefix)
+
+    def test_get_expired(self, redis_fixture: RedisFixture) -> None:
+        cache = OAuthTokenCache(redis_fixture.client, "http://feed", "user")
+        with freeze_time() as frozen_time:
+            cache.set(token("abc", expires_in=100))
+            assert cache.get() is not None
+
+            # Even if Redis hasn't dropped it yet, an expired token isn't used.
+            frozen_time.tick(datetime.timedelta(seconds=100))
+            assert cache.get() is None
+
+        # A token that has already expired isn't cached at all.
+        with freeze_time(datetime.timedelta(seconds=-100)):
+            expired = token("expired", expires_in=50)
+        cache.set(expired)
+        assert redis_fixture.client.get(cache._key()) is None
+
+    def test_token_url(self, redis_fixture: RedisFixture) -> None:
+        cache = OAuthTokenCache(redis_fixture.client, "http://feed", "user")
+        assert cache.get_token_url() is None
+
+        cache.set_token_url("http://token")
+        assert cache.get_token_url() == "http://token"
+        ttl = redis_fixture.client.ttl(cache._key("TokenUrl"))
+        assert 0 < ttl <= OAuthTokenCache.TOKEN_URL_EXPIRES_AFTER.total_seconds()
+
+    def test_refresh(self, redis_fixture: RedisFixture) -> None:
+        cache = OAuthTokenCache(redis_fixture.client, "http://feed", "user")
+        fetch = MagicMock(side_effect=[token("first"), token("second")])
+
+        # With nothing cached, a token is fetched and cached.
+        first = cache.refresh(fetch)
+        assert first.access_token == "first"
+        assert fetch.call_count == 1
+        cached = cache.get()
+        assert cached is not None
+        assert cached.access_token == "first"
+
+        # If a valid token is cached by the time we hold the lock, it's used rather
+        # than fetching another one.
+        assert cache.refresh(fetch).access_token == "first"
+        assert fetch.call_count == 1
+
+        # Unless it's the token the caller wants replaced.
+        second = cache.refresh(fetch, rejected=first)
+        assert second.access_token == "second"
+        assert fetch.call_count == 2
+        cached = cache.get()
+        assert cached is not None
+        assert cached.access_token == "second"
+
+        # Another caller still holding the first token gets the second one,
+        # without another fetch.
+        assert cache.refresh(fetch, rejected=first).access_token == "second"
+        assert fetch.call_count == 2
+
+        # The lock isn't held once the refresh is done.
+        lock = RedisLock(
+            redis_fixture.client, ["OAuthTokenCache", cache._id, "Refresh"]
+        )
+        assert not lock.locked()
+
+    def test_refresh_lock_timeout(
+        self, redis_fixture: RedisFixture, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        cache = OAuthTokenCache(redis_fixture.client, "http://feed", "user")
+        monkeypatch.setattr(OAuthTokenCache, "LOCK_WAIT_SECONDS", 0.1)
+
+        # Something else is refreshing the token and never finishes.
+        lock = RedisLock(
+            redis_fixture.client, ["OAuthTokenCache", cache._id, "Refresh"]
+        )
+        assert lock.acquire()
+
+        # After waiting a while, we fetch a token anyway, and leave the other lock
+        # alone.
+        fetch = MagicMock(return_value=token("abc"))
+        assert cache.refresh(fetch).access_token == "abc"
+        fetch.assert_called_once()
+        assert lock.locked(by_us=True)
+
+    def test_redis_unavailable(self) -> None:
+        redis_client = MagicMock()
+        redis_client.get_key.return_value = "key"
+        redis_client.get.side_effect = RedisError("down")
+        redis_client.set.side_effect = RedisError("down")
+        redis_client.register_script.return_value.side_effect = RedisError("down")
+        cache = OAuthTokenCache(redis_client, "http://feed", "user")
+
+        # The cache acts as if it's empty, and tokens are fetched directly.
+        assert cache.get() is None
+        assert cache.get_token_url() is None
+        cache.set(token("abc"))
+        cache.set_token_url("http://token")
+        assert cache.refresh(lambda: token("abc")).access_token == "abc"
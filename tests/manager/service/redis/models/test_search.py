@@ -2,7 +2,10 @@ import pytest
 
 from palace.util.log import LogLevel
 
-from palace.manager.service.redis.models.search import WaitingForIndexing
+from palace.manager.service.redis.models.search import (
+    CustomListIndexing,
+    WaitingForIndexing,
+)
 from tests.fixtures.database import DatabaseTransactionFixture
 from tests.fixtures.redis import RedisFixture
 
@@ -53,6 +56,18 @@ class TestIndexingNeededSet:
 
         assert waiting_for_indexing_fixture.get(2) == {1, work.id}
 
+    def test_add_many(
+        self,
+        waiting_for_indexing_fixture: WaitingForIndexingFixture,
+    ):
+        # Adding nothing doesn't touch redis at all.
+        assert waiting_for_indexing_fixture.waiting.add_many([]) == 0
+
+        # The number of works that weren't already waiting is returned.
+        assert waiting_for_indexing_fixture.waiting.add(1) is True
+        assert waiting_for_indexing_fixture.waiting.add_many([1, 2, 3]) == 2
+        assert waiting_for_indexing_fixture.get(5) == {1, 2, 3}
+
     def test_pop(
         self,
         waiting_for_indexing_fixture: WaitingForIndexingFixture,
@@ -120,3 +135,40 @@ class TestIndexingNeededSet:
         # Remove the works from the set
         waiting_for_indexing_fixture.waiting.remove([2, 3, 10])
         assert waiting_for_indexing_fixture.get(3) == set()
+
+    def test_waiting(self, waiting_for_indexing_fixture: WaitingForIndexingFixture):
+        waiting = waiting_for_indexing_fixture.waiting
+        assert waiting.waiting([]) == set()
+        assert waiting.waiting([1, 2]) == set()
+
+        waiting.add_many([1, 3])
+        assert waiting.waiting([1, 2, 3]) == {1, 3}
+
+
+class TestCustomListIndexing:
+    def test_pending(
+        self,
+        waiting_for_indexing_fixture: WaitingForIndexingFixture,
+        redis_fixture: RedisFixture,
+    ):
+        indexing = CustomListIndexing(redis_fixture.client, 5)
+        assert indexing._key.endswith("Search::CustomListIndexing::5")
+        assert indexing.pending() == 0
+
+        # Nothing is pending for works that aren't waiting to be indexed.
+        waiting_for_indexing_fixture.waiting.add_many([1, 2, 3])
+        indexing.add([])
+        indexing.add([1, 2, 3, 4])
+        assert 0 < redis_fixture.client.ttl(indexing._key) <= 3600
+        assert indexing.pending() == 3
+
+        # Other lists keep track of their own works.
+        assert CustomListIndexing(redis_fixture.client, 6).pending() == 0
+
+        # As the works are picked up for indexing, they stop being pending, and
+        # are forgotten.
+        waiting_for_indexing_fixture.waiting.remove([1, 2])
+        assert indexing.pending() == 1
+        waiting_for_indexing_fixture.waiting.remove([3])
+        assert indexing.pending() == 0
+        assert redis_fixture.client.smembers(indexing._key) == set()
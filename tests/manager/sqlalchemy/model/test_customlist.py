@@ -137,6 +137,65 @@ class TestCustomList:
         assert True == (entry.most_recent_appearance >= now)
         assert 5 == custom_list.size
 
+    def test_add_works(
+        self,
+        db: DatabaseTransactionFixture,
+        work_queue_indexing: WorkQueueIndexingFixture,
+    ):
+        custom_list = db.customlist(num_entries=0)[0]
+        now = utc_now()
+        assert [] == custom_list.add_works([])
+
+        existing = db.work()
+        existing_entry, _ = custom_list.add_entry(existing, first_appearance=now)
+        work_queue_indexing.clear()
+        previous_list_update_time = custom_list.updated
+
+        # Works are added by ID. Works already on the list, and IDs that don't
+        # belong to any Work, are skipped.
+        new1 = db.work()
+        new2 = db.work()
+        later = utc_now()
+        added = custom_list.add_works(
+            [new2.id, existing.id, new1.id, new1.id, -1], first_appearance=later
+        )
+        assert sorted([new1.id, new2.id]) == sorted(added)
+
+        entries = {entry.work: entry for entry in custom_list.entries}
+        assert {existing, new1, new2} == set(entries)
+        for work in (new1, new2):
+            entry = entries[work]
+            assert work.presentation_edition == entry.edition
+            assert False == entry.featured
+            assert later == entry.first_appearance
+            assert later == entry.most_recent_appearance
+
+        # The entry that was already on the list appeared again.
+        assert existing_entry == entries[existing]
+        assert now == existing_entry.first_appearance
+        assert later == existing_entry.most_recent_appearance
+
+        # The list was updated, and only the works that were added to it
+        # are queued for reindexing.
+        assert 3 == custom_list.size
+        assert custom_list.updated > previous_list_update_time
+        assert {new1.id, new2.id} == work_queue_indexing.queued_works
+
+        # Adding works that are all on the list already changes nothing.
+        work_queue_indexing.clear()
+        previous_list_update_time = custom_list.updated
+        assert [] == custom_list.add_works([new1.id, new2.id])
+        assert 3 == custom_list.size
+        assert previous_list_update_time == custom_list.updated
+        assert set() == work_queue_indexing.queued_works
+
+        # Reindexing can be skipped.
+        new3 = db.work()
+        assert [new3.id] == custom_list.add_works(
+            [new3.id], update_external_index=False
+        )
+        assert set() == work_queue_indexing.queued_works
+
     def test_add_entry_edition_duplicate_check(self, db: DatabaseTransactionFixture):
         # When adding an Edition to a CustomList, a duplicate check is run
         # so we don't end up adding the same book to the list twice.
@@ -985,6 +985,30 @@ class TestLicensePool:
             active_hold4,
         }
 
+    def test_active_holds_count(self, db: DatabaseTransactionFixture):
+        pool = db.licensepool(None)
+        decoy_pool = db.licensepool(None)
+
+        yesterday = utc_now() - timedelta(days=1)
+        tomorrow = utc_now() + timedelta(days=1)
+
+        assert pool.active_holds_count() == 0
+
+        waiting, _ = pool.on_hold_to(db.patron(), start=yesterday, position=1)
+        reserved, _ = pool.on_hold_to(
+            db.patron(), start=yesterday, end=tomorrow, position=0
+        )
+        # An expired reservation isn't counted, and neither are holds on other pools.
+        pool.on_hold_to(db.patron(), start=yesterday, end=yesterday, position=0)
+        decoy_pool.on_hold_to(db.patron(), start=yesterday, position=1)
+
+        # The count agrees with the holds get_active_holds() loads.
+        assert pool.active_holds_count() == len(pool.get_active_holds()) == 2
+
+        # Holds that are about to be deleted can be left out of the count.
+        assert pool.active_holds_count(ignored_holds={waiting}) == 1
+        assert pool.active_holds_count(ignored_holds={waiting, reserved}) == 0
+
     def test_update_availability(self, db: DatabaseTransactionFixture):
         work = db.work(with_license_pool=True)
         work.last_update_time = None
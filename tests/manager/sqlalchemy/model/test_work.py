@@ -7,7 +7,7 @@ import opensearchpy
 import pytest
 from psycopg2.extras import NumericRange
 from pytest import LogCaptureFixture
-from sqlalchemy import select
+from sqlalchemy import event, select
 
 from palace.util.datetime_helpers import datetime_utc, from_timestamp, utc_now
 from palace.util.exceptions import BasePalaceException
@@ -1425,6 +1425,47 @@ class TestWork:
         compare(search_doc_work1, work1)
         compare(search_doc_work2, work2)
 
+    def test_to_search_documents_query_count(self, db: DatabaseTransactionFixture):
+        # Collection settings are looked up once for a whole batch of works, so the
+        # number of queries it takes to build the documents doesn't depend on how
+        # many collections the works are in.
+        def queries_to_index(collection_count: int) -> tuple[int, list[int]]:
+            collections = [db.collection() for _ in range(collection_count)]
+            for priority, collection in enumerate(collections, start=1):
+                collection._set_settings(lane_priority_level=priority)
+            works = [
+                db.work(
+                    with_license_pool=True,
+                    collection=collections[idx % collection_count],
+                )
+                for idx in range(20)
+            ]
+            db.session.flush()
+            db.session.expire_all()
+
+            statements = []
+
+            def count(*args: Any) -> None:
+                statements.append(args[2])
+
+            connection = db.session.connection()
+            event.listen(connection, "before_cursor_execute", count)
+            try:
+                docs = Work.to_search_documents(db.session, [w.id for w in works])
+            finally:
+                event.remove(connection, "before_cursor_execute", count)
+
+            assert len(docs) == len(works)
+            levels = [doc["lane_priority_level"] for doc in docs]
+            return len(statements), levels
+
+        one_collection, levels = queries_to_index(1)
+        assert set(levels) == {1}
+
+        many_collections, levels = queries_to_index(10)
+        assert set(levels) == set(range(1, 11))
+        assert many_collections == one_collection
+
     def test_to_search_documents_with_missing_data(
         self, db: DatabaseTransactionFixture
     ):
@@ -0,0 +1,155 @@
+from collections.abc import Generator
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+
+from palace.manager.sqlalchemy import query_instrumentation
+from palace.manager.sqlalchemy.query_instrumentation import (
+    QueryStats,
+    collect_query_stats,
+    fingerprint,
+    start_collecting,
+    stop_collecting,
+)
+from tests.fixtures.query_budget import QueryBudgetFixture
+
+
+@pytest.fixture
+def engine() -> Generator[Engine]:
+    query_instrumentation.install()
+    yield create_engine("sqlite://")
+    query_instrumentation.uninstall()
+
+
+class TestFingerprint:
+    def test_fingerprint(self) -> None:
+        # Statements that only differ in their parameters share a fingerprint.
+        first = fingerprint(
+            "SELECT works.id FROM works\n   WHERE works.id IN (1, 2, 3) AND title = 'A'"
+        )
+        second = fingerprint(
+            "SELECT works.id FROM works WHERE works.id IN (%(id_1)s) AND title = 'It''s'"
+        )
+        assert first == second
+        digest, statement = first.split(" ", 1)
+        assert len(digest) == 8
+        assert statement == (
+            "SELECT works.id FROM works WHERE works.id IN (...) AND title = ?"
+        )
+
+        # Names with numbers in them are left alone.
+        assert fingerprint("SELECT anon_1.id FROM anon_1").endswith(
+            "SELECT anon_1.id FROM anon_1"
+        )
+
+        # Long statements are cut short, but the hash covers all of them.
+        long_statement = "SELECT " + ", ".join(f"column{c}" for c in "abcdefghij")
+        short = fingerprint(long_statement, length=20)
+        assert short.endswith("SELECT columna, colu...")
+        assert short != fingerprint(long_statement + ", columnk", length=20)
+
+
+class TestQueryStats:
+    def test_record(self) -> None:
+        stats = QueryStats()
+        for duration in (0.001, 0.005, 0.002, 0.010, 0.003):
+            stats.record(f"SELECT {duration}", duration)
+
+        assert stats.count == 5
+        assert stats.duration == pytest.approx(0.021)
+        assert stats.duration_ms == 21.0
+        assert [duration for duration, _ in stats.slowest] == [0.010, 0.005, 0.003]
+
+        data = stats.log_data()
+        assert data["count"] == 5
+        assert data["duration_ms"] == 21.0
+        assert data["slowest"][0] == {
+            "duration_ms": 10.0,
+            "statement": fingerprint("SELECT 0.010"),
+        }
+
+
+class TestCollectQueryStats:
+    def test_collect(self, engine: Engine) -> None:
+        with engine.connect() as connection:
+            # Nothing is collected outside a collector.
+            connection.execute(text("SELECT 1"))
+
+            with collect_query_stats() as stats:
+                connection.execute(text("SELECT 1"))
+                connection.execute(text("SELECT :value"), {"value": 2})
+            connection.execute(text("SELECT 3"))
+
+        assert stats.count == 2
+        assert stats.duration > 0
+        assert [statement for _, statement in stats.slowest] == [
+            fingerprint("SELECT 1")
+        ] * 2
+
+    def test_start_and_stop(self, engine: Engine) -> None:
+        assert stop_collecting() is None
+
+        stats = start_collecting()
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+        assert stop_collecting() is stats
+        assert stats.count == 1
+        assert stop_collecting() is None
+
+    def test_failed_statement(self, engine: Engine) -> None:
+        with engine.connect() as connection, collect_query_stats() as stats:
+            with pytest.raises(OperationalError):
+                connection.execute(text("SELECT * FROM missing"))
+            connection.execute(text("SELECT 1"))
+
+            # The failed statement isn't counted, and doesn't throw off the timing
+            # of the next one.
+            assert stats.count == 1
+            assert not connection.info[query_instrumentation._START_TIMES_KEY]
+
+    def test_install_is_idempotent(self, engine: Engine) -> None:
+        query_instrumentation.install()
+        with engine.connect() as connection, collect_query_stats() as stats:
+            connection.execute(text("SELECT 1"))
+        assert stats.count == 1
+
+    def test_uninstall(self, engine: Engine) -> None:
+        query_instrumentation.uninstall()
+        assert not query_instrumentation.installed()
+        with engine.connect() as connection, collect_query_stats() as stats:
+            connection.execute(text("SELECT 1"))
+        assert stats.count == 0
+
+        # Uninstalling again does nothing.
+        query_instrumentation.uninstall()
+
+
+class TestQueryBudgetFixture:
+    def test_budget(self, query_budget: QueryBudgetFixture, engine: Engine) -> None:
+        with engine.connect() as connection:
+            with query_budget(2) as stats:
+                connection.execute(text("SELECT 1"))
+                connection.execute(text("SELECT 2"))
+            assert stats.count == 2
+
+            with pytest.raises(AssertionError, match="over the budget of 1"):
+                with query_budget(1):
+                    connection.execute(text("SELECT 1"))
+                    connection.execute(text("SELECT 2"))
+
+    def test_close(self) -> None:
+        # The fixture removes the instrumentation it installed, so later tests don't
+        # run with it.
+        fixture = QueryBudgetFixture()
+        assert query_instrumentation.installed()
+        fixture.close()
+        assert not query_instrumentation.installed()
+
+        # But it leaves alone instrumentation that was already installed.
+        query_instrumentation.install()
+        fixture = QueryBudgetFixture()
+        fixture.close()
+        assert query_instrumentation.installed()
+        query_instrumentation.uninstall()
@@ -0,0 +1,94 @@
+import pytest
+
+from palace.manager.util.import_profile import (
+    ImportProfile,
+    ImportProfileError,
+    ImportTime,
+    main,
+    profile_imports,
+)
+
+# Import the services container and build the integration registries, the way every
+# process does when it starts up. How long this takes is timed by the benchmarks.
+REGISTRY_STARTUP = (
+    "import palace.manager.service.container\n"
+    "from palace.manager.service.integration_registry.container import (\n"
+    "    IntegrationRegistryContainer,\n"
+    ")\n"
+    "registries = IntegrationRegistryContainer()\n"
+    "registries.catalog_services()\n"
+    "registries.discovery()\n"
+    "registries.license_providers()\n"
+    "registries.metadata()\n"
+    "registries.patron_auth()\n"
+)
+
+# Building the registries shouldn't import any integration implementations, or the
+# libraries only they use.
+LAZY_MODULES = (
+    "palace.manager.integration.catalog",
+    "palace.manager.integration.discovery",
+    "palace.manager.integration.license",
+    "palace.manager.integration.metadata",
+    "palace.manager.integration.patron_auth",
+    "palace.manager.celery.tasks",
+    "onelogin",
+    "pymarc",
+)
+
+SAMPLE_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      2000 |       2000 |     json.decoder
+import time:       500 |       2500 |   json
+import time:      1000 |       3620 | palace.example
+Something else written to stderr
+"""
+
+
+class TestImportProfile:
+    def test_parse(self) -> None:
+        profile = ImportProfile.parse(SAMPLE_OUTPUT)
+        assert profile.imports == [
+            ImportTime("_io", 120, 120, 1),
+            ImportTime("json.decoder", 2000, 2000, 2),
+            ImportTime("json", 500, 2500, 1),
+            ImportTime("palace.example", 1000, 3620, 0),
+        ]
+        assert profile.total == pytest.approx(0.00362)
+        assert profile.modules == {"_io", "json.decoder", "json", "palace.example"}
+        assert [entry.module for entry in profile.slowest(2)] == [
+            "palace.example",
+            "json",
+        ]
+
+        # A prefix matches a module and the modules inside it, but not modules that
+        # just start with the same letters.
+        assert profile.imported(["json"]) == ["json", "json.decoder"]
+        assert profile.imported(["json.decoder", "palace"]) == [
+            "json.decoder",
+            "palace.example",
+        ]
+        assert profile.imported(["jso"]) == []
+
+    def test_profile_imports(self) -> None:
+        profile = profile_imports("import json")
+        assert "json" in profile.modules
+        assert profile.total > 0
+
+        with pytest.raises(ImportProfileError, match="No module named"):
+            profile_imports("import palace.no_such_module")
+
+    def test_main(self, capsys: pytest.CaptureFixture[str]) -> None:
+        assert main(["json", "--top", "3", "--forbid", "json.decoder"]) == 1
+        output = capsys.readouterr().out
+        assert "Importing json took" in output
+        assert "Imported forbidden modules:\n  json.decoder" in output
+
+        assert main(["json", "--budget", "100"]) == 0
+        assert main(["json", "--budget", "0"]) == 1
+        assert "Over the budget" in capsys.readouterr().out
+
+    def test_integration_registry_startup_imports(self) -> None:
+        profile = profile_imports(REGISTRY_STARTUP)
+        assert profile.imported(LAZY_MODULES) == []
@@ -112,7 +112,7 @@ class SearchServiceFake(SearchService):
         self.index_submit_documents([document])
 
     def index_submit_documents(
-        self, documents: Iterable[dict]
+        self, documents: Iterable[dict], thread_count: int = 1
     ) -> list[SearchServiceFailedDocument]:
         self._fail_if_necessary()
 
@@ -154,6 +154,15 @@ class SearchServiceFake(SearchService):
 
         return []
 
+    def index_update_settings(self, name: str, settings: dict[str, Any]) -> None:
+        self._fail_if_necessary()
+
+    def index_refresh(self, name: str) -> None:
+        self._fail_if_necessary()
+
+    def index_force_merge(self, name: str) -> None:
+        self._fail_if_necessary()
+
     def _pointer_set(self, revision: SearchSchemaRevision, alias: str) -> SearchPointer:
         return SearchPointer(
             alias=alias,
@@ -196,6 +205,7 @@ def fake_hits(works: list[Work]):
     return [
         Hit(
             {
+                "_id": work.id,
                 "_source": {"work_id": work.id},
                 "_sort": [work.sort_title, work.sort_author, work.id],
             }
@@ -227,7 +237,7 @@ class ExternalSearchIndexFake(ExternalSearchIndex):
         self._mock_multi_works = [fake_hits(works)]
         self._mock_multi_works.extend([fake_hits(arg_works) for arg_works in args])
 
-    def query_works_multi(self, queries, debug=False):
+    def query_works_multi(self, queries, debug=False, ids_only=False):
         result = []
         for ix, (query_string, filter, pagination) in enumerate(queries):
             self._queries.append((query_string, filter, pagination))